@@ -8,8 +8,23 @@ e instrucciones.
 
 from .observer import Observer, Observable, EventType
 from .exceptions import *
-from .instruction import Instruction, InstructionSet
-from .computer import Computer
+from .instruction import Instruction, InstructionSet, Opcode, OpcodeCategory, OperandKind, OperandToken
+from .word_format import LEGACY_WORD, WORD_WIDTHS, WordFormat, word_format_for
+
+
+def __getattr__(name):
+    """
+    Importa Computer bajo demanda.
+    
+    core.computer depende de hardware y utils, que a su vez importan
+    core; cargarlo de forma diferida evita el import circular cuando
+    utils se importa primero.
+    """
+    if name == 'Computer':
+        from .computer import Computer
+        return Computer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'Observer',
@@ -17,9 +32,21 @@ __all__ = [
     'EventType',
     'Instruction',
     'InstructionSet',
+    'Opcode',
+    'OpcodeCategory',
+    'OperandKind',
+    'OperandToken',
+    'WordFormat',
+    'LEGACY_WORD',
+    'WORD_WIDTHS',
+    'word_format_for',
     'Computer',
     'SimulatorError',
     'InvalidInstructionError',
+    'AssemblyError',
+    'AssemblyErrorGroup',
+    'ObjectFormatError',
+    'DataFormatError',
     'InvalidRegisterError',
     'InvalidMemoryAddressError',
     'ALUOperationError',
@@ -5,19 +5,35 @@ Este módulo implementa la clase Computer que orquesta todos los
 componentes del simulador y actúa como el modelo principal.
 """
 
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from typing import Iterable, List, Dict, Any, Mapping, Optional, Sequence, TYPE_CHECKING
 from core.observer import Observable, Observer, EventType
-from core.instruction import Instruction
+from core.instruction import OPCODE_CATEGORIES, OPCODE_IDS, Instruction, Opcode, OpcodeCategory, OperandKind, OperandToken
 from core.exceptions import *
-from utils.instruction_parser import InstructionParser
+from core.word_format import WordFormat, word_format_for
+from utils.instruction_parser import get_shared_parser
+from hardware.memory import Memory
+from hardware.alu import ALU
+from hardware.register_bank import RegisterBank
+from hardware.register import Register
+from hardware.control_unit import ControlUnit
+from hardware.wired_control_unit import WiredControlUnit
 
 if TYPE_CHECKING:
-    from hardware.memory import Memory
-    from hardware.alu import ALU
-    from hardware.register_bank import RegisterBank
-    from hardware.register import Register
-    from hardware.control_unit import ControlUnit
-    from hardware.wired_control_unit import WiredControlUnit
+    # El ensamblador y el formato objeto se importan al cargar un programa
+    # para no sumarlos al costo de arranque
+    from utils.assembler import AssembledProgram, Assembler
+    from utils.object_format import ObjectImage
+
+
+# Ids y categorías como enteros simples para el ciclo de ejecución
+_LOAD, _STORE, _MOVE = int(Opcode.LOAD), int(Opcode.STORE), int(Opcode.MOVE)
+_NOT, _JP, _JPZ = int(Opcode.NOT), int(Opcode.JP), int(Opcode.JPZ)
+_ALU_RESULT = int(OpcodeCategory.ALU_RESULT)
+
+# Clases de operando y nombre de registro por número para resolver operandos
+_REGISTER, _IMMEDIATE = OperandKind.REGISTER, OperandKind.IMMEDIATE
+_INDIRECT_REGISTER, _INDIRECT_ADDRESS = OperandKind.INDIRECT_REGISTER, OperandKind.INDIRECT_ADDRESS
+_REGISTER_NAMES = tuple(f'R{number}' for number in range(10))
 
 
 class Computer(Observable, Observer):
@@ -28,28 +44,27 @@ class Computer(Observable, Observer):
     la ejecución de programas siguiendo el patrón MVC.
     """
     
-    def __init__(self, memory_size: int = 32):
+    def __init__(self, memory_size: int = 32, word_width: Optional[int] = None):
         """
         Inicializa el simulador de computadora.
         
         Args:
             memory_size: Tamaño de la memoria (default: 32)
+            word_width: Ancho de palabra en bits (8, 16 o 32) que comparten
+                la ALU, los registros y la memoria; None conserva la
+                semántica histórica (rango [-16384, 16383], sin truncar)
+            
+        Raises:
+            ValueError: Si el ancho de palabra no está admitido
         """
         super().__init__()
-        
-        # Import hardware components locally to avoid circular imports
-        from hardware.memory import Memory
-        from hardware.alu import ALU
-        from hardware.register_bank import RegisterBank
-        from hardware.register import Register
-        from hardware.control_unit import ControlUnit
-        from hardware.wired_control_unit import WiredControlUnit
+        self._word_format = word_format_for(word_width)
         
         # Inicializar componentes de hardware
-        self._memory = Memory(memory_size)
-        self._alu = ALU()
+        self._memory = Memory(memory_size, self._word_format)
+        self._alu = ALU(word_format=self._word_format)
         self._control_unit = ControlUnit()
-        self._register_bank = RegisterBank()
+        self._register_bank = RegisterBank(self._word_format)
         self._wired_control_unit = WiredControlUnit()
         
         # Registros especiales
@@ -63,29 +78,45 @@ class Computer(Observable, Observer):
         self._is_running = False
         self._is_halted = False
         self._execution_mode = "automatic"  # "automatic" o "step"
-        self._loaded_program: List[str] = []
+        self._loaded_program: Sequence[str] = []
+        self._assembled_program: Optional['AssembledProgram'] = None
+        self._cycle_count = 0
         
-        # Parser de instrucciones
-        self._parser = InstructionParser()
+        # Parser de instrucciones (compartido, no guarda estado) y ensamblador
+        # (se crea al cargar el primer programa)
+        self._parser = get_shared_parser()
+        self._assembler: Optional['Assembler'] = None
         
         # Configurar observadores
         self._setup_observers()
     
     def _setup_observers(self) -> None:
         """Configura los observadores para todos los componentes."""
-        # Observar cambios en componentes de hardware
-        self._memory.add_observer(self)
+        # La ALU se observa siempre: sus flags actualizan el registro PSW
         self._alu.add_observer(self)
-        self._control_unit.add_observer(self)
-        self._register_bank.add_observer(self)
-        self._wired_control_unit.add_observer(self)
+    
+    def _forwarded_components(self) -> List[Observable]:
+        """Componentes cuyos eventos el Computer solo propaga a sus observadores."""
+        return [
+            self._memory, self._control_unit, self._register_bank, self._wired_control_unit,
+            # Registros especiales
+            self._pc_register, self._mar_register, self._ir_register,
+            self._mbr_register, self._psw_register,
+        ]
+    
+    def _observed_changed(self, observed: bool) -> None:
+        """
+        Observa los componentes solo mientras alguien observa al Computer.
         
-        # Observar registros especiales
-        self._pc_register.add_observer(self)
-        self._mar_register.add_observer(self)
-        self._ir_register.add_observer(self)
-        self._mbr_register.add_observer(self)
-        self._psw_register.add_observer(self)
+        Sin observadores (ejecución sin interfaz o ejecución rápida desde
+        el controlador) los registros no construyen eventos que nadie
+        recibiría.
+        """
+        for component in self._forwarded_components():
+            if observed:
+                component.add_observer(self)
+            else:
+                component.remove_observer(self)
     
     def update(self, observable: Observable, event_type: str, data: Any = None) -> None:
         """
@@ -108,10 +139,11 @@ class Computer(Observable, Observer):
     
     def load_program(self, program_lines: List[str]) -> bool:
         """
-        Carga un programa en la memoria.
+        Ensambla un programa y lo carga en la memoria.
         
         Args:
-            program_lines: Lista de líneas del programa
+            program_lines: Lista de líneas del programa (admite comentarios
+                `#`, etiquetas y constantes .equ)
             
         Returns:
             True si el programa se cargó exitosamente
@@ -119,36 +151,59 @@ class Computer(Observable, Observer):
         Raises:
             MemoryOverflowError: Si no hay suficiente memoria
             InvalidInstructionError: Si hay instrucciones inválidas
+                (AssemblyError indica la línea fuente)
+        """
+        program = self._get_assembler().assemble(program_lines)
+        return self.load_assembled_program(program)
+    
+    def _get_assembler(self) -> 'Assembler':
+        """Obtiene el ensamblador, importándolo y creándolo en el primer uso."""
+        if self._assembler is None:
+            from utils.assembler import Assembler
+            self._assembler = Assembler(self._parser)
+        return self._assembler
+    
+    def load_assembled_program(self, program: 'AssembledProgram') -> bool:
+        """
+        Carga en memoria un programa ya ensamblado, sin volver a parsearlo.
+        
+        Args:
+            program: Programa generado por el ensamblador
+            
+        Returns:
+            True si el programa se cargó exitosamente
+            
+        Raises:
+            InvalidInstructionError: Si el programa no cabe en memoria
         """
         try:
             self.reset()
             
             # Validar que hay espacio en memoria
-            if len(program_lines) > self._memory.instruction_size:
+            if len(program) > self._memory.instruction_size:
                 raise MemoryOverflowError(
-                    f"Program too large. Available: {self._memory.instruction_size}, Required: {len(program_lines)}"
+                    f"Program too large. Available: {self._memory.instruction_size}, Required: {len(program)}"
                 )
             
-            # Cargar cada instrucción
-            loaded_instructions = []
-            for idx, line in enumerate(program_lines):
-                line = line.strip()
-                if line:  # Ignorar líneas vacías
-                    # Validar instrucción
-                    self._parser.parse(line)
-                    
-                    # Almacenar en memoria
-                    self._memory.store_instruction(idx, line)
-                    loaded_instructions.append(line)
+            # Almacenar cada instrucción con su forma decodificada
+            loaded_instructions = program.lines
+            for address, (line, instruction) in enumerate(zip(loaded_instructions, program.instructions)):
+                self._memory.store_instruction(address, line, instruction)
+            
+            # Datos iniciales (.data)
+            for address, value in program.data.items():
+                self._memory.store_data(address, value)
             
             self._loaded_program = loaded_instructions
+            self._assembled_program = program
             
             # Notificar programa cargado
             self.notify_observers(
                 EventType.PROGRAM_LOADED,
                 {
                     'program': loaded_instructions,
-                    'instruction_count': len(loaded_instructions)
+                    'instruction_count': len(loaded_instructions),
+                    'source_map': program.source_map
                 }
             )
             
@@ -157,17 +212,137 @@ class Computer(Observable, Observer):
         except Exception as e:
             raise InvalidInstructionError(f"Error loading program: {str(e)}")
     
-    def execute_program(self) -> None:
-        """Ejecuta el programa completo automáticamente."""
+    def load_program_stream(self, program_lines: Iterable[str], max_errors: Optional[int] = None) -> bool:
+        """
+        Ensambla un programa leyéndolo línea a línea y lo carga en la memoria.
+        
+        Pensado para programas muy grandes: acepta cualquier iterable de
+        líneas (por ejemplo un archivo abierto o un generador) y guarda cada
+        instrucción directamente en la memoria, sin listas intermedias.
+        
+        Args:
+            program_lines: Líneas del programa
+            max_errors: Errores a reunir antes de abandonar la carga
+                (default: utils.assembler.DEFAULT_MAX_ERRORS)
+            
+        Returns:
+            True si el programa se cargó exitosamente
+            
+        Raises:
+            AssemblyErrorGroup: Con los primeros errores del programa (la
+                memoria de instrucciones queda vacía)
+            InvalidInstructionError: Si el programa no cabe en memoria
+        """
+        from utils.assembler import DEFAULT_MAX_ERRORS, LazySequence
+        
+        if max_errors is None:
+            max_errors = DEFAULT_MAX_ERRORS
+        memory = self._memory
+        
+        def store(address: int, instruction: Instruction) -> None:
+            memory.store_instruction(address, instruction.raw_instruction, instruction)
+        
+        try:
+            self.reset()
+            program = self._get_assembler().assemble_into(program_lines, store, max_errors, memory.instruction_size)
+            
+            # Datos iniciales (.data)
+            for address, value in program.data.items():
+                memory.store_data(address, value)
+            
+            # El texto del programa se lee de la memoria bajo demanda
+            self._loaded_program = LazySequence(len(program), memory.peek)
+            
+            self.notify_observers(
+                EventType.PROGRAM_LOADED,
+                {
+                    'program': self._loaded_program,
+                    'instruction_count': len(program),
+                    'source_map': program.source_map
+                }
+            )
+            
+            return True
+            
+        except AssemblyError:
+            self.reset()
+            raise
+        except Exception as e:
+            raise InvalidInstructionError(f"Error loading program: {str(e)}")
+    
+    def load_object_image(self, image: 'ObjectImage') -> bool:
+        """
+        Carga un programa desde un archivo objeto sin parsear texto.
+        
+        Las instrucciones se decodifican desde la imagen al primer acceso
+        de cada dirección, por lo que el costo de carga no depende del
+        tamaño del programa.
+        
+        Args:
+            image: Imagen leída con utils.object_format.read_object()
+            
+        Returns:
+            True si el programa se cargó exitosamente
+            
+        Raises:
+            InvalidInstructionError: Si el programa no cabe en memoria
+        """
+        try:
+            self.reset()
+            
+            # Validar que hay espacio en memoria
+            if len(image) > self._memory.instruction_size:
+                raise MemoryOverflowError(
+                    f"Program too large. Available: {self._memory.instruction_size}, Required: {len(image)}"
+                )
+            
+            self._memory.load_instruction_image(image)
+            for address, value in image.data.items():
+                self._memory.store_data(address, value)
+            
+            self._loaded_program = image.lines
+            
+            self.notify_observers(
+                EventType.PROGRAM_LOADED,
+                {
+                    'program': self._loaded_program,
+                    'instruction_count': len(image),
+                    'source_map': image.source_map
+                }
+            )
+            
+            return True
+            
+        except Exception as e:
+            raise InvalidInstructionError(f"Error loading program: {str(e)}")
+    
+    def execute_program(self, max_cycles: Optional[int] = None, accelerator=None) -> int:
+        """
+        Ejecuta el programa completo automáticamente.
+        
+        Args:
+            max_cycles: Número máximo de ciclos a ejecutar (None = sin límite)
+            accelerator: Objeto con accelerate(pc, ciclos restantes) que
+                puede saltar iteraciones de bucles (ver core.engine.FastEngine)
+            
+        Returns:
+            Número de ciclos ejecutados en esta llamada
+        """
         if not self._loaded_program:
             raise InvalidInstructionError("No program loaded")
         
         self._execution_mode = "automatic"
         self._is_running = True
         self._is_halted = False
+        start_cycles = self._cycle_count
         
         try:
             while self._can_continue_execution():
+                if max_cycles is not None and self._cycle_count - start_cycles >= max_cycles:
+                    break
+                if accelerator is not None:
+                    budget = None if max_cycles is None else max_cycles - (self._cycle_count - start_cycles)
+                    self._cycle_count += accelerator.accelerate(self._pc_register.value, budget)
                 self._execute_single_cycle()
                 
         except Exception as e:
@@ -175,10 +350,14 @@ class Computer(Observable, Observer):
             raise SimulatorError(f"Execution error: {str(e)}")
         
         self._is_running = False
+        if self._alu.lazy_flags:
+            self._sync_psw_display()
         self.notify_observers(
             EventType.EXECUTION_COMPLETED,
             {'mode': 'automatic'}
         )
+        
+        return self._cycle_count - start_cycles
     
     def execute_next_instruction(self) -> bool:
         """
@@ -219,28 +398,78 @@ class Computer(Observable, Observer):
         
         # DECODE
         opcode, operand1, operand2, operand3 = self._control_unit.decode()
+        instruction = self._control_unit.instruction_register
+        opcode_id = instruction.opcode_id
         
         # Generar señales de control
-        control_signals = self._wired_control_unit.generate_control_signals(opcode)
+        control_signals = self._wired_control_unit.generate_control_signals_id(opcode_id)
         
-        # Preparar operandos
-        resolved_operand1, resolved_operand2, resolved_operand3 = self._resolve_operands(operand1, operand2, operand3)
+        # Preparar operandos (con las clases que ya calculó el parser)
+        tokens = instruction.operand_tokens
+        if tokens:
+            resolved_operand1, resolved_operand2, resolved_operand3 = self._resolve_tokens(tokens)
+        else:
+            resolved_operand1, resolved_operand2, resolved_operand3 = self._resolve_operands(operand1, operand2, operand3)
         
         # EXECUTE
         self._execute_instruction(opcode, operand1, operand2, 
                                 resolved_operand1, resolved_operand2, 
                                 control_signals,
-                                operand3, resolved_operand3)
+                                operand3, resolved_operand3, opcode_id)
         
         # Actualizar PC (si no fue modificado por salto)
-        if opcode not in ['JP', 'JPZ'] or (opcode == 'JPZ' and resolved_operand2 != 0):
+        if opcode_id != _JP and (opcode_id != _JPZ or resolved_operand2 != 0):
             self._pc_register.set_value(pc_value + 1)
         
         # Notificar finalización de ciclo
+        self._cycle_count += 1
         self._control_unit.execute_completed()
     
+    def _resolve_tokens(self, tokens: Sequence[Optional[OperandToken]]) -> tuple:
+        """
+        Resuelve los operandos ya clasificados a sus valores reales.
+        
+        Equivale a _resolve_operands() sin volver a mirar el texto: el
+        direccionamiento indirecto solo se resuelve en el segundo operando.
+        """
+        count = len(tokens)
+        resolved_op1 = self._token_value(tokens[0])
+        resolved_op2 = None
+        resolved_op3 = None
+        
+        if count > 1:
+            token = tokens[1]
+            if token is not None:
+                kind = token.kind
+                if kind is _REGISTER:
+                    resolved_op2 = self._register_bank.get(token.text)
+                elif kind is _IMMEDIATE:
+                    resolved_op2 = token.value
+                elif kind is _INDIRECT_ADDRESS:
+                    resolved_op2 = self._memory.load_data(token.value).value
+                elif kind is _INDIRECT_REGISTER:
+                    address = self._register_bank.get(_REGISTER_NAMES[token.value])
+                    resolved_op2 = self._memory.load_data(address).value
+                elif token.text.startswith('*'):
+                    raise InvalidRegisterError(f"Invalid operand for indirect addressing: {token.text}")
+            if count > 2:
+                resolved_op3 = self._token_value(tokens[2])
+        
+        return resolved_op1, resolved_op2, resolved_op3
+    
+    def _token_value(self, token: Optional[OperandToken]) -> Any:
+        """Valor de un operando de registro o inmediato (None para el resto)."""
+        if token is None:
+            return None
+        kind = token.kind
+        if kind is _REGISTER:
+            return self._register_bank.get(token.text)
+        if kind is _IMMEDIATE:
+            return token.value
+        return None
+    
     def _resolve_operands(self, operand1: str, operand2: str, operand3: str = None) -> tuple:
-        """Resuelve los operandos a sus valores reales."""
+        """Resuelve los operandos a sus valores reales (instrucciones sin operandos clasificados)."""
         resolved_op1 = None
         resolved_op2 = None
         resolved_op3 = None
@@ -283,54 +512,71 @@ class Computer(Observable, Observer):
     
     def _execute_instruction(self, opcode: str, op1: str, op2: str, 
                            resolved_op1: Any, resolved_op2: Any, 
-                           control_signals: Dict[str, Any],
-                           op3: str = None, resolved_op3: Any = None) -> None:
+                           control_signals: Mapping[str, Any],
+                           op3: str = None, resolved_op3: Any = None,
+                           opcode_id: Optional[int] = None) -> None:
         """Ejecuta una instrucción específica."""
+        if opcode_id is None:
+            opcode_id = OPCODE_IDS.get(opcode, 0)
         
         if control_signals.get('alu_operation'):
             # Operaciones que requieren ALU
-            result = self._alu.execute(opcode, resolved_op1, resolved_op2)
+            result = self._alu.execute_id(opcode_id, resolved_op1, resolved_op2)
             
-            if opcode in ['ADD', 'SUB', 'MUL', 'DIV', 'AND', 'OR', 'NOT', 'XOR']:
+            if OPCODE_CATEGORIES[opcode_id] & _ALU_RESULT:
                 # Para operaciones de 3 operandos, guardar en el tercer operando (destino)
                 if op3:
                     self._register_bank.set(op3, result)
-                elif opcode == 'NOT':
+                elif opcode_id == _NOT:
                     # NOT usa op2 como destino
                     self._register_bank.set(op2, result)
                 else:
                     # Para compatibilidad con operaciones de 2 operandos
                     self._register_bank.set(op1, result)
-                
-        elif opcode == 'JP':
-            # Salto incondicional
-            self._pc_register.set_value(resolved_op1)
             
-        elif opcode == 'JPZ':
-            # Salto condicional
-            if resolved_op2 == 0:
+            elif opcode_id == _JP:
+                # Salto incondicional (la ALU ya validó la dirección)
                 self._pc_register.set_value(resolved_op1)
+            
+            elif opcode_id == _JPZ:
+                # Salto condicional
+                if resolved_op2 == 0:
+                    self._pc_register.set_value(resolved_op1)
                 
-        elif opcode == 'LOAD':
-            # Cargar datos
-            if op2.startswith('*'):
-                # Carga indirecta ya resuelta
-                value = resolved_op2
-            else:
-                # Carga inmediata - siempre usar el valor tal como está
-                value = resolved_op2
-                
+        elif opcode_id == _LOAD:
+            # Cargar datos (inmediato o indirecto, ya resuelto)
+            value = resolved_op2
             self._mbr_register.set_value(value)
             self._register_bank.set(op1, value)
             
-        elif opcode == 'STORE':
+        elif opcode_id == _STORE:
             # Almacenar datos
             self._memory.store_data(resolved_op2, resolved_op1)
             
-        elif opcode == 'MOVE':
+        elif opcode_id == _MOVE:
             # Mover entre registros
             self._register_bank.set(op1, resolved_op2)
     
+    def set_lazy_flags(self, enabled: bool) -> None:
+        """
+        Activa o desactiva los flags diferidos de la ALU.
+        
+        Con flags diferidos la ALU no calcula el PSW ni notifica eventos en
+        cada operación: el PSW se calcula al leerlo (get_system_state,
+        psw_register) o al terminar execute_program(). Pensado para
+        ejecuciones sin interfaz, donde nadie observa cada ciclo.
+        
+        Args:
+            enabled: True para diferir el cálculo de los flags
+        """
+        self._alu.set_lazy_flags(enabled)
+        if not enabled:
+            self._sync_psw_display()
+    
+    def _sync_psw_display(self) -> None:
+        """Actualiza el registro PSW con los flags actuales de la ALU."""
+        self._update_psw_display(self._alu.psw)
+    
     def _update_psw_display(self, psw: Dict[str, int]) -> None:
         """Actualiza la visualización del PSW."""
         psw_text = f"Z: {psw['Z']} C: {psw['C']} S: {psw['S']} O: {psw['O']}"
@@ -360,7 +606,9 @@ class Computer(Observable, Observer):
         # Resetear estado
         self._is_running = False
         self._is_halted = False
-        self._loaded_program.clear()
+        self._cycle_count = 0
+        self._loaded_program = []
+        self._assembled_program = None
         
         # Notificar reset
         self.notify_observers(
@@ -374,6 +622,11 @@ class Computer(Observable, Observer):
         self._is_running = False
     
     # Propiedades de solo lectura para acceso a componentes
+    @property
+    def word_format(self) -> WordFormat:
+        """Obtiene el formato de palabra de la máquina."""
+        return self._word_format
+    
     @property
     def memory(self) -> 'Memory':
         """Obtiene la memoria del sistema."""
@@ -384,6 +637,11 @@ class Computer(Observable, Observer):
         """Obtiene la ALU."""
         return self._alu
     
+    @property
+    def control_unit(self) -> 'ControlUnit':
+        """Obtiene la unidad de control."""
+        return self._control_unit
+    
     @property
     def register_bank(self) -> 'RegisterBank':
         """Obtiene el banco de registros."""
@@ -412,6 +670,8 @@ class Computer(Observable, Observer):
     @property
     def psw_register(self) -> 'Register':
         """Obtiene el registro PSW."""
+        if self._alu.lazy_flags:
+            self._sync_psw_display()
         return self._psw_register
     
     @property
@@ -419,10 +679,20 @@ class Computer(Observable, Observer):
         """Verifica si el simulador está ejecutando."""
         return self._is_running
     
+    @property
+    def cycle_count(self) -> int:
+        """Obtiene el número de ciclos ejecutados desde el último reset."""
+        return self._cycle_count
+    
     @property
     def loaded_program(self) -> List[str]:
         """Obtiene el programa cargado."""
-        return self._loaded_program.copy()
+        return list(self._loaded_program)
+    
+    @property
+    def assembled_program(self) -> Optional['AssembledProgram']:
+        """Obtiene el programa ensamblado cargado (con su mapa de líneas fuente)."""
+        return self._assembled_program
     
     def get_system_state(self) -> Dict[str, Any]:
         """
@@ -444,5 +714,6 @@ class Computer(Observable, Observer):
             'is_halted': self._is_halted,
             'execution_mode': self._execution_mode,
             'program_loaded': bool(self._loaded_program),
-            'program_size': len(self._loaded_program)
+            'program_size': len(self._loaded_program),
+            'cycle_count': self._cycle_count
         }
\ No newline at end of file
@@ -0,0 +1,266 @@
+"""
+Motor de ejecución rápida con aceleración de bucles de conteo.
+
+Un bucle de la forma
+
+    bucle: SUB R1, 1, R1     # actualizaciones afines de registros
+           ADD R2, 5, R2
+           JPZ fin, R1       # única salida
+           JP bucle
+
+solo suma a cada registro que modifica un paso constante por iteración,
+así que su estado tras n iteraciones se calcula directamente. El motor
+detecta estos bucles con utils.control_flow y, al llegar a la cabecera,
+salta en O(1) todas las iteraciones salvo la última, que se interpreta
+normalmente: el estado final (PSW, MBR, IR, MAR y ciclos incluidos) es el
+mismo que al interpretar el bucle completo.
+
+Si algún operando pudiera salir del rango de la ALU durante las
+iteraciones saltadas (donde la ALU lanzaría OperandOutOfRangeError), algún
+registro se truncaría al ancho de la palabra de la máquina, o el contador
+nunca llega a 0, el bucle se interpreta instrucción a instrucción.
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from core.instruction import Instruction, OperandKind, OperandToken
+from utils.instruction_parser import get_shared_parser
+
+# Operaciones permitidas en el cuerpo de un bucle acelerable
+AFFINE_OPCODES = frozenset({'ADD', 'SUB'})
+
+
+class _Update(NamedTuple):
+    """Actualización `R = R ± paso` de un registro del bucle."""
+    register: str
+    offset: int
+    step: Optional[int]
+    step_register: Optional[str]
+    negated: bool
+
+
+class LoopPlan(NamedTuple):
+    """
+    Bucle de conteo que el motor puede acelerar.
+    
+    Attributes:
+        header: Dirección de la primera instrucción del bucle
+        length: Instrucciones por iteración (incluidos JPZ y JP)
+        exit_offset: Posición del JPZ de salida desde la cabecera
+        counter: Registro que decide la salida
+        updates: Actualización de cada registro modificado por el bucle
+        alu_operands: Operandos que valida la ALU, por posición en el bucle
+    """
+    header: int
+    length: int
+    exit_offset: int
+    counter: str
+    updates: Tuple[_Update, ...]
+    alu_operands: Tuple[Tuple[int, Tuple[OperandToken, ...]], ...]
+
+
+def _alu_operands(instruction: Instruction) -> Tuple[OperandToken, ...]:
+    """Operandos que la ALU recibe (y valida) al ejecutar la instrucción."""
+    from utils.control_flow import operand_tokens
+    tokens = operand_tokens(instruction)
+    return tokens[:1] if instruction.opcode == 'JP' else tokens[:2]
+
+
+def plan_loops(instructions: List[Instruction]) -> Dict[int, LoopPlan]:
+    """
+    Encuentra los bucles de conteo acelerables de un programa.
+    
+    Un bucle es acelerable si ocupa direcciones consecutivas que terminan en
+    `JP cabecera`, tiene un único `JPZ` que sale del bucle sobre su
+    contador, y todas sus demás instrucciones son `ADD`/`SUB` de un
+    registro consigo mismo con un paso inmediato o un registro que el
+    bucle no modifica (sin accesos a memoria).
+    
+    Args:
+        instructions: Instrucciones decodificadas del programa
+    
+    Returns:
+        Diccionario dirección de la cabecera -> plan del bucle
+    """
+    # Todo bucle acelerable cierra con un JP: sin ninguno no hace falta
+    # cargar ni ejecutar el análisis de flujo de control
+    if not any(instruction.opcode == 'JP' for instruction in instructions):
+        return {}
+    from utils.control_flow import analyze_program, operand_tokens, register_written
+    
+    analysis = analyze_program(instructions)
+    cfg = analysis.cfg
+    plans = {}
+    
+    for loop in analysis.loops:
+        if loop.counter is None:
+            continue
+        addresses = analysis.loop_addresses(analysis.loops.index(loop))
+        header, last = addresses[0], addresses[-1]
+        if addresses != list(range(header, last + 1)) or header != cfg.blocks[loop.header].start:
+            continue
+        
+        body = [instructions[address] for address in addresses]
+        closing = body[-1]
+        if closing.opcode != 'JP' or operand_tokens(closing)[0].value != header:
+            continue
+        
+        exits = [offset for offset, instruction in enumerate(body) if instruction.opcode == 'JPZ']
+        if len(exits) != 1:
+            continue
+        exit_offset = exits[0]
+        exit_target, tested = operand_tokens(body[exit_offset])
+        if header <= exit_target.value <= last or tested.text != loop.counter:
+            continue
+        
+        others = body[:exit_offset] + body[exit_offset + 1:-1]
+        written = {register_written(instruction.opcode, operand_tokens(instruction)) for instruction in others}
+        if (any(instruction.opcode not in AFFINE_OPCODES for instruction in others)
+                or not written <= set(loop.induction_registers)):
+            continue
+        
+        updates = tuple(
+            _Update(induction.register, induction.address - header, induction.step,
+                    induction.step_register, induction.negated)
+            for induction in loop.induction_registers.values()
+        )
+        alu_operands = tuple((offset, _alu_operands(instruction)) for offset, instruction in enumerate(body))
+        plans[header] = LoopPlan(header, len(body), exit_offset, loop.counter, updates, alu_operands)
+    
+    return plans
+
+
+class FastEngine:
+    """
+    Ejecuta el programa cargado en un Computer acelerando los bucles de
+    conteo.
+    
+    Se construye después de cargar el programa y se usa en lugar de
+    Computer.execute_program() (por ejemplo, en el ejecutor sin interfaz).
+    """
+    
+    def __init__(self, computer):
+        """
+        Analiza el programa cargado en un Computer.
+        
+        Args:
+            computer: Computer con un programa ya cargado
+        """
+        self._computer = computer
+        self._registers = computer.register_bank
+        self._word = computer.word_format
+        self._plans = plan_loops(self._program_instructions(computer))
+        self._accelerated_cycles = 0
+        self._accelerated_iterations = 0
+    
+    @staticmethod
+    def _program_instructions(computer) -> List[Instruction]:
+        """Instrucciones decodificadas del programa cargado en memoria."""
+        memory = computer.memory
+        parser = get_shared_parser()
+        instructions = []
+        for address, text in enumerate(computer.loaded_program):
+            decoded = memory.load_decoded_instruction(address)
+            instructions.append(decoded if decoded is not None else parser.parse(text, address))
+        return instructions
+    
+    @property
+    def loops(self) -> Dict[int, LoopPlan]:
+        """Bucles acelerables, por dirección de la cabecera."""
+        return dict(self._plans)
+    
+    @property
+    def accelerated_cycles(self) -> int:
+        """Ciclos calculados sin interpretar en las ejecuciones de este motor."""
+        return self._accelerated_cycles
+    
+    @property
+    def accelerated_iterations(self) -> int:
+        """Iteraciones de bucle calculadas sin interpretar."""
+        return self._accelerated_iterations
+    
+    def run(self, max_cycles: Optional[int] = None) -> int:
+        """
+        Ejecuta el programa hasta terminar o alcanzar el límite de ciclos.
+        
+        Args:
+            max_cycles: Número máximo de ciclos a ejecutar (None = sin límite)
+        
+        Returns:
+            Número de ciclos ejecutados (interpretados y acelerados)
+        """
+        return self._computer.execute_program(max_cycles, accelerator=self if self._plans else None)
+    
+    def accelerate(self, pc: int, budget: Optional[int]) -> int:
+        """
+        Salta las iteraciones de un bucle de conteo que empieza en `pc`.
+        
+        Deja el PC en la cabecera con los registros como quedarían tras las
+        iteraciones saltadas; la última iteración (o, con límite de ciclos,
+        la última que cabe) se interpreta normalmente.
+        
+        Args:
+            pc: Dirección de la próxima instrucción
+            budget: Ciclos que quedan antes del límite (None = sin límite)
+        
+        Returns:
+            Ciclos saltados (0 si no hay un bucle acelerable en `pc`)
+        """
+        plan = self._plans.get(pc)
+        if plan is None:
+            return 0
+        
+        get = self._registers.get
+        initial = {update.register: get(update.register) for update in plan.updates}
+        steps = {}
+        for update in plan.updates:
+            step = update.step if update.step_register is None else get(update.step_register)
+            steps[update.register] = -step if update.negated else step
+        offsets = {update.register: update.offset for update in plan.updates}
+        
+        def value_at(register: str, offset: int, iteration: int) -> int:
+            """Valor de un registro al ejecutar la posición `offset` de una iteración."""
+            if register not in steps:
+                return get(register)
+            completed = iteration + (1 if offsets[register] < offset else 0)
+            return initial[register] + steps[register] * completed
+        
+        # Iteraciones completas antes de la que sale por el JPZ
+        tested = value_at(plan.counter, plan.exit_offset, 0)
+        step = steps[plan.counter]
+        if tested == 0 or step == 0 or tested % step != 0 or -tested // step < 0:
+            return 0
+        iterations = -tested // step
+        if budget is not None:
+            iterations = min(iterations, budget // plan.length)
+        
+        # La última iteración que se ejecutaría se interpreta
+        skipped = iterations - 1
+        if skipped < 1:
+            return 0
+        
+        # Los valores son afines en la iteración: basta revisar los extremos
+        for offset, tokens in plan.alu_operands:
+            for token in tokens:
+                for iteration in (0, skipped - 1):
+                    if token.kind is OperandKind.IMMEDIATE:
+                        value = token.value
+                    elif token.kind is OperandKind.REGISTER:
+                        value = value_at(token.text, offset, iteration)
+                    else:
+                        return 0
+                    if not self._word.in_range(value):
+                        return 0
+        
+        final = {register: value + steps[register] * skipped for register, value in initial.items()}
+        # Con palabra de ancho fijo un registro que se truncara ya no sería afín
+        if self._word.is_fixed and not all(map(self._word.in_range, final.values())):
+            return 0
+        
+        for register, value in final.items():
+            self._registers.set(register, value)
+        
+        cycles = skipped * plan.length
+        self._accelerated_iterations += skipped
+        self._accelerated_cycles += cycles
+        return cycles
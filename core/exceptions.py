@@ -28,6 +28,48 @@ class InvalidInstructionError(SimulatorError):
         super().__init__(message)
 
 
+class AssemblyError(InvalidInstructionError):
+    """Excepción para errores de ensamblado asociados a una línea del programa."""
+    
+    def __init__(self, details=None, line_number=None, source=None):
+        self.instruction = source
+        self.line_number = line_number
+        self.details = details
+        
+        if line_number is not None:
+            message = f"Error de ensamblado en línea {line_number}: {details}"
+        elif details is not None:
+            message = f"Error de ensamblado: {details}"
+        else:
+            message = "Error de ensamblado"
+        
+        SimulatorError.__init__(self, message)
+
+
+class AssemblyErrorGroup(AssemblyError):
+    """Excepción que agrupa los primeros errores de ensamblado de un programa."""
+    
+    def __init__(self, errors):
+        self.errors = list(errors)
+        first = self.errors[0]
+        AssemblyError.__init__(self, first.details, first.line_number, first.instruction)
+        
+        remaining = len(self.errors) - 1
+        if remaining:
+            suffix = "error más" if remaining == 1 else "errores más"
+            self.args = (f"{self.args[0]} (y {remaining} {suffix})",)
+
+
+class ObjectFormatError(SimulatorError):
+    """Excepción para archivos objeto inválidos o incompatibles."""
+    pass
+
+
+class DataFormatError(SimulatorError):
+    """Excepción para archivos de datos (binarios o CSV) inválidos."""
+    pass
+
+
 class InvalidRegisterError(SimulatorError):
     """Excepción para acceso a registros inválidos."""
     
@@ -5,16 +5,22 @@ Este módulo define las clases para representar y manejar
 instrucciones del lenguaje ensamblador del simulador.
 """
 
-from dataclasses import dataclass
-from enum import Enum
-from typing import List, Optional, Union
+from enum import Enum, IntEnum, IntFlag
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
 from core.exceptions import InvalidInstructionError
 
 
 class InstructionType(Enum):
-    """Tipos de instrucciones disponibles."""
+    """
+    Tipos de instrucciones disponibles.
+    
+    Incluye todo el repertorio de Opcode. JMP, JZ y JNZ son nombres
+    históricos que se conservan por compatibilidad: no tienen id de
+    opcode y el simulador no los ejecuta.
+    """
     LOAD = "LOAD"
     STORE = "STORE"
+    MOVE = "MOVE"
     ADD = "ADD"
     SUB = "SUB"
     MUL = "MUL"
@@ -23,17 +29,121 @@ class InstructionType(Enum):
     OR = "OR"
     NOT = "NOT"
     XOR = "XOR"
+    JP = "JP"
+    JPZ = "JPZ"
     JMP = "JMP"
     JZ = "JZ"
     JNZ = "JNZ"
     HALT = "HALT"
 
 
-@dataclass
+# Búsqueda directa de InstructionType por nombre
+_INSTRUCTION_TYPES = {instruction_type.value: instruction_type for instruction_type in InstructionType}
+
+class Opcode(IntEnum):
+    """
+    Repertorio completo de opcodes; el valor es su id numérico.
+    
+    El formato objeto guarda estos ids en disco: cambiarlos invalida los
+    archivos existentes.
+    """
+    LOAD = 1
+    STORE = 2
+    MOVE = 3
+    ADD = 4
+    SUB = 5
+    MUL = 6
+    DIV = 7
+    AND = 8
+    OR = 9
+    XOR = 10
+    NOT = 11
+    JP = 12
+    JPZ = 13
+    HALT = 14
+
+
+class OpcodeCategory(IntFlag):
+    """Categorías de opcode como bits combinables."""
+    NONE = 0
+    ARITHMETIC = 1
+    LOGICAL = 2
+    MEMORY = 4
+    CONTROL = 8
+    REGISTER = 16
+    # Operaciones que escriben el resultado de la ALU en un registro
+    ALU_RESULT = ARITHMETIC | LOGICAL
+    # Operaciones que pasan por la ALU
+    ALU = ARITHMETIC | LOGICAL | CONTROL
+
+
+# Ids numéricos de opcode, compartidos por el formato objeto y la ALU
+OPCODE_IDS: Dict[str, int] = {opcode.name: int(opcode) for opcode in Opcode}
+OPCODES_BY_ID: Dict[int, str] = {opcode_id: opcode for opcode, opcode_id in OPCODE_IDS.items()}
+
+_CATEGORIES_BY_OPCODE = {
+    Opcode.ADD: OpcodeCategory.ARITHMETIC, Opcode.SUB: OpcodeCategory.ARITHMETIC,
+    Opcode.MUL: OpcodeCategory.ARITHMETIC, Opcode.DIV: OpcodeCategory.ARITHMETIC,
+    Opcode.AND: OpcodeCategory.LOGICAL, Opcode.OR: OpcodeCategory.LOGICAL,
+    Opcode.XOR: OpcodeCategory.LOGICAL, Opcode.NOT: OpcodeCategory.LOGICAL,
+    Opcode.LOAD: OpcodeCategory.MEMORY, Opcode.STORE: OpcodeCategory.MEMORY,
+    Opcode.MOVE: OpcodeCategory.REGISTER,
+    Opcode.JP: OpcodeCategory.CONTROL, Opcode.JPZ: OpcodeCategory.CONTROL,
+}
+
+# Bits de categoría por id de opcode (el id 0 es un opcode desconocido),
+# como enteros simples para comprobarlos con `&` en el ciclo de ejecución
+OPCODE_CATEGORIES: Tuple[int, ...] = tuple(
+    int(_CATEGORIES_BY_OPCODE.get(opcode_id, OpcodeCategory.NONE)) for opcode_id in range(len(Opcode) + 1)
+)
+
+
+def opcode_category(opcode: str) -> OpcodeCategory:
+    """
+    Obtiene las categorías de un opcode.
+    
+    Args:
+        opcode: Código de operación (en mayúsculas)
+        
+    Returns:
+        Bits de categoría (NONE si el opcode no existe)
+    """
+    return OpcodeCategory(OPCODE_CATEGORIES[OPCODE_IDS.get(opcode, 0)])
+
+
+class OperandKind(IntEnum):
+    """Clases de operando reconocidas por el tokenizador."""
+    UNKNOWN = 0
+    REGISTER = 1
+    IMMEDIATE = 2
+    INDIRECT_REGISTER = 3
+    INDIRECT_ADDRESS = 4
+
+
+class OperandToken(NamedTuple):
+    """
+    Operando ya clasificado por el tokenizador.
+    
+    Attributes:
+        kind: Clase del operando
+        text: Texto original del operando
+        value: Número de registro (1-9) o valor entero; None si es UNKNOWN
+    """
+    kind: OperandKind
+    text: str
+    value: Optional[int]
+
+
 class Instruction:
     """
     Representa una instrucción del simulador.
     
+    Las instrucciones son inmutables, de modo que una misma instancia
+    puede compartirse (por ejemplo, desde la caché del parser). Usan
+    __slots__ en lugar de un __dict__: una copia con otra dirección
+    (_replace) solo ocupa sus referencias, y comparte con la original el
+    texto, los operandos y los operandos clasificados.
+    
     Attributes:
         type: Tipo de instrucción (InstructionType)
         operand1: Primer operando (registro o valor)
@@ -41,61 +151,137 @@ class Instruction:
         operand3: Tercer operando (registro, valor o None)
         raw_instruction: Instrucción original como string
         address: Dirección de memoria donde está la instrucción
+        operand_tokens: Operandos clasificados por el parser, con su clase
+            y su valor entero (vacío si se construyó a mano)
+        opcode: Opcode como texto (precalculado)
+        opcode_id: Id numérico del opcode, 0 si no es del repertorio
+            (precalculado)
     """
-    type: Union[str, InstructionType]
-    operand1: Optional[str] = None
-    operand2: Optional[str] = None
-    operand3: Optional[str] = None
-    raw_instruction: str = ""
-    address: int = 0
-    
-    def __post_init__(self):
-        """Validación posterior a la inicialización."""
-        if not self.type:
+    
+    # Campos en el orden del constructor (operand_tokens no se compara)
+    _fields = ('type', 'operand1', 'operand2', 'operand3', 'raw_instruction', 'address', 'operand_tokens')
+    __slots__ = _fields + ('opcode', 'opcode_id')
+    
+    def __init__(self, type: Union[str, InstructionType], operand1: Optional[str] = None,
+                 operand2: Optional[str] = None, operand3: Optional[str] = None,
+                 raw_instruction: str = "", address: int = 0,
+                 operand_tokens: Tuple[OperandToken, ...] = ()):
+        """
+        Crea una instrucción validando su tipo.
+        
+        Raises:
+            InvalidInstructionError: Si el tipo está vacío
+        """
+        if not type:
             raise InvalidInstructionError("Instruction type cannot be empty")
         
         # Handle both InstructionType enum and string
-        if isinstance(self.type, str):
-            self.type = self.type.upper()
-            # Try to convert to InstructionType
-            try:
-                self.type = InstructionType(self.type)
-            except ValueError:
-                # Keep as string if not a valid InstructionType
-                pass
+        if isinstance(type, str):
+            # Convert to InstructionType, keeping the string if it is not one
+            type = _INSTRUCTION_TYPES.get(type.upper(), type.upper())
+        opcode = type.value if isinstance(type, InstructionType) else type
+        
+        setattr_ = object.__setattr__
+        setattr_(self, 'type', type)
+        setattr_(self, 'operand1', operand1)
+        setattr_(self, 'operand2', operand2)
+        setattr_(self, 'operand3', operand3)
+        setattr_(self, 'raw_instruction', raw_instruction)
+        setattr_(self, 'address', address)
+        setattr_(self, 'operand_tokens', operand_tokens)
+        setattr_(self, 'opcode', opcode)
+        setattr_(self, 'opcode_id', OPCODE_IDS.get(opcode, 0))
+    
+    def _replace(self, **changes: Any) -> 'Instruction':
+        """
+        Crea una copia con algunos campos cambiados (como namedtuple._replace).
+        
+        Si no cambia el tipo, la copia reutiliza los demás valores sin
+        volver a validarlos.
+        
+        Raises:
+            ValueError: Si algún campo no existe
+        """
+        if not changes.keys() <= _FIELD_NAMES:
+            unknown = set(changes) - _FIELD_NAMES
+            raise ValueError(f"Got unexpected field names: {', '.join(sorted(unknown))}")
+        if 'type' in changes:
+            return Instruction(**{name: changes.get(name, getattr(self, name)) for name in self._fields})
+        
+        # Copia campo por campo (la reubicación del ensamblador incremental
+        # la usa para cada instrucción desplazada)
+        copy = object.__new__(Instruction)
+        setattr_ = object.__setattr__
+        get = changes.get
+        setattr_(copy, 'type', self.type)
+        setattr_(copy, 'operand1', get('operand1', self.operand1))
+        setattr_(copy, 'operand2', get('operand2', self.operand2))
+        setattr_(copy, 'operand3', get('operand3', self.operand3))
+        setattr_(copy, 'raw_instruction', get('raw_instruction', self.raw_instruction))
+        setattr_(copy, 'address', get('address', self.address))
+        setattr_(copy, 'operand_tokens', get('operand_tokens', self.operand_tokens))
+        setattr_(copy, 'opcode', self.opcode)
+        setattr_(copy, 'opcode_id', self.opcode_id)
+        return copy
+    
+    def _key(self) -> Tuple:
+        """Campos que definen la igualdad (todos salvo operand_tokens)."""
+        return (self.type, self.operand1, self.operand2, self.operand3, self.raw_instruction, self.address)
+    
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._key() == other._key()
+    
+    def __hash__(self) -> int:
+        return hash(self._key())
+    
+    # dataclasses se importa solo al fallar: cargarlo (con inspect) es caro
+    # y casi nunca se usa
+    def __setattr__(self, name: str, value: Any) -> None:
+        from dataclasses import FrozenInstanceError
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+    
+    def __delattr__(self, name: str) -> None:
+        from dataclasses import FrozenInstanceError
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+    
+    def __reduce__(self):
+        """Permite copiar y serializar (pickle) la instrucción inmutable."""
+        return Instruction, tuple(getattr(self, name) for name in self._fields)
+    
+    def __repr__(self) -> str:
+        return (f"Instruction(type={self.type!r}, operand1={self.operand1!r}, operand2={self.operand2!r}, "
+                f"operand3={self.operand3!r}, raw_instruction={self.raw_instruction!r}, address={self.address!r})")
     
     @property
-    def opcode(self) -> str:
-        """Get the opcode as string."""
-        if isinstance(self.type, InstructionType):
-            return self.type.value
-        return self.type
+    def category(self) -> int:
+        """Bits de categoría del opcode (OpcodeCategory)."""
+        return OPCODE_CATEGORIES[self.opcode_id]
     
     def is_arithmetic_operation(self) -> bool:
         """Verifica si es una operación aritmética."""
-        return self.opcode in ['ADD', 'SUB', 'MUL', 'DIV']
+        return bool(self.category & OpcodeCategory.ARITHMETIC)
     
     def is_logical_operation(self) -> bool:
         """Verifica si es una operación lógica."""
-        return self.opcode in ['AND', 'OR', 'NOT', 'XOR']
+        return bool(self.category & OpcodeCategory.LOGICAL)
     
     def is_memory_operation(self) -> bool:
         """Verifica si es una operación de memoria."""
-        return self.opcode in ['LOAD', 'STORE']
+        return bool(self.category & OpcodeCategory.MEMORY)
     
     def is_control_operation(self) -> bool:
         """Verifica si es una operación de control de flujo."""
-        return self.opcode in ['JP', 'JPZ']
+        return bool(self.category & OpcodeCategory.CONTROL)
     
     def is_register_operation(self) -> bool:
         """Verifica si es una operación entre registros."""
-        return self.opcode in ['MOVE']
+        return bool(self.category & OpcodeCategory.REGISTER)
     
     def requires_alu(self) -> bool:
         """Verifica si la instrucción requiere la ALU."""
-        return (self.is_arithmetic_operation() or 
-                self.is_logical_operation() or 
-                self.is_control_operation())
+        return bool(self.category & OpcodeCategory.ALU)
     
     def __str__(self) -> str:
         """Representación string de la instrucción."""
@@ -113,6 +299,10 @@ class Instruction:
             return self.opcode
 
 
+# Campos que acepta Instruction._replace
+_FIELD_NAMES = frozenset(Instruction._fields)
+
+
 class InstructionSet:
     """
     Conjunto de instrucciones válidas del simulador.
@@ -35,9 +35,12 @@ class Observable:
     Clase base para objetos observables en el patrón Observer.
     
     Los objetos observables mantienen una lista de observadores y
-    los notifican cuando su estado cambia.
+    los notifican cuando su estado cambia. Declara __slots__ para que las
+    subclases que también lo hagan (como Register) no necesiten __dict__.
     """
     
+    __slots__ = ('_observers',)
+    
     def __init__(self):
         """Inicializa la lista de observadores."""
         self._observers: List[Observer] = []
@@ -56,6 +59,8 @@ class Observable:
             raise TypeError("Observer cannot be None")
         if observer not in self._observers:
             self._observers.append(observer)
+            if len(self._observers) == 1:
+                self._observed_changed(True)
     
     def remove_observer(self, observer: Observer) -> None:
         """
@@ -66,6 +71,8 @@ class Observable:
         """
         if observer in self._observers:
             self._observers.remove(observer)
+            if not self._observers:
+                self._observed_changed(False)
     
     def notify_observers(self, event_type: str, data: Any = None) -> None:
         """
@@ -87,7 +94,22 @@ class Observable:
     
     def clear_observers(self) -> None:
         """Remueve todos los observadores."""
-        self._observers.clear()
+        if self._observers:
+            self._observers.clear()
+            self._observed_changed(False)
+    
+    def _observed_changed(self, observed: bool) -> None:
+        """
+        Se llama cuando el objeto pasa a tener su primer observador o se
+        queda sin ninguno.
+        
+        Los componentes que solo reenvían los eventos de otros lo usan para
+        suscribirse a ellos mientras alguien los observa: sin observadores,
+        sus fuentes (por ejemplo, un Register) no construyen los eventos.
+        
+        Args:
+            observed: True si ahora tiene observadores
+        """
 
 
 class EventType:
@@ -107,6 +129,8 @@ class EventType:
     MEMORY_DATA_STORED = "memory_data_stored"
     MEMORY_DATA_LOADED = "memory_data_loaded"
     MEMORY_CLEARED = "memory_cleared"
+    MEMORY_BLOCK_LOADED = "memory_block_loaded"
+    MEMORY_BLOCK_STORED = "memory_block_stored"
     
     # Eventos de ALU
     ALU_OPERATION_EXECUTED = "alu_operation_executed"
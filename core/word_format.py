@@ -0,0 +1,133 @@
+"""
+Formato de palabra de la máquina simulada.
+
+Un WordFormat reúne las constantes precalculadas (máscara, bit de signo,
+rango) que usan la ALU, el banco de registros y la memoria para que los
+valores de la máquina tengan un ancho fijo:
+
+- Con 8, 16 o 32 bits los valores son enteros con signo en complemento a
+  dos: los resultados de la ALU y los valores guardados en registros y
+  memoria se truncan al ancho de la palabra, por lo que caben en un
+  array('b'/'h'/'i') o en un dtype de NumPy del mismo ancho.
+- El formato histórico (LEGACY_WORD, el predeterminado) conserva la
+  semántica original del simulador: operandos en [-16384, 16383], carry
+  por encima de 0x3FFF, overflow según el bit 0x2000 y resultados sin
+  truncar.
+"""
+
+from typing import Dict, NamedTuple, Optional
+
+
+# Anchos de palabra fijos admitidos
+WORD_WIDTHS = (8, 16, 32)
+
+# Código de array.array y dtype de NumPy de cada ancho
+_ARRAY_TYPECODES = {8: 'b', 16: 'h', 32: 'i'}
+_NUMPY_DTYPES = {8: 'int8', 16: 'int16', 32: 'int32'}
+
+# Código de array de los bloques de datos con el formato histórico
+_LEGACY_BLOCK_TYPECODE = 'q'
+
+
+class WordFormat(NamedTuple):
+    """
+    Constantes de una palabra de la máquina.
+    
+    Attributes:
+        bits: Ancho de la palabra (None en el formato histórico)
+        min_value: Menor operando que acepta la ALU
+        max_value: Mayor operando que acepta la ALU
+        mask: Máscara de los bits de la palabra
+        sign_bit: Bit de signo (el que usa la detección de overflow)
+        carry_limit: Mayor resultado sin carry (sin signo)
+    """
+    bits: Optional[int]
+    min_value: int
+    max_value: int
+    mask: int
+    sign_bit: int
+    carry_limit: int
+    
+    @classmethod
+    def fixed(cls, bits: int) -> 'WordFormat':
+        """
+        Crea el formato de una palabra con signo de `bits` bits.
+        
+        Args:
+            bits: Ancho de la palabra
+        
+        Returns:
+            Formato con máscara y bit de signo precalculados
+        """
+        sign_bit = 1 << (bits - 1)
+        mask = (1 << bits) - 1
+        return cls(bits, -sign_bit, sign_bit - 1, mask, sign_bit, mask)
+    
+    @property
+    def is_fixed(self) -> bool:
+        """True si los valores se truncan al ancho de la palabra."""
+        return self.bits is not None
+    
+    @property
+    def array_typecode(self) -> Optional[str]:
+        """Código de array.array para guardar palabras (None si no es fijo)."""
+        return _ARRAY_TYPECODES.get(self.bits)
+    
+    @property
+    def block_typecode(self) -> str:
+        """Código de array.array de un bloque de datos (int64 en el formato histórico)."""
+        return _ARRAY_TYPECODES.get(self.bits, _LEGACY_BLOCK_TYPECODE)
+    
+    @property
+    def numpy_dtype(self) -> Optional[str]:
+        """Nombre del dtype de NumPy de la palabra (None si no es fijo)."""
+        return _NUMPY_DTYPES.get(self.bits)
+    
+    def wrap(self, value: int) -> int:
+        """
+        Trunca un entero al ancho de la palabra (complemento a dos).
+        
+        En el formato histórico el valor no cambia.
+        
+        Args:
+            value: Entero a truncar
+        
+        Returns:
+            Valor con signo representable en la palabra
+        """
+        if self.bits is None:
+            return value
+        return ((value + self.sign_bit) & self.mask) - self.sign_bit
+    
+    def in_range(self, value: int) -> bool:
+        """True si la ALU acepta el valor como operando."""
+        return self.min_value <= value <= self.max_value
+    
+    def __str__(self) -> str:
+        return f"{self.bits} bits" if self.bits is not None else "legacy"
+
+
+# Formato original del simulador (rango de 15 bits con signo, sin truncar)
+LEGACY_WORD = WordFormat(None, -16384, 16383, 0x7FFF, 0x2000, 0x3FFF)
+
+_FIXED_FORMATS: Dict[int, WordFormat] = {bits: WordFormat.fixed(bits) for bits in WORD_WIDTHS}
+
+
+def word_format_for(width: Optional[int]) -> WordFormat:
+    """
+    Obtiene el formato de palabra de un ancho.
+    
+    Args:
+        width: 8, 16 o 32 bits (None = formato histórico)
+    
+    Returns:
+        Formato de palabra compartido para ese ancho
+    
+    Raises:
+        ValueError: Si el ancho no está admitido
+    """
+    if width is None:
+        return LEGACY_WORD
+    if width not in _FIXED_FORMATS:
+        raise ValueError(f"Unsupported word width: {width} (expected one of {', '.join(map(str, WORD_WIDTHS))})")
+    return _FIXED_FORMATS[width]
@@ -0,0 +1,195 @@
+"""
+Panel de memoria virtualizado para la vista del simulador.
+
+Este módulo implementa un visor de memoria que solo crea elementos
+gráficos para las filas visibles, de modo que memorias de decenas de
+miles de posiciones siguen siendo fluidas.
+"""
+
+from typing import Any, List, Optional, Set, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from hardware.memory import Memory
+
+
+class MemoryPanel:
+    """
+    Visor de memoria con filas virtualizadas sobre un Canvas.
+    
+    Mantiene un conjunto fijo de elementos de texto (uno por fila visible)
+    y los reutiliza al desplazarse. En cada refresco solo se reescriben las
+    filas visibles cuyas direcciones cambiaron desde el refresco anterior.
+    """
+    
+    ROW_HEIGHT = 18
+    CHAR_WIDTH = 8
+    
+    def __init__(self, canvas, x: int, y: int, width: int, height: int, scrollbar=None):
+        """
+        Inicializa el panel y crea las filas visibles.
+        
+        Args:
+            canvas: Canvas donde se dibujan las filas
+            x: Coordenada x de la esquina superior izquierda
+            y: Coordenada y de la esquina superior izquierda
+            width: Ancho del área de filas
+            height: Alto del área de filas
+            scrollbar: Barra de desplazamiento vertical (opcional)
+        """
+        self._canvas = canvas
+        self._scrollbar = scrollbar
+        self._memory: Optional['Memory'] = None
+        
+        self._visible_rows = max(1, height // self.ROW_HEIGHT)
+        self._max_chars = max(8, width // self.CHAR_WIDTH)
+        self._first_address = 0
+        self._highlight_address: Optional[int] = None
+        self._previous_highlight: Optional[int] = None
+        self._needs_full_render = True
+        
+        # Elementos gráficos reutilizables y último texto dibujado por fila
+        self._row_ids: List[int] = []
+        self._row_texts: List[Optional[str]] = [None] * self._visible_rows
+        for row in range(self._visible_rows):
+            self._row_ids.append(canvas.create_text(
+                x, y + row * self.ROW_HEIGHT, text="", fill="white",
+                anchor="nw", font=("Courier", 10), tags=("memory_row",)
+            ))
+        
+        canvas.tag_bind("memory_row", "<MouseWheel>", self._on_mouse_wheel)
+        canvas.tag_bind("memory_row", "<Button-4>", lambda event: self.scroll(-3))
+        canvas.tag_bind("memory_row", "<Button-5>", lambda event: self.scroll(3))
+    
+    @property
+    def visible_rows(self) -> int:
+        """Número de filas que se dibujan simultáneamente."""
+        return self._visible_rows
+    
+    @property
+    def first_address(self) -> int:
+        """Dirección mostrada en la primera fila visible."""
+        return self._first_address
+    
+    def set_memory(self, memory: 'Memory') -> None:
+        """
+        Asocia la memoria a mostrar.
+        
+        Args:
+            memory: Memoria del modelo
+        """
+        self._memory = memory
+        self._first_address = 0
+        self._needs_full_render = True
+    
+    def scroll(self, delta_rows: int) -> None:
+        """Desplaza la ventana visible un número de filas."""
+        self.jump_to(self._first_address + delta_rows, center=False)
+    
+    def jump_to(self, address: int, center: bool = True) -> None:
+        """
+        Muestra una dirección de memoria.
+        
+        Args:
+            address: Dirección a mostrar
+            center: True para ubicarla en el centro de la ventana visible
+        """
+        if self._memory is None:
+            return
+        
+        if center:
+            address -= self._visible_rows // 2
+        last_first = max(0, self._memory.size - self._visible_rows)
+        first = min(max(0, address), last_first)
+        
+        if first != self._first_address:
+            self._first_address = first
+            self._needs_full_render = True
+            self.refresh()
+    
+    def on_scrollbar(self, action: str, *args) -> None:
+        """Callback para el comando de la barra de desplazamiento."""
+        if self._memory is None:
+            return
+        
+        if action == "moveto":
+            self.jump_to(int(float(args[0]) * self._memory.size), center=False)
+        elif action == "scroll":
+            amount, unit = int(args[0]), args[1]
+            self.scroll(amount * (self._visible_rows if unit == "pages" else 1))
+    
+    def highlight(self, address: Optional[int]) -> None:
+        """
+        Resalta la dirección de la instrucción en curso.
+        
+        Puede llamarse desde el hilo de ejecución: solo guarda la dirección
+        y el dibujo ocurre en el siguiente refresh().
+        """
+        self._highlight_address = address
+    
+    def refresh(self) -> None:
+        """
+        Redibuja las filas visibles que cambiaron desde el último refresco.
+        
+        Debe llamarse desde el hilo de la interfaz gráfica.
+        """
+        if self._memory is None:
+            return
+        
+        changed = self._memory.consume_changed_addresses()
+        first = self._first_address
+        last = first + self._visible_rows
+        
+        highlight = self._highlight_address
+        if highlight != self._previous_highlight:
+            changed = self._add_highlight_rows(changed, highlight)
+            self._previous_highlight = highlight
+        
+        if changed is None or self._needs_full_render:
+            self._needs_full_render = False
+            rows = range(self._visible_rows)
+        else:
+            rows = [address - first for address in changed if first <= address < last]
+        
+        for row in rows:
+            self._render_row(row)
+        
+        if self._scrollbar is not None and rows:
+            size = self._memory.size
+            self._scrollbar.set(first / size, min(last, size) / size)
+    
+    def _add_highlight_rows(self, changed: Optional[Set[int]], highlight: Optional[int]) -> Optional[Set[int]]:
+        """Incluye en los cambios las filas cuyo resaltado cambió."""
+        if changed is None:
+            return None
+        changed = set(changed)
+        for address in (self._previous_highlight, highlight):
+            if address is not None:
+                changed.add(address)
+        return changed
+    
+    def _render_row(self, row: int) -> None:
+        """Dibuja una fila si su contenido cambió."""
+        address = self._first_address + row
+        if address < self._memory.size:
+            text = self._format_cell(address, self._memory.peek(address))
+        else:
+            text = ""
+        
+        if address == self._highlight_address:
+            text = "▶" + text[1:]
+        
+        if self._row_texts[row] != text:
+            self._row_texts[row] = text
+            self._canvas.itemconfig(self._row_ids[row], text=text)
+    
+    def _format_cell(self, address: int, content: Any) -> str:
+        """Formatea el contenido de una dirección para mostrarlo."""
+        section = "I" if address < self._memory.instruction_size else "D"
+        text = f" {address:>5} {section} {content}"
+        if len(text) > self._max_chars:
+            text = text[:self._max_chars - 1] + "…"
+        return text
+    
+    def _on_mouse_wheel(self, event) -> None:
+        """Desplaza la ventana con la rueda del ratón."""
+        self.scroll(-3 if event.delta > 0 else 3)
@@ -5,12 +5,25 @@ Este módulo implementa el controlador que coordina
 la comunicación entre el modelo y la vista.
 """
 
-from typing import List
+from typing import AbstractSet, Dict, List, Optional, Set
 import threading
 import time
 from core.computer import Computer
 from core.exceptions import *
 from gui.simulator_view import SimulatorView
+from utils.assembler import AssemblyReport, IncrementalAssembler, get_shared_assembler
+from utils.optimizer import PeepholeOptimizer
+
+
+# Niveles de velocidad: (nombre, segundos entre instrucciones animadas).
+# Un retardo de 0 ejecuta sin límite, a la velocidad del motor.
+SPEED_LEVELS = (
+    ("Lenta", 1.5),
+    ("Normal", 0.75),
+    ("Rápida", 0.25),
+    ("Muy rápida", 0.05),
+    ("Sin límite", 0.0),
+)
 
 
 class SimulatorController:
@@ -32,15 +45,31 @@ class SimulatorController:
         self._view = view
         self._computer = computer
         
+        # Estado del controlador
+        self._is_executing = False
+        self._execution_thread = None
+        
+        # Velocidad y puntos de ruptura
+        self._speed_index = 0
+        self._breakpoints: Set[int] = set()
+        # Las condiciones se reemplazan completas (copia al escribir) porque el
+        # hilo de ejecución las recorre mientras la interfaz las edita
+        self._register_conditions: Dict[str, AbstractSet[int]] = {}
+        
+        # Ensamblado incremental del editor (compartido con el hilo de ejecución)
+        self._incremental_assembler = IncrementalAssembler()
+        self._assembler_lock = threading.Lock()
+        
+        # Optimización de mirilla: desactivada por defecto (modo docente),
+        # para que se ejecute exactamente el programa escrito
+        self._optimizer: Optional[PeepholeOptimizer] = None
+        
         # Configurar observadores
         self._computer.add_observer(self._view)
+        self._view.set_memory_source(self._computer.memory)
         
         # Configurar callbacks de la vista
         self._setup_view_callbacks()
-        
-        # Estado del controlador
-        self._is_executing = False
-        self._execution_thread = None
     
     def _setup_view_callbacks(self) -> None:
         """Configura los callbacks de la vista."""
@@ -48,6 +77,11 @@ class SimulatorController:
         self._view.set_execute_program_callback(self.execute_program)
         self._view.set_step_execution_callback(self.step_execution)
         self._view.set_reset_callback(self.reset_system)
+        self._view.set_speed_callback(self.cycle_execution_speed)
+        self._view.set_toggle_breakpoint_callback(self.toggle_breakpoint_at_line)
+        self._view.set_register_condition_callback(self.set_register_conditions_from_text)
+        self._view.set_program_changed_callback(self.check_program)
+        self._view.set_speed_label(self.execution_speed_name)
     
     def load_program(self) -> None:
         """
@@ -61,18 +95,19 @@ class SimulatorController:
                 self._view.show_error("Error", "Por favor ingrese un programa")
                 return
             
-            # Dividir en líneas
-            program_lines = [line.strip() for line in program_text.split('\n') if line.strip()]
+            # Solo se reensamblan las líneas que cambiaron desde la última vez
+            report = self._assemble_editor_program()
+            self._view.mark_error_lines(report.errors)
             
-            if not program_lines:
+            # Cargar en el modelo
+            success = self._computer.load_assembled_program(self._require_program(report))
+            
+            if success and not self._computer.loaded_program:
                 self._view.show_error("Error", "El programa no contiene instrucciones válidas")
                 return
             
-            # Cargar en el modelo
-            success = self._computer.load_program(program_lines)
-            
             if success:
-                self._view.show_info("Éxito", f"Programa cargado exitosamente\\n{len(program_lines)} instrucciones")
+                self._view.show_info("Éxito", f"Programa cargado exitosamente\\n{len(self._computer.loaded_program)} instrucciones")
             
         except MemoryOverflowError as e:
             self._view.show_error("Error de Memoria", str(e))
@@ -110,25 +145,42 @@ class SimulatorController:
     def _execute_program_thread(self) -> None:
         """
         Ejecuta el programa en un hilo separado con animaciones.
+        
+        Si hay puntos de ruptura (o la velocidad es "Sin límite") el modelo
+        corre a la velocidad del motor, sin la vista como observadora, hasta
+        alcanzar uno; a partir de ahí continúa paso a paso con animación.
         """
         try:
             # Resetear antes de ejecutar
             self._computer.reset()
             
-            # Recargar el programa
-            program_lines = [line.strip() for line in self._view.get_program_text().split('\n') if line.strip()]
-            self._computer.load_program(program_lines)
+            # Recargar el programa (sin cambios en el editor no se reparsea nada)
+            report = self._assemble_editor_program()
+            self._computer.load_assembled_program(self._require_program(report))
+            
+            program_size = len(self._computer.loaded_program)
+            pc_register = self._computer.pc_register
+            
+            fast_forward = self.has_breakpoints() or self.execution_delay == 0
+            if fast_forward:
+                hit = self._run_until_breakpoint(program_size)
+                self._view.root.after(0, self._refresh_view_after_fast_forward)
+                if hit is not None:
+                    self._view.root.after(0, lambda: self._view.show_status(
+                        f"Punto de ruptura alcanzado en PC = {hit}"))
             
             # Ejecutar paso a paso con delays para visualización
-            while self._computer.pc_register.value < len(self._computer.loaded_program):
+            while pc_register.value < program_size:
                 if not self._is_executing:  # Permitir cancelación
                     break
                 
                 # Ejecutar siguiente instrucción
                 self._computer.execute_next_instruction()
                 
-                # Delay para visualización
-                time.sleep(1.5)  # 1.5 segundos entre instrucciones
+                # Delay para visualización (leído en cada ciclo para reflejar cambios de velocidad)
+                delay = self.execution_delay
+                if delay:
+                    time.sleep(delay)
             
             self._is_executing = False
             
@@ -139,6 +191,115 @@ class SimulatorController:
             # Programar mostrar error en el hilo principal
             self._view.root.after(0, lambda: self._view.show_error("Error de Ejecución", error_message))
     
+    def check_program(self) -> AssemblyReport:
+        """
+        Revalida el programa del editor y marca las líneas con errores.
+        
+        Se invoca cuando el usuario deja de escribir; solo se vuelven a
+        analizar las líneas que cambiaron desde la validación anterior.
+        
+        Returns:
+            Reporte del ensamblado incremental
+        """
+        report = self._assemble_editor_program()
+        self._view.mark_error_lines(report.errors)
+        
+        if report.errors:
+            line_number = min(report.errors)
+            self._view.show_status(f"Línea {line_number}: {report.errors[line_number]}")
+        else:
+            self._view.show_status(f"Programa válido: {len(report.program)} instrucciones")
+        return report
+    
+    def _assemble_editor_program(self) -> AssemblyReport:
+        """Ensambla el texto del editor reutilizando el ensamblado anterior."""
+        # Se conservan todas las líneas para que cada dirección se asocie a
+        # su línea del editor
+        program_lines = self._view.get_program_text().split('\n')
+        with self._assembler_lock:
+            return self._incremental_assembler.update(program_lines)
+    
+    def _require_program(self, report: AssemblyReport):
+        """
+        Obtiene el programa de un reporte de ensamblado (optimizado si la
+        optimización está activada).
+        
+        Raises:
+            AssemblyError: Con el error de la primera línea inválida
+        """
+        if report.errors:
+            line_number = min(report.errors)
+            raise AssemblyError(report.errors[line_number], line_number)
+        if self._optimizer is None:
+            return report.program
+        program, _ = self._optimizer.optimize(report.program)
+        return program
+    
+    @property
+    def optimization_enabled(self) -> bool:
+        """True si los programas se optimizan antes de cargarlos."""
+        return self._optimizer is not None
+    
+    def set_optimization_enabled(self, enabled: bool) -> None:
+        """
+        Activa o desactiva el optimizador de mirilla.
+        
+        Con la optimización activada el PSW, el MBR y los ciclos pueden
+        diferir de los del programa escrito; el modo docente la desactiva.
+        
+        Args:
+            enabled: True para optimizar los programas al cargarlos
+        """
+        self._optimizer = PeepholeOptimizer() if enabled else None
+    
+    def _run_until_breakpoint(self, program_size: int) -> Optional[int]:
+        """
+        Ejecuta sin animación hasta alcanzar un punto de ruptura o el final.
+        
+        La vista se desconecta del modelo durante el avance rápido para que
+        cada ciclo no genere actualizaciones gráficas.
+        
+        Args:
+            program_size: Número de instrucciones del programa cargado
+            
+        Returns:
+            PC del punto de ruptura alcanzado, o None si el programa terminó
+        """
+        computer = self._computer
+        pc_register = computer.pc_register
+        register_bank = computer.register_bank
+        breakpoints = self._breakpoints
+        
+        computer.remove_observer(self._view)
+        try:
+            while self._is_executing:
+                pc = pc_register.value
+                if pc >= program_size:
+                    return None
+                if pc in breakpoints:
+                    return pc
+                # Se lee en cada ciclo: la interfaz reemplaza el diccionario
+                # completo (nunca lo modifica) mientras este hilo lo recorre
+                conditions = self._register_conditions
+                if conditions and self._register_condition_hit(register_bank, conditions):
+                    return pc
+                computer.execute_next_instruction()
+            return None
+        finally:
+            computer.add_observer(self._view)
+    
+    @staticmethod
+    def _register_condition_hit(register_bank, conditions: Dict[str, AbstractSet[int]]) -> bool:
+        """Verifica si algún registro tiene uno de los valores de ruptura."""
+        for reg_name, values in conditions.items():
+            if register_bank.get(reg_name) in values:
+                return True
+        return False
+    
+    def _refresh_view_after_fast_forward(self) -> None:
+        """Sincroniza la vista con el estado del modelo tras el avance rápido."""
+        self._view.display_system_state(self._computer.get_system_state())
+    
     def step_execution(self) -> None:
         """
         Ejecuta la siguiente instrucción paso a paso.
@@ -184,6 +345,7 @@ class SimulatorController:
             
             # Limpiar la vista
             self._view.clear_program_text()
+            self._view.mark_error_lines({})
             
             self._view.show_info("Información", "Sistema reseteado exitosamente")
             
@@ -201,6 +363,155 @@ class SimulatorController:
             if self._execution_thread and self._execution_thread.is_alive():
                 self._execution_thread.join(timeout=2.0)
     
+    # Control de velocidad
+    @property
+    def execution_delay(self) -> float:
+        """Segundos de espera entre instrucciones animadas."""
+        return SPEED_LEVELS[self._speed_index][1]
+    
+    @property
+    def execution_speed_name(self) -> str:
+        """Nombre del nivel de velocidad actual."""
+        return SPEED_LEVELS[self._speed_index][0]
+    
+    def set_execution_speed(self, level: int) -> None:
+        """
+        Establece el nivel de velocidad de ejecución.
+        
+        Args:
+            level: Índice en SPEED_LEVELS (0 = más lenta)
+            
+        Raises:
+            ValueError: Si el nivel no existe
+        """
+        if not 0 <= level < len(SPEED_LEVELS):
+            raise ValueError(f"Speed level must be in [0, {len(SPEED_LEVELS) - 1}]")
+        self._speed_index = level
+        self._view.set_speed_label(self.execution_speed_name)
+    
+    def cycle_execution_speed(self) -> None:
+        """Avanza al siguiente nivel de velocidad (vuelve al primero tras el último)."""
+        self.set_execution_speed((self._speed_index + 1) % len(SPEED_LEVELS))
+    
+    # Puntos de ruptura
+    def add_breakpoint(self, address: int) -> None:
+        """Agrega un punto de ruptura en una dirección de instrucción."""
+        self._breakpoints.add(address)
+    
+    def remove_breakpoint(self, address: int) -> None:
+        """Elimina un punto de ruptura si existe."""
+        self._breakpoints.discard(address)
+    
+    def toggle_breakpoint(self, address: int) -> bool:
+        """
+        Activa o desactiva un punto de ruptura.
+        
+        Returns:
+            True si el punto de ruptura quedó activo
+        """
+        if address in self._breakpoints:
+            self._breakpoints.discard(address)
+            return False
+        self._breakpoints.add(address)
+        return True
+    
+    def toggle_breakpoint_at_line(self, line_number: int) -> None:
+        """
+        Activa o desactiva el punto de ruptura de una línea del editor.
+        
+        Args:
+            line_number: Línea del editor (comenzando en 1)
+        """
+        lines = self._view.get_program_text().split('\n')
+        
+        # La dirección sale del mapa de líneas del ensamblador (ignora
+        # comentarios, líneas vacías, etiquetas sueltas y directivas)
+        try:
+            source_map = get_shared_assembler().map_source_lines(lines)
+        except AssemblyError:
+            return
+        if line_number not in source_map:
+            return
+        
+        address = source_map.index(line_number)
+        active = self.toggle_breakpoint(address)
+        self._view.mark_breakpoint_line(line_number, active)
+    
+    def clear_breakpoints(self) -> None:
+        """Elimina todos los puntos de ruptura y condiciones."""
+        self._breakpoints.clear()
+        self._register_conditions = {}
+        self._view.clear_breakpoint_marks()
+    
+    @property
+    def breakpoints(self) -> Set[int]:
+        """Obtiene las direcciones con punto de ruptura."""
+        return set(self._breakpoints)
+    
+    def add_register_condition(self, reg_name: str, value: int) -> None:
+        """
+        Agrega una condición de ruptura sobre el valor de un registro.
+        
+        Args:
+            reg_name: Nombre del registro (R1-R9)
+            value: Valor que detiene el avance rápido
+            
+        Raises:
+            RegisterNotFoundError: Si el registro no existe
+        """
+        if not self._computer.register_bank.exists(reg_name):
+            raise RegisterNotFoundError(f"Register {reg_name} not found")
+        conditions = dict(self._register_conditions)
+        conditions[reg_name] = conditions.get(reg_name, frozenset()) | {value}
+        self._register_conditions = conditions
+    
+    def remove_register_condition(self, reg_name: str, value: int) -> None:
+        """Elimina una condición de ruptura sobre un registro."""
+        values = self._register_conditions.get(reg_name)
+        if values is None or value not in values:
+            return
+        conditions = dict(self._register_conditions)
+        values = values - {value}
+        if values:
+            conditions[reg_name] = values
+        else:
+            del conditions[reg_name]
+        self._register_conditions = conditions
+    
+    @property
+    def register_conditions(self) -> Dict[str, Set[int]]:
+        """Obtiene las condiciones de ruptura por registro."""
+        return {name: set(values) for name, values in self._register_conditions.items()}
+    
+    def set_register_conditions_from_text(self, text: str) -> None:
+        """
+        Reemplaza las condiciones de ruptura a partir de texto.
+        
+        Formato: condiciones separadas por coma, por ejemplo "R1=0, R3=10".
+        
+        Args:
+            text: Texto ingresado por el usuario
+        """
+        conditions: Dict[str, Set[int]] = {}
+        try:
+            for part in text.split(','):
+                if not part.strip():
+                    continue
+                reg_name, _, value = part.partition('=')
+                reg_name = reg_name.strip().upper()
+                if not self._computer.register_bank.exists(reg_name):
+                    raise RegisterNotFoundError(f"Register {reg_name} not found")
+                conditions.setdefault(reg_name, set()).add(int(value.strip()))
+        except (ValueError, SimulatorError) as e:
+            self._view.show_error("Error de Condición", f"Condición inválida '{text}': {e}")
+            return
+        
+        self._register_conditions = conditions
+    
+    def has_breakpoints(self) -> bool:
+        """Verifica si hay puntos de ruptura o condiciones activas."""
+        return bool(self._breakpoints or self._register_conditions)
+    
     def get_system_state(self) -> dict:
         """
         Obtiene el estado actual del sistema.
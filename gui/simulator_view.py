@@ -5,10 +5,12 @@ Este módulo implementa la interfaz gráfica del simulador
 separando la presentación de la lógica de negocio.
 """
 
+import time
 import tkinter as tk
 from tkinter import Canvas, Text, messagebox
 from typing import Dict, Any, Optional
 from core.observer import Observer, EventType
+from gui.memory_panel import MemoryPanel
 
 
 class SimulatorView(Observer):
@@ -19,6 +21,13 @@ class SimulatorView(Observer):
     del modelo usando el patrón Observer.
     """
     
+    # Intervalo del temporizador único de refresco y animación (ms)
+    TICK_MS = 50
+    # Duración del resaltado de un bus activado (s)
+    BUS_HIGHLIGHT_SECONDS = 0.5
+    # Espera tras la última tecla antes de revalidar el programa (ms)
+    EDIT_DEBOUNCE_MS = 300
+    
     def __init__(self, root: tk.Tk):
         """
         Inicializa la vista del simulador.
@@ -30,7 +39,7 @@ class SimulatorView(Observer):
         
         # Referencias a elementos gráficos para actualización
         self._register_displays: Dict[str, int] = {}
-        self._memory_text_id: Optional[int] = None
+        self._memory_panel: Optional[MemoryPanel] = None
         self._control_signals_displays: Dict[str, int] = {}
         
         # Referencias a buses para animación
@@ -38,11 +47,21 @@ class SimulatorView(Observer):
         self._bus_data_id: Optional[int] = None
         self._bus_control_id: Optional[int] = None
         
+        # Instante (time.monotonic) en que expira el resaltado de cada bus activo
+        self._bus_expiry: Dict[int, float] = {}
+        
         # Callback para comunicación con el controlador
         self._on_load_program_callback = None
         self._on_execute_program_callback = None
         self._on_step_execution_callback = None
         self._on_reset_callback = None
+        self._on_speed_callback = None
+        self._on_toggle_breakpoint_callback = None
+        self._on_register_condition_callback = None
+        self._on_program_changed_callback = None
+        
+        # Revalidación pendiente del programa editado (id de root.after)
+        self._program_check_id = None
         
         # Configurar ventana y crear widgets
         self._setup_window()
@@ -122,6 +141,34 @@ class SimulatorView(Observer):
             width=15
         )
         
+        self.speed_button = tk.Button(
+            button_frame,
+            text="Velocidad: Lenta",
+            command=self._on_speed,
+            bg="#8A2BE2",
+            fg="white",
+            font=("Arial", 12, "bold"),
+            width=18
+        )
+        
+        self.condition_button = tk.Button(
+            button_frame,
+            text="Condiciones",
+            command=self._on_register_condition,
+            bg="#1E90FF",
+            fg="white",
+            font=("Arial", 12, "bold"),
+            width=12
+        )
+        
+        # Doble clic en una línea del programa activa/desactiva un punto de ruptura
+        self.text_widget.tag_configure("breakpoint", background="#FF6347")
+        self.text_widget.bind("<Double-Button-1>", self._on_text_double_click)
+        
+        # Las líneas con errores de ensamblado se marcan mientras se escribe
+        self.text_widget.tag_configure("assembly_error", background="#FFB6B6", underline=True)
+        self.text_widget.bind("<KeyRelease>", self._on_text_edited)
+        
         # Label para estado del sistema
         self.status_label = tk.Label(
             self.root,
@@ -158,6 +205,8 @@ class SimulatorView(Observer):
         self.execute_button.pack(side=tk.LEFT, padx=5)
         self.step_button.pack(side=tk.LEFT, padx=5)
         self.reset_button.pack(side=tk.LEFT, padx=5)
+        self.speed_button.pack(side=tk.LEFT, padx=5)
+        self.condition_button.pack(side=tk.LEFT, padx=5)
         
         # Estado del sistema
         self.status_label.pack(pady=5)
@@ -167,6 +216,9 @@ class SimulatorView(Observer):
         
         # Crear elementos gráficos en el canvas
         self._create_hardware_visualization()
+        
+        # Un único temporizador periódico refresca memoria y animaciones
+        self._tick()
     
     def _create_hardware_visualization(self) -> None:
         """Crea la visualización de los componentes de hardware."""
@@ -246,24 +298,27 @@ class SimulatorView(Observer):
         # Rectángulo principal de memoria
         self.canvas.create_rectangle(630, 40, 990, 480, outline="white", width=2)
         
-        # Línea divisoria entre instrucciones y datos
-        self.canvas.create_line(810, 40, 810, 480, fill="white", width=2)
-        
         # Títulos
         self.canvas.create_text(
             810, 20, text="Memoria Principal", fill="white", font=("Arial", 12, "bold")
         )
         self.canvas.create_text(
-            720, 60, text="Instrucciones", fill="white", font=("Arial", 11, "bold")
+            650, 50, text="Dir.  I=Instrucción  D=Dato", fill="white", anchor="nw",
+            font=("Arial", 9, "bold")
         )
-        self.canvas.create_text(
-            900, 60, text="Datos", fill="white", font=("Arial", 11, "bold")
+        jump_id = self.canvas.create_text(
+            975, 50, text="Ir a…", fill="#FFD700", anchor="ne",
+            font=("Arial", 9, "bold underline")
         )
+        self.canvas.tag_bind(jump_id, "<Button-1>", lambda event: self._on_memory_jump())
         
-        # Área de texto para mostrar contenido
-        self._memory_text_id = self.canvas.create_text(
-            650, 80, text="", fill="white", anchor="nw", font=("Arial", 10), width=150
+        # Barra de desplazamiento y filas virtualizadas (solo las visibles existen)
+        self.memory_scrollbar = tk.Scrollbar(self.canvas, orient=tk.VERTICAL)
+        self.canvas.create_window(992, 40, window=self.memory_scrollbar, anchor="nw", height=440)
+        self._memory_panel = MemoryPanel(
+            self.canvas, 645, 72, 340, 400, scrollbar=self.memory_scrollbar
         )
+        self.memory_scrollbar.config(command=self._memory_panel.on_scrollbar)
     
     def _create_bus_visualization(self) -> None:
         """Crea la visualización de los buses."""
@@ -376,9 +431,11 @@ class SimulatorView(Observer):
                 )
     
     def _update_memory_display(self, data: Dict[str, Any]) -> None:
-        """Actualiza la visualización de la memoria."""
-        # Esta implementación se puede expandir para mostrar contenido específico
-        pass
+        """Resalta en el panel de memoria la instrucción leída."""
+        event_data = data.get('data') or {}
+        if 'instruction' in event_data and self._memory_panel:
+            # Solo las lecturas (fetch) traen 'instruction'; el dibujo ocurre en el refresco
+            self._memory_panel.highlight(event_data['address'])
     
     def _update_alu_display(self, data: Dict[str, Any]) -> None:
         """Actualiza la visualización de la ALU."""
@@ -418,11 +475,36 @@ class SimulatorView(Observer):
                         fill=color
                     )
     
+    def _tick(self) -> None:
+        """
+        Temporizador periódico de la vista (hilo de la GUI).
+        
+        Refresca el panel de memoria y apaga los buses cuyo resaltado expiró,
+        en lugar de programar un callback after() por cada evento.
+        """
+        if self._memory_panel:
+            self._memory_panel.refresh()
+        
+        if self._bus_expiry:
+            now = time.monotonic()
+            for bus_id in list(self._bus_expiry):
+                if self._bus_expiry.get(bus_id, now) <= now:
+                    del self._bus_expiry[bus_id]
+                    self._reset_bus_color(bus_id)
+        
+        self.root.after(self.TICK_MS, self._tick)
+    
     def _animate_bus(self, bus_id: int, color: str) -> None:
-        """Anima un bus cambiando su color temporalmente."""
+        """
+        Anima un bus cambiando su color temporalmente.
+        
+        Si el bus ya está resaltado solo se extiende su expiración; el
+        temporizador de _tick() restaura el color cuando vence.
+        """
         if bus_id:
-            self.canvas.itemconfig(bus_id, outline=color, width=3)
-            self.root.after(500, lambda: self._reset_bus_color(bus_id))
+            if bus_id not in self._bus_expiry:
+                self.canvas.itemconfig(bus_id, outline=color, width=3)
+            self._bus_expiry[bus_id] = time.monotonic() + self.BUS_HIGHLIGHT_SECONDS
     
     def _reset_bus_color(self, bus_id: int) -> None:
         """Resetea el color de un bus."""
@@ -448,13 +530,18 @@ class SimulatorView(Observer):
             elif reg_name == "PSW":
                 self.canvas.itemconfig(display_id, text="PSW: Z: 0, C: 0, S: 0, O: 0")
         
+        # Apagar buses resaltados
+        for bus_id in list(self._bus_expiry):
+            self._reset_bus_color(bus_id)
+        self._bus_expiry.clear()
+        
         # Resetear señales de control
         for signal_name, display_id in self._control_signals_displays.items():
             self.canvas.itemconfig(display_id, text=f"{signal_name}: Off", fill="red")
         
-        # Resetear memoria
-        if self._memory_text_id:
-            self.canvas.itemconfig(self._memory_text_id, text="")
+        # Resetear memoria (el contenido se redibuja en el siguiente refresco)
+        if self._memory_panel:
+            self._memory_panel.highlight(None)
         
         self._update_status("Sistema reseteado")
     
@@ -462,9 +549,82 @@ class SimulatorView(Observer):
         """Actualiza el estado del sistema."""
         self.status_label.config(text=message)
     
+    def show_status(self, message: str) -> None:
+        """Muestra un mensaje en la barra de estado."""
+        self._update_status(message)
+    
+    def display_system_state(self, state: Dict[str, Any]) -> None:
+        """
+        Actualiza todos los registros visibles a partir del estado del modelo.
+        
+        Se usa tras ejecutar sin la vista como observadora.
+        
+        Args:
+            state: Estado devuelto por Computer.get_system_state()
+        """
+        values = {
+            "PC": state['pc'],
+            "MAR": state['mar'],
+            "IR": state['ir'],
+            "MBR": state['mbr'],
+            "ALU": state['alu_value'],
+        }
+        values.update(state['registers'])
+        
+        for reg_name, value in values.items():
+            if reg_name in self._register_displays:
+                self.canvas.itemconfig(self._register_displays[reg_name], text=f"{reg_name}: {value}")
+        
+        self._update_psw_display({'data': {'psw': state['psw']}})
+    
+    def set_memory_source(self, memory) -> None:
+        """
+        Asocia la memoria del modelo al panel de memoria.
+        
+        Args:
+            memory: Memoria del modelo (Computer.memory)
+        """
+        if self._memory_panel:
+            self._memory_panel.set_memory(memory)
+    
+    def set_speed_label(self, speed_name: str) -> None:
+        """Muestra el nivel de velocidad actual en su botón."""
+        self.speed_button.config(text=f"Velocidad: {speed_name}")
+    
+    def mark_breakpoint_line(self, line_number: int, active: bool) -> None:
+        """
+        Resalta o quita el resaltado de una línea con punto de ruptura.
+        
+        Args:
+            line_number: Línea del editor (comenzando en 1)
+            active: True para resaltar la línea
+        """
+        start = f"{line_number}.0"
+        end = f"{line_number}.end"
+        if active:
+            self.text_widget.tag_add("breakpoint", start, end)
+        else:
+            self.text_widget.tag_remove("breakpoint", start, end)
+    
+    def clear_breakpoint_marks(self) -> None:
+        """Quita el resaltado de todos los puntos de ruptura."""
+        self.text_widget.tag_remove("breakpoint", "1.0", tk.END)
+    
+    def mark_error_lines(self, errors: Dict[int, str]) -> None:
+        """
+        Resalta las líneas del editor con errores de ensamblado.
+        
+        Args:
+            errors: Mensaje de error de cada línea (comenzando en 1)
+        """
+        self.text_widget.tag_remove("assembly_error", "1.0", tk.END)
+        for line_number in errors:
+            self.text_widget.tag_add("assembly_error", f"{line_number}.0", f"{line_number}.end")
+    
     def get_program_text(self) -> str:
         """Obtiene el texto del programa ingresado."""
-        return self.text_widget.get("1.0", tk.END).strip()
+        # Solo se eliminan espacios finales para conservar la numeración de líneas
+        return self.text_widget.get("1.0", tk.END).rstrip()
     
     def clear_program_text(self) -> None:
         """Limpia el área de texto del programa."""
@@ -495,6 +655,22 @@ class SimulatorView(Observer):
         """Configura el callback para resetear."""
         self._on_reset_callback = callback
     
+    def set_speed_callback(self, callback) -> None:
+        """Configura el callback para cambiar la velocidad de ejecución."""
+        self._on_speed_callback = callback
+    
+    def set_toggle_breakpoint_callback(self, callback) -> None:
+        """Configura el callback para activar/desactivar puntos de ruptura."""
+        self._on_toggle_breakpoint_callback = callback
+    
+    def set_register_condition_callback(self, callback) -> None:
+        """Configura el callback para definir condiciones sobre registros."""
+        self._on_register_condition_callback = callback
+    
+    def set_program_changed_callback(self, callback) -> None:
+        """Configura el callback invocado cuando el usuario deja de editar el programa."""
+        self._on_program_changed_callback = callback
+    
     # Métodos de eventos internos
     def _on_load_program(self) -> None:
         """Maneja el evento de cargar programa."""
@@ -514,4 +690,59 @@ class SimulatorView(Observer):
     def _on_reset(self) -> None:
         """Maneja el evento de resetear."""
         if self._on_reset_callback:
-            self._on_reset_callback()
\ No newline at end of file
+            self._on_reset_callback()
+    
+    def _on_speed(self) -> None:
+        """Maneja el evento de cambiar la velocidad."""
+        if self._on_speed_callback:
+            self._on_speed_callback()
+    
+    def _on_text_edited(self, event=None) -> None:
+        """
+        Maneja una tecla en el editor del programa.
+        
+        La revalidación se pospone hasta que el usuario deja de escribir
+        EDIT_DEBOUNCE_MS milisegundos, para no reensamblar en cada tecla.
+        """
+        if self._on_program_changed_callback is None:
+            return
+        if self._program_check_id is not None:
+            self.root.after_cancel(self._program_check_id)
+        self._program_check_id = self.root.after(self.EDIT_DEBOUNCE_MS, self._on_program_changed)
+    
+    def _on_program_changed(self) -> None:
+        """Notifica al controlador que el programa del editor cambió."""
+        self._program_check_id = None
+        if self._on_program_changed_callback:
+            self._on_program_changed_callback()
+    
+    def _on_text_double_click(self, event) -> str:
+        """Maneja el doble clic sobre una línea del programa."""
+        if self._on_toggle_breakpoint_callback:
+            index = self.text_widget.index(f"@{event.x},{event.y}")
+            self._on_toggle_breakpoint_callback(int(index.split('.')[0]))
+        return "break"
+    
+    def _on_register_condition(self) -> None:
+        """Solicita condiciones de ruptura sobre registros (ej: "R1=0, R3=10")."""
+        if not self._on_register_condition_callback:
+            return
+        
+        from tkinter import simpledialog
+        text = simpledialog.askstring(
+            "Condiciones de ruptura",
+            "Detener cuando un registro tome un valor (ej: R1=0, R3=10).\n"
+            "Deje vacío para eliminar las condiciones:",
+            parent=self.root
+        )
+        if text is not None:
+            self._on_register_condition_callback(text)
+    
+    def _on_memory_jump(self) -> None:
+        """Solicita una dirección y desplaza el panel de memoria hasta ella."""
+        from tkinter import simpledialog
+        address = simpledialog.askinteger(
+            "Ir a dirección", "Dirección de memoria:", parent=self.root, minvalue=0
+        )
+        if address is not None and self._memory_panel:
+            self._memory_panel.jump_to(address)
@@ -5,12 +5,27 @@ Este módulo contiene todos los componentes de hardware
 del simulador refactorizados con el patrón Observer.
 """
 
-from .register import Register
-from .register_bank import RegisterBank
-from .alu import ALU
-from .memory import Memory
-from .control_unit import ControlUnit
-from .wired_control_unit import WiredControlUnit
+import importlib
+
+# Módulo de cada componente: se importan bajo demanda para que importar un
+# componente (como hace core.computer con hardware.memory) no cargue los demás
+_COMPONENT_MODULES = {
+    'Register': 'register',
+    'RegisterBank': 'register_bank',
+    'ALU': 'alu',
+    'Memory': 'memory',
+    'ControlUnit': 'control_unit',
+    'WiredControlUnit': 'wired_control_unit'
+}
+
+
+def __getattr__(name):
+    """Importa los componentes bajo demanda."""
+    module = _COMPONENT_MODULES.get(name)
+    if module is not None:
+        return getattr(importlib.import_module(f'.{module}', __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'Register',
@@ -19,4 +34,4 @@ __all__ = [
     'Memory',
     'ControlUnit',
     'WiredControlUnit'
-]
\ No newline at end of file
+]
@@ -5,9 +5,207 @@ Este módulo implementa la Unidad Aritmético-Lógica que notifica
 cambios de estado y resultados de operaciones.
 """
 
-from typing import Any, Dict
+import operator
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 from core.observer import Observable, EventType
 from core.exceptions import ALUOperationError, OperandOutOfRangeError
+from core.instruction import OPCODE_IDS, OPCODES_BY_ID
+from core.word_format import LEGACY_WORD, WordFormat
+
+
+def _detect_add_overflow(operand1: int, operand2: int, result: int) -> bool:
+    """Detecta overflow en suma."""
+    return ((operand1 & 0x2000) == (operand2 & 0x2000)) and \
+           ((result & 0x2000) != (operand1 & 0x2000))
+
+
+def _detect_sub_overflow(operand1: int, operand2: int, result: int) -> bool:
+    """Detecta overflow en resta."""
+    return ((operand1 & 0x2000) != (operand2 & 0x2000)) and \
+           ((result & 0x2000) != (operand1 & 0x2000))
+
+
+# Manejadores por opcode: cada uno devuelve (resultado, Z, C, S, O)
+def _add(operand1: int, operand2: int) -> Tuple[int, int, int, int, int]:
+    """Suma: C si el resultado excede 0x3FFF, O por desborde."""
+    value = operand1 + operand2
+    return (value, int(value == 0), int(value > 0x3FFF), int(value < 0),
+            int(_detect_add_overflow(operand1, operand2, value)))
+
+
+def _sub(operand1: int, operand2: int) -> Tuple[int, int, int, int, int]:
+    """Resta: C si hay préstamo, O por desborde."""
+    value = operand1 - operand2
+    return (value, int(value == 0), int(operand1 < operand2), int(value < 0),
+            int(_detect_sub_overflow(operand1, operand2, value)))
+
+
+def _mul(operand1: int, operand2: int) -> Tuple[int, int, int, int, int]:
+    """Multiplicación: C si el resultado excede 0x3FFF."""
+    value = operand1 * operand2
+    return value, int(value == 0), int(value > 0x3FFF), int(value < 0), 0
+
+
+def _div(operand1: int, operand2: int) -> Tuple[int, int, int, int, int]:
+    """División entera (por cero retorna 0 con Z)."""
+    if operand2 == 0:
+        # División por cero: retornar 0 y establecer flag Z
+        return 0, 1, 0, 0, 0
+    value = operand1 // operand2
+    return value, int(value == 0), 0, int(value < 0), 0
+
+
+def _and(operand1: int, operand2: int) -> Tuple[int, int, int, int, int]:
+    """AND bit a bit."""
+    value = operand1 & operand2
+    return value, int(value == 0), 0, int(value < 0), 0
+
+
+def _or(operand1: int, operand2: int) -> Tuple[int, int, int, int, int]:
+    """OR bit a bit."""
+    value = operand1 | operand2
+    return value, int(value == 0), 0, int(value < 0), 0
+
+
+def _xor(operand1: int, operand2: int) -> Tuple[int, int, int, int, int]:
+    """XOR bit a bit."""
+    value = operand1 ^ operand2
+    return value, int(value == 0), 0, int(value < 0), 0
+
+
+def _not(operand1: int, operand2: int) -> Tuple[int, int, int, int, int]:
+    """NOT del segundo operando."""
+    value = ~operand2
+    return value, int(value == 0), 0, int(value < 0), 0
+
+
+def _jp(operand1: int, operand2: int) -> Tuple[int, int, int, int, int]:
+    """Salto incondicional: el resultado es la dirección."""
+    return operand1, int(operand1 == 0), 0, int(operand1 < 0), 0
+
+
+def _jpz(operand1: int, operand2: int) -> Tuple[Optional[int], int, int, int, int]:
+    """Salto condicional: sin salto no hay resultado y los flags quedan en 0."""
+    if operand2 != 0:
+        return None, 0, 0, 0, 0
+    return operand1, int(operand1 == 0), 0, int(operand1 < 0), 0
+
+
+# Tabla de despacho por opcode
+HANDLERS: Dict[str, Callable[[int, int], Tuple[Optional[int], int, int, int, int]]] = {
+    'ADD': _add, 'SUB': _sub, 'MUL': _mul, 'DIV': _div,
+    'AND': _and, 'OR': _or, 'XOR': _xor, 'NOT': _not,
+    'JP': _jp, 'JPZ': _jpz,
+}
+
+# La misma tabla indexada por id de opcode (None si no es de la ALU)
+HANDLERS_BY_ID: List[Optional[Callable]] = [None] * (max(OPCODE_IDS.values()) + 1)
+for _opcode, _handler in HANDLERS.items():
+    HANDLERS_BY_ID[OPCODE_IDS[_opcode]] = _handler
+del _opcode, _handler
+
+# Solo el resultado de cada operación, para el modo de flags diferidos
+VALUE_HANDLERS: Dict[str, Callable[[int, int], Optional[int]]] = {
+    'ADD': operator.add, 'SUB': operator.sub, 'MUL': operator.mul,
+    'DIV': lambda operand1, operand2: operand1 // operand2 if operand2 != 0 else 0,
+    'AND': operator.and_, 'OR': operator.or_, 'XOR': operator.xor,
+    'NOT': lambda operand1, operand2: ~operand2,
+    'JP': lambda operand1, operand2: operand1,
+    'JPZ': lambda operand1, operand2: operand1 if operand2 == 0 else None,
+}
+VALUE_HANDLERS_BY_ID: List[Optional[Callable]] = [None] * len(HANDLERS_BY_ID)
+for _opcode, _handler in VALUE_HANDLERS.items():
+    VALUE_HANDLERS_BY_ID[OPCODE_IDS[_opcode]] = _handler
+del _opcode, _handler
+
+
+def _by_id(handlers: Dict[str, Callable]) -> List[Optional[Callable]]:
+    """Indexa una tabla de manejadores por id de opcode."""
+    table: List[Optional[Callable]] = [None] * len(HANDLERS_BY_ID)
+    for opcode, handler in handlers.items():
+        table[OPCODE_IDS[opcode]] = handler
+    return table
+
+
+def build_handler_tables(word: WordFormat) -> Tuple[List[Optional[Callable]], List[Optional[Callable]]]:
+    """
+    Construye las tablas de despacho de la ALU para un formato de palabra.
+    
+    Con el formato histórico son HANDLERS_BY_ID y VALUE_HANDLERS_BY_ID.
+    Con un ancho fijo los resultados aritméticos se truncan a la palabra
+    con la máscara precalculada; C es el acarreo (o préstamo) sin signo y
+    O indica que el resultado con signo no cabía en la palabra. Las
+    operaciones lógicas y los saltos no cambian: con operandos en rango su
+    resultado siempre cabe.
+    
+    Args:
+        word: Formato de palabra
+        
+    Returns:
+        Tupla (manejadores con flags, manejadores solo de resultado)
+    """
+    if not word.is_fixed:
+        return HANDLERS_BY_ID, VALUE_HANDLERS_BY_ID
+    
+    mask, sign = word.mask, word.sign_bit
+    
+    def add(operand1: int, operand2: int) -> Tuple[int, int, int, int, int]:
+        raw = operand1 + operand2
+        value = ((raw + sign) & mask) - sign
+        return (value, int(value == 0), int((operand1 & mask) + (operand2 & mask) > mask),
+                int(value < 0), int(value != raw))
+    
+    def sub(operand1: int, operand2: int) -> Tuple[int, int, int, int, int]:
+        raw = operand1 - operand2
+        value = ((raw + sign) & mask) - sign
+        return (value, int(value == 0), int((operand1 & mask) < (operand2 & mask)),
+                int(value < 0), int(value != raw))
+    
+    def mul(operand1: int, operand2: int) -> Tuple[int, int, int, int, int]:
+        raw = operand1 * operand2
+        value = ((raw + sign) & mask) - sign
+        return value, int(value == 0), int(value != raw), int(value < 0), int(value != raw)
+    
+    def div(operand1: int, operand2: int) -> Tuple[int, int, int, int, int]:
+        if operand2 == 0:
+            return 0, 1, 0, 0, 0
+        # Solo el mínimo dividido entre -1 no cabe en la palabra
+        raw = operand1 // operand2
+        value = ((raw + sign) & mask) - sign
+        return value, int(value == 0), 0, int(value < 0), int(value != raw)
+    
+    handlers = dict(HANDLERS, ADD=add, SUB=sub, MUL=mul, DIV=div)
+    value_handlers = dict(
+        VALUE_HANDLERS,
+        ADD=lambda operand1, operand2: ((operand1 + operand2 + sign) & mask) - sign,
+        SUB=lambda operand1, operand2: ((operand1 - operand2 + sign) & mask) - sign,
+        MUL=lambda operand1, operand2: ((operand1 * operand2 + sign) & mask) - sign,
+        DIV=lambda operand1, operand2: ((operand1 // operand2 + sign) & mask) - sign if operand2 != 0 else 0,
+    )
+    return _by_id(handlers), _by_id(value_handlers)
+
+
+# Operaciones que admite ALU.execute_many (los saltos no producen un
+# resultado numérico en todos los casos)
+BATCH_OPCODES = frozenset({'ADD', 'SUB', 'MUL', 'DIV', 'AND', 'OR', 'XOR', 'NOT'})
+
+
+class BatchResult(NamedTuple):
+    """
+    Resultado de ALU.execute_many: arreglos NumPy del mismo tamaño.
+    
+    Attributes:
+        value: Resultado de cada operación (0 si los operandos son inválidos)
+        z, c, s, o: Flags de cada operación (0 o 1)
+        valid: True donde los operandos están en el rango de la ALU; en
+            las demás posiciones solo O vale 1
+    """
+    value: Any
+    z: Any
+    c: Any
+    s: Any
+    o: Any
+    valid: Any
 
 
 class ALU(Observable):
@@ -16,11 +214,24 @@ class ALU(Observable):
     
     Ejecuta operaciones aritméticas y lógicas, manteniendo el registro
     PSW y notificando cambios de estado.
+    
+    Con flags diferidos (lazy_flags) cada operación solo calcula su
+    resultado y guarda sus operandos; los flags se calculan cuando se leen
+    (psw, get_psw_string) y no se notifican eventos por operación.
     """
     
-    def __init__(self):
-        """Inicializa la ALU con valor cero y flags del PSW."""
+    def __init__(self, lazy_flags: bool = False, word_format: WordFormat = LEGACY_WORD):
+        """
+        Inicializa la ALU con valor cero y flags del PSW.
+        
+        Args:
+            lazy_flags: True para calcular los flags solo al leerlos
+            word_format: Formato de palabra (default: el histórico, sin
+                truncar resultados)
+        """
         super().__init__()
+        self._word = word_format
+        self._handlers, self._value_handlers = build_handler_tables(word_format)
         self._value = 0
         self._psw = {
             'Z': 0,  # Zero flag
@@ -28,6 +239,9 @@ class ALU(Observable):
             'S': 0,  # Sign flag
             'O': 0   # Overflow flag
         }
+        self._lazy_flags = lazy_flags
+        # Última operación con flags sin calcular: (manejador, operando1, operando2)
+        self._pending_flags: Optional[Tuple[Callable, int, int]] = None
     
     @property
     def value(self) -> int:
@@ -37,12 +251,45 @@ class ALU(Observable):
     @property
     def psw(self) -> Dict[str, int]:
         """Obtiene el estado actual del PSW."""
+        self._evaluate_pending_flags()
         return self._psw.copy()
     
+    @property
+    def word_format(self) -> WordFormat:
+        """Formato de palabra de las operaciones."""
+        return self._word
+    
+    @property
+    def lazy_flags(self) -> bool:
+        """True si los flags se calculan solo al leerlos."""
+        return self._lazy_flags
+    
+    def set_lazy_flags(self, enabled: bool) -> None:
+        """
+        Activa o desactiva los flags diferidos.
+        
+        Args:
+            enabled: True para calcular los flags solo al leerlos (sin
+                eventos por operación); False para calcularlos y
+                notificarlos en cada operación
+        """
+        self._evaluate_pending_flags()
+        self._lazy_flags = enabled
+    
+    def _evaluate_pending_flags(self) -> None:
+        """Calcula los flags de la última operación si quedaron diferidos."""
+        pending = self._pending_flags
+        if pending is not None:
+            self._pending_flags = None
+            handler, operand1, operand2 = pending
+            _, self._psw['Z'], self._psw['C'], self._psw['S'], self._psw['O'] = handler(operand1, operand2)
+    
     def execute(self, opcode: str, operand1: int, operand2: int = None) -> int:
         """
         Ejecuta una operación y notifica el resultado.
         
+        Envoltorio de execute_id() que acepta el opcode como texto.
+        
         Args:
             opcode: Código de operación
             operand1: Primer operando
@@ -55,122 +302,103 @@ class ALU(Observable):
             OperandOutOfRangeError: Si los operandos están fuera del rango
             ALUOperationError: Si la operación no es válida
         """
+        opcode_id = OPCODE_IDS.get(opcode.upper(), 0)
+        if self._handlers[opcode_id] is None:
+            # Los operandos se validan antes que la operación
+            self._validate_operands(operand1, operand2)
+            self._reset_flags()
+            raise ALUOperationError(f"Unsupported operation: {opcode}")
+        return self.execute_id(opcode_id, operand1, operand2)
+    
+    def execute_id(self, opcode_id: int, operand1: int, operand2: int = None) -> int:
+        """
+        Ejecuta una operación identificada por su id numérico (OPCODE_IDS).
+        
+        Llama directamente al manejador de la tabla de despacho del formato
+        de palabra (HANDLERS_BY_ID en el histórico), sin procesar texto;
+        pensado para motores de ejecución.
+        
+        Args:
+            opcode_id: Id del opcode (core.instruction.OPCODE_IDS)
+            operand1: Primer operando
+            operand2: Segundo operando (opcional)
+            
+        Returns:
+            Resultado de la operación
+            
+        Raises:
+            OperandOutOfRangeError: Si los operandos están fuera del rango
+            ALUOperationError: Si el id no corresponde a una operación de la ALU
+        """
         # Validar rango de operandos
         self._validate_operands(operand1, operand2)
         
-        # Resetear flags
-        self._reset_flags()
+        handlers = self._handlers
+        handler = handlers[opcode_id] if 0 <= opcode_id < len(handlers) else None
+        if handler is None:
+            self._reset_flags()
+            raise ALUOperationError(f"Unsupported operation id: {opcode_id}")
         
-        # Ejecutar operación
-        old_value = self._value
-        self._execute_operation(opcode, operand1, operand2)
+        if self._lazy_flags:
+            # Los flags se calculan al leerlos, a partir de los operandos
+            self._value = self._value_handlers[opcode_id](operand1, operand2)
+            self._pending_flags = (handler, operand1, operand2)
+            return self._value
         
-        # Actualizar flags basados en el resultado
-        self._update_flags()
-        
-        # Notificar operación ejecutada
-        self.notify_observers(
-            EventType.ALU_OPERATION_EXECUTED,
-            {
-                'opcode': opcode,
-                'operand1': operand1,
-                'operand2': operand2,
-                'old_value': old_value,
-                'new_value': self._value,
-                'psw': self._psw.copy()
-            }
-        )
+        # Resultado y flags en una sola llamada
+        old_value = self._value
+        self._value, z, c, s, o = handler(operand1, operand2)
+        psw = self._psw
+        psw['Z'] = z
+        psw['C'] = c
+        psw['S'] = s
+        psw['O'] = o
         
-        # Notificar cambio de flags
-        self.notify_observers(
-            EventType.ALU_FLAGS_UPDATED,
-            {'psw': self._psw.copy()}
-        )
+        if self._observers:
+            # Notificar operación ejecutada
+            self.notify_observers(
+                EventType.ALU_OPERATION_EXECUTED,
+                {
+                    'opcode': OPCODES_BY_ID[opcode_id],
+                    'operand1': operand1,
+                    'operand2': operand2,
+                    'old_value': old_value,
+                    'new_value': self._value,
+                    'psw': psw.copy()
+                }
+            )
+            
+            # Notificar cambio de flags
+            self.notify_observers(
+                EventType.ALU_FLAGS_UPDATED,
+                {'psw': psw.copy()}
+            )
         
         return self._value
     
     def _validate_operands(self, operand1: int, operand2: int = None) -> None:
         """Valida que los operandos estén en el rango válido."""
+        # Rango válido según el formato de palabra ([-16384, 16383] en el histórico)
+        low, high = self._word.min_value, self._word.max_value
+        
         def is_valid_operand(operand):
-            # Rango válido: [-16384, 16383] (16-bit signed integer range)
-            return operand is None or (-16384 <= operand <= 16383)
+            return operand is None or (low <= operand <= high)
 
         if not is_valid_operand(operand1) or not is_valid_operand(operand2):
+            self._evaluate_pending_flags()
             self._psw['O'] = 1
-            raise OperandOutOfRangeError(f'Operands out of range [-16384, 16383]')
+            raise OperandOutOfRangeError(f'Operands out of range [{low}, {high}]')
     
     def _reset_flags(self) -> None:
         """Resetea todos los flags del PSW."""
+        self._pending_flags = None
         for flag in self._psw:
             self._psw[flag] = 0
     
-    def _execute_operation(self, opcode: str, operand1: int, operand2: int = None) -> None:
-        """Ejecuta la operación específica."""
-        opcode = opcode.upper()
-        
-        if opcode == 'ADD':
-            self._value = operand1 + operand2
-            self._psw['C'] = int(self._value > 0x3FFF)
-            self._psw['O'] = int(self._detect_add_overflow(operand1, operand2))
-            
-        elif opcode == 'SUB':
-            self._value = operand1 - operand2
-            self._psw['C'] = int(operand1 < operand2)
-            self._psw['O'] = int(self._detect_sub_overflow(operand1, operand2))
-            
-        elif opcode == 'MUL':
-            self._value = operand1 * operand2
-            self._psw['C'] = int(self._value > 0x3FFF)
-            
-        elif opcode == 'DIV':
-            if operand2 == 0:
-                # División por cero: retornar 0 y establecer flag Z
-                self._value = 0
-                self._psw['Z'] = 1
-            else:
-                self._value = operand1 // operand2
-                
-        elif opcode == 'AND':
-            self._value = operand1 & operand2
-            
-        elif opcode == 'OR':
-            self._value = operand1 | operand2
-            
-        elif opcode == 'NOT':
-            self._value = ~operand2
-            
-        elif opcode == 'XOR':
-            self._value = operand1 ^ operand2
-            
-        elif opcode == 'JP':
-            self._value = operand1
-            
-        elif opcode == 'JPZ':
-            self._value = operand1 if operand2 == 0 else None
-            
-        else:
-            raise ALUOperationError(f"Unsupported operation: {opcode}")
-    
-    def _detect_add_overflow(self, operand1: int, operand2: int) -> bool:
-        """Detecta overflow en suma."""
-        return ((operand1 & 0x2000) == (operand2 & 0x2000)) and \
-               ((self._value & 0x2000) != (operand1 & 0x2000))
-    
-    def _detect_sub_overflow(self, operand1: int, operand2: int) -> bool:
-        """Detecta overflow en resta."""
-        return ((operand1 & 0x2000) != (operand2 & 0x2000)) and \
-               ((self._value & 0x2000) != (operand1 & 0x2000))
-    
-    def _update_flags(self) -> None:
-        """Actualiza los flags basados en el resultado."""
-        if self._value is not None:
-            self._psw['Z'] = int(self._value == 0)
-            self._psw['S'] = int(self._value < 0)
-    
     def reset(self) -> None:
         """Resetea la ALU a su estado inicial."""
         old_value = self._value
-        old_psw = self._psw.copy()
+        old_psw = self.psw
         
         self._value = 0
         self._reset_flags()
@@ -191,8 +419,106 @@ class ALU(Observable):
         Returns:
             String formateado con los flags del PSW
         """
+        self._evaluate_pending_flags()
         return f"Z: {self._psw['Z']} C: {self._psw['C']} S: {self._psw['S']} O: {self._psw['O']}"
     
+    def execute_many(self, opcode: str, operand1, operand2, strict: bool = True) -> BatchResult:
+        """
+        Aplica una operación a arreglos completos de operandos con NumPy.
+        
+        Tiene la semántica de execute() para cada par de operandos (rango
+        del formato de palabra, división por cero que retorna 0 con Z y, en
+        el formato histórico, carry en 0x3FFF y overflow según el bit
+        0x2000), pero no modifica el estado de la ALU ni notifica a los
+        observadores. NumPy se importa al llamar, por lo que no es una
+        dependencia del simulador.
+        
+        Args:
+            opcode: Operación aritmética o lógica (BATCH_OPCODES)
+            operand1: Arreglo (o escalar) con los primeros operandos
+            operand2: Arreglo (o escalar) con los segundos operandos
+            strict: True para lanzar OperandOutOfRangeError si algún
+                operando está fuera de rango; False para marcarlo en `valid`
+            
+        Returns:
+            BatchResult con el resultado y los flags de cada par (con un
+            ancho de palabra fijo, `value` tiene el dtype de la palabra)
+            
+        Raises:
+            ImportError: Si NumPy no está instalado
+            OperandOutOfRangeError: Si strict y algún operando está fuera de rango
+            ALUOperationError: Si la operación no es aritmética ni lógica
+        """
+        opcode = opcode.upper()
+        if opcode not in BATCH_OPCODES:
+            raise ALUOperationError(f"Unsupported batch operation: {opcode}")
+        
+        import numpy as np
+        
+        word = self._word
+        low, high = word.min_value, word.max_value
+        operand1, operand2 = np.broadcast_arrays(np.asarray(operand1, dtype=np.int64),
+                                                 np.asarray(operand2, dtype=np.int64))
+        valid = ((operand1 >= low) & (operand1 <= high) &
+                 (operand2 >= low) & (operand2 <= high))
+        if strict and not valid.all():
+            raise OperandOutOfRangeError(f'Operands out of range [{low}, {high}]')
+        
+        carry = np.zeros(operand1.shape, dtype=bool)
+        overflow = np.zeros(operand1.shape, dtype=bool)
+        sign = word.sign_bit
+        if opcode == 'ADD':
+            value = operand1 + operand2
+            if word.is_fixed:
+                carry = (operand1 & word.mask) + (operand2 & word.mask) > word.mask
+            else:
+                carry = value > word.carry_limit
+                overflow = (((operand1 & sign) == (operand2 & sign)) &
+                            ((value & sign) != (operand1 & sign)))
+        elif opcode == 'SUB':
+            value = operand1 - operand2
+            if word.is_fixed:
+                carry = (operand1 & word.mask) < (operand2 & word.mask)
+            else:
+                carry = operand1 < operand2
+                overflow = (((operand1 & sign) != (operand2 & sign)) &
+                            ((value & sign) != (operand1 & sign)))
+        elif opcode == 'MUL':
+            value = operand1 * operand2
+            if not word.is_fixed:
+                carry = value > word.carry_limit
+        elif opcode == 'DIV':
+            # División por cero: 0 (y Z = 1 por ser resultado cero)
+            divisor = np.where(operand2 == 0, 1, operand2)
+            value = np.where(operand2 == 0, 0, np.floor_divide(operand1, divisor))
+        elif opcode == 'AND':
+            value = operand1 & operand2
+        elif opcode == 'OR':
+            value = operand1 | operand2
+        elif opcode == 'XOR':
+            value = operand1 ^ operand2
+        else:
+            value = ~operand2
+        
+        value = np.where(valid, value, 0)
+        if word.is_fixed:
+            # Truncar a la palabra: O si el resultado con signo no cabía
+            wrapped = ((value + sign) & word.mask) - sign
+            overflow = wrapped != value
+            if opcode == 'MUL':
+                carry = overflow
+            value = wrapped.astype(word.numpy_dtype)
+        
+        flag = np.uint8
+        return BatchResult(
+            value,
+            ((value == 0) & valid).astype(flag),
+            (carry & valid).astype(flag),
+            ((value < 0) & valid).astype(flag),
+            (overflow | ~valid).astype(flag),
+            valid
+        )
+    
     # Convenience methods for backward compatibility with tests
     def add(self, operand1: int, operand2: int) -> int:
         """Suma dos operandos."""
@@ -10,7 +10,7 @@ from core.observer import Observable, EventType
 from core.instruction import Instruction
 from core.exceptions import InvalidInstructionError
 from hardware.memory import Memory
-from utils.instruction_parser import InstructionParser
+from utils.instruction_parser import parse_cached
 
 
 class ControlUnit(Observable):
@@ -26,7 +26,6 @@ class ControlUnit(Observable):
         super().__init__()
         self._instruction_register: Optional[Instruction] = None
         self._current_pc = 0
-        self._parser = InstructionParser()
     
     @property
     def instruction_register(self) -> Optional[Instruction]:
@@ -60,8 +59,9 @@ class ControlUnit(Observable):
             if not instruction_str.strip():
                 raise InvalidInstructionError(f"No instruction found at PC address {pc}")
             
-            # Crear objeto Instruction
-            self._instruction_register = self._create_instruction(instruction_str, pc)
+            # Usar la instrucción ya decodificada por el ensamblador si existe
+            decoded = memory.load_decoded_instruction(pc)
+            self._instruction_register = decoded or self._create_instruction(instruction_str, pc)
             
             self.notify_observers(
                 EventType.INSTRUCTION_FETCHED,
@@ -149,7 +149,7 @@ class ControlUnit(Observable):
         
         Args:
             instruction_str: Instrucción como string
-            address: Dirección de memoria
+            address: Dirección de memoria (la instancia compartida no la guarda)
             
         Returns:
             Objeto Instruction
@@ -158,9 +158,9 @@ class ControlUnit(Observable):
             InvalidInstructionError: Si la instrucción es inválida
         """
         try:
-            # Usar el parser oficial para obtener la instrucción parseada
-            instruction = self._parser.parse(instruction_str, address)
-            return instruction
+            # Usar la caché compartida del parser: la misma línea no se vuelve a
+            # parsear en cada fetch (la dirección se conserva en current_pc)
+            return parse_cached(instruction_str)
             
         except Exception as e:
             raise InvalidInstructionError(f"Invalid instruction format '{instruction_str}': {str(e)}")
@@ -181,7 +181,7 @@ class ControlUnit(Observable):
             'operand1': instruction.operand1,
             'operand2': instruction.operand2,
             'raw_instruction': instruction.raw_instruction,
-            'address': instruction.address,
+            'address': self._current_pc,
             'requires_alu': instruction.requires_alu(),
             'is_arithmetic': instruction.is_arithmetic_operation(),
             'is_logical': instruction.is_logical_operation(),
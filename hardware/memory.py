@@ -5,13 +5,18 @@ Este módulo implementa la memoria del sistema que gestiona
 instrucciones y datos, notificando cambios de estado.
 """
 
-from typing import Dict, List, Any, TYPE_CHECKING
+import threading
+from array import array
+from typing import Dict, List, Any, Optional, Set
 from core.observer import Observable, EventType
 from core.exceptions import InvalidMemoryAddressError, MemoryOverflowError
+from core.instruction import Instruction
+from core.word_format import LEGACY_WORD, WordFormat
+from hardware.register import Register
 
-if TYPE_CHECKING:
-    from hardware.register import Register
 
+# Formatos del protocolo de buffer que contienen enteros
+_INTEGER_FORMATS = frozenset('bBhHiIlLqQnN')
 
 class Memory(Observable):
     """
@@ -21,28 +26,48 @@ class Memory(Observable):
     notificando cambios usando el patrón Observer.
     """
     
-    def __init__(self, size: int = 32):
+    def __init__(self, size: int = 32, word_format: WordFormat = LEGACY_WORD):
         """
         Inicializa la memoria con el tamaño especificado.
         
         Args:
             size: Tamaño total de la memoria (default: 32)
+            word_format: Formato de palabra de los datos; con un ancho fijo
+                los enteros se truncan al guardarlos (default: el histórico)
         """
         super().__init__()
+        self._word = word_format
         self._size = size
         self._instruction_size = size // 2
         self._data_size = size // 2
         
-        # Memoria de instrucciones (primera mitad)
+        # Direcciones modificadas desde la última consulta (para vistas
+        # incrementales). Mientras _all_changed está activo no se anotan:
+        # la próxima consulta refresca todo y, sin vista, el conjunto no
+        # crece. El lock protege el intercambio con el hilo de la interfaz.
+        self._changed_addresses: Set[int] = set()
+        self._all_changed = True
+        self._changed_lock = threading.Lock()
+        
+        # Memoria de instrucciones (primera mitad) y su forma decodificada
+        # (None si la instrucción se guardó solo como texto)
         self._instruction_memory: List[str] = [''] * self._instruction_size
+        self._decoded_instructions: List[Optional[Instruction]] = [None] * self._instruction_size
+        self._instruction_memory_empty = True
+        
+        # Imagen de un archivo objeto: sus instrucciones se decodifican al
+        # primer acceso a cada dirección
+        self._instruction_image = None
+        
+        # Memoria de datos (segunda mitad) - usando registros observables.
+        # Los registros se crean al primer acceso; una dirección sin
+        # registro contiene 0.
+        self._data_memory: Dict[int, Register] = {}
         
-        # Memoria de datos (segunda mitad) - usando registros observables
-        from hardware.register import Register
-        self._data_memory: Dict[int, 'Register'] = {}
-        for i in range(self._instruction_size, size):
-            data_register = Register(f"MEM[{i}]")
-            data_register.add_observer(self)
-            self._data_memory[i] = data_register
+        # Contadores de uso que mantienen store_instruction, store_data y
+        # clear_all para que get_memory_usage no recorra la memoria
+        self._instructions_used = 0
+        self._data_used = 0
     
     def update(self, observable: Observable, event_type: str, data: Any = None) -> None:
         """
@@ -60,6 +85,14 @@ class Memory(Observable):
                 data
             )
     
+    def _observed_changed(self, observed: bool) -> None:
+        """Se suscribe a los registros de datos solo mientras la memoria tiene observadores."""
+        for data_register in self._data_memory.values():
+            if observed:
+                data_register.add_observer(self)
+            else:
+                data_register.remove_observer(self)
+    
     @property
     def size(self) -> int:
         """Obtiene el tamaño total de la memoria."""
@@ -75,6 +108,16 @@ class Memory(Observable):
         """Obtiene el tamaño de la memoria de datos."""
         return self._data_size
     
+    @property
+    def word_format(self) -> WordFormat:
+        """Formato de palabra de los datos."""
+        return self._word
+    
+    @property
+    def block_typecode(self) -> str:
+        """Código de array.array de los bloques que devuelve load_block."""
+        return self._word.block_typecode
+    
     def load_instruction(self, address: int) -> str:
         """
         Carga una instrucción desde la memoria.
@@ -94,6 +137,8 @@ class Memory(Observable):
             )
         
         instruction = self._instruction_memory[address]
+        if not instruction and self._instruction_image is not None:
+            instruction = self._read_image_instruction(address)
         
         self.notify_observers(
             EventType.MEMORY_INSTRUCTION_LOADED,
@@ -105,13 +150,83 @@ class Memory(Observable):
         
         return instruction
     
-    def store_instruction(self, address: int, instruction: str) -> None:
+    def load_decoded_instruction(self, address: int) -> Optional[Instruction]:
+        """
+        Obtiene la instrucción decodificada de una dirección sin notificar.
+        
+        Args:
+            address: Dirección de memoria
+            
+        Returns:
+            Instrucción decodificada por el ensamblador, o None si la
+            dirección solo tiene texto
+            
+        Raises:
+            InvalidMemoryAddressError: Si la dirección es inválida
+        """
+        if not self._is_valid_instruction_address(address):
+            raise InvalidMemoryAddressError(
+                f"Invalid instruction address: {address}. Valid range: 0-{self._instruction_size-1}"
+            )
+        
+        decoded = self._decoded_instructions[address]
+        if decoded is None and self._instruction_image is not None and not self._instruction_memory[address]:
+            self._read_image_instruction(address)
+            decoded = self._decoded_instructions[address]
+        return decoded
+    
+    def load_instruction_image(self, image) -> None:
+        """
+        Reemplaza la memoria de instrucciones por la imagen de un archivo objeto.
+        
+        Las instrucciones no se copian: cada dirección se decodifica desde la
+        imagen la primera vez que se lee.
+        
+        Args:
+            image: Imagen con len() e instruction(address) (ver utils.object_format)
+            
+        Raises:
+            InvalidMemoryAddressError: Si la imagen no cabe en la memoria de instrucciones
+        """
+        if len(image) > self._instruction_size:
+            raise InvalidMemoryAddressError(
+                f"Instruction image too large. Available: {self._instruction_size}, Required: {len(image)}"
+            )
+        
+        self._clear_instruction_memory()
+        self._instruction_image = image
+        # Cada dirección de la imagen contiene una instrucción ensamblada
+        self._instructions_used = len(image)
+        self._mark_all_changed()
+    
+    def _read_image_instruction(self, address: int) -> str:
+        """Decodifica una dirección desde la imagen y la guarda en memoria."""
+        if address >= len(self._instruction_image):
+            return ''
+        decoded = self._instruction_image.instruction(address)
+        self._instruction_memory[address] = decoded.raw_instruction
+        self._decoded_instructions[address] = decoded
+        self._instruction_memory_empty = False
+        return decoded.raw_instruction
+    
+    def _materialize_image(self) -> None:
+        """Decodifica todas las direcciones pendientes de la imagen y la descarta."""
+        image = self._instruction_image
+        if image is None:
+            return
+        for address in range(len(image)):
+            if not self._instruction_memory[address]:
+                self._read_image_instruction(address)
+        self._instruction_image = None
+    
+    def store_instruction(self, address: int, instruction: str, decoded: Optional[Instruction] = None) -> None:
         """
         Almacena una instrucción en la memoria.
         
         Args:
             address: Dirección donde almacenar
             instruction: Instrucción a almacenar
+            decoded: Instrucción ya decodificada (opcional)
             
         Raises:
             InvalidMemoryAddressError: Si la dirección es inválida
@@ -121,8 +236,15 @@ class Memory(Observable):
                 f"Invalid instruction address: {address}. Valid range: 0-{self._instruction_size-1}"
             )
         
+        self._materialize_image()
         old_instruction = self._instruction_memory[address]
+        self._instructions_used += bool(instruction.strip()) - bool(old_instruction.strip())
         self._instruction_memory[address] = instruction
+        self._decoded_instructions[address] = decoded
+        self._instruction_memory_empty = False
+        if not self._all_changed:
+            with self._changed_lock:
+                self._changed_addresses.add(address)
         
         self.notify_observers(
             EventType.MEMORY_INSTRUCTION_LOADED,
@@ -133,7 +255,7 @@ class Memory(Observable):
             }
         )
     
-    def load_data(self, address: int) -> 'Register':
+    def load_data(self, address: int) -> Register:
         """
         Carga un dato desde la memoria.
         
@@ -151,7 +273,7 @@ class Memory(Observable):
                 f"Invalid data address: {address}. Valid range: {self._instruction_size}-{self._size-1}"
             )
         
-        data_register = self._data_memory[address]
+        data_register = self._get_data_register(address)
         
         self.notify_observers(
             EventType.MEMORY_DATA_LOADED,
@@ -194,22 +316,187 @@ class Memory(Observable):
                 f"Invalid data address: {address}. Valid range: {self._instruction_size}-{self._size-1}"
             )
         
-        self._data_memory[address].set_value(value)
+        if self._word.is_fixed and isinstance(value, int):
+            value = self._word.wrap(value)
+        data_register = self._get_data_register(address)
+        self._data_used += (value != 0) - (data_register.value != 0)
+        data_register.set_value(value)
+        if not self._all_changed:
+            with self._changed_lock:
+                self._changed_addresses.add(address)
+    
+    def load_block(self, address: int, count: int) -> array:
+        """
+        Lee un bloque de datos consecutivos con una sola notificación.
+        
+        Args:
+            address: Primera dirección de datos del bloque
+            count: Cantidad de palabras a leer
+            
+        Returns:
+            array.array (ver block_typecode) con los valores del bloque
+            
+        Raises:
+            InvalidMemoryAddressError: Si el bloque no cabe en la memoria de datos
+        """
+        self._check_data_block(address, count)
+        
+        block = array(self.block_typecode, bytes(count * array(self.block_typecode).itemsize))
+        data_memory = self._data_memory
+        # Recorrer lo más corto: las direcciones del bloque o los registros creados
+        if len(data_memory) < count:
+            end = address + count
+            for data_address, data_register in data_memory.items():
+                if address <= data_address < end:
+                    block[data_address - address] = data_register.value
+        else:
+            for offset in range(count):
+                data_register = data_memory.get(address + offset)
+                if data_register is not None:
+                    block[offset] = data_register.value
+        
+        if self._observers:
+            self.notify_observers(
+                EventType.MEMORY_BLOCK_LOADED,
+                {'address': address, 'count': count}
+            )
+        return block
+    
+    def store_block(self, address: int, buffer: Any) -> None:
+        """
+        Guarda un bloque de datos consecutivos con una sola notificación.
+        
+        Los registros de datos se actualizan sin notificar uno por uno; los
+        observadores reciben un único MEMORY_BLOCK_STORED y las direcciones
+        quedan marcadas como modificadas para las vistas incrementales.
+        
+        Args:
+            address: Primera dirección de datos del bloque
+            buffer: Objeto con protocolo de buffer de una dimensión y
+                elementos enteros (bytes, array.array, arreglo de NumPy...)
+            
+        Raises:
+            TypeError: Si el buffer no es de enteros o no tiene una dimensión
+            InvalidMemoryAddressError: Si el bloque no cabe en la memoria de datos
+        """
+        view = memoryview(buffer)
+        if view.ndim != 1 or view.format not in _INTEGER_FORMATS:
+            raise TypeError(
+                f"Data block must be a one-dimensional integer buffer, got format {view.format!r} "
+                f"with {view.ndim} dimensions"
+            )
+        values = view.tolist()
+        count = len(values)
+        self._check_data_block(address, count)
+        
+        # Un buffer del mismo tipo que la palabra ya tiene valores representables
+        word = self._word
+        if word.is_fixed and view.format != word.array_typecode:
+            values = [word.wrap(value) for value in values]
+        
+        data_memory = self._data_memory
+        data_used = self._data_used
+        for data_address, value in enumerate(values, address):
+            data_register = data_memory.get(data_address)
+            if data_register is None:
+                if not value:
+                    continue
+                data_register = self._get_data_register(data_address)
+            data_used += (value != 0) - (data_register.value != 0)
+            data_register._poke(value)
+        self._data_used = data_used
+        if not self._all_changed:
+            with self._changed_lock:
+                self._changed_addresses.update(range(address, address + count))
+        
+        if self._observers:
+            self.notify_observers(
+                EventType.MEMORY_BLOCK_STORED,
+                {'address': address, 'count': count}
+            )
+    
+    def _check_data_block(self, address: int, count: int) -> None:
+        """Valida que [address, address + count) esté en la memoria de datos."""
+        if count < 0 or not self._instruction_size <= address <= self._size - count:
+            raise InvalidMemoryAddressError(
+                f"Invalid data block: {count} words at {address}. "
+                f"Valid range: {self._instruction_size}-{self._size-1}"
+            )
+    
+    def peek(self, address: int) -> Any:
+        """
+        Lee el contenido de cualquier dirección sin notificar observadores.
+        
+        Pensado para vistas que solo muestran la memoria.
+        
+        Args:
+            address: Dirección de memoria (instrucciones o datos)
+            
+        Returns:
+            Instrucción (str) o valor almacenado
+            
+        Raises:
+            InvalidMemoryAddressError: Si la dirección es inválida
+        """
+        if self._is_valid_instruction_address(address):
+            instruction = self._instruction_memory[address]
+            if not instruction and self._instruction_image is not None:
+                instruction = self._read_image_instruction(address)
+            return instruction
+        if self._is_valid_data_address(address):
+            data_register = self._data_memory.get(address)
+            return data_register.value if data_register is not None else 0
+        raise InvalidMemoryAddressError(
+            f"Invalid memory address: {address}. Valid range: 0-{self._size-1}"
+        )
+    
+    def consume_changed_addresses(self) -> Optional[Set[int]]:
+        """
+        Obtiene y reinicia el conjunto de direcciones modificadas.
+        
+        Returns:
+            Direcciones modificadas desde la última llamada, o None si
+            cambió toda la memoria (inicialización o clear_all)
+        """
+        with self._changed_lock:
+            changed = self._changed_addresses
+            self._changed_addresses = set()
+            if self._all_changed:
+                self._all_changed = False
+                return None
+        return changed
+    
+    def _mark_all_changed(self) -> None:
+        """Marca toda la memoria como modificada y descarta las direcciones anotadas."""
+        with self._changed_lock:
+            self._all_changed = True
+            self._changed_addresses = set()
     
     def clear_all(self) -> None:
         """Limpia toda la memoria."""
         # Limpiar instrucciones
-        self._instruction_memory = [''] * self._instruction_size
+        self._clear_instruction_memory()
+        self._instruction_image = None
+        self._mark_all_changed()
         
         # Limpiar datos
         for data_register in self._data_memory.values():
             data_register.clear()
+        self._data_used = 0
         
         self.notify_observers(
             EventType.MEMORY_CLEARED,
             {'message': 'All memory cleared'}
         )
     
+    def _clear_instruction_memory(self) -> None:
+        """Vacía la memoria de instrucciones (sin reasignarla si ya está vacía)."""
+        if not self._instruction_memory_empty:
+            self._instruction_memory = [''] * self._instruction_size
+            self._decoded_instructions = [None] * self._instruction_size
+            self._instruction_memory_empty = True
+        self._instructions_used = 0
+    
     def get_instructions(self) -> List[str]:
         """
         Obtiene todas las instrucciones cargadas.
@@ -217,17 +504,31 @@ class Memory(Observable):
         Returns:
             Lista de instrucciones
         """
+        self._materialize_image()
         return [instr for instr in self._instruction_memory if instr.strip()]
     
-    def get_data_registers(self) -> Dict[int, 'Register']:
+    def get_data_registers(self) -> Dict[int, Register]:
         """
         Obtiene todos los registros de datos.
         
         Returns:
             Diccionario de registros de datos
         """
+        # Materializar todos los registros para devolver el mapa completo
+        for address in range(self._instruction_size, self._size):
+            self._get_data_register(address)
         return self._data_memory.copy()
     
+    def _get_data_register(self, address: int) -> Register:
+        """Obtiene el registro de una dirección de datos, creándolo si no existe."""
+        data_register = self._data_memory.get(address)
+        if data_register is None:
+            data_register = Register(f"MEM[{address}]")
+            if self._observers:
+                data_register.add_observer(self)
+            self._data_memory[address] = data_register
+        return data_register
+    
     def is_instruction_memory_full(self) -> bool:
         """
         Verifica si la memoria de instrucciones está llena.
@@ -235,7 +536,7 @@ class Memory(Observable):
         Returns:
             True si está llena
         """
-        return len([instr for instr in self._instruction_memory if instr.strip()]) >= self._instruction_size
+        return self._instructions_used >= self._instruction_size
     
     def get_next_free_instruction_address(self) -> int:
         """
@@ -244,6 +545,7 @@ class Memory(Observable):
         Returns:
             Dirección libre o -1 si está llena
         """
+        self._materialize_image()
         for i, instr in enumerate(self._instruction_memory):
             if not instr.strip():
                 return i
@@ -261,11 +563,15 @@ class Memory(Observable):
         """
         Obtiene información sobre el uso de memoria.
         
+        Usa los contadores incrementales: el costo no depende del tamaño de
+        la memoria. Los datos se cuentan al escribirlos con store_data; los
+        registros que devuelve load_data son para leer.
+        
         Returns:
             Diccionario con estadísticas de uso
         """
-        instructions_used = len([instr for instr in self._instruction_memory if instr.strip()])
-        data_used = len([reg for reg in self._data_memory.values() if reg.value != 0])
+        instructions_used = self._instructions_used
+        data_used = self._data_used
         
         return {
             'total_size': self._size,
@@ -15,8 +15,11 @@ class Register(Observable):
     
     Utiliza el patrón Observer para notificar cuando su valor cambia,
     permitiendo que la interfaz gráfica se actualice automáticamente.
+    Sin observadores, set_value no construye el evento.
     """
     
+    __slots__ = ('_name', '_value')
+    
     def __init__(self, name: str, initial_value: Any = 0):
         """
         Inicializa el registro con un nombre y valor inicial.
@@ -47,12 +50,10 @@ class Register(Observable):
             value: Nuevo valor para el registro
         """
         old_value = self._value
+        self._value = value
         
-        # Solo notificar si el valor realmente cambió
-        if old_value != value:
-            self._value = value
-            
-            # Notificar el cambio a todos los observadores
+        # Solo notificar si hay observadores y el valor realmente cambió
+        if self._observers and old_value != value:
             self.notify_observers(
                 EventType.REGISTER_VALUE_CHANGED,
                 {
@@ -61,9 +62,18 @@ class Register(Observable):
                     'new_value': value
                 }
             )
-        else:
-            # Actualizar el valor sin notificar
-            self._value = value
+    
+    def _poke(self, value: Any) -> None:
+        """
+        Establece el valor sin notificar a los observadores.
+        
+        Para motores de ejecución que agrupan las notificaciones: quien
+        llama debe notificar (o refrescar las vistas) por su cuenta.
+        
+        Args:
+            value: Nuevo valor para el registro
+        """
+        self._value = value
     
     def clear(self) -> None:
         """Limpia el registro estableciendo valor a 0."""
@@ -9,6 +9,7 @@ from typing import Dict, Any
 from hardware.register import Register
 from core.observer import Observable, EventType
 from core.exceptions import RegisterNotFoundError
+from core.word_format import LEGACY_WORD, WordFormat
 
 
 class RegisterBank(Observable):
@@ -16,20 +17,35 @@ class RegisterBank(Observable):
     Banco de registros que gestiona múltiples registros numerados.
     
     Mantiene registros R1-R9 y notifica cambios usando el patrón Observer.
+    Con un formato de palabra de ancho fijo los valores enteros se truncan
+    a la palabra al guardarlos.
     """
     
-    def __init__(self):
-        """Inicializa el banco con registros R1-R9."""
+    def __init__(self, word_format: WordFormat = LEGACY_WORD):
+        """
+        Inicializa el banco con registros R1-R9.
+        
+        Args:
+            word_format: Formato de palabra de los valores (default: el
+                histórico, sin truncar)
+        """
         super().__init__()
+        self._word = word_format
         self._registers: Dict[str, Register] = {}
         
-        # Crear registros R1 a R9
+        # Crear registros R1 a R9 (el banco propaga sus eventos mientras
+        # alguien lo observa, ver _observed_changed)
         for i in range(1, 10):
             reg_name = f'R{i}'
-            register = Register(reg_name)
-            # Propagar eventos del registro individual
-            register.add_observer(self)
-            self._registers[reg_name] = register
+            self._registers[reg_name] = Register(reg_name)
+    
+    def _observed_changed(self, observed: bool) -> None:
+        """Se suscribe a los registros solo mientras el banco tiene observadores."""
+        for register in self._registers.values():
+            if observed:
+                register.add_observer(self)
+            else:
+                register.remove_observer(self)
     
     def update(self, observable: Observable, event_type: str, data: Any = None) -> None:
         """
@@ -73,8 +89,15 @@ class RegisterBank(Observable):
         """
         if reg_name not in self._registers:
             raise RegisterNotFoundError(f"Register {reg_name} not found")
+        if self._word.is_fixed and isinstance(value, int):
+            value = self._word.wrap(value)
         self._registers[reg_name].set_value(value)
     
+    @property
+    def word_format(self) -> WordFormat:
+        """Formato de palabra de los valores de los registros."""
+        return self._word
+    
     def get_register(self, reg_name: str) -> Register:
         """
         Obtiene la instancia completa de un registro.
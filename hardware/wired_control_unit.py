@@ -5,8 +5,53 @@ Este módulo implementa la unidad de control cableada que genera
 señales de control basadas en opcodes.
 """
 
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
 from core.observer import Observable, EventType
+from core.instruction import OPCODES_BY_ID, Opcode, OpcodeCategory, opcode_category
+
+
+def _signal_set(**active: Any) -> Mapping[str, Any]:
+    """Crea un conjunto inmutable de señales: búsqueda y decodificación más `active`."""
+    signals = {
+        'fetch': True,
+        'decode': True,
+        'execute': False,
+        'memory_read': False,
+        'memory_write': False,
+        'register_read': False,
+        'register_write': False,
+        'alu_operation': None,
+    }
+    signals.update(active)
+    return MappingProxyType(signals)
+
+
+# Señales de un opcode sin configuración propia (solo búsqueda y decodificación)
+DEFAULT_SIGNALS = _signal_set()
+
+# Señales tras un reset (todas apagadas)
+RESET_SIGNALS = _signal_set(fetch=False, decode=False)
+
+# Tabla precalculada opcode -> señales de control. Los conjuntos son
+# inmutables, por lo que se entregan por referencia sin copiarlos.
+SIGNAL_TABLE: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    **{
+        opcode.name: _signal_set(execute=True, alu_operation=opcode.name, register_read=True, register_write=True)
+        for opcode in Opcode if opcode_category(opcode.name) & OpcodeCategory.ALU_RESULT
+    },
+    'LOAD': _signal_set(memory_read=True, register_write=True),
+    'STORE': _signal_set(memory_write=True, register_read=True),
+    'MOVE': _signal_set(register_read=True, register_write=True),
+    'JP': _signal_set(execute=True, alu_operation='JP'),
+    'JPZ': _signal_set(execute=True, alu_operation='JPZ'),
+})
+
+# La misma tabla indexada por id de opcode (Opcode); el índice 0 es un
+# opcode fuera del repertorio
+SIGNALS_BY_ID: Tuple[Mapping[str, Any], ...] = tuple(
+    SIGNAL_TABLE.get(OPCODES_BY_ID.get(opcode_id), DEFAULT_SIGNALS) for opcode_id in range(len(Opcode) + 1)
+)
 
 
 class WiredControlUnit(Observable):
@@ -14,20 +59,22 @@ class WiredControlUnit(Observable):
     Unidad de Control Cableada que genera señales de control.
     
     Genera las señales de control apropiadas para cada instrucción
-    y notifica los cambios usando el patrón Observer.
+    y notifica los cambios usando el patrón Observer. Las señales de cada
+    opcode se toman de SIGNAL_TABLE (o de SIGNALS_BY_ID por id) y solo se
+    notifican cuando difieren de las del ciclo anterior.
     """
     
     def __init__(self):
         """Inicializa la unidad de control cableada."""
         super().__init__()
-        self._control_signals: Dict[str, Any] = {}
+        self._control_signals: Mapping[str, Any] = RESET_SIGNALS
     
     @property
-    def control_signals(self) -> Dict[str, Any]:
-        """Obtiene las señales de control actuales."""
-        return self._control_signals.copy()
+    def control_signals(self) -> Mapping[str, Any]:
+        """Obtiene las señales de control actuales (de solo lectura)."""
+        return self._control_signals
     
-    def generate_control_signals(self, opcode: str) -> Dict[str, Any]:
+    def generate_control_signals(self, opcode: str) -> Mapping[str, Any]:
         """
         Genera señales de control basadas en el opcode.
         
@@ -35,110 +82,61 @@ class WiredControlUnit(Observable):
             opcode: Código de operación de la instrucción
             
         Returns:
-            Diccionario con las señales de control
+            Señales de control de solo lectura (compartidas: no se copian)
         """
-        old_signals = self._control_signals.copy()
+        signals = SIGNAL_TABLE.get(opcode)
+        if signals is None:
+            opcode = opcode.upper()
+            signals = SIGNAL_TABLE.get(opcode, DEFAULT_SIGNALS)
         
-        # Resetear señales a estado inicial
-        self._control_signals = {
-            'fetch': True,
-            'decode': True,
-            'execute': False,
-            'memory_read': False,
-            'memory_write': False,
-            'register_read': False,
-            'register_write': False,
-            'alu_operation': None,
-        }
+        old_signals = self._control_signals
+        if signals is not old_signals:
+            self._switch_signals(old_signals, signals, opcode)
+        return signals
+    
+    def generate_control_signals_id(self, opcode_id: int) -> Mapping[str, Any]:
+        """
+        Genera señales de control a partir del id numérico del opcode.
         
-        # Configurar señales según el opcode
-        opcode = opcode.upper()
+        Igual que generate_control_signals() pero indexando SIGNALS_BY_ID,
+        sin procesar texto; pensado para el ciclo de ejecución.
         
-        if opcode in ['ADD', 'SUB', 'MUL', 'DIV', 'AND', 'OR', 'NOT', 'XOR']:
-            self._configure_alu_operation(opcode)
-            
-        elif opcode == 'LOAD':
-            self._configure_load_operation()
-            
-        elif opcode == 'STORE':
-            self._configure_store_operation()
-            
-        elif opcode == 'MOVE':
-            self._configure_move_operation()
+        Args:
+            opcode_id: Id del opcode (Instruction.opcode_id, 0 si es desconocido)
             
-        elif opcode in ['JP', 'JPZ']:
-            self._configure_jump_operation(opcode)
-        
-        # Notificar cambio de señales
-        self.notify_observers(
-            EventType.BUS_CONTROL_ACTIVATED,
-            {
-                'old_signals': old_signals,
-                'new_signals': self._control_signals.copy(),
-                'opcode': opcode
-            }
-        )
-        
-        return self._control_signals.copy()
-    
-    def _configure_alu_operation(self, opcode: str) -> None:
-        """Configura señales para operaciones de ALU."""
-        self._control_signals.update({
-            'execute': True,
-            'alu_operation': opcode,
-            'register_read': True,
-            'register_write': True
-        })
-    
-    def _configure_load_operation(self) -> None:
-        """Configura señales para operación LOAD."""
-        self._control_signals.update({
-            'memory_read': True,
-            'register_write': True
-        })
-    
-    def _configure_store_operation(self) -> None:
-        """Configura señales para operación STORE."""
-        self._control_signals.update({
-            'memory_write': True,
-            'register_read': True
-        })
-    
-    def _configure_move_operation(self) -> None:
-        """Configura señales para operación MOVE."""
-        self._control_signals.update({
-            'register_read': True,
-            'register_write': True
-        })
+        Returns:
+            Señales de control de solo lectura (compartidas: no se copian)
+        """
+        signals = SIGNALS_BY_ID[opcode_id]
+        old_signals = self._control_signals
+        if signals is not old_signals:
+            self._switch_signals(old_signals, signals, OPCODES_BY_ID.get(opcode_id, ''))
+        return signals
     
-    def _configure_jump_operation(self, opcode: str) -> None:
-        """Configura señales para operaciones de salto."""
-        self._control_signals.update({
-            'execute': True,
-            'alu_operation': opcode
-        })
+    def _switch_signals(self, old_signals: Mapping[str, Any], signals: Mapping[str, Any], opcode: str) -> None:
+        """Activa `signals` y notifica si difieren de las del ciclo anterior."""
+        self._control_signals = signals
+        if signals != old_signals:
+            self.notify_observers(
+                EventType.BUS_CONTROL_ACTIVATED,
+                {
+                    'old_signals': old_signals,
+                    'new_signals': signals,
+                    'opcode': opcode
+                }
+            )
     
     def reset(self) -> None:
         """Resetea la unidad de control cableada."""
-        old_signals = self._control_signals.copy()
-        
-        self._control_signals = {
-            'fetch': False,
-            'decode': False,
-            'execute': False,
-            'memory_read': False,
-            'memory_write': False,
-            'register_read': False,
-            'register_write': False,
-            'alu_operation': None,
-        }
+        old_signals = self._control_signals
+        self._control_signals = RESET_SIGNALS
         
         self.notify_observers(
             EventType.SYSTEM_RESET,
             {
                 'component': 'WiredControlUnit',
                 'old_signals': old_signals,
-                'new_signals': self._control_signals.copy()
+                'new_signals': RESET_SIGNALS
             }
         )
     
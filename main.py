@@ -24,16 +24,15 @@ Autor: Proyecto Universidad de Caldas
 Versión: 3.0 - Instrucciones 3-operandos + Memoria 32-bits
 """
 
-import tkinter as tk
+import argparse
 import sys
 import os
 
 # Agregar el directorio raíz al path para imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from core.computer import Computer
-from gui.simulator_view import SimulatorView
-from gui.simulator_controller import SimulatorController
+# tkinter y gui.* se importan solo al iniciar la interfaz gráfica, de modo
+# que el modo --headless funcione en servidores sin pantalla.
 
 
 def configure_tcl_tk_libraries():
@@ -68,17 +67,109 @@ def configure_tcl_tk_libraries():
             break
 
 
-def main():
+def parse_arguments(argv=None) -> argparse.Namespace:
+    """
+    Interpreta los argumentos de la línea de comandos.
+    
+    Args:
+        argv: Lista de argumentos (default: sys.argv[1:])
+        
+    Returns:
+        Argumentos interpretados
+    """
+    parser = argparse.ArgumentParser(
+        description="Simulador de Computadora - UdC"
+    )
+    parser.add_argument(
+        '--headless', metavar='PROGRAMA',
+        help="Ejecuta el archivo de programa sin interfaz gráfica"
+    )
+    parser.add_argument(
+        '--max-cycles', type=int, default=None, metavar='N',
+        help="Número máximo de ciclos a ejecutar (solo --headless)"
+    )
+    parser.add_argument(
+        '--dump-state', choices=['text', 'json'], default='text',
+        help="Formato del estado final (solo --headless)"
+    )
+    parser.add_argument(
+        '--memory-size', type=int, default=32, metavar='N',
+        help="Tamaño de la memoria del simulador (solo --headless)"
+    )
+    parser.add_argument(
+        '--word-width', type=int, choices=[8, 16, 32], default=None, metavar='BITS',
+        help="Ancho de palabra de la máquina: 8, 16 o 32 bits (solo --headless; "
+             "por defecto, la semántica histórica sin truncar)"
+    )
+    parser.add_argument(
+        '--data', metavar='ARCHIVO',
+        help="Archivo de datos (binario o .csv) a cargar al inicio del segmento de datos (solo --headless)"
+    )
+    parser.add_argument(
+        '--max-errors', type=int, default=10, metavar='N',
+        help="Errores de ensamblado a reportar antes de abandonar la carga (solo --headless)"
+    )
+    parser.add_argument(
+        '--optimize', action='store_true',
+        help="Aplica el optimizador de mirilla antes de ejecutar (solo --headless)"
+    )
+    parser.add_argument(
+        '--no-accelerate', action='store_true',
+        help="Interpreta todas las iteraciones de los bucles de conteo (solo --headless)"
+    )
+    parser.add_argument(
+        '--emit-object', metavar='ARCHIVO',
+        help="Ensambla el programa de --headless y lo guarda como archivo objeto sin ejecutarlo"
+    )
+    parser.add_argument(
+        '--jobs', type=int, default=1, metavar='N',
+        help="Procesos para ensamblar en paralelo (solo --emit-object)"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """
     Función principal que inicializa y ejecuta el simulador usando arquitectura MVC.
     
     Crea los componentes del patrón MVC (Model-View-Controller) y 
     configura la comunicación entre ellos usando el patrón Observer.
+    Con --headless ejecuta un programa sin crear la interfaz gráfica.
     """
+    args = parse_arguments(argv)
+    
+    if args.headless and args.emit_object:
+        from utils.headless_runner import assemble_to_object
+        return assemble_to_object(args.headless, args.emit_object, args.jobs)
+    
+    if args.headless:
+        from utils.headless_runner import run_headless
+        return run_headless(
+            args.headless,
+            max_cycles=args.max_cycles,
+            dump_state=args.dump_state,
+            memory_size=args.memory_size,
+            word_width=args.word_width,
+            data_path=args.data,
+            max_errors=args.max_errors,
+            optimize=args.optimize,
+            accelerate=not args.no_accelerate
+        )
+    
+    return run_gui()
+
+
+def run_gui():
+    """Crea la interfaz gráfica MVC y ejecuta el ciclo de eventos de Tk."""
     # Configurar librerías Tcl/Tk si es necesario
     configure_tcl_tk_libraries()
     
     try:
+        import tkinter as tk
+        from core.computer import Computer
+        from gui.simulator_view import SimulatorView
+        from gui.simulator_controller import SimulatorController
+        
         # Crear la ventana principal
         root = tk.Tk()
         root.title("Simulador de Computadora - UdC (MVC)")
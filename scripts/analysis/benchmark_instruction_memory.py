@@ -0,0 +1,92 @@
+"""
+Benchmark de la memoria por instrucción decodificada.
+
+Decodifica un programa sintético (por defecto de 1.000.000 de líneas) de
+tres formas y mide con tracemalloc los bytes por instrucción que quedan
+en uso, sin contar el texto de las líneas:
+
+- sin compartir: cada línea se parsea por separado (objetos propios para
+  la instrucción, sus operandos y sus operandos clasificados)
+- copias por dirección: parser.parse(línea, dirección), como el
+  ensamblador; cada copia solo guarda sus referencias y comparte el resto
+  con la instrucción de la caché
+- compartidas: parse_cached(línea), como la carga en streaming y los
+  archivos objeto; las líneas idénticas son la misma instancia
+
+Uso (desde la raíz del proyecto):
+    python scripts/analysis/benchmark_instruction_memory.py [--lines N] [--distinct N]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, PROJECT_ROOT)
+
+from benchmark_parser import generate_program
+from utils.instruction_parser import clear_parse_cache, get_shared_parser, parse_cached
+
+# Fracción máxima de la memoria de una instrucción sin compartir que puede
+# ocupar una copia por dirección y una instrucción compartida
+LOCATED_BYTES_BUDGET_RATIO = 0.75
+SHARED_BYTES_BUDGET_RATIO = 0.1
+
+
+def measure(decode, lines: list) -> float:
+    """
+    Decodifica todas las líneas y mide la memoria que queda en uso.
+    
+    Args:
+        decode: Función (línea, dirección) -> Instruction
+        lines: Líneas del programa
+    
+    Returns:
+        Bytes por instrucción
+    """
+    clear_parse_cache()
+    gc.collect()
+    tracemalloc.start()
+    instructions = [decode(line, address) for address, line in enumerate(lines)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instructions
+    return current / len(lines)
+
+
+def main(argv=None) -> int:
+    """Ejecuta el benchmark e imprime el reporte."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--lines', type=int, default=1_000_000, help="Líneas del programa sintético")
+    parser.add_argument('--distinct', type=int, default=2_000,
+                        help="Líneas distintas del programa (se repiten hasta completarlo)")
+    args = parser.parse_args(argv)
+    
+    distinct = generate_program(args.distinct)
+    lines = [distinct[index % len(distinct)] for index in range(args.lines)]
+    instruction_parser = get_shared_parser()
+    
+    unshared = measure(lambda line, address: instruction_parser._parse_uncached(line.strip(), address), lines)
+    located = measure(instruction_parser.parse, lines)
+    shared = measure(lambda line, address: parse_cached(line), lines)
+    
+    print("=" * 60)
+    print("MEMORIA POR INSTRUCCIÓN")
+    print("=" * 60)
+    print(f"\nLíneas: {args.lines} ({len(set(distinct))} distintas)")
+    print(f"Sin compartir:        {unshared:8.1f} bytes/instrucción")
+    print(f"Copias por dirección: {located:8.1f} bytes/instrucción "
+          f"({located / unshared:.2f}x, presupuesto {LOCATED_BYTES_BUDGET_RATIO:.2f}x)")
+    print(f"Compartidas:          {shared:8.1f} bytes/instrucción "
+          f"({shared / unshared:.2f}x, presupuesto {SHARED_BYTES_BUDGET_RATIO:.2f}x)")
+    
+    over_budget = (located > LOCATED_BYTES_BUDGET_RATIO * unshared
+                   or shared > SHARED_BYTES_BUDGET_RATIO * unshared)
+    print("\nResultado:", "PRESUPUESTO EXCEDIDO" if over_budget else "dentro del presupuesto")
+    return 1 if over_budget else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
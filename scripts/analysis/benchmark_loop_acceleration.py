@@ -0,0 +1,91 @@
+"""
+Benchmark de la aceleración de bucles de conteo.
+
+Ejecuta un programa con un bucle de conteo (por defecto de 5.000
+iteraciones) interpretándolo completo y con core.engine.FastEngine, y
+verifica que el estado final sea idéntico. El motor rápido debe ser al
+menos LOOP_SPEEDUP_BUDGET veces más rápido.
+
+Uso (desde la raíz del proyecto):
+    python scripts/analysis/benchmark_loop_acceleration.py [--iterations N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, PROJECT_ROOT)
+
+from core.computer import Computer
+from core.engine import FastEngine
+
+# Aceleración mínima del motor rápido sobre la interpretación
+LOOP_SPEEDUP_BUDGET = 50.0
+
+
+def generate_loop_program(iterations: int) -> list:
+    """
+    Genera un programa que acumula un paso constante en un bucle de conteo.
+    
+    Args:
+        iterations: Iteraciones del bucle
+    
+    Returns:
+        Lista de líneas del programa
+    """
+    return [
+        f"LOAD R1, {iterations}",
+        "LOAD R2, 0",
+        "LOAD R3, 2",
+        "bucle: ADD R2, R3, R2",
+        "SUB R1, 1, R1",
+        "JPZ fin, R1",
+        "JP bucle",
+        "fin: STORE R2, 40",
+    ]
+
+
+def timed_run(program: list, accelerate: bool):
+    """Ejecuta el programa y devuelve (segundos, ciclos, estado final)."""
+    computer = Computer(64)
+    computer.load_program(program)
+    
+    start = time.perf_counter()
+    cycles = FastEngine(computer).run() if accelerate else computer.execute_program()
+    seconds = time.perf_counter() - start
+    return seconds, cycles, computer.get_system_state()
+
+
+def main(argv=None) -> int:
+    """Ejecuta el benchmark e imprime el reporte."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--iterations', type=int, default=5000, help="Iteraciones del bucle")
+    args = parser.parse_args(argv)
+    
+    program = generate_loop_program(args.iterations)
+    interpreted_seconds, interpreted_cycles, interpreted_state = timed_run(program, accelerate=False)
+    accelerated_seconds, accelerated_cycles, accelerated_state = timed_run(program, accelerate=True)
+    
+    if (accelerated_cycles, accelerated_state) != (interpreted_cycles, interpreted_state):
+        print("ERROR: el estado final del motor rápido difiere de la interpretación")
+        return 1
+    
+    speedup = interpreted_seconds / accelerated_seconds
+    over_budget = speedup < LOOP_SPEEDUP_BUDGET
+    
+    print("=" * 60)
+    print("ACELERACIÓN DE BUCLES DE CONTEO")
+    print("=" * 60)
+    print(f"\nIteraciones: {args.iterations}  Ciclos: {interpreted_cycles}")
+    print(f"  Interpretado: {interpreted_seconds * 1000:10.1f} ms")
+    print(f"  FastEngine:   {accelerated_seconds * 1000:10.1f} ms  ({speedup:.0f}x, "
+          f"presupuesto {LOOP_SPEEDUP_BUDGET:.0f}x)")
+    
+    print("\nResultado:", "PRESUPUESTO EXCEDIDO" if over_budget else "dentro del presupuesto")
+    return 1 if over_budget else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""
+Benchmark de carga de programas en formato objeto.
+
+Ensambla un programa sintético (por defecto de 1.000.000 de
+instrucciones), lo guarda como archivo objeto y compara el tiempo de
+cargarlo en un Computer con el de una lectura simple del archivo. La
+carga debería estar dominada por esa lectura.
+
+Uso (desde la raíz del proyecto):
+    python scripts/analysis/benchmark_object_format.py [--instructions N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, PROJECT_ROOT)
+
+from benchmark_parser import generate_program
+from core.computer import Computer
+from utils.assembler import assemble
+from utils.object_format import read_object, write_object
+
+# La carga completa no debe superar este múltiplo del tiempo de lectura
+LOAD_TO_READ_BUDGET = 3.0
+
+
+def best_of(function, repeat: int = 5) -> float:
+    """Mejor tiempo (segundos) de varias ejecuciones."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(argv=None) -> int:
+    """Ejecuta el benchmark e imprime el reporte."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--instructions', type=int, default=1_000_000, help="Instrucciones del programa")
+    args = parser.parse_args(argv)
+    
+    print("Ensamblando programa sintético...")
+    assemble_start = time.perf_counter()
+    program = assemble(generate_program(args.instructions))
+    assemble_seconds = time.perf_counter() - assemble_start
+    
+    computer = Computer(2 * len(program))
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'programa.simo')
+        write_object(program, path)
+        size = os.path.getsize(path)
+        
+        def read_file():
+            with open(path, 'rb') as source:
+                source.read()
+        
+        read_seconds = best_of(read_file)
+        load_seconds = best_of(lambda: computer.load_object_image(read_object(path)))
+    
+    # La primera instrucción se decodifica al ejecutarla
+    computer.execute_next_instruction()
+    
+    print("=" * 60)
+    print("CARGA DE ARCHIVO OBJETO")
+    print("=" * 60)
+    print(f"\nInstrucciones: {len(program)}  Archivo: {size / 1e6:.1f} MB")
+    print(f"Ensamblado desde texto: {assemble_seconds * 1000:10.1f} ms")
+    print(f"Lectura del archivo:    {read_seconds * 1000:10.1f} ms")
+    print(f"Carga en Computer:      {load_seconds * 1000:10.1f} ms "
+          f"({load_seconds / read_seconds:.1f}x la lectura, presupuesto {LOAD_TO_READ_BUDGET:.0f}x)")
+    
+    over_budget = load_seconds > LOAD_TO_READ_BUDGET * read_seconds
+    print("\nResultado:", "PRESUPUESTO EXCEDIDO" if over_budget else "dentro del presupuesto")
+    return 1 if over_budget else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""
+Benchmark del ensamblado en paralelo.
+
+Ensambla un programa sintético (por defecto de 1.000.000 de líneas, con
+etiquetas y saltos entre bloques) a formato objeto con 1, 2, 4 y 8
+procesos y muestra la aceleración respecto a un solo proceso. Verifica
+que todas las imágenes sean idénticas byte a byte.
+
+Con al menos 4 CPUs, 4 procesos deben acelerar el ensamblado al menos
+PARALLEL_SPEEDUP_BUDGET veces; con menos CPUs solo se informa la escala.
+
+Uso (desde la raíz del proyecto):
+    python scripts/analysis/benchmark_parallel_assembly.py [--lines N] [--workers 1 2 4 8]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, PROJECT_ROOT)
+
+from benchmark_parser import generate_program
+from utils.instruction_parser import clear_parse_cache
+from utils.parallel_assembler import DEFAULT_CHUNK_LINES, assemble_parallel
+
+# Aceleración mínima con 4 procesos (solo se exige con 4 CPUs o más)
+PARALLEL_SPEEDUP_BUDGET = 2.0
+BUDGET_WORKERS = 4
+
+# Cada cuántas líneas se inserta una etiqueta y un salto hacia ella
+LABEL_EVERY = 1000
+
+
+def generate_labeled_program(lines: int) -> list:
+    """
+    Genera un programa sintético con etiquetas y saltos hacia adelante.
+    
+    Args:
+        lines: Número de líneas a generar
+    
+    Returns:
+        Lista de líneas del programa
+    """
+    program = generate_program(lines)
+    for index in range(0, lines - LABEL_EVERY, LABEL_EVERY):
+        program[index] = f"JP bloque_{index + LABEL_EVERY}"
+        program[index + LABEL_EVERY - 1] = f"bloque_{index + LABEL_EVERY}: " + program[index + LABEL_EVERY - 1]
+    return program
+
+
+def main(argv=None) -> int:
+    """Ejecuta el benchmark e imprime el reporte."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--lines', type=int, default=1_000_000, help="Líneas del programa sintético")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8], help="Procesos a medir")
+    parser.add_argument('--chunk-lines', type=int, default=DEFAULT_CHUNK_LINES, help="Líneas por bloque")
+    args = parser.parse_args(argv)
+    
+    program = generate_labeled_program(args.lines)
+    cpus = os.cpu_count() or 1
+    
+    timings = {}
+    reference = None
+    for workers in args.workers:
+        # Cada medición parte con la caché de parseo vacía
+        clear_parse_cache()
+        start = time.perf_counter()
+        image = assemble_parallel(program, workers, args.chunk_lines)
+        timings[workers] = time.perf_counter() - start
+        
+        if reference is None:
+            reference = image.content
+        elif image.content != reference:
+            print(f"ERROR: la imagen con {workers} procesos difiere de la de {args.workers[0]}")
+            return 1
+    
+    print("=" * 60)
+    print("ENSAMBLADO EN PARALELO")
+    print("=" * 60)
+    print(f"\nLíneas: {args.lines}  Bloque: {args.chunk_lines} líneas  CPUs: {cpus}")
+    baseline = timings[args.workers[0]]
+    for workers, seconds in timings.items():
+        print(f"  {workers:>2} procesos: {seconds * 1000:10.1f} ms  ({baseline / seconds:.2f}x)")
+    
+    over_budget = False
+    if BUDGET_WORKERS in timings and 1 in timings and cpus >= BUDGET_WORKERS:
+        speedup = timings[1] / timings[BUDGET_WORKERS]
+        over_budget = speedup < PARALLEL_SPEEDUP_BUDGET
+        print(f"\nAceleración con {BUDGET_WORKERS} procesos: {speedup:.2f}x "
+              f"(presupuesto {PARALLEL_SPEEDUP_BUDGET:.1f}x)")
+    else:
+        print(f"\nMenos de {BUDGET_WORKERS} CPUs: la aceleración solo se informa")
+    
+    print("\nResultado:", "PRESUPUESTO EXCEDIDO" if over_budget else "dentro del presupuesto")
+    return 1 if over_budget else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
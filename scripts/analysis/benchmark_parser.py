@@ -0,0 +1,102 @@
+"""
+Benchmark del rendimiento del parser de instrucciones.
+
+Genera un programa sintético (por defecto de 1.000.000 de líneas) con
+todas las formas de operandos válidas y mide cuántas líneas por segundo
+procesa el parser, tanto sin caché (tokenizador puro) como a través de
+la caché LRU compartida.
+
+Uso (desde la raíz del proyecto):
+    python scripts/analysis/benchmark_parser.py [--lines N] [--seed N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils.instruction_parser import get_shared_parser, parse_cached, clear_parse_cache, parse_cache_info
+
+
+def _register(rng: random.Random) -> str:
+    """Registro aleatorio R1-R9."""
+    return f"R{rng.randint(1, 9)}"
+
+
+def generate_program(lines: int, seed: int = 0) -> list:
+    """
+    Genera un programa sintético con instrucciones válidas.
+    
+    Args:
+        lines: Número de líneas a generar
+        seed: Semilla del generador aleatorio
+    
+    Returns:
+        Lista de instrucciones como strings
+    """
+    rng = random.Random(seed)
+    generators = (
+        lambda: f"{rng.choice(('ADD', 'SUB', 'MUL', 'DIV', 'AND', 'OR', 'XOR'))} "
+                f"{_register(rng)}, {rng.choice((_register(rng), str(rng.randint(-500, 500))))}, {_register(rng)}",
+        lambda: f"NOT {_register(rng)}, {_register(rng)}",
+        lambda: f"LOAD {_register(rng)}, {rng.randint(-16384, 16383)}",
+        lambda: f"LOAD {_register(rng)}, *{_register(rng)}",
+        lambda: f"LOAD {_register(rng)}, *{rng.randint(16, 31)}",
+        lambda: f"STORE {_register(rng)}, {rng.randint(16, 31)}",
+        lambda: f"MOVE {_register(rng)}, {_register(rng)}",
+        lambda: f"JP {rng.randint(0, 15)}",
+        lambda: f"JPZ {rng.randint(0, 15)}, {_register(rng)}",
+        lambda: "HALT",
+    )
+    return [rng.choice(generators)() for _ in range(lines)]
+
+
+def measure(function, program: list) -> float:
+    """
+    Mide las líneas por segundo de una función de parseo.
+    
+    Args:
+        function: Función que recibe una línea
+        program: Líneas a procesar
+    
+    Returns:
+        Líneas por segundo
+    """
+    start = time.perf_counter()
+    for line in program:
+        function(line)
+    elapsed = time.perf_counter() - start
+    return len(program) / elapsed
+
+
+def main(argv=None) -> int:
+    """Ejecuta el benchmark e imprime el reporte."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--lines', type=int, default=1_000_000, help="Líneas del programa sintético")
+    parser.add_argument('--seed', type=int, default=0, help="Semilla del generador")
+    args = parser.parse_args(argv)
+    
+    program = generate_program(args.lines, args.seed)
+    shared_parser = get_shared_parser()
+    
+    uncached = measure(shared_parser._parse_uncached, program)
+    
+    clear_parse_cache()
+    cached = measure(parse_cached, program)
+    info = parse_cache_info()
+    
+    print("=" * 60)
+    print("RENDIMIENTO DEL PARSER")
+    print("=" * 60)
+    print(f"\nLíneas: {len(program)} ({info['misses']} distintas en caché)")
+    print(f"Sin caché:  {uncached:12,.0f} líneas/s")
+    print(f"Con caché:  {cached:12,.0f} líneas/s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
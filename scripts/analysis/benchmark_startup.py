@@ -0,0 +1,128 @@
+"""
+Benchmark del costo de arranque del simulador.
+
+Mide el tiempo de importación de los paquetes del proyecto con
+`python -X importtime` y el tiempo de construir instancias de Computer,
+comparándolos con un presupuesto fijo. Termina con código 1 si algún
+presupuesto se excede.
+
+Uso (desde la raíz del proyecto):
+    python scripts/analysis/benchmark_startup.py [--runs N] [--instances N]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import timeit
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, PROJECT_ROOT)
+
+# Presupuestos de arranque
+IMPORT_BUDGET_MS = 60.0          # Importar core.computer (paquetes del proyecto + stdlib usada)
+CONSTRUCT_BUDGET_US = 60.0       # Computer() con memoria por defecto
+LARGE_CONSTRUCT_BUDGET_US = 1000.0  # Computer(65536)
+
+PROJECT_PACKAGES = ('core', 'hardware', 'utils')
+
+
+def measure_import_time(module: str, runs: int):
+    """
+    Mide la importación de un módulo en procesos nuevos con -X importtime.
+    
+    Args:
+        module: Módulo a importar
+        runs: Número de procesos a lanzar (se toma el mínimo)
+    
+    Returns:
+        Tupla (total_ms, lista de (módulo, self_ms, cumulative_ms) del mejor run)
+    """
+    best_total = None
+    best_rows = []
+    
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            cwd=PROJECT_ROOT, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            universal_newlines=True, check=True
+        )
+        
+        rows = []
+        total_us = 0
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:') or 'self [us]' in line:
+                continue
+            self_us, cumulative_us, name = line[len('import time:'):].split('|')
+            indent = len(name) - len(name.lstrip())
+            name = name.strip()
+            if indent == 1:
+                # Módulos de primer nivel: su acumulado incluye a sus dependencias
+                total_us += int(cumulative_us)
+            rows.append((name, int(self_us) / 1000, int(cumulative_us) / 1000))
+        
+        total_ms = total_us / 1000
+        if best_total is None or total_ms < best_total:
+            best_total = total_ms
+            best_rows = rows
+    
+    return best_total, best_rows
+
+
+def measure_construction(memory_size: int, instances: int) -> float:
+    """
+    Mide el tiempo medio de construir un Computer.
+    
+    Args:
+        memory_size: Tamaño de memoria de cada instancia
+        instances: Número de instancias a construir por repetición
+    
+    Returns:
+        Microsegundos por instancia (mejor de 5 repeticiones)
+    """
+    from core.computer import Computer
+    
+    timer = timeit.Timer(lambda: Computer(memory_size))
+    return min(timer.repeat(repeat=5, number=instances)) / instances * 1e6
+
+
+def main(argv=None) -> int:
+    """Ejecuta el benchmark e imprime el reporte."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=5, help="Procesos para medir la importación")
+    parser.add_argument('--instances', type=int, default=2000, help="Instancias de Computer por repetición")
+    parser.add_argument('--top', type=int, default=10, help="Módulos más costosos a mostrar")
+    args = parser.parse_args(argv)
+    
+    import_ms, rows = measure_import_time('core.computer', args.runs)
+    construct_us = measure_construction(32, args.instances)
+    large_construct_us = measure_construction(65536, max(1, args.instances // 10))
+    
+    print("=" * 60)
+    print("ARRANQUE DEL SIMULADOR")
+    print("=" * 60)
+    print(f"\nImportar core.computer: {import_ms:.2f} ms (presupuesto {IMPORT_BUDGET_MS:.0f} ms)")
+    
+    project_rows = [row for row in rows if row[0].split('.')[0] in PROJECT_PACKAGES]
+    print("\nMódulos del proyecto (self ms / acumulado ms):")
+    for name, self_ms, cumulative_ms in sorted(project_rows, key=lambda row: -row[1])[:args.top]:
+        print(f"  {name:<35} {self_ms:8.2f} {cumulative_ms:10.2f}")
+    
+    print("\nMódulos más costosos en total (self ms):")
+    for name, self_ms, _ in sorted(rows, key=lambda row: -row[1])[:args.top]:
+        print(f"  {name:<35} {self_ms:8.2f}")
+    
+    print(f"\nComputer(): {construct_us:.1f} us (presupuesto {CONSTRUCT_BUDGET_US:.0f} us)")
+    print(f"Computer(65536): {large_construct_us:.1f} us (presupuesto {LARGE_CONSTRUCT_BUDGET_US:.0f} us)")
+    
+    over_budget = (
+        import_ms > IMPORT_BUDGET_MS or
+        construct_us > CONSTRUCT_BUDGET_US or
+        large_construct_us > LARGE_CONSTRUCT_BUDGET_US
+    )
+    print("\nResultado:", "PRESUPUESTO EXCEDIDO" if over_budget else "dentro del presupuesto")
+    return 1 if over_budget else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
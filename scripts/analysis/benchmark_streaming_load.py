@@ -0,0 +1,100 @@
+"""
+Benchmark de la carga en streaming de programas de texto.
+
+Escribe un programa sintético (por defecto de 200.000 líneas) en un
+archivo y compara la carga con la lista completa de líneas
+(Computer.load_program) contra la carga en streaming desde el archivo
+abierto (Computer.load_program_stream). Con tracemalloc mide la memoria
+pico de cada carga, descontando la memoria del simulador ya construido.
+
+Uso (desde la raíz del proyecto):
+    python scripts/analysis/benchmark_streaming_load.py [--lines N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, PROJECT_ROOT)
+
+from benchmark_parser import generate_program
+from core.computer import Computer
+from utils.instruction_parser import clear_parse_cache
+
+# La carga en streaming no debe superar esta fracción de la memoria pico
+# de la carga con la lista completa
+STREAM_PEAK_BUDGET_RATIO = 0.5
+
+
+def measure_load(path: str, memory_size: int, streaming: bool):
+    """
+    Carga el programa de un archivo y mide tiempo y memoria pico.
+    
+    Args:
+        path: Archivo con el programa
+        memory_size: Tamaño de memoria del Computer
+        streaming: True para load_program_stream, False para load_program
+    
+    Returns:
+        Tupla (segundos sin tracemalloc, bytes pico con tracemalloc)
+    """
+    def load(computer):
+        with open(path, encoding='utf-8') as source:
+            if streaming:
+                computer.load_program_stream(source)
+            else:
+                computer.load_program(source.read().splitlines())
+    
+    # Cada carga parte con la caché de parseo vacía
+    clear_parse_cache()
+    computer = Computer(memory_size)
+    start = time.perf_counter()
+    load(computer)
+    seconds = time.perf_counter() - start
+    
+    clear_parse_cache()
+    computer = Computer(memory_size)
+    tracemalloc.start()
+    load(computer)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    return seconds, peak
+
+
+def main(argv=None) -> int:
+    """Ejecuta el benchmark e imprime el reporte."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--lines', type=int, default=200_000, help="Líneas del programa sintético")
+    args = parser.parse_args(argv)
+    
+    memory_size = 2 * args.lines
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'programa.txt')
+        with open(path, 'w', encoding='utf-8') as target:
+            for line in generate_program(args.lines):
+                target.write(line + '\n')
+        
+        list_seconds, list_peak = measure_load(path, memory_size, streaming=False)
+        stream_seconds, stream_peak = measure_load(path, memory_size, streaming=True)
+    
+    print("=" * 60)
+    print("CARGA EN STREAMING")
+    print("=" * 60)
+    print(f"\nLíneas: {args.lines}")
+    print(f"Lista completa: {list_seconds * 1000:10.1f} ms  pico {list_peak / 1e6:8.1f} MB")
+    print(f"Streaming:      {stream_seconds * 1000:10.1f} ms  pico {stream_peak / 1e6:8.1f} MB "
+          f"({stream_peak / list_peak:.2f}x, presupuesto {STREAM_PEAK_BUDGET_RATIO:.2f}x)")
+    
+    over_budget = stream_peak > STREAM_PEAK_BUDGET_RATIO * list_peak
+    print("\nResultado:", "PRESUPUESTO EXCEDIDO" if over_budget else "dentro del presupuesto")
+    return 1 if over_budget else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -17,6 +17,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 
 from core.computer import Computer
 from core.instruction import Instruction, InstructionType
+from core.observer import EventType
 from core.exceptions import *
 
 
@@ -334,6 +335,218 @@ class TestComputerIntegration(unittest.TestCase):
         self.assertEqual(final_sum, 15)
 
 
+    def test_jump_loop_execution(self):
+        """Test bucle con JPZ y JP que salta a las direcciones indicadas."""
+        program = [
+            "LOAD R1, 3",
+            "LOAD R2, 1",
+            "SUB R1, R2, R1",
+            "ADD R3, R2, R3",
+            "JPZ 6, R1",
+            "JP 2",
+            "STORE R3, 20"
+        ]
+        
+        self.computer.load_program(program)
+        self.computer.execute_program()
+        
+        self.assertEqual(self.computer.register_bank.get("R1"), 0)
+        self.assertEqual(self.computer.memory.read(20), 3)
+        self.assertEqual(self.computer.pc_register.value, 7)
+    
+    def test_operands_resolved_from_parsed_tokens(self):
+        """Los operandos se resuelven con las clases del parser, sin reclasificar el texto."""
+        program = [
+            "LOAD R1, -7",
+            "STORE R1, 30",
+            "LOAD R2, 30",
+            "LOAD R3, *30",
+            "LOAD R4, *R2",
+            "ADD R3, R4, R5",
+            "MOVE R6, R5",
+        ]
+        self.computer.load_program(program)
+        
+        with patch.object(self.computer.register_bank, 'exists') as exists:
+            self.computer.execute_program()
+        
+        exists.assert_not_called()
+        self.assertEqual(self.computer.register_bank.get("R3"), -7)
+        self.assertEqual(self.computer.register_bank.get("R4"), -7)
+        self.assertEqual(self.computer.register_bank.get("R6"), -14)
+    
+    def test_lazy_flags_give_same_final_state(self):
+        """Con flags diferidos el estado final y el registro PSW no cambian."""
+        program = ["LOAD R1, 2", "SUB R1, 3, R2", "MUL R2, 5, R3", "ADD R3, 5, R4"]
+        eager = Computer()
+        eager.load_program(program)
+        eager.execute_program()
+        
+        self.computer.set_lazy_flags(True)
+        self.computer.load_program(program)
+        self.computer.execute_program()
+        
+        self.assertEqual(self.computer.get_system_state(), eager.get_system_state())
+        self.assertEqual(self.computer.psw_register.value, eager.psw_register.value)
+        events = [call[0][1] for call in self.mock_observer.update.call_args_list]
+        self.assertNotIn(EventType.ALU_FLAGS_UPDATED, events)
+
+
+class TestControllerBreakpoints(unittest.TestCase):
+    """Pruebas de velocidad y puntos de ruptura del controlador (vista simulada)."""
+    
+    def setUp(self):
+        """Crea el controlador con una vista simulada."""
+        # Los widgets se simulan igual que en TestMVCIntegration
+        with patch('tkinter.Canvas'), patch('tkinter.Text'):
+            from gui.simulator_controller import SimulatorController, SPEED_LEVELS
+        self.speed_levels = SPEED_LEVELS
+        self.computer = Computer()
+        self.view = Mock()
+        self.view.get_program_text.return_value = "\n".join([
+            "LOAD R1, 4",
+            "LOAD R2, 1",
+            "SUB R1, R2, R1",
+            "JPZ 5, R1",
+            "JP 2",
+            "STORE R1, 20"
+        ])
+        self.controller = SimulatorController(self.view, self.computer)
+        self.computer.load_program([line for line in self.view.get_program_text().split("\n")])
+        self.controller._is_executing = True
+    
+    def test_run_until_address_breakpoint(self):
+        """El avance rápido se detiene en la dirección con punto de ruptura."""
+        self.controller.add_breakpoint(3)
+        
+        hit = self.controller._run_until_breakpoint(len(self.computer.loaded_program))
+        
+        self.assertEqual(hit, 3)
+        self.assertEqual(self.computer.register_bank.get("R1"), 3)
+        # La vista vuelve a observar el modelo
+        self.assertIn(self.view, self.computer._observers)
+    
+    def test_run_until_register_condition(self):
+        """El avance rápido se detiene cuando un registro toma el valor indicado."""
+        self.controller.set_register_conditions_from_text("r1=1")
+        
+        hit = self.controller._run_until_breakpoint(len(self.computer.loaded_program))
+        
+        self.assertEqual(hit, 3)
+        self.assertEqual(self.computer.register_bank.get("R1"), 1)
+    
+    def test_run_without_breakpoints_reaches_end(self):
+        """Sin puntos de ruptura el avance rápido termina el programa."""
+        hit = self.controller._run_until_breakpoint(len(self.computer.loaded_program))
+        
+        self.assertIsNone(hit)
+        self.assertEqual(self.computer.register_bank.get("R1"), 0)
+    
+    def test_toggle_breakpoint_at_editor_line(self):
+        """El doble clic en una línea del editor mapea a la dirección de la instrucción."""
+        self.view.get_program_text.return_value = "LOAD R1, 1\n\nLOAD R2, 2"
+        
+        self.controller.toggle_breakpoint_at_line(3)
+        self.assertEqual(self.controller.breakpoints, {1})
+        
+        self.controller.toggle_breakpoint_at_line(3)
+        self.assertEqual(self.controller.breakpoints, set())
+    
+    def test_invalid_register_condition_reports_error(self):
+        """Una condición inválida se reporta y no reemplaza las existentes."""
+        self.controller.add_register_condition("R2", 5)
+        
+        self.controller.set_register_conditions_from_text("R42=1")
+        
+        self.view.show_error.assert_called()
+        self.assertEqual(self.controller.register_conditions, {"R2": {5}})
+    
+    def test_condition_edits_do_not_mutate_running_snapshot(self):
+        """Editar las condiciones reemplaza el diccionario que recorre el hilo de ejecución."""
+        self.controller.add_register_condition("R1", 1)
+        self.controller.add_register_condition("R1", 2)
+        snapshot = self.controller._register_conditions
+        
+        self.controller.remove_register_condition("R1", 1)
+        self.controller.add_register_condition("R2", 3)
+        self.controller.clear_breakpoints()
+        
+        self.assertEqual(snapshot, {"R1": {1, 2}})
+        self.assertEqual(self.controller.register_conditions, {})
+    
+    def test_cycle_execution_speed(self):
+        """El nivel de velocidad avanza cíclicamente hasta "sin límite"."""
+        for _ in range(len(self.speed_levels) - 1):
+            self.controller.cycle_execution_speed()
+        self.assertEqual(self.controller.execution_delay, 0.0)
+        
+        self.controller.cycle_execution_speed()
+        self.assertEqual(self.controller.execution_delay, self.speed_levels[0][1])
+
+
+class TestControllerIncrementalAssembly(unittest.TestCase):
+    """Pruebas del reensamblado incremental del editor (vista simulada)."""
+    
+    def setUp(self):
+        """Crea el controlador con una vista simulada."""
+        with patch('tkinter.Canvas'), patch('tkinter.Text'):
+            from gui.simulator_controller import SimulatorController
+        self.computer = Computer()
+        self.view = Mock()
+        self.view.get_program_text.return_value = "LOAD R1, 1\nFOO R2\nLOAD R3, 3"
+        self.controller = SimulatorController(self.view, self.computer)
+    
+    def test_program_changed_callback_is_registered(self):
+        """El controlador se suscribe a las ediciones del programa."""
+        self.view.set_program_changed_callback.assert_called_once_with(self.controller.check_program)
+    
+    def test_check_program_marks_error_lines(self):
+        """Las líneas inválidas se marcan y se informan en la barra de estado."""
+        report = self.controller.check_program()
+        
+        self.assertEqual(list(report.errors), [2])
+        self.view.mark_error_lines.assert_called_with(report.errors)
+        self.assertIn("Línea 2", self.view.show_status.call_args[0][0])
+    
+    def test_load_reuses_checked_program(self):
+        """Cargar tras validar no vuelve a analizar ninguna línea."""
+        self.view.get_program_text.return_value = "LOAD R1, 1\nLOAD R2, 2\nLOAD R3, 3"
+        checked = self.controller.check_program()
+        
+        self.controller.load_program()
+        
+        self.assertEqual(self.controller._incremental_assembler.last_report.reparsed_lines, [])
+        self.assertIs(self.computer.assembled_program.instructions[0], checked.program.instructions[0])
+        self.assertEqual(self.computer.loaded_program, ["LOAD R1, 1", "LOAD R2, 2", "LOAD R3, 3"])
+    
+    def test_load_with_errors_reports_first_line(self):
+        """Cargar un programa inválido muestra el error de la primera línea inválida."""
+        self.controller.load_program()
+        
+        title, message = self.view.show_error.call_args[0]
+        self.assertEqual(title, "Error de Instrucción")
+        self.assertIn("línea 2", message)
+        self.assertEqual(self.computer.loaded_program, [])
+    
+    def test_optimization_is_disabled_by_default(self):
+        """En modo docente se carga exactamente el programa escrito."""
+        self.view.get_program_text.return_value = "LOAD R1, 1\nMOVE R1, R1"
+        
+        self.controller.load_program()
+        
+        self.assertFalse(self.controller.optimization_enabled)
+        self.assertEqual(self.computer.loaded_program, ["LOAD R1, 1", "MOVE R1, R1"])
+    
+    def test_enabled_optimization_loads_optimized_program(self):
+        """Con la optimización activada se carga el programa optimizado."""
+        self.view.get_program_text.return_value = "LOAD R1, 1\nMOVE R1, R1"
+        self.controller.set_optimization_enabled(True)
+        
+        self.controller.load_program()
+        
+        self.assertEqual(self.computer.loaded_program, ["LOAD R1, 1"])
+
+
 @patch('tkinter.Tk')
 @patch('tkinter.Canvas')
 @patch('tkinter.Text')
@@ -430,6 +643,56 @@ class TestMVCIntegration(unittest.TestCase):
         
         # Verificar que la vista es observadora del modelo
         self.assertIn(view, computer._observers)
+    
+    def test_bus_animation_uses_single_timer(self, mock_showerror, mock_scrollbar, mock_label, mock_button, mock_frame, mock_text, mock_canvas, mock_tk):
+        """Test las activaciones repetidas de un bus no programan callbacks nuevos."""
+        mock_root = Mock()
+        mock_root.tk = Mock()
+        mock_root._last_child_ids = {}
+        
+        from gui.simulator_view import SimulatorView
+        
+        view = SimulatorView(mock_root)
+        view.canvas = Mock()
+        after_calls = mock_root.after.call_count
+        
+        for _ in range(100):
+            view._animate_bus(view._bus_data_id, "yellow")
+        
+        # Un solo resaltado y ningún after() adicional por evento
+        self.assertEqual(view.canvas.itemconfig.call_count, 1)
+        self.assertEqual(mock_root.after.call_count, after_calls)
+        
+        # Al expirar, el temporizador restaura el color
+        view._bus_expiry[view._bus_data_id] = 0
+        view._tick()
+        self.assertEqual(view._bus_expiry, {})
+        view.canvas.itemconfig.assert_called_with(view._bus_data_id, outline="white", width=2)
+    
+    def test_editing_program_debounces_validation(self, mock_showerror, mock_scrollbar, mock_label, mock_button, mock_frame, mock_text, mock_canvas, mock_tk):
+        """Test varias teclas seguidas programan una sola revalidación pendiente."""
+        mock_root = Mock()
+        mock_root.tk = Mock()
+        mock_root._last_child_ids = {}
+        
+        from gui.simulator_view import SimulatorView
+        
+        view = SimulatorView(mock_root)
+        callback = Mock()
+        view.set_program_changed_callback(callback)
+        mock_root.after.side_effect = ["check-1", "check-2", "check-3"]
+        
+        for _ in range(3):
+            view._on_text_edited()
+        
+        # Cada tecla cancela la revalidación anterior
+        self.assertEqual(mock_root.after_cancel.call_count, 2)
+        mock_root.after_cancel.assert_called_with("check-2")
+        callback.assert_not_called()
+        
+        view._on_program_changed()
+        callback.assert_called_once_with()
+        self.assertIsNone(view._program_check_id)
 
 
 if __name__ == '__main__':
@@ -6,6 +6,9 @@ Aplicando técnicas de partición equivalente:
 - Partición 2: Operaciones lógicas válidas (AND, OR, NOT, XOR)
 - Partición 3: Casos límite (división por cero, overflow, valores extremos)
 - Partición 4: Gestión de flags PSW (Zero, Carry, Sign, Overflow)
+- Partición 5: Despacho por id de opcode (execute_id y tabla de manejadores)
+- Partición 6: Flags diferidos (se calculan al leerlos, sin eventos por operación)
+- Partición 7: Operaciones en lote con NumPy (execute_many)
 """
 
 import unittest
@@ -16,8 +19,14 @@ import os
 # Agregar path para imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from hardware.alu import ALU
-from core.exceptions import ALUOperationError as ALUError
+from hardware.alu import ALU, BATCH_OPCODES, HANDLERS, HANDLERS_BY_ID
+from core.exceptions import ALUOperationError as ALUError, OperandOutOfRangeError
+from core.instruction import OPCODE_IDS
+
+try:
+    import numpy
+except ImportError:  # NumPy es opcional: solo lo usa ALU.execute_many
+    numpy = None
 
 
 class TestALU(unittest.TestCase):
@@ -378,7 +387,159 @@ class TestALU(unittest.TestCase):
         """Test representación string de ALU."""
         str_repr = str(self.alu)
         self.assertIn("ALU", str_repr)
+    
+    # Partición 5: Despacho por id de opcode
+    def test_execute_id_matches_execute(self):
+        """execute_id da el mismo resultado y PSW que execute para cada opcode."""
+        reference = ALU()
+        cases = [(1, 2), (8191, 8191), (-5, 3), (0, 0), (7, 0), (-16384, 16383), (12, -3)]
+        for opcode in HANDLERS:
+            for operand1, operand2 in cases:
+                with self.subTest(opcode=opcode, operands=(operand1, operand2)):
+                    expected = reference.execute(opcode, operand1, operand2)
+                    result = self.alu.execute_id(OPCODE_IDS[opcode], operand1, operand2)
+                    
+                    self.assertEqual(result, expected)
+                    self.assertEqual(self.alu.psw, reference.psw)
+    
+    def test_handler_table_is_indexed_by_opcode_id(self):
+        """Cada manejador está en la posición de su id; el resto es None."""
+        for opcode, handler in HANDLERS.items():
+            self.assertIs(HANDLERS_BY_ID[OPCODE_IDS[opcode]], handler)
+        self.assertIsNone(HANDLERS_BY_ID[OPCODE_IDS['LOAD']])
+    
+    def test_execute_id_rejects_non_alu_opcode(self):
+        """Un id que no es de la ALU lanza ALUOperationError."""
+        with self.assertRaises(ALUError):
+            self.alu.execute_id(OPCODE_IDS['LOAD'], 1, 2)
+        with self.assertRaises(ALUError):
+            self.alu.execute_id(99, 1, 2)
+    
+    def test_execute_id_validates_operands(self):
+        """execute_id valida el rango de los operandos y marca overflow."""
+        with self.assertRaises(OperandOutOfRangeError):
+            self.alu.execute_id(OPCODE_IDS['ADD'], 16384, 1)
+        self.assertEqual(self.alu.psw['O'], 1)
+    
+    # Partición 6: Flags diferidos
+    def test_lazy_flags_match_eager_flags(self):
+        """Los flags diferidos son los mismos que los calculados en cada operación."""
+        lazy = ALU(lazy_flags=True)
+        for opcode in HANDLERS:
+            for operand1, operand2 in [(8191, 8191), (-5, 3), (7, 0), (0, 0), (3, -3)]:
+                with self.subTest(opcode=opcode, operands=(operand1, operand2)):
+                    self.assertEqual(lazy.execute(opcode, operand1, operand2),
+                                     self.alu.execute(opcode, operand1, operand2))
+                    self.assertEqual(lazy.psw, self.alu.psw)
+                    self.assertEqual(lazy.get_psw_string(), self.alu.get_psw_string())
+    
+    def test_lazy_flags_skip_notifications(self):
+        """Con flags diferidos no se notifican eventos por operación."""
+        lazy = ALU(lazy_flags=True)
+        lazy.add_observer(self.mock_observer)
+        
+        lazy.add(1, -1)
+        
+        self.mock_observer.update.assert_not_called()
+        self.assertEqual(lazy.psw['Z'], 1)
+    
+    def test_out_of_range_after_lazy_operation_keeps_previous_flags(self):
+        """Un error de rango marca O sobre los flags de la operación anterior."""
+        lazy = ALU(lazy_flags=True)
+        lazy.subtract(1, 2)
+        
+        with self.assertRaises(OperandOutOfRangeError):
+            lazy.add(20000, 1)
+        
+        self.assertEqual(lazy.psw, {'Z': 0, 'C': 1, 'S': 1, 'O': 1})
+    
+    def test_disabling_lazy_flags_restores_notifications(self):
+        """Al desactivar los flags diferidos vuelven los eventos por operación."""
+        self.alu.set_lazy_flags(True)
+        self.alu.add(2, 2)
+        self.alu.set_lazy_flags(False)
+        self.alu.add_observer(self.mock_observer)
+        
+        self.alu.add(1, 1)
+        
+        self.assertFalse(self.alu.lazy_flags)
+        self.assertEqual(self.mock_observer.update.call_count, 2)
+    
+    def test_execute_accepts_lowercase_opcode(self):
+        """execute conserva la compatibilidad con opcodes en minúsculas."""
+        self.assertEqual(self.alu.execute('add', 2, 3), 5)
+        with self.assertRaises(ALUError):
+            self.alu.execute('MOD', 2, 3)
+
 
 
+class TestALUBatch(unittest.TestCase):
+    """Pruebas para ALU.execute_many."""
+    
+    # Partición 7: Operaciones en lote
+    def setUp(self):
+        """Configuración común para todas las pruebas."""
+        self.alu = ALU()
+    
+    @unittest.skipIf(numpy is None, "NumPy no está instalado")
+    def test_batch_matches_scalar_execution(self):
+        """Cada par da el mismo resultado y flags que execute()."""
+        edges = [-16384, -8193, -8192, -1, 0, 1, 2, 3, 8191, 8192, 16383]
+        operand1, operand2 = numpy.meshgrid(edges, edges)
+        operand1, operand2 = operand1.ravel(), operand2.ravel()
+        scalar = ALU()
+        
+        for opcode in sorted(BATCH_OPCODES):
+            with self.subTest(opcode=opcode):
+                batch = self.alu.execute_many(opcode, operand1, operand2)
+                for index, (first, second) in enumerate(zip(operand1.tolist(), operand2.tolist())):
+                    value = scalar.execute(opcode, first, second)
+                    psw = scalar.psw
+                    flags = (batch.z[index], batch.c[index], batch.s[index], batch.o[index])
+                    self.assertEqual(batch.value[index], value)
+                    self.assertEqual(flags, (psw['Z'], psw['C'], psw['S'], psw['O']))
+    
+    @unittest.skipIf(numpy is None, "NumPy no está instalado")
+    def test_division_by_zero_returns_zero_with_z(self):
+        """La división por cero da 0 con Z en cada posición."""
+        batch = self.alu.execute_many('DIV', [5, -7, 9], [0, 0, 3])
+        
+        self.assertEqual(batch.value.tolist(), [0, 0, 3])
+        self.assertEqual(batch.z.tolist(), [1, 1, 0])
+    
+    @unittest.skipIf(numpy is None, "NumPy no está instalado")
+    def test_out_of_range_operands(self):
+        """Fuera de rango se lanza el error o se marca la posición como inválida."""
+        with self.assertRaises(OperandOutOfRangeError):
+            self.alu.execute_many('ADD', [1, 16384], [1, 1])
+        
+        batch = self.alu.execute_many('ADD', [1, 16384], [1, 1], strict=False)
+        self.assertEqual(batch.valid.tolist(), [True, False])
+        self.assertEqual(batch.value.tolist(), [2, 0])
+        self.assertEqual(batch.o.tolist(), [0, 1])
+    
+    @unittest.skipIf(numpy is None, "NumPy no está instalado")
+    def test_batch_does_not_change_alu_state(self):
+        """execute_many no modifica el resultado ni el PSW de la ALU."""
+        self.alu.add(2, 3)
+        
+        self.alu.execute_many('SUB', [0], [1])
+        
+        self.assertEqual(self.alu.value, 5)
+        self.assertEqual(self.alu.psw['S'], 0)
+    
+    def test_jump_opcodes_are_rejected(self):
+        """Los saltos no se admiten en lote."""
+        with self.assertRaises(ALUError):
+            self.alu.execute_many('JPZ', [1], [0])
+    
+    def test_missing_numpy_raises_import_error(self):
+        """Sin NumPy execute_many lanza ImportError y execute sigue funcionando."""
+        with patch.dict(sys.modules, {'numpy': None}):
+            with self.assertRaises(ImportError):
+                self.alu.execute_many('ADD', [1], [2])
+        
+        self.assertEqual(self.alu.add(1, 2), 3)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
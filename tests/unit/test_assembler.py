@@ -0,0 +1,339 @@
+"""
+Pruebas unitarias para el ensamblador de dos pasadas.
+
+Aplicando técnicas de partición equivalente:
+- Partición 1: Programas válidos (comentarios, etiquetas, constantes)
+- Partición 2: Programas inválidos (símbolos y directivas incorrectos)
+- Partición 3: Carga del programa ensamblado en Computer
+- Partición 4: Reensamblado incremental (líneas cambiadas, reubicadas, errores por línea)
+- Partición 5: Carga en streaming (referencias hacia adelante, límite de errores)
+"""
+
+import io
+import unittest
+from unittest.mock import patch
+import sys
+import os
+
+# Agregar path para imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.computer import Computer
+from core.exceptions import AssemblyError, AssemblyErrorGroup, InvalidInstructionError
+from utils.assembler import Assembler, IncrementalAssembler
+from utils.instruction_parser import InstructionParser
+
+
+COUNTDOWN_SOURCE = """# Cuenta regresiva con etiquetas
+.equ INICIAL, 3
+.equ DATO, 20
+
+        LOAD R1, INICIAL   # Contador
+        LOAD R2, 1
+bucle:  SUB R1, R2, R1
+        JPZ fin, R1
+        JP bucle
+fin:
+        STORE R2, DATO
+        LOAD R3, *DATO
+""".split("\n")
+
+
+class TestAssembler(unittest.TestCase):
+    """Pruebas para Assembler."""
+    
+    def setUp(self):
+        """Crea el ensamblador bajo prueba."""
+        self.assembler = Assembler()
+    
+    # Partición 1: Programas válidos
+    def test_comments_and_blank_lines_are_skipped(self):
+        """Solo las instrucciones ocupan direcciones."""
+        program = self.assembler.assemble(COUNTDOWN_SOURCE)
+        
+        self.assertEqual(len(program), 7)
+        self.assertEqual(program.lines[0], "LOAD R1, 3")
+    
+    def test_labels_and_constants_are_resolved(self):
+        """Las etiquetas y constantes se sustituyen por su valor."""
+        program = self.assembler.assemble(COUNTDOWN_SOURCE)
+        
+        self.assertEqual(program.symbols, {"INICIAL": 3, "DATO": 20, "bucle": 2, "fin": 5})
+        self.assertEqual(program.lines[3], "JPZ 5, R1")
+        self.assertEqual(program.lines[4], "JP 2")
+        self.assertEqual(program.lines[6], "LOAD R3, *20")
+    
+    def test_source_map(self):
+        """Cada dirección apunta a su línea fuente y viceversa."""
+        program = self.assembler.assemble(COUNTDOWN_SOURCE)
+        
+        self.assertEqual(program.line_for_address(0), 5)
+        self.assertEqual(program.line_for_address(2), 7)
+        self.assertEqual(program.address_for_line(11), 5)
+        self.assertIsNone(program.address_for_line(10))
+        self.assertIsNone(program.line_for_address(99))
+    
+    def test_instructions_are_decoded_with_address(self):
+        """Las instrucciones decodificadas conocen su dirección."""
+        program = self.assembler.assemble(COUNTDOWN_SOURCE)
+        
+        self.assertEqual(program.instructions[2].opcode, "SUB")
+        self.assertEqual(program.instructions[2].address, 2)
+    
+    # Partición 2: Programas inválidos
+    def test_invalid_instruction_reports_line(self):
+        """Un error del parser se reporta con la línea fuente."""
+        with self.assertRaises(AssemblyError) as context:
+            self.assembler.assemble(["LOAD R1, 1", "# comentario", "FOO R1"])
+        
+        self.assertEqual(context.exception.line_number, 3)
+        self.assertIsInstance(context.exception, InvalidInstructionError)
+    
+    def test_undefined_symbol(self):
+        """Un símbolo no definido se reporta por nombre."""
+        with self.assertRaisesRegex(AssemblyError, "Undefined symbol 'salida'"):
+            self.assembler.assemble(["JP salida"])
+    
+    def test_duplicate_label(self):
+        """Una etiqueta no puede definirse dos veces."""
+        with self.assertRaisesRegex(AssemblyError, "Duplicate symbol 'a'"):
+            self.assembler.assemble(["a: HALT", "a: HALT"])
+    
+    def test_register_name_is_not_a_symbol(self):
+        """Los nombres de registro no pueden ser etiquetas ni constantes."""
+        with self.assertRaises(AssemblyError):
+            self.assembler.assemble([".equ R1, 5"])
+    
+    def test_unknown_directive(self):
+        """Las directivas desconocidas se rechazan."""
+        with self.assertRaisesRegex(AssemblyError, "Unknown directive"):
+            self.assembler.assemble([".org 4"])
+    
+    # Partición 3: Carga en Computer
+    def test_computer_runs_assembled_program(self):
+        """Computer carga el programa ensamblado y lo ejecuta."""
+        computer = Computer()
+        computer.load_program(COUNTDOWN_SOURCE)
+        computer.execute_program()
+        
+        self.assertEqual(computer.register_bank.get("R1"), 0)
+        self.assertEqual(computer.register_bank.get("R3"), 1)
+        self.assertEqual(computer.assembled_program.symbols["fin"], 5)
+    
+    def test_fetch_uses_decoded_instruction(self):
+        """La memoria guarda la instrucción decodificada que usa el fetch."""
+        computer = Computer()
+        computer.load_program(COUNTDOWN_SOURCE)
+        
+        decoded = computer.memory.load_decoded_instruction(0)
+        computer.execute_next_instruction()
+        
+        self.assertIs(computer.control_unit.instruction_register, decoded)
+        self.assertIs(decoded, computer.assembled_program.instructions[0])
+
+
+class TestIncrementalAssembler(unittest.TestCase):
+    """Pruebas para IncrementalAssembler."""
+    
+    def setUp(self):
+        """Configuración inicial para cada prueba."""
+        self.incremental = IncrementalAssembler()
+    
+    def test_first_update_matches_full_assembly(self):
+        """La primera actualización produce el mismo programa que Assembler."""
+        report = self.incremental.update(COUNTDOWN_SOURCE)
+        expected = Assembler().assemble(COUNTDOWN_SOURCE)
+        
+        self.assertTrue(report.ok)
+        self.assertEqual(report.program.instructions, expected.instructions)
+        self.assertEqual(report.program.source_map, expected.source_map)
+        self.assertEqual(report.program.symbols, expected.symbols)
+        self.assertEqual(report.reparsed_lines, list(range(1, len(COUNTDOWN_SOURCE) + 1)))
+    
+    def test_only_changed_lines_are_reparsed(self):
+        """Editar una línea solo vuelve a analizar esa línea."""
+        self.incremental.update(COUNTDOWN_SOURCE)
+        edited = list(COUNTDOWN_SOURCE)
+        edited[5] = "        LOAD R2, 2"
+        
+        report = self.incremental.update(edited)
+        
+        self.assertEqual(report.reparsed_lines, [6])
+        self.assertEqual(report.program.instructions[1].raw_instruction, "LOAD R2, 2")
+    
+    def test_unchanged_instructions_are_reused(self):
+        """Las instrucciones de líneas sin cambios conservan la misma instancia."""
+        first = self.incremental.update(COUNTDOWN_SOURCE).program
+        second = self.incremental.update(list(COUNTDOWN_SOURCE)).program
+        
+        self.assertEqual(self.incremental.last_report.reparsed_lines, [])
+        for before, after in zip(first.instructions, second.instructions):
+            self.assertIs(before, after)
+    
+    def test_inserted_line_shifts_labels(self):
+        """Insertar una instrucción reubica las etiquetas y los saltos que las usan."""
+        self.incremental.update(COUNTDOWN_SOURCE)
+        edited = list(COUNTDOWN_SOURCE)
+        edited.insert(5, "        LOAD R3, 0")
+        
+        report = self.incremental.update(edited)
+        
+        self.assertEqual(report.reparsed_lines, [6])
+        self.assertEqual(report.program.symbols["bucle"], 3)
+        self.assertEqual(report.program.instructions[5].raw_instruction, "JP 3")
+        self.assertEqual(report.program.instructions[5].address, 5)
+        self.assertEqual(report.program.instructions, Assembler().assemble(edited).instructions)
+    
+    def test_insert_relocates_lines_below_without_reparsing(self):
+        """Insertar una línea solo parsea esa línea; las siguientes se reubican."""
+        parser = InstructionParser()
+        incremental = IncrementalAssembler(Assembler(parser))
+        source = ["LOAD R1, 1", "ADD R1, 2, R2", "STORE R2, 20", "MOVE R3, R2", "JP 0"]
+        before = incremental.update(source).program
+        edited = source[:1] + ["LOAD R9, 9"] + source[1:]
+        
+        with patch.object(parser, 'parse', wraps=parser.parse) as parse:
+            report = incremental.update(edited)
+        
+        self.assertEqual([call.args[0] for call in parse.call_args_list], ["LOAD R9, 9"])
+        self.assertEqual(report.program.instructions, Assembler().assemble(edited).instructions)
+        for old, new in zip(before.instructions[1:], report.program.instructions[2:]):
+            self.assertEqual(new.address, old.address + 1)
+            self.assertIs(new.operand_tokens, old.operand_tokens)
+    
+    def test_errors_are_reported_per_line(self):
+        """Cada línea inválida tiene su propio error y no hay programa."""
+        report = self.incremental.update([
+            "LOAD R1, 1",
+            "FOO R1",
+            "JP destino",
+            "LOAD R2, 2",
+        ])
+        
+        self.assertFalse(report.ok)
+        self.assertIsNone(report.program)
+        self.assertEqual(sorted(report.errors), [2, 3])
+        self.assertIn("destino", report.errors[3])
+    
+    def test_fixing_line_clears_error(self):
+        """Corregir la línea inválida elimina su error."""
+        self.incremental.update(["LOAD R1, 1", "FOO R1"])
+        
+        report = self.incremental.update(["LOAD R1, 1", "LOAD R2, 2"])
+        
+        self.assertTrue(report.ok)
+        self.assertEqual(report.errors, {})
+        self.assertEqual(len(report.program), 2)
+    
+    def test_duplicate_label_reported_on_second_definition(self):
+        """Una etiqueta duplicada se reporta en la línea que la redefine."""
+        report = self.incremental.update(["a: LOAD R1, 1", "a: LOAD R2, 2"])
+        
+        self.assertEqual(list(report.errors), [2])
+    
+    def test_reset_forces_full_analysis(self):
+        """Tras reset() la siguiente actualización analiza todas las líneas."""
+        self.incremental.update(COUNTDOWN_SOURCE)
+        self.incremental.reset()
+        
+        report = self.incremental.update(COUNTDOWN_SOURCE)
+        
+        self.assertEqual(len(report.reparsed_lines), len(COUNTDOWN_SOURCE))
+
+
+class TestStreamingAssembly(unittest.TestCase):
+    """Pruebas para Assembler.assemble_into y Computer.load_program_stream."""
+    
+    def setUp(self):
+        """Configuración inicial para cada prueba."""
+        self.assembler = Assembler()
+        self.stored = {}
+    
+    def store(self, address, instruction):
+        """Destino de prueba para las instrucciones ensambladas."""
+        self.stored[address] = instruction
+    
+    def test_stream_matches_full_assembly(self):
+        """El ensamblado en streaming produce las mismas instrucciones y líneas."""
+        program = self.assembler.assemble_into(iter(COUNTDOWN_SOURCE), self.store)
+        expected = self.assembler.assemble(COUNTDOWN_SOURCE)
+        
+        self.assertEqual(len(program), len(expected))
+        self.assertEqual(list(program.source_map), expected.source_map)
+        self.assertEqual(program.symbols, expected.symbols)
+        self.assertEqual([self.stored[address].raw_instruction for address in range(len(program))],
+                         expected.lines)
+    
+    def test_forward_references_are_backpatched(self):
+        """Un salto a una etiqueta posterior se completa al final de la lectura."""
+        program = self.assembler.assemble_into(["JP fin", "LOAD R1, 1", "fin: LOAD R2, 2"], self.store)
+        
+        self.assertEqual(program.symbols["fin"], 2)
+        self.assertEqual(self.stored[0].raw_instruction, "JP 2")
+    
+    def test_identical_lines_share_instruction(self):
+        """Las líneas idénticas comparten la instancia decodificada."""
+        self.assembler.assemble_into(["LOAD R1, 1", "LOAD R1, 1"], self.store)
+        
+        self.assertIs(self.stored[0], self.stored[1])
+    
+    def test_errors_are_grouped_by_line(self):
+        """Los errores se reúnen ordenados por línea hasta max_errors."""
+        lines = ["JP nada", "FOO R1", "LOAD R1, 1", "BAR R2"]
+        
+        with self.assertRaises(AssemblyErrorGroup) as context:
+            self.assembler.assemble_into(lines, self.store, max_errors=3)
+        
+        errors = context.exception.errors
+        self.assertEqual([error.line_number for error in errors], [1, 2, 4])
+        self.assertIn("nada", errors[0].details)
+        self.assertEqual(context.exception.line_number, 1)
+    
+    def test_early_stop_does_not_report_unread_symbols(self):
+        """Al abandonar la lectura no se inventan símbolos indefinidos que desplacen errores reales."""
+        lines = ["JP end", "BOGUS 1", "BOGUS 2", "LOAD R1, 5", "end: HALT"]
+        
+        with self.assertRaises(AssemblyErrorGroup) as context:
+            self.assembler.assemble_into(lines, self.store, max_errors=2)
+        
+        errors = context.exception.errors
+        self.assertEqual([error.line_number for error in errors], [2, 3])
+        self.assertFalse(any("Undefined symbol" in str(error) for error in errors))
+    
+    def test_stops_reading_after_max_errors(self):
+        """La lectura se abandona al reunir max_errors errores."""
+        consumed = []
+        
+        def lines():
+            for line in ["FOO", "BAR", "LOAD R1, 1", "LOAD R2, 2"]:
+                consumed.append(line)
+                yield line
+        
+        with self.assertRaises(AssemblyErrorGroup):
+            self.assembler.assemble_into(lines(), self.store, max_errors=2)
+        
+        self.assertEqual(consumed, ["FOO", "BAR"])
+    
+    def test_computer_loads_stream(self):
+        """Computer carga un archivo abierto sin listas intermedias y lo ejecuta."""
+        computer = Computer()
+        
+        self.assertTrue(computer.load_program_stream(io.StringIO("\n".join(COUNTDOWN_SOURCE))))
+        computer.execute_program()
+        
+        self.assertEqual(len(computer.loaded_program), 7)
+        self.assertEqual(computer.register_bank.get("R3"), 1)
+    
+    def test_computer_stream_errors_leave_memory_empty(self):
+        """Tras un error de carga la memoria de instrucciones queda vacía."""
+        computer = Computer()
+        
+        with self.assertRaises(AssemblyErrorGroup):
+            computer.load_program_stream(["LOAD R1, 1", "FOO"])
+        
+        self.assertEqual(computer.memory.get_instructions(), [])
+        self.assertEqual(computer.loaded_program, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,209 @@
+"""
+Pruebas unitarias para el análisis de flujo de control.
+
+Aplicando técnicas de partición equivalente:
+- Partición 1: Bloques básicos y aristas (secuencial, JP, JPZ, HALT, salida del programa)
+- Partición 2: Dominadores (bloques alcanzables e inalcanzables)
+- Partición 3: Bucles naturales (simples, anidados, sin bucles)
+- Partición 4: Registros de inducción y bucles de conteo
+- Partición 5: Reparto de ciclos entre bucles
+"""
+
+import os
+import unittest
+import sys
+
+# Agregar path para imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from utils.assembler import assemble
+from utils.control_flow import analyze_program, build_cfg, compute_dominators, dominates
+
+
+COUNTDOWN = """
+        LOAD R1, 3
+        LOAD R2, 0
+bucle:  ADD R2, 5, R2
+        SUB R1, 1, R1
+        JPZ fin, R1
+        JP bucle
+fin:    STORE R2, 40
+"""
+
+NESTED = """
+        LOAD R1, 2
+externo: LOAD R2, 3
+interno: SUB R2, 1, R2
+        JPZ siguiente, R2
+        JP interno
+siguiente: SUB R1, 1, R1
+        JPZ fin, R1
+        JP externo
+fin:    STORE R1, 40
+"""
+
+
+def instructions_of(source):
+    """Ensambla un programa y devuelve sus instrucciones."""
+    return assemble(source.strip().split("\n")).instructions
+
+
+class TestControlFlowGraph(unittest.TestCase):
+    """Pruebas para build_cfg y compute_dominators."""
+    
+    # Partición 1: Bloques y aristas
+    def test_straight_line_program_is_one_block(self):
+        """Un programa sin saltos es un único bloque que termina el programa."""
+        cfg = build_cfg(instructions_of("LOAD R1, 1\nLOAD R2, 2\nADD R1, R2, R3"))
+        
+        self.assertEqual(len(cfg.blocks), 1)
+        self.assertEqual(list(cfg.blocks[0].addresses), [0, 1, 2])
+        self.assertEqual(cfg.blocks[0].successors, [])
+        self.assertTrue(cfg.blocks[0].exits_program)
+    
+    def test_blocks_split_at_jumps_and_targets(self):
+        """Los bloques empiezan en cada destino de salto y tras cada salto."""
+        cfg = build_cfg(instructions_of(COUNTDOWN))
+        
+        self.assertEqual([(block.start, block.end) for block in cfg.blocks], [(0, 2), (2, 5), (5, 6), (6, 7)])
+        self.assertEqual(cfg.blocks[0].successors, [1])
+        self.assertEqual(sorted(cfg.blocks[1].successors), [2, 3])
+        self.assertEqual(cfg.blocks[2].successors, [1])
+        self.assertEqual(sorted(cfg.blocks[1].predecessors), [0, 2])
+        self.assertIs(cfg.block_at(3), cfg.blocks[1])
+        self.assertIsNone(cfg.block_at(7))
+    
+    def test_jump_outside_program_exits(self):
+        """Un salto fuera del programa se trata como salida."""
+        cfg = build_cfg(instructions_of("JPZ 99, R1\nLOAD R1, 1"))
+        
+        self.assertTrue(cfg.blocks[0].exits_program)
+        self.assertEqual(cfg.blocks[0].successors, [1])
+    
+    def test_halt_ends_block_without_successors(self):
+        """HALT termina su bloque y la ejecución: el bloque siguiente empieza tras él."""
+        cfg = build_cfg(instructions_of("LOAD R1, 1\nHALT\nLOAD R2, 2"))
+        
+        self.assertEqual([(block.start, block.end) for block in cfg.blocks], [(0, 2), (2, 3)])
+        self.assertEqual(cfg.blocks[0].successors, [])
+        self.assertTrue(cfg.blocks[0].exits_program)
+        self.assertEqual(cfg.blocks[1].predecessors, [])
+    
+    def test_empty_program(self):
+        """Un programa vacío no tiene bloques ni bucles."""
+        analysis = analyze_program([])
+        
+        self.assertEqual(analysis.cfg.blocks, [])
+        self.assertEqual(analysis.loops, [])
+    
+    # Partición 2: Dominadores
+    def test_immediate_dominators(self):
+        """La cabecera del bucle domina a su cuerpo y a la salida."""
+        cfg = build_cfg(instructions_of(COUNTDOWN))
+        idom = compute_dominators(cfg)
+        
+        self.assertEqual(idom, {0: 0, 1: 0, 2: 1, 3: 1})
+        self.assertTrue(dominates(idom, 1, 3))
+        self.assertFalse(dominates(idom, 2, 3))
+    
+    def test_unreachable_block_has_no_dominator(self):
+        """Un bloque inalcanzable no aparece en los dominadores."""
+        cfg = build_cfg(instructions_of("JP 2\nLOAD R1, 1\nLOAD R2, 2"))
+        idom = compute_dominators(cfg)
+        
+        self.assertNotIn(1, idom)
+        self.assertFalse(dominates(idom, 0, 1))
+
+
+class TestLoopAnalysis(unittest.TestCase):
+    """Pruebas para find_loops y los registros de inducción."""
+    
+    # Partición 3: Bucles naturales
+    def test_counting_loop(self):
+        """Un bucle con contador que sale por JPZ se reconoce como de conteo."""
+        analysis = analyze_program(instructions_of(COUNTDOWN))
+        
+        self.assertEqual(len(analysis.loops), 1)
+        loop = analysis.loops[0]
+        self.assertEqual(loop.header, 1)
+        self.assertEqual(loop.blocks, frozenset({1, 2}))
+        self.assertEqual(loop.back_edges, [(2, 1)])
+        self.assertEqual(loop.exits, [(1, 3)])
+        self.assertEqual(loop.counter, 'R1')
+        self.assertEqual(analysis.loop_addresses(0), [2, 3, 4, 5])
+    
+    def test_nested_loops_are_ordered_inner_first(self):
+        """Los bucles anidados se ordenan de interior a exterior con su padre."""
+        analysis = analyze_program(instructions_of(NESTED))
+        
+        inner, outer = analysis.loops
+        self.assertLess(inner.blocks, outer.blocks)
+        self.assertEqual(inner.parent, 1)
+        self.assertIsNone(outer.parent)
+        self.assertEqual(inner.counter, 'R2')
+        self.assertEqual(outer.counter, 'R1')
+        self.assertEqual(analysis.loop_at(2), 0)
+        self.assertEqual(analysis.loop_at(1), 1)
+        self.assertIsNone(analysis.loop_at(0))
+    
+    def test_program_without_back_edges_has_no_loops(self):
+        """Los saltos hacia adelante no forman bucles."""
+        analysis = analyze_program(instructions_of("JPZ 2, R1\nLOAD R1, 1\nLOAD R2, 2"))
+        
+        self.assertEqual(analysis.loops, [])
+    
+    # Partición 4: Registros de inducción
+    def test_halt_inside_loop_body_breaks_the_loop(self):
+        """Un HALT en el cuerpo corta la arista de retorno que lo sigue."""
+        source = """
+bucle:  SUB R1, 1, R1
+        JPZ fin, R1
+        HALT
+        JP bucle
+fin:    STORE R1, 40
+"""
+        analysis = analyze_program(instructions_of(source))
+        cfg = analysis.cfg
+        
+        self.assertEqual([(block.start, block.end) for block in cfg.blocks], [(0, 2), (2, 3), (3, 4), (4, 5)])
+        self.assertEqual(cfg.blocks[1].successors, [])
+        self.assertTrue(cfg.blocks[1].exits_program)
+        self.assertEqual(cfg.blocks[2].predecessors, [])
+        self.assertEqual(analysis.loops, [])
+    
+    def test_induction_registers_and_steps(self):
+        """Cada registro actualizado una vez con paso constante es de inducción."""
+        loop = analyze_program(instructions_of(COUNTDOWN)).loops[0]
+        
+        self.assertEqual(loop.induction_registers['R1'].step, -1)
+        self.assertEqual(loop.induction_registers['R2'].step, 5)
+        self.assertEqual(loop.induction_registers['R2'].address, 2)
+    
+    def test_invariant_register_step(self):
+        """Un paso en un registro que el bucle no modifica también es de inducción."""
+        source = "LOAD R3, 2\nbucle: SUB R1, R3, R1\nJPZ 4, R1\nJP bucle\nSTORE R1, 40"
+        induction = analyze_program(instructions_of(source)).loops[0].induction_registers['R1']
+        
+        self.assertIsNone(induction.step)
+        self.assertEqual(induction.step_register, 'R3')
+        self.assertTrue(induction.negated)
+    
+    def test_register_written_twice_is_not_induction(self):
+        """Un registro escrito dos veces por iteración no es de inducción."""
+        source = "bucle: ADD R1, 1, R1\nMUL R1, 2, R1\nJPZ 4, R1\nJP bucle\nSTORE R1, 40"
+        loop = analyze_program(instructions_of(source)).loops[0]
+        
+        self.assertEqual(loop.induction_registers, {})
+        self.assertIsNone(loop.counter)
+    
+    # Partición 5: Ciclos por bucle
+    def test_cycles_are_attributed_to_innermost_loop(self):
+        """Los ciclos se asignan al bucle más interior de cada dirección."""
+        analysis = analyze_program(instructions_of(NESTED))
+        counts = {0: 1, 1: 2, 2: 6, 3: 6, 4: 4, 5: 2, 6: 2, 7: 1, 8: 1}
+        
+        self.assertEqual(analysis.cycles_per_loop(counts), [(0, 16), (1, 7)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+"""
+Pruebas unitarias para el motor de ejecución rápida.
+
+Aplicando técnicas de partición equivalente:
+- Partición 1: Bucles acelerables (paso inmediato, paso en registro, salida al final)
+- Partición 2: Bucles no acelerables (memoria, varias salidas, contador sin llegar a 0)
+- Partición 3: Equivalencia exacta con la interpretación (con y sin límite de ciclos)
+- Partición 4: Operandos fuera de rango durante el bucle
+"""
+
+import os
+import unittest
+import sys
+
+# Agregar path para imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.computer import Computer
+from core.engine import FastEngine, plan_loops
+from core.exceptions import SimulatorError
+from utils.assembler import assemble
+
+
+ACCUMULATE = """
+        LOAD R1, 3000
+        LOAD R2, 0
+        LOAD R3, 3
+bucle:  ADD R2, R3, R2
+        SUB R1, 1, R1
+        JPZ fin, R1
+        JP bucle
+fin:    STORE R2, 40
+"""
+
+
+def load(source):
+    """Crea un Computer con el programa cargado."""
+    computer = Computer(64)
+    computer.load_program(source.strip().split("\n"))
+    return computer
+
+
+def plans_of(source):
+    """Planes de los bucles acelerables de un programa."""
+    return plan_loops(assemble(source.strip().split("\n")).instructions)
+
+
+class TestLoopPlans(unittest.TestCase):
+    """Pruebas para plan_loops."""
+    
+    # Partición 1: Bucles acelerables
+    def test_counting_loop_is_planned(self):
+        """Un bucle de conteo con actualizaciones afines se acelera."""
+        plans = plans_of(ACCUMULATE)
+        
+        self.assertEqual(list(plans), [3])
+        plan = plans[3]
+        self.assertEqual((plan.length, plan.exit_offset, plan.counter), (4, 2, 'R1'))
+        self.assertEqual({update.register for update in plan.updates}, {'R1', 'R2'})
+    
+    def test_loop_exiting_past_the_end_is_planned(self):
+        """Un JPZ que sale al final del programa también es una salida."""
+        plans = plans_of("LOAD R1, 5\nbucle: SUB R1, 1, R1\nJPZ 4, R1\nJP bucle")
+        
+        self.assertIn(1, plans)
+    
+    # Partición 2: Bucles no acelerables
+    def test_loop_with_memory_access_is_not_planned(self):
+        """Un bucle que escribe en memoria se interpreta."""
+        source = "LOAD R1, 5\nbucle: SUB R1, 1, R1\nSTORE R1, 40\nJPZ 5, R1\nJP bucle\nLOAD R2, 1"
+        
+        self.assertEqual(plans_of(source), {})
+    
+    def test_loop_with_non_affine_update_is_not_planned(self):
+        """Un bucle con MUL no es afín."""
+        source = "LOAD R1, 5\nbucle: SUB R1, 1, R1\nMUL R2, 2, R2\nJPZ 5, R1\nJP bucle\nLOAD R2, 1"
+        
+        self.assertEqual(plans_of(source), {})
+    
+    def test_loop_with_two_exits_is_not_planned(self):
+        """Un bucle con dos JPZ de salida se interpreta."""
+        source = "bucle: SUB R1, 1, R1\nJPZ 4, R1\nJPZ 4, R2\nJP bucle\nLOAD R2, 1"
+        
+        self.assertEqual(plans_of(source), {})
+
+
+class TestFastEngine(unittest.TestCase):
+    """Pruebas para FastEngine."""
+    
+    def assert_same_execution(self, source, max_cycles=None):
+        """Verifica que el motor rápido deja el mismo estado que la interpretación."""
+        interpreted = load(source)
+        interpreted_cycles = interpreted.execute_program(max_cycles)
+        
+        accelerated = load(source)
+        engine = FastEngine(accelerated)
+        accelerated_cycles = engine.run(max_cycles)
+        
+        self.assertEqual(accelerated_cycles, interpreted_cycles)
+        self.assertEqual(accelerated.get_system_state(), interpreted.get_system_state())
+        self.assertEqual(accelerated.memory.read(40), interpreted.memory.read(40))
+        return engine
+    
+    # Partición 3: Equivalencia
+    def test_loop_is_skipped_with_identical_state(self):
+        """El bucle se salta en O(1) y el estado final es idéntico."""
+        engine = self.assert_same_execution(ACCUMULATE)
+        
+        self.assertEqual(engine.accelerated_iterations, 2998)
+        self.assertEqual(engine.accelerated_cycles, 2998 * 4)
+    
+    def test_max_cycles_stop_matches_interpretation(self):
+        """Con límite de ciclos el motor se detiene en el mismo estado."""
+        for max_cycles in (2, 5, 13, 1001, 6002):
+            with self.subTest(max_cycles=max_cycles):
+                self.assert_same_execution(ACCUMULATE, max_cycles)
+    
+    def test_counter_updated_after_exit_test(self):
+        """El contador puede actualizarse después del JPZ."""
+        source = "LOAD R1, 40\nbucle: JPZ fin, R1\nADD R2, 7, R2\nSUB R1, 2, R1\nJP bucle\nfin: STORE R2, 40"
+        
+        engine = self.assert_same_execution(source)
+        self.assertGreater(engine.accelerated_cycles, 0)
+    
+    def test_counter_that_skips_zero_is_interpreted(self):
+        """Si el contador nunca vale 0 el bucle se interpreta."""
+        source = "LOAD R1, 5\nbucle: SUB R1, 2, R1\nJPZ 4, R1\nJP bucle"
+        
+        engine = self.assert_same_execution(source, max_cycles=300)
+        self.assertEqual(engine.accelerated_cycles, 0)
+    
+    # Partición 4: Rango de la ALU
+    def test_out_of_range_loop_fails_like_interpretation(self):
+        """Si un operando sale de rango, el error es el de la interpretación."""
+        source = ACCUMULATE.replace("LOAD R1, 3000", "LOAD R1, 10000")
+        interpreted = load(source)
+        with self.assertRaises(SimulatorError):
+            interpreted.execute_program()
+        
+        accelerated = load(source)
+        engine = FastEngine(accelerated)
+        with self.assertRaises(SimulatorError):
+            engine.run()
+        
+        self.assertEqual(engine.accelerated_cycles, 0)
+        self.assertEqual(accelerated.get_system_state(), interpreted.get_system_state())
+
+
+if __name__ == '__main__':
+    unittest.main()
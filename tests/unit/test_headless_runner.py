@@ -0,0 +1,203 @@
+"""
+Pruebas unitarias para el ejecutor sin interfaz gráfica.
+
+Aplicando técnicas de partición equivalente:
+- Partición 1: Programas que terminan (con comentarios y saltos)
+- Partición 2: Programas detenidos por el límite de ciclos
+- Partición 3: Errores de lectura o de simulación
+- Partición 4: Independencia de tkinter y del paquete gui
+- Partición 5: Tiempo de arranque del modo headless
+"""
+
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+import unittest.mock
+
+# Agregar path para imports
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils.headless_runner import (
+    run_program, run_headless,
+    EXIT_OK, EXIT_ERROR, EXIT_MAX_CYCLES
+)
+
+
+COUNTDOWN_PROGRAM = """# Cuenta regresiva
+LOAD R1, 3       # Contador
+LOAD R2, 1
+
+SUB R1, R2, R1
+JPZ 5, R1        # Salir cuando R1 = 0
+JP 2
+STORE R1, 20
+"""
+
+
+class TestHeadlessRunner(unittest.TestCase):
+    """Pruebas para utils.headless_runner."""
+    
+    def setUp(self):
+        """Escribe el programa de prueba en un archivo temporal."""
+        handle, self.program_path = tempfile.mkstemp(suffix='.asm')
+        with os.fdopen(handle, 'w', encoding='utf-8') as program_file:
+            program_file.write(COUNTDOWN_PROGRAM)
+    
+    def tearDown(self):
+        """Elimina el archivo temporal."""
+        os.remove(self.program_path)
+    
+    # Partición 1: Programas que terminan
+    def test_comments_and_blank_lines_are_not_loaded(self):
+        """Los comentarios y líneas vacías no ocupan memoria de instrucciones."""
+        report = run_program(io.StringIO(COUNTDOWN_PROGRAM))
+        
+        self.assertEqual(report['state']['program_size'], 6)
+    
+    def test_run_program_completes(self):
+        """El programa termina y reporta ciclos."""
+        report = run_program(COUNTDOWN_PROGRAM.splitlines())
+        
+        self.assertEqual(report['stop_reason'], 'completed')
+        self.assertEqual(report['state']['registers']['R1'], 0)
+        self.assertEqual(report['performance']['cycles'], 11)
+    
+    def test_run_headless_json_output(self):
+        """La salida JSON contiene estado y contadores."""
+        output = io.StringIO()
+        
+        exit_code = run_headless(self.program_path, dump_state='json', output=output)
+        
+        self.assertEqual(exit_code, EXIT_OK)
+        report = json.loads(output.getvalue())
+        self.assertEqual(report['state']['pc'], 6)
+        self.assertIn('cycles_per_second', report['performance'])
+    
+    def test_counting_loop_is_accelerated(self):
+        """El bucle de conteo se acelera sin cambiar el resultado."""
+        lines = COUNTDOWN_PROGRAM.splitlines()
+        
+        accelerated = run_program(lines)
+        interpreted = run_program(lines, accelerate=False)
+        
+        self.assertEqual(accelerated['performance']['accelerated_cycles'], 3)
+        self.assertEqual(interpreted['performance']['accelerated_cycles'], 0)
+        self.assertEqual(accelerated['state'], interpreted['state'])
+    
+    def test_optimized_run_reports_changes(self):
+        """Con optimize el resultado es el mismo e incluye los cambios aplicados."""
+        lines = (COUNTDOWN_PROGRAM + "MOVE R2, R2\n").splitlines()
+        
+        report = run_program(lines, optimize=True)
+        
+        self.assertEqual(report['stop_reason'], 'completed')
+        self.assertEqual(report['state']['registers']['R1'], 0)
+        self.assertEqual(report['optimization']['optimized_size'], 6)
+        self.assertNotIn('optimization', run_program(lines))
+    
+    # Partición 2: Límite de ciclos
+    def test_max_cycles_stops_execution(self):
+        """El límite de ciclos detiene la ejecución con un código propio."""
+        output = io.StringIO()
+        
+        exit_code = run_headless(self.program_path, max_cycles=4, output=output)
+        
+        self.assertEqual(exit_code, EXIT_MAX_CYCLES)
+        self.assertIn("Ciclos: 4", output.getvalue())
+    
+    # Partición 3: Errores
+    def test_missing_file_returns_error(self):
+        """Un archivo inexistente devuelve código de error."""
+        self.assertEqual(run_headless(self.program_path + '.missing', output=io.StringIO()), EXIT_ERROR)
+    
+    def test_invalid_program_returns_error(self):
+        """Una instrucción inválida devuelve código de error."""
+        with open(self.program_path, 'w', encoding='utf-8') as program_file:
+            program_file.write("FOO R1\n")
+        
+        self.assertEqual(run_headless(self.program_path, output=io.StringIO()), EXIT_ERROR)
+    
+    def test_errors_are_reported_up_to_max_errors(self):
+        """Se reportan los primeros max_errors errores, cada uno con su línea."""
+        with open(self.program_path, 'w', encoding='utf-8') as program_file:
+            program_file.write("FOO R1\nLOAD R1, 1\nBAR R2\nBAZ R3\n")
+        
+        with unittest.mock.patch('sys.stderr', new_callable=io.StringIO) as errors:
+            exit_code = run_headless(self.program_path, output=io.StringIO(), max_errors=2)
+        
+        self.assertEqual(exit_code, EXIT_ERROR)
+        reported = errors.getvalue().splitlines()
+        self.assertEqual(len(reported), 2)
+        self.assertIn("línea 1", reported[0])
+        self.assertIn("línea 3", reported[1])
+    
+    # Partición 4: Sin tkinter
+    def test_headless_entry_point_does_not_import_gui(self):
+        """main.py --headless no importa tkinter ni gui.*"""
+        script = (
+            "import sys, main\n"
+            f"code = main.main(['--headless', {self.program_path!r}])\n"
+            "loaded = [m for m in sys.modules if m == 'tkinter' or m.startswith('gui')]\n"
+            "sys.exit(10 if loaded else code)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', script], cwd=PROJECT_ROOT,
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        
+        self.assertEqual(result.returncode, EXIT_OK, result.stderr.decode())
+    
+    # Partición 5: Arranque
+    def test_headless_startup_skips_unused_modules(self):
+        """Un programa sin saltos no carga el análisis de flujo ni otras rutas."""
+        with open(self.program_path, 'w', encoding='utf-8') as program_file:
+            program_file.write("LOAD R1, 3\nSTORE R1, 20\n")
+        unused = [
+            'dataclasses', 'inspect', 'json',
+            'utils.object_format', 'utils.optimizer', 'utils.control_flow'
+        ]
+        script = (
+            "import sys, main\n"
+            f"code = main.main(['--headless', {self.program_path!r}])\n"
+            f"loaded = [m for m in {unused!r} if m in sys.modules]\n"
+            "print('LOADED:' + ','.join(loaded))\n"
+            "sys.exit(code)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', script], cwd=PROJECT_ROOT,
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        
+        self.assertEqual(result.returncode, EXIT_OK, result.stderr.decode())
+        self.assertIn('LOADED:', result.stdout.decode().splitlines())
+    
+    def test_headless_startup_budget(self):
+        """python main.py --headless arranca y termina en menos de 100 ms."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # Bytecode en un directorio propio, como en una instalación normal
+            env = dict(os.environ, PYTHONPYCACHEPREFIX=cache_dir)
+            env.pop('PYTHONDONTWRITEBYTECODE', None)
+            command = [sys.executable, 'main.py', '--headless', self.program_path]
+            
+            timings = []
+            for _ in range(6):
+                start = time.perf_counter()
+                result = subprocess.run(
+                    command, cwd=PROJECT_ROOT, env=env,
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE
+                )
+                timings.append(time.perf_counter() - start)
+                self.assertEqual(result.returncode, EXIT_OK, result.stderr.decode())
+        
+        # La primera ejecución compila el bytecode; el mínimo descarta ruido
+        self.assertLess(min(timings[1:]), 0.100)
+
+
+if __name__ == '__main__':
+    unittest.main()
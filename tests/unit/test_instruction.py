@@ -6,16 +6,23 @@ Aplicando técnicas de partición equivalente:
 - Partición 2: Instrucciones inválidas (formato incorrecto, operandos incorrectos)
 - Partición 3: Casos límite (valores máximos, mínimos, operandos opcionales)
 - Partición 4: Tipos de instrucciones (aritméticas, memoria, control)
+- Partición 5: Opcodes enteros y bits de categoría (repertorio completo)
+- Partición 6: Representación compacta (slots, inmutabilidad, copias que comparten datos)
 """
 
 import unittest
+import pickle
 import sys
 import os
+from dataclasses import FrozenInstanceError
 
 # Agregar path para imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from core.instruction import Instruction, InstructionType
+from core.instruction import (
+    OPCODE_CATEGORIES, OPCODE_IDS, Instruction, InstructionSet, InstructionType, Opcode,
+    OpcodeCategory, opcode_category
+)
 
 
 class TestInstructionType(unittest.TestCase):
@@ -38,6 +45,13 @@ class TestInstructionType(unittest.TestCase):
         self.assertEqual(InstructionType.STORE.value, "STORE")
         self.assertEqual(InstructionType.ADD.value, "ADD")
         self.assertEqual(InstructionType.HALT.value, "HALT")
+    
+    def test_instruction_type_covers_opcodes(self):
+        """Todo opcode del repertorio tiene su InstructionType."""
+        for opcode in Opcode:
+            with self.subTest(opcode=opcode.name):
+                self.assertEqual(InstructionType[opcode.name].value, opcode.name)
+                self.assertIs(Instruction(opcode.name).type, InstructionType[opcode.name])
 
 
 class TestInstruction(unittest.TestCase):
@@ -294,5 +308,93 @@ class TestInstruction(unittest.TestCase):
                 self.assertEqual(instruction.type, inst_type)
 
 
+
+class TestOpcode(unittest.TestCase):
+    """Pruebas para los opcodes enteros y sus categorías."""
+    
+    # Partición 5: Opcodes enteros y bits de categoría
+    def test_opcode_enum_covers_full_isa(self):
+        """Opcode cubre todos los opcodes válidos con los ids del formato objeto."""
+        self.assertEqual({opcode.name for opcode in Opcode}, InstructionSet.VALID_OPCODES)
+        self.assertEqual(OPCODE_IDS, {opcode.name: opcode.value for opcode in Opcode})
+        self.assertEqual(Opcode.JP, 12)
+    
+    def test_categories_by_opcode(self):
+        """Cada opcode tiene su categoría; HALT y los desconocidos ninguna."""
+        self.assertEqual(opcode_category('MUL'), OpcodeCategory.ARITHMETIC)
+        self.assertEqual(opcode_category('NOT'), OpcodeCategory.LOGICAL)
+        self.assertEqual(opcode_category('STORE'), OpcodeCategory.MEMORY)
+        self.assertEqual(opcode_category('JPZ'), OpcodeCategory.CONTROL)
+        self.assertEqual(opcode_category('MOVE'), OpcodeCategory.REGISTER)
+        self.assertEqual(opcode_category('HALT'), OpcodeCategory.NONE)
+        self.assertEqual(opcode_category('NOP'), OpcodeCategory.NONE)
+        self.assertEqual(OPCODE_CATEGORIES[0], 0)
+    
+    def test_category_predicates_for_jump_and_move(self):
+        """JP, JPZ y MOVE (ausentes de InstructionType) se clasifican correctamente."""
+        jump = Instruction("JPZ", "5", "R1")
+        move = Instruction("MOVE", "R1", "R2")
+        
+        self.assertEqual(jump.opcode_id, Opcode.JPZ)
+        self.assertTrue(jump.is_control_operation())
+        self.assertTrue(jump.requires_alu())
+        self.assertTrue(move.is_register_operation())
+        self.assertFalse(move.requires_alu())
+
+
+
+class TestCompactInstruction(unittest.TestCase):
+    """Pruebas de la representación compacta de Instruction."""
+    
+    # Partición 6: Representación compacta
+    def test_instruction_has_no_dict(self):
+        """Instruction usa __slots__ en lugar de un __dict__ por instancia."""
+        instruction = Instruction("ADD", "R1", "R2", "R3")
+        
+        self.assertFalse(hasattr(instruction, '__dict__'))
+        self.assertEqual(instruction.opcode_id, Opcode.ADD)
+    
+    def test_instruction_is_immutable(self):
+        """Asignar o borrar un campo lanza FrozenInstanceError."""
+        instruction = Instruction("LOAD", "R1", "5")
+        
+        with self.assertRaises(FrozenInstanceError):
+            instruction.address = 3
+        with self.assertRaises(FrozenInstanceError):
+            del instruction.operand1
+    
+    def test_replace_shares_unchanged_fields(self):
+        """_replace copia solo las referencias de los campos que no cambian."""
+        tokens = ("token",)
+        instruction = Instruction("JP", "4", None, None, "JP 4", 0, tokens)
+        
+        located = instruction._replace(address=9)
+        
+        self.assertEqual(located.address, 9)
+        self.assertIs(located.operand_tokens, tokens)
+        self.assertIs(located.raw_instruction, instruction.raw_instruction)
+        self.assertEqual(located.opcode, "JP")
+        with self.assertRaises(ValueError):
+            instruction._replace(size=1)
+    
+    def test_equality_ignores_operand_tokens(self):
+        """La igualdad y el hash no dependen de los operandos clasificados."""
+        first = Instruction("MOVE", "R1", "R2", None, "MOVE R1, R2", 2, ("a",))
+        second = Instruction("MOVE", "R1", "R2", None, "MOVE R1, R2", 2)
+        
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertNotEqual(first, first._replace(address=3))
+    
+    def test_pickle_round_trip(self):
+        """Las instrucciones inmutables se pueden serializar."""
+        instruction = Instruction("STORE", "R1", "20", None, "STORE R1, 20", 4)
+        
+        restored = pickle.loads(pickle.dumps(instruction))
+        
+        self.assertEqual(restored, instruction)
+        self.assertEqual(restored.opcode_id, Opcode.STORE)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,173 @@
+"""
+Pruebas unitarias para el parser de instrucciones y su caché compartida.
+
+Aplicando técnicas de partición equivalente:
+- Partición 1: Líneas idénticas o equivalentes (comparten resultado)
+- Partición 2: Líneas distintas o inválidas (no comparten / no se cachean)
+- Partición 3: Compatibilidad de InstructionParser.parse con direcciones
+- Partición 4: Clasificación de operandos del tokenizador
+"""
+
+import dataclasses
+import unittest
+import sys
+import os
+
+# Agregar path para imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.exceptions import InvalidInstructionError
+from core.instruction import OperandKind, OperandToken
+from utils.instruction_parser import (
+    InstructionParser, parse_cached, parse_cache_info, clear_parse_cache, tokenize_operand
+)
+
+
+class TestParseCache(unittest.TestCase):
+    """Pruebas para la caché LRU de parseo."""
+    
+    def setUp(self):
+        """Inicia cada prueba con la caché vacía."""
+        clear_parse_cache()
+    
+    # Partición 1: Líneas equivalentes
+    def test_identical_lines_share_instance(self):
+        """La misma línea devuelve la misma instancia y cuenta un acierto."""
+        first = parse_cached("ADD R1, R2, R3")
+        second = parse_cached("ADD R1, R2, R3")
+        
+        self.assertIs(first, second)
+        info = parse_cache_info()
+        self.assertEqual(info['hits'], 1)
+        self.assertEqual(info['misses'], 1)
+    
+    def test_whitespace_is_normalized(self):
+        """Espacios extra no generan una entrada nueva."""
+        first = parse_cached("LOAD R1, 5")
+        second = parse_cached("  LOAD   R1,   5 ")
+        
+        self.assertIs(first, second)
+    
+    def test_cached_instruction_is_immutable(self):
+        """Las instrucciones compartidas no se pueden modificar."""
+        instruction = parse_cached("MOVE R1, R2")
+        
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            instruction.operand1 = "R3"
+    
+    # Partición 2: Líneas distintas o inválidas
+    def test_different_lines_are_different_entries(self):
+        """Líneas diferentes producen instrucciones diferentes."""
+        self.assertIsNot(parse_cached("LOAD R1, 5"), parse_cached("LOAD R1, 6"))
+        self.assertEqual(parse_cache_info()['currsize'], 2)
+    
+    def test_invalid_line_raises_and_is_not_cached(self):
+        """Las líneas inválidas lanzan error en cada intento."""
+        for _ in range(2):
+            with self.assertRaises(InvalidInstructionError):
+                parse_cached("FOO R1")
+        self.assertEqual(parse_cache_info()['currsize'], 0)
+    
+    def test_empty_line_raises(self):
+        """Una línea vacía es inválida."""
+        with self.assertRaises(InvalidInstructionError):
+            parse_cached("   ")
+    
+    # Partición 3: InstructionParser.parse
+    def test_parser_uses_shared_cache_across_instances(self):
+        """Distintas instancias del parser comparten la caché."""
+        InstructionParser().parse("SUB R1, R2, R3")
+        InstructionParser().parse("SUB R1, R2, R3")
+        
+        self.assertEqual(parse_cache_info()['hits'], 1)
+    
+    def test_parse_with_address_keeps_address(self):
+        """parse() conserva la dirección solicitada sin alterar la instancia compartida."""
+        instruction = InstructionParser().parse("JP 3", address=7)
+        
+        self.assertEqual(instruction.address, 7)
+        self.assertEqual(instruction.operand1, "3")
+        self.assertEqual(parse_cached("JP 3").address, 0)
+    
+    def test_parse_with_address_shares_cached_operands(self):
+        """Las copias por dirección comparten los operandos de la instancia de la caché."""
+        shared = parse_cached("ADD R1, 5, R2")
+        
+        located = InstructionParser().parse("ADD R1, 5, R2", address=4)
+        
+        self.assertIs(located.operand_tokens, shared.operand_tokens)
+        self.assertIs(located.operand1, shared.operand1)
+
+
+
+class TestTokenizer(unittest.TestCase):
+    """Pruebas para el tokenizador de una sola pasada."""
+    
+    def setUp(self):
+        """Crea el parser bajo prueba."""
+        self.parser = InstructionParser()
+    
+    # Partición 4: Clasificación de operandos
+    def test_operand_kinds(self):
+        """Cada forma de operando recibe su clase y valor."""
+        cases = {
+            "R3": OperandToken(OperandKind.REGISTER, "R3", 3),
+            "-25": OperandToken(OperandKind.IMMEDIATE, "-25", -25),
+            "*R7": OperandToken(OperandKind.INDIRECT_REGISTER, "*R7", 7),
+            "*16": OperandToken(OperandKind.INDIRECT_ADDRESS, "*16", 16),
+            "R0": OperandToken(OperandKind.UNKNOWN, "R0", None),
+        }
+        for text, expected in cases.items():
+            with self.subTest(operand=text):
+                self.assertEqual(tokenize_operand(f" {text} "), expected)
+    
+    def test_empty_operand_is_none(self):
+        """Un operando vacío no produce token."""
+        self.assertIsNone(tokenize_operand("  "))
+    
+    def test_tokenize_instruction(self):
+        """tokenize devuelve el opcode en mayúsculas y los operandos tipados."""
+        opcode, tokens = self.parser.tokenize("load R1, *R2")
+        
+        self.assertEqual(opcode, "LOAD")
+        self.assertEqual([token.kind for token in tokens],
+                         [OperandKind.REGISTER, OperandKind.INDIRECT_REGISTER])
+    
+    def test_instruction_keeps_tokens(self):
+        """La instrucción parseada conserva sus operandos clasificados."""
+        instruction = parse_cached("JPZ 4, R1")
+        
+        self.assertEqual(instruction.operand1, "4")
+        self.assertEqual(instruction.operand2, "R1")
+        self.assertEqual([token.value for token in instruction.operand_tokens], [4, 1])
+    
+    def test_wrong_operand_kind_message(self):
+        """Una clase de operando no permitida produce el mensaje de su posición."""
+        with self.assertRaisesRegex(InvalidInstructionError, "MOVE second operand must be a register"):
+            self.parser.parse("MOVE R1, 5")
+    
+    def test_missing_operands_message(self):
+        """Faltan operandos obligatorios."""
+        with self.assertRaisesRegex(InvalidInstructionError, "ADD requires two operands"):
+            self.parser.parse("ADD")
+    
+    def test_missing_operand_reported_before_wrong_kind(self):
+        """Como en la validación original, faltar un operando se informa antes que su clase."""
+        cases = {
+            "STORE +5 ,  ": "STORE requires two operands",
+            "NOT +5 , ,r1": "NOT requires two operands",
+            "JPZ *16 ,": "JPZ requires two operands",
+        }
+        for line, message in cases.items():
+            with self.subTest(line=line):
+                with self.assertRaisesRegex(InvalidInstructionError, message):
+                    self.parser.parse(line)
+    
+    def test_jump_with_extra_operand(self):
+        """JP solo admite un operando."""
+        with self.assertRaisesRegex(InvalidInstructionError, "JP takes only one operand"):
+            self.parser.parse("JP 3, R1")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,345 @@
+"""
+Pruebas unitarias para el módulo memory.py
+
+Aplicando técnicas de partición equivalente:
+- Partición 1: Contadores de uso de instrucciones (guardar, reemplazar, vaciar, imagen)
+- Partición 2: Contadores de uso de datos (cero / distinto de cero, truncado, clear_all)
+- Partición 3: Coincidencia con un recorrido completo de la memoria
+- Partición 4: Bloques con protocolo de buffer (bytes, array, NumPy)
+- Partición 5: Bloques inválidos (fuera del segmento, buffers no enteros)
+- Partición 6: Archivos de datos binarios y CSV
+- Partición 7: Direcciones modificadas (refresco completo, consumo concurrente)
+"""
+
+import os
+import random
+import sys
+import tempfile
+import threading
+import unittest
+from array import array
+from unittest.mock import Mock
+
+# Agregar path para imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.exceptions import DataFormatError, InvalidMemoryAddressError
+from core.observer import EventType
+from core.word_format import word_format_for
+from hardware.memory import Memory
+from utils.assembler import assemble
+from utils.data_file import export_data, import_data, read_data_file
+from utils.headless_runner import run_program
+from utils.object_format import ObjectImage, encode_program
+
+try:
+    import numpy
+except ImportError:  # NumPy es opcional
+    numpy = None
+
+
+def scanned_usage(memory):
+    """Uso de memoria calculado recorriendo todas las direcciones."""
+    instructions = sum(1 for address in range(memory.instruction_size)
+                       if memory.peek(address).strip())
+    data = sum(1 for address in range(memory.instruction_size, memory.size)
+               if memory.peek(address) != 0)
+    return instructions, data
+
+
+class TestMemoryUsage(unittest.TestCase):
+    """Pruebas de los contadores incrementales de uso de memoria."""
+    
+    def setUp(self):
+        self.memory = Memory(32)
+    
+    def usage(self):
+        usage = self.memory.get_memory_usage()
+        return usage['instructions_used'], usage['data_used']
+    
+    # Partición 1: Instrucciones
+    def test_replacing_instruction_counts_once(self):
+        """Reemplazar una instrucción no cambia el contador; borrarla lo reduce."""
+        self.memory.store_instruction(0, "LOAD R1, 5")
+        self.memory.store_instruction(0, "LOAD R1, 6")
+        self.memory.store_instruction(1, "HALT")
+        self.assertEqual(self.usage(), (2, 0))
+        
+        self.memory.store_instruction(0, "")
+        
+        self.assertEqual(self.usage(), (1, 0))
+        self.assertFalse(self.memory.is_instruction_memory_full())
+    
+    def test_full_instruction_memory(self):
+        """La memoria está llena cuando todas las direcciones tienen instrucción."""
+        for address in range(self.memory.instruction_size):
+            self.memory.store_instruction(address, "HALT")
+        
+        self.assertTrue(self.memory.is_instruction_memory_full())
+        self.assertEqual(self.memory.get_memory_usage()['instruction_usage_percent'], 100)
+    
+    def test_object_image_counted_without_decoding(self):
+        """Una imagen cuenta todas sus instrucciones sin decodificarlas."""
+        image = ObjectImage(encode_program(assemble(["LOAD R1, 1", "ADD R1, 1, R1", "HALT"])))
+        
+        self.memory.load_instruction_image(image)
+        
+        self.assertEqual(self.usage(), (3, 0))
+        self.assertIsNotNone(self.memory._instruction_image)
+        
+        self.memory.store_instruction(3, "HALT")
+        self.assertEqual(self.usage(), (4, 0))
+    
+    # Partición 2: Datos
+    def test_data_counts_non_zero_values(self):
+        """Solo cuentan los datos distintos de cero."""
+        self.memory.store_data(16, 5)
+        self.memory.store_data(16, 7)
+        self.memory.store_data(17, 0)
+        self.assertEqual(self.usage(), (0, 1))
+        
+        self.memory.store_data(16, 0)
+        
+        self.assertEqual(self.usage(), (0, 0))
+    
+    def test_wrapped_zero_is_not_counted(self):
+        """Un valor que se trunca a cero no ocupa la dirección."""
+        memory = Memory(32, word_format_for(8))
+        
+        memory.store_data(16, 256)
+        
+        self.assertEqual(memory.get_memory_usage()['data_used'], 0)
+    
+    def test_clear_all_resets_counters(self):
+        """clear_all deja los contadores en cero."""
+        self.memory.store_instruction(0, "HALT")
+        self.memory.store_data(20, 3)
+        
+        self.memory.clear_all()
+        
+        self.assertEqual(self.usage(), (0, 0))
+    
+    # Partición 3: Coincidencia con el recorrido
+    def test_counters_match_full_scan(self):
+        """Tras escrituras aleatorias los contadores coinciden con un recorrido."""
+        rng = random.Random(49)
+        for _ in range(500):
+            if rng.random() < 0.5:
+                self.memory.store_instruction(rng.randrange(16), rng.choice(["", "  ", "HALT", "LOAD R1, 2"]))
+            else:
+                self.memory.store_data(rng.randrange(16, 32), rng.choice([0, 0, 1, -4]))
+            if rng.random() < 0.01:
+                self.memory.clear_all()
+        
+        self.assertEqual(self.usage(), scanned_usage(self.memory))
+
+
+
+class TestMemoryBlocks(unittest.TestCase):
+    """Pruebas de load_block y store_block."""
+    
+    def setUp(self):
+        self.memory = Memory(32)
+        self.observer = Mock()
+        self.memory.add_observer(self.observer)
+    
+    def events(self):
+        return [call.args[1] for call in self.observer.update.call_args_list]
+    
+    # Partición 4: Bloques con protocolo de buffer
+    def test_store_block_notifies_once(self):
+        """Un bloque se guarda con una sola notificación y marca sus direcciones."""
+        self.memory.consume_changed_addresses()
+        
+        self.memory.store_block(16, array('h', [5, 0, -3, 7]))
+        
+        self.assertEqual(self.events(), [EventType.MEMORY_BLOCK_STORED])
+        self.assertEqual(self.observer.update.call_args.args[2], {'address': 16, 'count': 4})
+        self.assertEqual([self.memory.peek(address) for address in range(16, 20)], [5, 0, -3, 7])
+        self.assertEqual(self.memory.consume_changed_addresses(), {16, 17, 18, 19})
+        self.assertEqual(self.memory.get_memory_usage()['data_used'], 3)
+    
+    def test_load_block_round_trip(self):
+        """load_block devuelve un array con los valores y ceros donde no hay datos."""
+        self.memory.store_data(18, 9)
+        self.memory.store_block(20, bytes([1, 2, 255]))
+        self.observer.reset_mock()
+        
+        block = self.memory.load_block(17, 6)
+        
+        self.assertEqual(block.typecode, self.memory.block_typecode)
+        self.assertEqual(list(block), [0, 9, 0, 1, 2, 255])
+        self.assertEqual(self.events(), [EventType.MEMORY_BLOCK_LOADED])
+    
+    def test_overwriting_with_zeros_updates_usage(self):
+        """Un bloque de ceros libera las direcciones que tenían datos."""
+        self.memory.store_block(16, array('i', range(1, 17)))
+        
+        self.memory.store_block(16, bytes(16))
+        
+        self.assertEqual(self.memory.get_memory_usage()['data_used'], 0)
+    
+    def test_fixed_width_block_wraps(self):
+        """Con ancho fijo los valores se truncan y el bloque usa el tipo de la palabra."""
+        memory = Memory(32, word_format_for(8))
+        
+        memory.store_block(16, array('i', [127, 128, 300]))
+        
+        block = memory.load_block(16, 3)
+        self.assertEqual(block.typecode, 'b')
+        self.assertEqual(list(block), [127, -128, 44])
+    
+    @unittest.skipIf(numpy is None, "NumPy no está instalado")
+    def test_numpy_block(self):
+        """Los arreglos de NumPy se aceptan y se pueden reconstruir desde load_block."""
+        memory = Memory(32, word_format_for(16))
+        
+        memory.store_block(20, numpy.arange(4, dtype=numpy.int16) * 1000)
+        
+        values = numpy.frombuffer(memory.load_block(20, 4), dtype=numpy.int16)
+        self.assertEqual(values.tolist(), [0, 1000, 2000, 3000])
+    
+    # Partición 5: Bloques inválidos
+    def test_block_outside_data_segment_raises(self):
+        """Un bloque que no cabe en el segmento de datos no modifica la memoria."""
+        with self.assertRaises(InvalidMemoryAddressError):
+            self.memory.store_block(30, bytes([1, 2, 3]))
+        with self.assertRaises(InvalidMemoryAddressError):
+            self.memory.store_block(15, bytes([1]))
+        with self.assertRaises(InvalidMemoryAddressError):
+            self.memory.load_block(16, 17)
+        
+        self.assertEqual(self.memory.peek(30), 0)
+        self.assertEqual(self.events(), [])
+    
+    def test_non_integer_buffer_raises(self):
+        """Solo se aceptan buffers de enteros de una dimensión."""
+        with self.assertRaises(TypeError):
+            self.memory.store_block(16, array('d', [1.5]))
+        with self.assertRaises(TypeError):
+            self.memory.store_block(16, memoryview(bytes(4)).cast('B', (2, 2)))
+    
+    def test_empty_block(self):
+        """Un bloque vacío es válido incluso al final de la memoria."""
+        self.memory.store_block(32, b'')
+        
+        self.assertEqual(len(self.memory.load_block(32, 0)), 0)
+
+
+class TestDataFiles(unittest.TestCase):
+    """Pruebas de la importación y exportación del segmento de datos."""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+    
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+    
+    # Partición 6: Archivos binarios y CSV
+    def test_binary_and_csv_round_trip(self):
+        """Exportar e importar conserva los valores en ambos formatos."""
+        for name in ("datos.bin", "datos.csv"):
+            source = Memory(32, word_format_for(16))
+            source.store_block(16, array('h', [-1, 0, 32767, 12]))
+            
+            self.assertEqual(export_data(source, self.path(name)), 16)
+            target = Memory(32, word_format_for(16))
+            self.assertEqual(import_data(target, self.path(name)), 16)
+            
+            self.assertEqual(list(target.load_block(16, 16)), list(source.load_block(16, 16)))
+    
+    def test_binary_file_is_little_endian_words(self):
+        """El archivo binario contiene palabras little-endian del ancho de la máquina."""
+        memory = Memory(32, word_format_for(16))
+        memory.store_block(16, array('h', [1, -2]))
+        
+        export_data(memory, self.path("datos.bin"), count=2)
+        
+        with open(self.path("datos.bin"), 'rb') as source:
+            self.assertEqual(source.read(), b'\x01\x00\xfe\xff')
+    
+    def test_csv_accepts_commas_and_lines(self):
+        """El CSV admite valores separados por comas y por líneas."""
+        with open(self.path("vector.csv"), 'w', encoding='utf-8') as output:
+            output.write("1, 2,3\n\n-4\n")
+        memory = Memory(32)
+        
+        self.assertEqual(import_data(memory, self.path("vector.csv"), address=20), 4)
+        
+        self.assertEqual(list(memory.load_block(20, 4)), [1, 2, 3, -4])
+    
+    def test_invalid_files_raise(self):
+        """Un CSV no numérico o un binario con palabras incompletas se rechaza."""
+        with open(self.path("malo.csv"), 'w', encoding='utf-8') as output:
+            output.write("1,dos\n")
+        with open(self.path("malo.bin"), 'wb') as output:
+            output.write(b'\x01\x02\x03')
+        
+        with self.assertRaises(DataFormatError):
+            read_data_file(self.path("malo.csv"), 'h')
+        with self.assertRaises(DataFormatError):
+            read_data_file(self.path("malo.bin"), 'h')
+    
+    def test_headless_preloads_data(self):
+        """run_program guarda el bloque de datos antes de ejecutar."""
+        program = ["LOAD R1, *16", "LOAD R2, *17", "ADD R1, R2, R3", "STORE R3, 18"]
+        
+        report = run_program(program, data=array('b', [20, 22]), word_width=8)
+        
+        self.assertEqual(report['state']['registers']['R3'], 42)
+
+
+class TestChangedAddresses(unittest.TestCase):
+    """Pruebas del registro de direcciones modificadas para las vistas."""
+    
+    def setUp(self):
+        self.memory = Memory(32)
+    
+    # Partición 7: Direcciones modificadas
+    def test_no_tracking_while_all_changed(self):
+        """Sin vista que consuma los cambios, las escrituras no acumulan direcciones."""
+        self.memory.store_instruction(0, "LOAD R1, 1")
+        self.memory.store_data(16, 5)
+        self.memory.store_block(17, array('h', [1, 2, 3]))
+        
+        self.assertEqual(self.memory._changed_addresses, set())
+        self.assertIsNone(self.memory.consume_changed_addresses())
+    
+    def test_changes_after_consume_are_tracked(self):
+        """Tras una consulta se anotan las escrituras hasta el siguiente clear_all."""
+        self.memory.consume_changed_addresses()
+        self.memory.store_data(16, 5)
+        self.memory.store_instruction(1, "LOAD R1, 1")
+        
+        self.assertEqual(self.memory.consume_changed_addresses(), {1, 16})
+        
+        self.memory.store_data(17, 2)
+        self.memory.clear_all()
+        self.assertEqual(self.memory._changed_addresses, set())
+        self.assertIsNone(self.memory.consume_changed_addresses())
+    
+    def test_concurrent_consume_loses_no_address(self):
+        """Consumir desde otro hilo mientras se escribe no pierde direcciones."""
+        self.memory.consume_changed_addresses()
+        seen = set()
+        done = threading.Event()
+        
+        def writer():
+            for round_number in range(200):
+                for address in range(16, 32):
+                    self.memory.store_data(address, round_number)
+            done.set()
+        
+        thread = threading.Thread(target=writer)
+        thread.start()
+        while not done.is_set():
+            seen |= self.memory.consume_changed_addresses()
+        thread.join()
+        seen |= self.memory.consume_changed_addresses()
+        
+        self.assertEqual(seen, set(range(16, 32)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Pruebas unitarias para el panel de memoria virtualizado.
+
+Aplicando técnicas de partición equivalente:
+- Partición 1: Creación de filas (solo las visibles)
+- Partición 2: Refresco incremental (solo filas modificadas y visibles)
+- Partición 3: Navegación (desplazamiento y salto a dirección)
+"""
+
+import unittest
+from unittest.mock import Mock
+import sys
+import os
+
+# Agregar path para imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from gui.memory_panel import MemoryPanel
+from hardware.memory import Memory
+
+
+class TestMemoryPanel(unittest.TestCase):
+    """Pruebas para MemoryPanel con un Canvas simulado."""
+    
+    def setUp(self):
+        """Crea un panel de 10 filas sobre una memoria grande."""
+        self.canvas = Mock()
+        self.canvas.create_text.side_effect = range(1000)
+        self.memory = Memory(4096)
+        self.panel = MemoryPanel(self.canvas, 0, 0, 300, 10 * MemoryPanel.ROW_HEIGHT)
+        self.panel.set_memory(self.memory)
+        self.panel.refresh()
+        self.canvas.itemconfig.reset_mock()
+    
+    # Partición 1: Solo se crean las filas visibles
+    def test_only_visible_rows_are_created(self):
+        """El número de elementos creados no depende del tamaño de la memoria."""
+        self.assertEqual(self.panel.visible_rows, 10)
+        self.assertEqual(self.canvas.create_text.call_count, 10)
+    
+    # Partición 2: Refresco incremental
+    def test_refresh_without_changes_draws_nothing(self):
+        """Sin cambios en memoria no se redibuja ninguna fila."""
+        self.panel.refresh()
+        self.canvas.itemconfig.assert_not_called()
+    
+    def test_refresh_updates_only_changed_visible_row(self):
+        """Solo se redibuja la fila cuya dirección cambió."""
+        self.memory.store_instruction(3, "LOAD R1, 5")
+        self.memory.store_data(3000, 7)  # Fuera de la ventana visible
+        
+        self.panel.refresh()
+        
+        self.canvas.itemconfig.assert_called_once()
+        self.assertIn("LOAD R1, 5", self.canvas.itemconfig.call_args[1]['text'])
+    
+    def test_clear_all_redraws_visible_rows(self):
+        """Limpiar la memoria redibuja la ventana completa."""
+        self.memory.store_instruction(0, "LOAD R1, 5")
+        self.panel.refresh()
+        self.canvas.itemconfig.reset_mock()
+        
+        self.memory.clear_all()
+        self.panel.refresh()
+        
+        self.canvas.itemconfig.assert_called_once()
+    
+    # Partición 3: Navegación
+    def test_jump_to_centers_address(self):
+        """Saltar a una dirección la ubica en el centro de la ventana."""
+        self.panel.jump_to(3000)
+        
+        self.assertEqual(self.panel.first_address, 2995)
+        texts = [call[1]['text'] for call in self.canvas.itemconfig.call_args_list]
+        self.assertTrue(any(" 3000 D" in text for text in texts))
+    
+    def test_jump_past_end_is_clamped(self):
+        """El salto más allá del final muestra las últimas filas."""
+        self.panel.jump_to(10 ** 6)
+        
+        self.assertEqual(self.panel.first_address, 4096 - 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+"""
+Pruebas unitarias para el formato binario de archivo objeto.
+
+Aplicando técnicas de partición equivalente:
+- Partición 1: Ida y vuelta (codificar y decodificar sin perder información)
+- Partición 2: Archivos inválidos (firma, versión, tamaño, registros)
+- Partición 3: Carga en Computer y ejecución sin interfaz gráfica
+"""
+
+import io
+import os
+import tempfile
+import unittest
+import sys
+
+# Agregar path para imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.computer import Computer
+from core.exceptions import ObjectFormatError
+from core.instruction import OperandKind
+from utils.assembler import assemble
+from utils import headless_runner
+from utils.headless_runner import run_headless, EXIT_OK
+from utils.object_format import (
+    ObjectImage, encode_instruction, encode_program, read_object, write_object, is_object_file,
+    HEADER, RECORD, MAGIC, VERSION
+)
+
+
+SOURCE = """.equ DATO, 20
+.data DATO, 7, 8
+        LOAD R1, *DATO
+        LOAD R2, 21
+        LOAD R3, *R2
+        ADD R1, R3, R4
+bucle:  JPZ fin, R5
+        MOVE R6, R4
+fin:    STORE R4, 22
+        HALT
+""".split("\n")
+
+
+class TestObjectFormat(unittest.TestCase):
+    """Pruebas de codificación y decodificación."""
+    
+    def setUp(self):
+        """Ensambla el programa de prueba."""
+        self.program = assemble(SOURCE)
+        self.image = ObjectImage(encode_program(self.program))
+    
+    # Partición 1: Ida y vuelta
+    def test_round_trip_lines(self):
+        """El texto decodificado coincide con el ensamblado."""
+        self.assertEqual(list(self.image.lines), self.program.lines)
+        self.assertEqual(len(self.image), len(self.program))
+    
+    def test_round_trip_tokens(self):
+        """Las clases y valores de los operandos se conservan."""
+        instruction = self.image.instruction(2)
+        
+        self.assertEqual(instruction.opcode, "LOAD")
+        self.assertEqual([token.kind for token in instruction.operand_tokens],
+                         [OperandKind.REGISTER, OperandKind.INDIRECT_REGISTER])
+        self.assertEqual(instruction.operand2, "*R2")
+    
+    def test_data_and_source_map(self):
+        """Los datos iniciales y el mapa de líneas viajan en el archivo."""
+        self.assertEqual(self.image.data, {20: 7, 21: 8})
+        self.assertEqual(list(self.image.source_map), self.program.source_map)
+        self.assertEqual(self.image.line_for_address(4), 7)
+    
+    def test_source_map_is_optional(self):
+        """Sin mapa de líneas el archivo es más pequeño y no informa líneas."""
+        image = ObjectImage(encode_program(self.program, include_source_map=False))
+        
+        self.assertIsNone(image.source_map)
+        self.assertIsNone(image.line_for_address(0))
+    
+    def test_fixed_width_records(self):
+        """Cada instrucción ocupa un registro de ancho fijo."""
+        content = encode_program(self.program, include_source_map=False)
+        
+        self.assertEqual(len(content), HEADER.size + len(self.program) * RECORD.size + 2 * 8)
+    
+    def test_identical_records_share_instruction(self):
+        """Registros idénticos se decodifican una sola vez."""
+        program = assemble(["ADD R1, R2, R3"] * 3)
+        image = ObjectImage(encode_program(program))
+        
+        self.assertIs(image.instruction(0), image.instruction(2))
+    
+    # Partición 2: Archivos inválidos
+    def test_bad_magic(self):
+        """Una firma distinta se rechaza."""
+        with self.assertRaises(ObjectFormatError):
+            ObjectImage(b"XXXX" + bytes(HEADER.size))
+    
+    def test_bad_version(self):
+        """Una versión desconocida se rechaza."""
+        with self.assertRaises(ObjectFormatError):
+            ObjectImage(HEADER.pack(MAGIC, VERSION + 1, 0, 0, 0))
+    
+    def test_truncated_file(self):
+        """Un archivo truncado se rechaza."""
+        content = encode_program(self.program)
+        with self.assertRaises(ObjectFormatError):
+            ObjectImage(content[:-1])
+    
+    def test_invalid_record(self):
+        """Un registro con clases de operando inválidas se detecta al decodificarlo."""
+        content = HEADER.pack(MAGIC, VERSION, 0, 1, 0) + RECORD.pack(3, 1, 2, 0, 1, 5, 0)
+        image = ObjectImage(content)
+        
+        with self.assertRaises(ObjectFormatError):
+            image.instruction(0)
+    
+    def test_invalid_register_number(self):
+        """Un registro fuera de R1-R9 se rechaza al decodificar la instrucción."""
+        opcode_id, kind1, kind2, kind3, value1, _, value3 = encode_instruction(self.image.instruction(2))
+        content = HEADER.pack(MAGIC, VERSION, 0, 1, 0) + RECORD.pack(opcode_id, kind1, kind2, kind3, value1, 12, value3)
+        image = ObjectImage(content)
+        
+        with self.assertRaises(ObjectFormatError):
+            image.instruction(0)
+    
+    # Partición 3: Carga y ejecución
+    def test_computer_loads_image(self):
+        """Computer ejecuta la imagen igual que el programa en texto."""
+        from_text = Computer()
+        from_text.load_program(SOURCE)
+        from_text.execute_program()
+        
+        from_image = Computer()
+        from_image.load_object_image(self.image)
+        from_image.execute_program()
+        
+        self.assertEqual(from_image.get_system_state()['registers'], from_text.get_system_state()['registers'])
+        self.assertEqual(from_image.memory.read(22), 15)
+    
+    def test_headless_runs_object_file(self):
+        """El modo sin interfaz reconoce archivos objeto."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "programa.simo")
+            write_object(self.program, path)
+            
+            self.assertTrue(is_object_file(path))
+            self.assertEqual(len(read_object(path)), len(self.program))
+            self.assertEqual(run_headless(path, output=io.StringIO()), EXIT_OK)
+    
+    def test_headless_runner_uses_same_magic(self):
+        """El ejecutor sin interfaz reconoce la misma firma sin importar este módulo."""
+        self.assertEqual(headless_runner._OBJECT_MAGIC, MAGIC)
+
+
+if __name__ == '__main__':
+    unittest.main()
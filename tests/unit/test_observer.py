@@ -6,6 +6,7 @@ Aplicando técnicas de partición equivalente:
 - Partición 2: Observadores inválidos (None, objetos sin notify)
 - Partición 3: Operaciones con lista vacía
 - Partición 4: Operaciones con múltiples observadores
+- Partición 5: Suscripción a las fuentes solo mientras hay observadores
 """
 
 import unittest
@@ -214,5 +215,58 @@ class TestObservable(unittest.TestCase):
             observer.update.assert_called_once_with(self.observable, "test", "mass_test")
 
 
+class TestObservedHook(unittest.TestCase):
+    """Pruebas del gancho _observed_changed y de los componentes que reenvían eventos."""
+    
+    # Partición 5: Suscripción a las fuentes solo mientras hay observadores
+    def test_hook_called_on_first_and_last_observer(self):
+        """El gancho se llama al primer observador y al quitar el último."""
+        calls = []
+        
+        class Source(Observable):
+            def _observed_changed(self, observed):
+                calls.append(observed)
+        
+        observable = Source()
+        first, second = Mock(), Mock()
+        
+        observable.add_observer(first)
+        observable.add_observer(second)
+        observable.remove_observer(first)
+        observable.clear_observers()
+        
+        self.assertEqual(calls, [True, False])
+    
+    def test_register_bank_forwards_only_while_observed(self):
+        """El banco se suscribe a sus registros solo mientras lo observan."""
+        from hardware.register_bank import RegisterBank
+        bank = RegisterBank()
+        register = bank.get_register('R1')
+        self.assertEqual(register._observers, [])
+        
+        observer = Mock()
+        bank.add_observer(observer)
+        bank.set('R1', 5)
+        self.assertIn(bank, register._observers)
+        observer.update.assert_called()
+        
+        bank.remove_observer(observer)
+        self.assertEqual(register._observers, [])
+    
+    def test_computer_forwards_only_while_observed(self):
+        """Sin observadores el Computer no recibe eventos de los registros."""
+        from core.computer import Computer
+        computer = Computer()
+        self.assertEqual(computer.pc_register._observers, [])
+        
+        view = Mock()
+        computer.add_observer(view)
+        computer.register_bank.set('R2', 3)
+        
+        self.assertIn(computer, computer.pc_register._observers)
+        self.assertIn(computer.register_bank, computer.register_bank.get_register('R2')._observers)
+        view.update.assert_called()
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,165 @@
+"""
+Pruebas unitarias para el optimizador de mirilla.
+
+Aplicando técnicas de partición equivalente:
+- Partición 1: Cada regla de reescritura por separado
+- Partición 2: Casos que no deben optimizarse (destinos de salto, operandos desconocidos)
+- Partición 3: Reubicación de saltos y mapa de líneas fuente
+- Partición 4: Equivalencia del estado final al ejecutar
+"""
+
+import os
+import unittest
+import sys
+
+# Agregar path para imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.computer import Computer
+from utils.assembler import assemble
+from utils.optimizer import (
+    CONSTANT_FOLD, DEAD_LOAD, SELF_MOVE, STORE_LOAD, PeepholeOptimizer, optimize_program
+)
+
+
+def optimize_lines(text, rules=None):
+    """Ensambla y optimiza un programa escrito como texto."""
+    program = assemble(text.strip().split("\n"))
+    optimizer = PeepholeOptimizer(rules) if rules is not None else PeepholeOptimizer()
+    return program, optimizer.optimize(program)
+
+
+def final_registers(program):
+    """Ejecuta un programa ensamblado y devuelve los registros finales."""
+    computer = Computer(64)
+    computer.load_assembled_program(program)
+    computer.execute_program(10_000)
+    return computer.get_system_state()['registers']
+
+
+class TestPeepholeRules(unittest.TestCase):
+    """Pruebas para cada regla del optimizador."""
+    
+    # Partición 1: Reglas
+    def test_self_move_is_removed(self):
+        """Verifica que MOVE R1, R1 se elimina."""
+        _, (optimized, report) = optimize_lines("LOAD R1, 3\nMOVE R1, R1\nADD R1, R2, R3", [SELF_MOVE])
+        
+        self.assertEqual(optimized.lines, ["LOAD R1, 3", "ADD R1, R2, R3"])
+        self.assertEqual([change.rule for change in report.changes], [SELF_MOVE])
+        self.assertIsNone(report.changes[0].after)
+    
+    def test_load_after_store_reads_register(self):
+        """Verifica que LOAD de la dirección recién almacenada se vuelve MOVE."""
+        _, (optimized, _) = optimize_lines("STORE R1, 40\nLOAD R2, *40", [STORE_LOAD])
+        
+        self.assertEqual(optimized.lines, ["STORE R1, 40", "MOVE R2, R1"])
+    
+    def test_load_of_stored_register_is_removed(self):
+        """Verifica que recargar el mismo registro almacenado se elimina."""
+        _, (optimized, _) = optimize_lines("STORE R1, 40\nLOAD R1, *40", [STORE_LOAD])
+        
+        self.assertEqual(optimized.lines, ["STORE R1, 40"])
+    
+    def test_constant_arithmetic_is_folded(self):
+        """Verifica que una operación con operandos conocidos se pliega."""
+        _, (optimized, report) = optimize_lines("LOAD R1, 6\nMUL R1, 7, R2\nNOT R1, R2", [CONSTANT_FOLD])
+        
+        self.assertEqual(optimized.lines, ["LOAD R1, 6", "LOAD R2, 42", "LOAD R2, -43"])
+        self.assertEqual(len(report.changes), 2)
+    
+    def test_overwritten_load_is_removed(self):
+        """Verifica que un LOAD sobrescrito sin leerse se elimina."""
+        _, (optimized, _) = optimize_lines("LOAD R1, 1\nLOAD R1, 2\nLOAD R2, 3\nADD R2, 1, R2", [DEAD_LOAD])
+        
+        self.assertEqual(optimized.lines, ["LOAD R1, 2", "LOAD R2, 3", "ADD R2, 1, R2"])
+    
+    def test_unknown_rule_raises(self):
+        """Verifica que una regla desconocida se rechaza."""
+        with self.assertRaises(ValueError):
+            PeepholeOptimizer(['inline'])
+    
+    # Partición 2: Casos no optimizables
+    def test_jump_target_blocks_store_load(self):
+        """Verifica que un LOAD destino de salto no se reescribe."""
+        source = "JP 2\nSTORE R1, 40\nLOAD R2, *40"
+        _, (optimized, report) = optimize_lines(source, [STORE_LOAD])
+        
+        self.assertEqual(report.changes, [])
+        self.assertEqual(optimized.lines, source.split("\n"))
+    
+    def test_jump_target_forgets_constants(self):
+        """Verifica que los valores conocidos se descartan en un destino de salto."""
+        source = "LOAD R1, 5\nbucle: ADD R1, 1, R1\nJPZ bucle, R2"
+        _, (_, report) = optimize_lines(source, [CONSTANT_FOLD])
+        
+        self.assertEqual(report.changes, [])
+    
+    def test_out_of_range_operand_is_not_folded(self):
+        """Verifica que no se pliega una operación que la ALU rechazaría."""
+        _, (_, report) = optimize_lines("LOAD R1, 20000\nADD R1, 1, R2", [CONSTANT_FOLD])
+        
+        self.assertEqual(report.changes, [])
+    
+    def test_input_program_is_not_modified(self):
+        """Verifica que el programa original no se modifica."""
+        program, _ = optimize_lines("LOAD R1, 1\nLOAD R1, 2\nMOVE R1, R1")
+        
+        self.assertEqual(program.lines, ["LOAD R1, 1", "LOAD R1, 2", "MOVE R1, R1"])
+    
+    # Partición 3: Reubicación
+    def test_jump_targets_are_relocated(self):
+        """Verifica que los saltos apuntan a las nuevas direcciones."""
+        source = "MOVE R1, R1\nJP fin\nMOVE R2, R2\nfin: LOAD R3, 1"
+        _, (optimized, report) = optimize_lines(source)
+        
+        self.assertEqual(optimized.lines, ["JP 1", "LOAD R3, 1"])
+        self.assertEqual(report.address_map, [0, 0, 1, 1, 2])
+        self.assertEqual([instruction.address for instruction in optimized.instructions], [0, 1])
+    
+    def test_source_map_keeps_surviving_lines(self):
+        """Verifica que cada instrucción conserva su línea fuente."""
+        _, (optimized, report) = optimize_lines("LOAD R1, 1\n# comentario\nMOVE R1, R1\nLOAD R2, 2")
+        
+        self.assertEqual(optimized.source_map, [1, 4])
+        self.assertEqual(report.changes[0].line_number, 3)
+        self.assertEqual(report.summary(), "1 cambios, 3 -> 2 instrucciones")
+
+
+class TestOptimizedExecution(unittest.TestCase):
+    """Pruebas de equivalencia del programa optimizado."""
+    
+    # Partición 4: Equivalencia
+    def test_loop_program_reaches_same_state(self):
+        """Verifica que un programa con bucle termina con los mismos registros."""
+        source = """
+        LOAD R1, 5
+        LOAD R2, 7
+        ADD R1, R2, R3
+        MOVE R3, R3
+        STORE R3, 40
+        LOAD R4, *40
+bucle:  SUB R4, 1, R4
+        JPZ fin, R4
+        JP bucle
+fin:    LOAD R5, 1
+        LOAD R5, 2
+        NOT R1, R5
+"""
+        program, (optimized, report) = optimize_lines(source)
+        
+        self.assertLess(len(optimized), len(program))
+        self.assertEqual(final_registers(optimized), final_registers(program))
+        self.assertEqual(report.removed, len(program) - len(optimized))
+    
+    def test_optimize_program_uses_all_rules(self):
+        """Verifica que optimize_program aplica todas las reglas."""
+        program = assemble(["LOAD R1, 2", "ADD R1, R1, R2", "MOVE R2, R2"])
+        optimized, report = optimize_program(program)
+        
+        self.assertEqual(optimized.lines, ["LOAD R1, 2", "LOAD R2, 4"])
+        self.assertEqual({change.rule for change in report.changes}, {CONSTANT_FOLD, SELF_MOVE})
+
+
+if __name__ == '__main__':
+    unittest.main()
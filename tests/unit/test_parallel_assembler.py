@@ -0,0 +1,100 @@
+"""
+Pruebas unitarias para el ensamblado en paralelo.
+
+Aplicando técnicas de partición equivalente:
+- Partición 1: Equivalencia con el ensamblado secuencial (cualquier tamaño de bloque)
+- Partición 2: Símbolos entre bloques (etiquetas, constantes y datos)
+- Partición 3: Errores reunidos de varios bloques
+"""
+
+import os
+import unittest
+import sys
+
+# Agregar path para imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.computer import Computer
+from core.exceptions import AssemblyErrorGroup
+from utils.assembler import assemble
+from utils.object_format import encode_program
+from utils.parallel_assembler import assemble_parallel
+
+
+SOURCE = """# Suma con saltos entre bloques
+.equ DATO, 20
+.data DATO, 7
+        JP inicio
+datos:  LOAD R2, 3
+        JP suma
+inicio: LOAD R1, *DATO
+        JP datos
+suma:   ADD R1, R2, R1
+        STORE R1, 21
+""".split("\n")
+
+
+class TestParallelAssembler(unittest.TestCase):
+    """Pruebas para utils.parallel_assembler."""
+    
+    # Partición 1: Equivalencia
+    def test_image_matches_sequential_encoding(self):
+        """La imagen es idéntica byte a byte para cualquier tamaño de bloque."""
+        expected = encode_program(assemble(SOURCE))
+        
+        for chunk_lines in (1, 2, 3, 5, len(SOURCE)):
+            with self.subTest(chunk_lines=chunk_lines):
+                image = assemble_parallel(SOURCE, workers=1, chunk_lines=chunk_lines)
+                self.assertEqual(bytes(image.content), expected)
+    
+    def test_process_pool_matches_sequential_encoding(self):
+        """Con un pool de procesos el resultado es el mismo."""
+        image = assemble_parallel(SOURCE, workers=2, chunk_lines=3)
+        
+        self.assertEqual(bytes(image.content), encode_program(assemble(SOURCE)))
+    
+    # Partición 2: Símbolos entre bloques
+    def test_labels_resolve_across_chunks(self):
+        """Los saltos usan la dirección global de etiquetas de otros bloques."""
+        image = assemble_parallel(SOURCE, workers=1, chunk_lines=2)
+        
+        self.assertEqual(image.text(0), "JP 3")
+        self.assertEqual(image.text(4), "JP 1")
+        self.assertEqual(image.data, {20: 7})
+        self.assertEqual(image.line_for_address(3), 7)
+    
+    def test_image_runs_in_computer(self):
+        """La imagen ensamblada en paralelo se ejecuta correctamente."""
+        computer = Computer()
+        computer.load_object_image(assemble_parallel(SOURCE, workers=1, chunk_lines=4))
+        
+        computer.execute_program()
+        
+        self.assertEqual(computer.memory.read(21), 10)
+    
+    # Partición 3: Errores
+    def test_errors_from_all_chunks_sorted_by_line(self):
+        """Los errores de todos los bloques se reportan ordenados por línea."""
+        lines = ["LOAD R1, 1", "JP nada", "FOO R1", "LOAD R2, 2", "a: HALT", "a: HALT"]
+        
+        with self.assertRaises(AssemblyErrorGroup) as context:
+            assemble_parallel(lines, workers=1, chunk_lines=2)
+        
+        self.assertEqual([error.line_number for error in context.exception.errors], [2, 3, 6])
+        self.assertIn("nada", context.exception.errors[0].details)
+    
+    def test_max_errors_limits_report(self):
+        """Solo se reportan los primeros max_errors errores."""
+        with self.assertRaises(AssemblyErrorGroup) as context:
+            assemble_parallel(["FOO"] * 5, workers=1, chunk_lines=2, max_errors=3)
+        
+        self.assertEqual([error.line_number for error in context.exception.errors], [1, 2, 3])
+    
+    def test_invalid_chunk_size(self):
+        """Un tamaño de bloque no positivo es un error."""
+        with self.assertRaises(ValueError):
+            assemble_parallel(SOURCE, chunk_lines=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,10 +6,11 @@ Aplicando técnicas de partición equivalente:
 - Partición 2: Valores límite (0, valores máximos/mínimos)
 - Partición 3: Valores inválidos (negativos, fuera de rango)
 - Partición 4: Operaciones con observadores
+- Partición 5: Camino rápido sin observadores (__slots__, _poke)
 """
 
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 import sys
 import os
 
@@ -287,6 +288,30 @@ class TestRegister(unittest.TestCase):
         self.register.set_value(200)  # No debe notificar
         
         self.mock_observer.update.assert_not_called()
+    
+    # Partición 5: Camino rápido sin observadores
+    def test_register_uses_slots(self):
+        """Register no tiene __dict__ por instancia."""
+        self.assertFalse(hasattr(self.register, '__dict__'))
+        with self.assertRaises(AttributeError):
+            self.register.extra = 1
+    
+    def test_set_value_without_observers_skips_notification(self):
+        """Sin observadores set_value solo guarda el valor."""
+        with patch.object(Register, 'notify_observers') as notify:
+            self.register.set_value(7)
+        
+        notify.assert_not_called()
+        self.assertEqual(self.register.value, 7)
+    
+    def test_poke_does_not_notify(self):
+        """_poke cambia el valor sin notificar aunque haya observadores."""
+        self.register.add_observer(self.mock_observer)
+        
+        self.register._poke(99)
+        
+        self.assertEqual(self.register.value, 99)
+        self.mock_observer.update.assert_not_called()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,119 @@
+"""
+Pruebas unitarias para el módulo wired_control_unit.py
+
+Aplicando técnicas de partición equivalente:
+- Partición 1: Señales por tipo de opcode (ALU, LOAD, STORE, MOVE, saltos, desconocido, por id)
+- Partición 2: Tabla precalculada inmutable entregada por referencia
+- Partición 3: Notificación solo cuando las señales cambian
+"""
+
+import unittest
+from unittest.mock import Mock
+import sys
+import os
+
+# Agregar path para imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from hardware.wired_control_unit import (
+    DEFAULT_SIGNALS, RESET_SIGNALS, SIGNAL_TABLE, WiredControlUnit
+)
+from core.instruction import Opcode
+from core.observer import EventType
+
+
+class TestWiredControlUnit(unittest.TestCase):
+    """Pruebas para la unidad de control cableada."""
+    
+    def setUp(self):
+        """Configuración común para todas las pruebas."""
+        self.unit = WiredControlUnit()
+        self.observer = Mock()
+        self.unit.add_observer(self.observer)
+    
+    def bus_events(self):
+        """Eventos BUS_CONTROL_ACTIVATED recibidos por el observador."""
+        return [call for call in self.observer.update.call_args_list
+                if call.args[1] == EventType.BUS_CONTROL_ACTIVATED]
+    
+    # Partición 1: Señales por tipo de opcode
+    def test_alu_operation_signals(self):
+        """Las operaciones de la ALU leen y escriben registros."""
+        signals = self.unit.generate_control_signals('ADD')
+        
+        self.assertEqual(signals['alu_operation'], 'ADD')
+        self.assertTrue(signals['execute'])
+        self.assertTrue(signals['register_read'])
+        self.assertTrue(signals['register_write'])
+    
+    def test_memory_signals(self):
+        """LOAD lee memoria y STORE la escribe."""
+        self.assertTrue(self.unit.generate_control_signals('LOAD')['memory_read'])
+        self.assertTrue(self.unit.generate_control_signals('STORE')['memory_write'])
+    
+    def test_lowercase_and_unknown_opcodes(self):
+        """Los opcodes en minúsculas se reconocen; los desconocidos solo buscan y decodifican."""
+        self.assertIs(self.unit.generate_control_signals('jpz'), SIGNAL_TABLE['JPZ'])
+        self.assertIs(self.unit.generate_control_signals('HALT'), DEFAULT_SIGNALS)
+    
+    def test_signals_by_opcode_id_match_names(self):
+        """Por id se obtienen las mismas señales que por nombre; el id 0 es desconocido."""
+        for opcode in Opcode:
+            with self.subTest(opcode=opcode.name):
+                self.assertIs(self.unit.generate_control_signals_id(opcode),
+                              self.unit.generate_control_signals(opcode.name))
+        
+        self.assertIs(self.unit.generate_control_signals_id(0), DEFAULT_SIGNALS)
+    
+    # Partición 2: Tabla inmutable por referencia
+    def test_signals_are_shared_and_read_only(self):
+        """Las señales se entregan sin copiar y no se pueden modificar."""
+        signals = self.unit.generate_control_signals('MOVE')
+        
+        self.assertIs(signals, SIGNAL_TABLE['MOVE'])
+        self.assertIs(self.unit.control_signals, signals)
+        with self.assertRaises(TypeError):
+            signals['memory_write'] = True
+    
+    def test_reset_turns_signals_off(self):
+        """Tras un reset todas las señales están apagadas."""
+        self.unit.generate_control_signals('ADD')
+        
+        self.unit.reset()
+        
+        self.assertIs(self.unit.control_signals, RESET_SIGNALS)
+        self.assertEqual(self.unit.get_active_signals(), {})
+    
+    # Partición 3: Notificación solo al cambiar
+    def test_repeated_opcode_notifies_once(self):
+        """Repetir el mismo opcode no vuelve a notificar."""
+        for _ in range(3):
+            self.unit.generate_control_signals('LOAD')
+        
+        self.assertEqual(len(self.bus_events()), 1)
+    
+    def test_changed_signals_notify(self):
+        """Cambiar de opcode notifica las señales anteriores y las nuevas."""
+        self.unit.generate_control_signals('LOAD')
+        self.unit.generate_control_signals('SUB')
+        
+        events = self.bus_events()
+        self.assertEqual(len(events), 2)
+        data = events[1].args[2]
+        self.assertIs(data['old_signals'], SIGNAL_TABLE['LOAD'])
+        self.assertIs(data['new_signals'], SIGNAL_TABLE['SUB'])
+        self.assertEqual(data['opcode'], 'SUB')
+    
+    def test_changed_signals_by_id_report_opcode_name(self):
+        """Al cambiar por id la notificación lleva el nombre del opcode."""
+        self.unit.generate_control_signals_id(Opcode.LOAD)
+        self.unit.generate_control_signals_id(Opcode.LOAD)
+        self.unit.generate_control_signals_id(Opcode.JPZ)
+        
+        events = self.bus_events()
+        self.assertEqual(len(events), 2)
+        self.assertEqual(events[1].args[2]['opcode'], 'JPZ')
+
+
+if __name__ == '__main__':
+    unittest.main()
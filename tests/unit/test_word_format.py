@@ -0,0 +1,248 @@
+"""
+Pruebas unitarias para el formato de palabra configurable.
+
+Aplicando técnicas de partición equivalente:
+- Partición 1: Constantes precalculadas y truncado (8, 16, 32 bits e histórico)
+- Partición 2: ALU con ancho fijo (resultados truncados, carry y overflow)
+- Partición 3: Registros y memoria truncan los valores guardados
+- Partición 4: Computer, motor rápido y optimizador con ancho fijo
+- Partición 5: Anchos no admitidos
+"""
+
+import os
+import sys
+import unittest
+
+# Agregar path para imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from array import array
+
+from core.computer import Computer
+from core.engine import FastEngine
+from core.exceptions import OperandOutOfRangeError
+from core.word_format import LEGACY_WORD, WORD_WIDTHS, word_format_for
+from hardware.alu import ALU
+from hardware.memory import Memory
+from hardware.register_bank import RegisterBank
+from utils.assembler import assemble
+from utils.headless_runner import run_program
+from utils.optimizer import optimize_program
+
+try:
+    import numpy
+except ImportError:  # NumPy es opcional: solo lo usa ALU.execute_many
+    numpy = None
+
+
+ACCUMULATE = """
+        LOAD R1, 100
+        LOAD R2, 0
+bucle:  ADD R2, 3, R2
+        SUB R1, 1, R1
+        JPZ fin, R1
+        JP bucle
+fin:    STORE R2, 40
+"""
+
+
+class TestWordFormat(unittest.TestCase):
+    """Pruebas de las constantes del formato de palabra."""
+    
+    # Partición 1: Constantes y truncado
+    def test_fixed_width_constants(self):
+        """Cada ancho precalcula máscara, bit de signo y rango."""
+        word = word_format_for(8)
+        
+        self.assertEqual(word.mask, 0xFF)
+        self.assertEqual(word.sign_bit, 0x80)
+        self.assertEqual((word.min_value, word.max_value), (-128, 127))
+        self.assertEqual(word_format_for(16).max_value, 32767)
+        self.assertEqual(word_format_for(32).min_value, -2 ** 31)
+    
+    def test_wrap_uses_twos_complement(self):
+        """wrap trunca al ancho de la palabra con signo."""
+        word = word_format_for(8)
+        
+        self.assertEqual(word.wrap(127), 127)
+        self.assertEqual(word.wrap(128), -128)
+        self.assertEqual(word.wrap(-129), 127)
+        self.assertEqual(word.wrap(300), 44)
+    
+    def test_legacy_keeps_original_semantics(self):
+        """El formato histórico no trunca y conserva el rango de 15 bits."""
+        self.assertIsNone(LEGACY_WORD.bits)
+        self.assertEqual(LEGACY_WORD.wrap(10 ** 9), 10 ** 9)
+        self.assertEqual((LEGACY_WORD.min_value, LEGACY_WORD.max_value), (-16384, 16383))
+        self.assertIs(word_format_for(None), LEGACY_WORD)
+    
+    def test_storage_types_match_width(self):
+        """Cada ancho fijo tiene un código de array y un dtype del mismo tamaño."""
+        for bits in WORD_WIDTHS:
+            word = word_format_for(bits)
+            self.assertGreaterEqual(array(word.array_typecode).itemsize * 8, bits)
+            self.assertEqual(word.numpy_dtype, f"int{bits}")
+        self.assertIsNone(LEGACY_WORD.array_typecode)
+    
+    # Partición 5: Anchos no admitidos
+    def test_unsupported_width_raises(self):
+        """Un ancho no admitido lanza ValueError."""
+        with self.assertRaises(ValueError):
+            word_format_for(12)
+        with self.assertRaises(ValueError):
+            Computer(32, word_width=64)
+
+
+class TestFixedWidthALU(unittest.TestCase):
+    """Pruebas de la ALU con ancho de palabra fijo."""
+    
+    def setUp(self):
+        self.alu = ALU(word_format=word_format_for(8))
+    
+    # Partición 2: Resultados truncados y flags
+    def test_add_wraps_and_sets_overflow(self):
+        """127 + 1 en 8 bits da -128 con overflow y sin carry."""
+        self.assertEqual(self.alu.add(127, 1), -128)
+        self.assertEqual(self.alu.psw, {'Z': 0, 'C': 0, 'S': 1, 'O': 1})
+    
+    def test_add_sets_unsigned_carry(self):
+        """-1 + 1 en 8 bits da 0 con carry sin signo y sin overflow."""
+        self.assertEqual(self.alu.add(-1, 1), 0)
+        self.assertEqual(self.alu.psw, {'Z': 1, 'C': 1, 'S': 0, 'O': 0})
+    
+    def test_sub_sets_borrow_and_overflow(self):
+        """-128 - 1 desborda; 0 - 1 pide préstamo."""
+        self.assertEqual(self.alu.subtract(-128, 1), 127)
+        self.assertEqual(self.alu.psw['O'], 1)
+        
+        self.assertEqual(self.alu.subtract(0, 1), -1)
+        self.assertEqual(self.alu.psw, {'Z': 0, 'C': 1, 'S': 1, 'O': 0})
+    
+    def test_mul_is_truncated(self):
+        """Un producto que no cabe se trunca con carry y overflow."""
+        self.assertEqual(self.alu.multiply(100, 3), 44)
+        self.assertEqual(self.alu.psw['C'], 1)
+        self.assertEqual(self.alu.psw['O'], 1)
+        
+        self.assertEqual(self.alu.multiply(-8, 16), -128)
+        self.assertEqual(self.alu.psw['O'], 0)
+    
+    def test_div_min_by_minus_one_overflows(self):
+        """El mínimo entre -1 es el único cociente que no cabe."""
+        self.assertEqual(self.alu.divide(-128, -1), -128)
+        self.assertEqual(self.alu.psw['O'], 1)
+    
+    def test_operands_checked_against_width(self):
+        """La ALU valida los operandos con el rango de la palabra."""
+        with self.assertRaises(OperandOutOfRangeError):
+            self.alu.add(128, 0)
+        
+        alu = ALU(word_format=word_format_for(32))
+        self.assertEqual(alu.add(20000, 20000), 40000)
+    
+    def test_lazy_flags_match_eager_flags(self):
+        """Los flags diferidos coinciden con los calculados en cada operación."""
+        lazy = ALU(lazy_flags=True, word_format=word_format_for(8))
+        
+        for opcode, a, b in [('ADD', 127, 1), ('SUB', 0, 1), ('MUL', 100, 3), ('DIV', -128, -1)]:
+            self.assertEqual(lazy.execute(opcode, a, b), self.alu.execute(opcode, a, b))
+            self.assertEqual(lazy.psw, self.alu.psw)
+    
+    @unittest.skipIf(numpy is None, "NumPy no está instalado")
+    def test_batch_uses_word_dtype(self):
+        """execute_many trunca como execute y devuelve el dtype de la palabra."""
+        pairs = [(127, 1), (-1, 1), (100, 3), (-128, -1)]
+        for opcode in ('ADD', 'SUB', 'MUL', 'DIV'):
+            batch = self.alu.execute_many(opcode, [a for a, _ in pairs], [b for _, b in pairs])
+            self.assertEqual(batch.value.dtype, numpy.int8)
+            for index, (a, b) in enumerate(pairs):
+                self.assertEqual(int(batch.value[index]), self.alu.execute(opcode, a, b))
+                psw = self.alu.psw
+                self.assertEqual([int(batch.z[index]), int(batch.c[index]), int(batch.s[index]),
+                                  int(batch.o[index])], [psw['Z'], psw['C'], psw['S'], psw['O']])
+
+
+class TestFixedWidthStorage(unittest.TestCase):
+    """Pruebas de registros y memoria con ancho de palabra fijo."""
+    
+    # Partición 3: Valores truncados al guardarlos
+    def test_register_bank_wraps_values(self):
+        """El banco de registros trunca los enteros a la palabra."""
+        bank = RegisterBank(word_format_for(8))
+        
+        bank.set('R1', 300)
+        
+        self.assertEqual(bank.get('R1'), 44)
+    
+    def test_memory_wraps_data(self):
+        """La memoria trunca los datos a la palabra."""
+        memory = Memory(32, word_format_for(16))
+        
+        memory.store_data(20, 40000)
+        
+        self.assertEqual(memory.read(20), 40000 - 65536)
+    
+    def test_legacy_storage_is_unbounded(self):
+        """Con el formato histórico los valores no se truncan."""
+        bank = RegisterBank()
+        
+        bank.set('R1', 10 ** 6)
+        
+        self.assertEqual(bank.get('R1'), 10 ** 6)
+
+
+class TestFixedWidthComputer(unittest.TestCase):
+    """Pruebas del simulador completo con ancho de palabra fijo."""
+    
+    def load(self, word_width):
+        computer = Computer(64, word_width=word_width)
+        computer.load_program(ACCUMULATE.strip().split("\n"))
+        return computer
+    
+    # Partición 4: Computer, motor rápido y optimizador
+    def test_components_share_word_format(self):
+        """La ALU, los registros y la memoria usan el formato del Computer."""
+        computer = Computer(32, word_width=16)
+        
+        self.assertIs(computer.alu.word_format, computer.word_format)
+        self.assertIs(computer.register_bank.word_format, computer.word_format)
+        self.assertIs(computer.memory.word_format, computer.word_format)
+    
+    def test_program_results_wrap(self):
+        """Un acumulador de 8 bits se trunca a la palabra."""
+        computer = self.load(8)
+        
+        computer.execute_program()
+        
+        self.assertEqual(computer.register_bank.get('R2'), 44)
+        self.assertEqual(computer.memory.read(40), 44)
+    
+    def test_fast_engine_matches_interpreter(self):
+        """El motor rápido no acelera lo que se truncaría y da el mismo estado."""
+        for word_width in (None, 8, 16):
+            interpreted = self.load(word_width)
+            interpreted.execute_program()
+            accelerated = self.load(word_width)
+            FastEngine(accelerated).run()
+            
+            self.assertEqual(accelerated.get_system_state(), interpreted.get_system_state())
+    
+    def test_optimizer_folds_with_machine_width(self):
+        """El optimizador pliega constantes con la palabra de la máquina."""
+        source = ["LOAD R1, 100", "MUL R1, 3, R2", "STORE R2, 20"]
+        word = word_format_for(8)
+        
+        optimized, _ = optimize_program(assemble(source), word_format=word)
+        
+        self.assertEqual(optimized.instructions[1].raw_instruction, "LOAD R2, 44")
+    
+    def test_headless_report_names_word(self):
+        """El ejecutor sin interfaz acepta el ancho de palabra."""
+        report = run_program(ACCUMULATE.strip().split("\n"), memory_size=64, word_width=8)
+        
+        self.assertEqual(report['word_format'], "8 bits")
+        self.assertEqual(report['state']['registers']['R2'], 44)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,8 +5,44 @@ Este módulo contiene utilidades y herramientas auxiliares
 para el funcionamiento del simulador.
 """
 
-from .instruction_parser import InstructionParser
+from .instruction_parser import (
+    InstructionParser,
+    get_shared_parser,
+    parse_cached,
+    parse_cache_info,
+    clear_parse_cache
+)
+
+# Nombres del ensamblador: se importan bajo demanda para que importar
+# utils.instruction_parser (como hace core.computer) no cargue el ensamblador
+_ASSEMBLER_NAMES = frozenset({
+    'Assembler',
+    'AssembledProgram',
+    'AssemblyReport',
+    'IncrementalAssembler',
+    'assemble',
+    'get_shared_assembler'
+})
+
+
+def __getattr__(name):
+    """Importa los nombres del ensamblador bajo demanda."""
+    if name in _ASSEMBLER_NAMES:
+        from . import assembler
+        return getattr(assembler, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
-    'InstructionParser'
+    'InstructionParser',
+    'get_shared_parser',
+    'parse_cached',
+    'parse_cache_info',
+    'clear_parse_cache',
+    'Assembler',
+    'AssembledProgram',
+    'AssemblyReport',
+    'IncrementalAssembler',
+    'assemble',
+    'get_shared_assembler'
 ]
\ No newline at end of file
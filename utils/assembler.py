@@ -0,0 +1,731 @@
+"""
+Ensamblador de dos pasadas para el simulador.
+
+Este módulo convierte el texto de un programa con comentarios `#`,
+etiquetas (`bucle:`), constantes (`.equ LIMITE, 10`) y datos iniciales
+(`.data 20, 1, 2`) en instrucciones decodificadas listas para cargar en
+memoria, junto con un mapa de cada dirección a su línea fuente.
+"""
+
+import re
+from array import array
+from collections import abc
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from core.exceptions import AssemblyError, AssemblyErrorGroup, InvalidInstructionError, MemoryOverflowError
+from core.instruction import Instruction
+from utils.instruction_parser import InstructionParser, get_shared_parser, parse_cached
+
+
+COMMENT_CHAR = '#'
+EQU_DIRECTIVE = '.equ'
+DATA_DIRECTIVE = '.data'
+
+# Etiqueta al inicio de la línea: "bucle:" o "bucle: SUB R1, R2, R1"
+LABEL_PATTERN = re.compile(r'([A-Za-z_][A-Za-z0-9_]*)\s*:')
+SYMBOL_PATTERN = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+# Los nombres de registro no pueden usarse como símbolos
+REGISTER_NAME_PATTERN = re.compile(r'R[0-9]+')
+# Operando que podría ser un símbolo (descarta rápido las líneas sin símbolos)
+SYMBOL_REFERENCE_PATTERN = re.compile(r'[\s,*](?!R[0-9]+\b)[A-Za-z_]')
+
+# Errores que se reportan antes de abandonar un ensamblado en streaming
+DEFAULT_MAX_ERRORS = 10
+
+
+class AssembledProgram:
+    """
+    Programa ensamblado listo para cargar en memoria.
+    
+    Attributes:
+        instructions: Instrucciones decodificadas, una por dirección
+        source_map: Línea fuente (comenzando en 1) de cada dirección
+        symbols: Valor de cada etiqueta y constante
+        data: Valores iniciales de la memoria de datos (dirección -> valor)
+    """
+    
+    def __init__(self, instructions: Optional[List[Instruction]] = None, source_map: Optional[List[int]] = None,
+                 symbols: Optional[Dict[str, int]] = None, data: Optional[Dict[int, int]] = None):
+        self.instructions = instructions if instructions is not None else []
+        self.source_map = source_map if source_map is not None else []
+        self.symbols = symbols if symbols is not None else {}
+        self.data = data if data is not None else {}
+    
+    def __len__(self) -> int:
+        """Número de instrucciones del programa."""
+        return len(self.instructions)
+    
+    @property
+    def lines(self) -> List[str]:
+        """Texto de cada instrucción con los símbolos ya resueltos."""
+        return [instruction.raw_instruction for instruction in self.instructions]
+    
+    def line_for_address(self, address: int) -> Optional[int]:
+        """
+        Obtiene la línea fuente de una dirección.
+        
+        Args:
+            address: Dirección de la instrucción
+        
+        Returns:
+            Línea fuente (comenzando en 1) o None si la dirección no existe
+        """
+        if 0 <= address < len(self.source_map):
+            return self.source_map[address]
+        return None
+    
+    def address_for_line(self, line_number: int) -> Optional[int]:
+        """
+        Obtiene la dirección de la instrucción escrita en una línea fuente.
+        
+        Args:
+            line_number: Línea fuente (comenzando en 1)
+        
+        Returns:
+            Dirección o None si la línea no contiene una instrucción
+        """
+        for address, line in enumerate(self.source_map):
+            if line == line_number:
+                return address
+        return None
+
+
+class StreamedProgram:
+    """
+    Resumen de un programa ensamblado en streaming.
+    
+    Las instrucciones no se guardan aquí sino directamente en su destino
+    (normalmente la memoria del simulador); solo se conserva el mapa de
+    líneas fuente como arreglo compacto de enteros.
+    
+    Attributes:
+        instruction_count: Número de instrucciones ensambladas
+        source_map: Línea fuente (comenzando en 1) de cada dirección
+        symbols: Valor de cada etiqueta y constante
+        data: Valores iniciales de la memoria de datos (dirección -> valor)
+    """
+    
+    def __init__(self):
+        self.instruction_count = 0
+        self.source_map = array('I')
+        self.symbols = {}
+        self.data = {}
+    
+    def __len__(self) -> int:
+        """Número de instrucciones del programa."""
+        return self.instruction_count
+    
+    def line_for_address(self, address: int) -> Optional[int]:
+        """Obtiene la línea fuente de una dirección (None si no existe)."""
+        if 0 <= address < len(self.source_map):
+            return self.source_map[address]
+        return None
+    
+    def address_for_line(self, line_number: int) -> Optional[int]:
+        """Obtiene la dirección de la instrucción de una línea fuente (None si no tiene)."""
+        try:
+            return self.source_map.index(line_number)
+        except ValueError:
+            return None
+
+
+class LazySequence(abc.Sequence):
+    """Secuencia de solo lectura cuyos elementos se obtienen bajo demanda."""
+    
+    def __init__(self, length: int, getter: Callable[[int], object]):
+        self._length = length
+        self._getter = getter
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._getter(i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("program index out of range")
+        return self._getter(index)
+
+
+def strip_comment(line: str) -> str:
+    """
+    Elimina el comentario y los espacios de una línea.
+    
+    Args:
+        line: Línea del programa
+    
+    Returns:
+        Texto de la línea sin comentario
+    """
+    return line.split(COMMENT_CHAR, 1)[0].strip()
+
+
+class Assembler:
+    """
+    Ensamblador de dos pasadas.
+    
+    La primera pasada elimina comentarios, asigna una dirección a cada
+    instrucción y registra etiquetas y constantes. La segunda sustituye
+    los símbolos en los operandos y decodifica cada instrucción con el
+    parser compartido.
+    """
+    
+    def __init__(self, parser: Optional[InstructionParser] = None):
+        """
+        Inicializa el ensamblador.
+        
+        Args:
+            parser: Parser de instrucciones (default: el parser compartido)
+        """
+        self._parser = parser or get_shared_parser()
+    
+    def assemble(self, program_lines: Iterable[str]) -> AssembledProgram:
+        """
+        Ensambla un programa.
+        
+        Args:
+            program_lines: Líneas del programa (pueden contener comentarios,
+                etiquetas, directivas .equ/.data y líneas vacías)
+        
+        Returns:
+            Programa ensamblado
+        
+        Raises:
+            AssemblyError: Si alguna línea es inválida
+        """
+        statements, symbols, data = self._first_pass(program_lines)
+        program = AssembledProgram(symbols=symbols, data=data)
+        
+        for address, (line_number, text) in enumerate(statements):
+            program.instructions.append(self._assemble_statement(text, address, line_number, symbols))
+            program.source_map.append(line_number)
+        
+        return program
+    
+    def assemble_into(self, program_lines: Iterable[str], store: Callable[[int, Instruction], None],
+                      max_errors: int = DEFAULT_MAX_ERRORS,
+                      capacity: Optional[int] = None) -> StreamedProgram:
+        """
+        Ensambla un programa en una sola lectura, entregando cada instrucción a `store`.
+        
+        Las líneas se consumen una a una (sirve cualquier iterable, incluido
+        un archivo abierto) y no se construyen listas intermedias de líneas
+        ni de instrucciones. Las líneas idénticas comparten la misma
+        instancia de Instruction (con address 0, como en los archivos
+        objeto). Las instrucciones que usan un símbolo aún no definido (una
+        etiqueta posterior) se guardan como pendientes y se entregan al
+        final, cuando la tabla de símbolos está completa; si la lectura se
+        abandona por exceso de errores, las pendientes no se revisan.
+        
+        Args:
+            program_lines: Líneas del programa
+            store: Función store(dirección, instrucción) que guarda cada
+                instrucción decodificada (no necesariamente en orden)
+            max_errors: Errores a reunir antes de abandonar la lectura
+            capacity: Número máximo de instrucciones (None = sin límite)
+        
+        Returns:
+            Resumen del programa ensamblado
+        
+        Raises:
+            AssemblyErrorGroup: Con los primeros `max_errors` errores, por línea
+            MemoryOverflowError: Si el programa supera `capacity`
+        """
+        program = StreamedProgram()
+        symbols = program.symbols
+        data = program.data
+        source_map = program.source_map
+        resolve_symbols = self._resolve_symbols
+        
+        # Instrucciones con referencias hacia adelante: (dirección, línea, texto)
+        pending: List[Tuple[int, int, str]] = []
+        errors: List[AssemblyError] = []
+        address = 0
+        stopped_early = False
+        
+        for line_number, line in enumerate(program_lines, 1):
+            text = strip_comment(line)
+            if not text:
+                continue
+            
+            try:
+                label = LABEL_PATTERN.match(text)
+                if label:
+                    self._define_symbol(symbols, label.group(1), address, line_number, text)
+                    text = text[label.end():].strip()
+                    if not text:
+                        continue
+                if text.startswith('.'):
+                    self._apply_directive(symbols, data, text, line_number)
+                    continue
+                
+                if capacity is not None and address >= capacity:
+                    raise MemoryOverflowError(f"Program too large. Available: {capacity}, Required: more than {capacity}")
+                
+                resolved, unresolved = resolve_symbols(text, symbols)
+                if unresolved:
+                    pending.append((address, line_number, text))
+                else:
+                    store(address, self._decode_shared(resolved, [], line_number, text))
+                
+                source_map.append(line_number)
+                address += 1
+            except AssemblyError as e:
+                errors.append(e)
+                if len(errors) >= max_errors:
+                    stopped_early = True
+                    break
+        
+        # Completar las referencias hacia adelante (si la lectura se abandonó,
+        # la tabla de símbolos está incompleta y daría falsos "Undefined symbol")
+        for pending_address, line_number, text in ([] if stopped_early else pending):
+            resolved, unresolved = resolve_symbols(text, symbols)
+            try:
+                store(pending_address, self._decode_shared(resolved, unresolved, line_number, text))
+            except AssemblyError as e:
+                errors.append(e)
+        
+        if errors:
+            errors.sort(key=lambda error: error.line_number)
+            raise AssemblyErrorGroup(errors[:max_errors])
+        
+        program.instruction_count = address
+        return program
+    
+    def map_source_lines(self, program_lines: Iterable[str]) -> List[int]:
+        """
+        Obtiene la línea fuente de cada dirección sin decodificar instrucciones.
+        
+        Solo ejecuta la primera pasada, por lo que funciona aunque alguna
+        instrucción sea inválida.
+        
+        Args:
+            program_lines: Líneas del programa
+        
+        Returns:
+            Línea fuente (comenzando en 1) de cada dirección
+        
+        Raises:
+            AssemblyError: Si una etiqueta o directiva es inválida
+        """
+        statements, _, _ = self._first_pass(program_lines)
+        return [line_number for line_number, _ in statements]
+    
+    def _first_pass(self, program_lines: Iterable[str]) -> Tuple[List[Tuple[int, str]], Dict[str, int], Dict[int, int]]:
+        """
+        Recorre el programa asignando direcciones y registrando símbolos.
+        
+        Args:
+            program_lines: Líneas del programa
+        
+        Returns:
+            Tupla (lista de (línea fuente, instrucción), tabla de símbolos,
+            datos iniciales)
+        
+        Raises:
+            AssemblyError: Si una etiqueta o directiva es inválida
+        """
+        statements: List[Tuple[int, str]] = []
+        symbols: Dict[str, int] = {}
+        data: Dict[int, int] = {}
+        
+        for line_number, line in enumerate(program_lines, 1):
+            text = strip_comment(line)
+            if not text:
+                continue
+            
+            label = LABEL_PATTERN.match(text)
+            if label:
+                self._define_symbol(symbols, label.group(1), len(statements), line_number, text)
+                text = text[label.end():].strip()
+                if not text:
+                    continue
+            
+            if text.startswith('.'):
+                self._apply_directive(symbols, data, text, line_number)
+            else:
+                statements.append((line_number, text))
+        
+        return statements, symbols, data
+    
+    def _apply_directive(self, symbols: Dict[str, int], data: Dict[int, int], text: str, line_number: int) -> None:
+        """
+        Procesa una directiva del ensamblador.
+        
+        Args:
+            symbols: Tabla de símbolos
+            data: Datos iniciales
+            text: Línea con la directiva
+            line_number: Línea fuente
+        
+        Raises:
+            AssemblyError: Si la directiva es desconocida o está mal formada
+        """
+        directive, _, arguments = text.partition(' ')
+        directive = directive.lower()
+        parts = arguments.replace(',', ' ').split()
+        
+        if directive == EQU_DIRECTIVE:
+            if len(parts) != 2:
+                raise AssemblyError(".equ requires a name and a value: .equ NAME, value", line_number, text)
+            name, value = parts
+            self._define_symbol(symbols, name, self._directive_value(symbols, value, line_number, text),
+                                line_number, text)
+        
+        elif directive == DATA_DIRECTIVE:
+            if len(parts) < 2:
+                raise AssemblyError(".data requires an address and values: .data address, value, ...",
+                                    line_number, text)
+            address = self._directive_value(symbols, parts[0], line_number, text)
+            for offset, value in enumerate(parts[1:]):
+                data[address + offset] = self._directive_value(symbols, value, line_number, text)
+        
+        else:
+            raise AssemblyError(f"Unknown directive '{directive}'", line_number, text)
+    
+    def _directive_value(self, symbols: Dict[str, int], value: str, line_number: int, text: str) -> int:
+        """
+        Obtiene el valor numérico de un argumento de directiva.
+        
+        Raises:
+            AssemblyError: Si no es un entero ni un símbolo ya definido
+        """
+        if value in symbols:
+            return symbols[value]
+        try:
+            return int(value)
+        except ValueError:
+            raise AssemblyError(f"Invalid directive value '{value}'", line_number, text)
+    
+    def _define_symbol(self, symbols: Dict[str, int], name: str, value: int, line_number: int, text: str) -> None:
+        """
+        Registra una etiqueta o constante.
+        
+        Raises:
+            AssemblyError: Si el nombre es inválido o ya estaba definido
+        """
+        if not SYMBOL_PATTERN.fullmatch(name) or REGISTER_NAME_PATTERN.fullmatch(name):
+            raise AssemblyError(f"Invalid symbol name '{name}'", line_number, text)
+        if name in symbols:
+            raise AssemblyError(f"Duplicate symbol '{name}'", line_number, text)
+        symbols[name] = value
+    
+    def _assemble_statement(self, text: str, address: int, line_number: int,
+                            symbols: Dict[str, int]) -> Instruction:
+        """
+        Resuelve los símbolos de una instrucción y la decodifica.
+        
+        Raises:
+            AssemblyError: Si la instrucción es inválida o usa un símbolo no definido
+        """
+        resolved, unresolved = self._resolve_symbols(text, symbols)
+        
+        try:
+            return self._parser.parse(resolved, address)
+        except InvalidInstructionError as e:
+            raise AssemblyError(self._statement_error(e, unresolved), line_number, text)
+    
+    def _decode_shared(self, resolved: str, unresolved: List[str], line_number: int, text: str) -> Instruction:
+        """
+        Decodifica una instrucción ya resuelta con la caché compartida.
+        
+        Raises:
+            AssemblyError: Si la instrucción es inválida o usa un símbolo no definido
+        """
+        try:
+            return parse_cached(resolved)
+        except InvalidInstructionError as e:
+            raise AssemblyError(self._statement_error(e, unresolved), line_number, text)
+    
+    @staticmethod
+    def _statement_error(error: InvalidInstructionError, unresolved: List[str]) -> str:
+        """Obtiene el detalle del error de una instrucción que no se pudo decodificar."""
+        if unresolved:
+            return f"Undefined symbol '{unresolved[0]}'"
+        return error.instruction if error.instruction is not None else str(error)
+    
+    def _resolve_symbols(self, text: str, symbols: Dict[str, int]) -> Tuple[str, List[str]]:
+        """
+        Sustituye los símbolos de los operandos por su valor.
+        
+        Los operandos `NOMBRE` y `*NOMBRE` se reemplazan por el valor del
+        símbolo. Los nombres no definidos se dejan intactos para que el
+        parser decida si el operando es válido.
+        
+        Returns:
+            Tupla (instrucción resuelta, nombres no definidos)
+        """
+        if not SYMBOL_REFERENCE_PATTERN.search(text):
+            return text, []
+        parts = text.split(maxsplit=1)
+        if len(parts) == 1:
+            return text, []
+        
+        operands = [operand.strip() for operand in parts[1].split(',')]
+        unresolved = []
+        changed = False
+        
+        for index, operand in enumerate(operands):
+            prefix = '*' if operand.startswith('*') else ''
+            name = operand[len(prefix):]
+            if not SYMBOL_PATTERN.fullmatch(name) or REGISTER_NAME_PATTERN.fullmatch(name):
+                continue
+            if name in symbols:
+                operands[index] = f"{prefix}{symbols[name]}"
+                changed = True
+            else:
+                unresolved.append(name)
+        
+        if not changed:
+            return text, unresolved
+        return f"{parts[0]} {', '.join(operands)}", unresolved
+
+
+class _LineInfo(NamedTuple):
+    """Resultado de analizar una línea del programa de forma aislada."""
+    label: Optional[str]
+    directive: Optional[str]
+    statement: Optional[str]
+    symbolic: bool
+    error: Optional[str]
+
+
+_EMPTY_LINE = _LineInfo(None, None, None, False, None)
+
+
+class AssemblyReport:
+    """
+    Resultado de un reensamblado incremental.
+    
+    Attributes:
+        program: Programa ensamblado, o None si alguna línea tiene errores
+        errors: Mensaje de error de cada línea fuente inválida (comenzando en 1)
+        reparsed_lines: Líneas fuente que se volvieron a analizar
+    """
+    
+    def __init__(self, program: Optional[AssembledProgram], errors: Optional[Dict[int, str]] = None,
+                 reparsed_lines: Optional[List[int]] = None):
+        self.program = program
+        self.errors = errors if errors is not None else {}
+        self.reparsed_lines = reparsed_lines if reparsed_lines is not None else []
+    
+    @property
+    def ok(self) -> bool:
+        """True si el programa se ensambló sin errores."""
+        return self.program is not None
+
+
+class IncrementalAssembler:
+    """
+    Ensamblador que reutiliza el trabajo de la versión anterior del programa.
+    
+    Conserva el análisis y la instrucción decodificada de cada línea. Al
+    recibir una nueva versión del texto solo vuelve a parsear el bloque
+    de líneas que cambió (entre el prefijo y el sufijo comunes); si el
+    resto de las líneas cambia de dirección, su instrucción se reubica con
+    _replace sin volver a parsearla. Las instrucciones que usan símbolos
+    se vuelven a resolver en cada actualización porque una etiqueta puede
+    moverse aunque su línea no cambie; solo se parsean si su texto
+    resuelto cambió.
+    
+    A diferencia de Assembler, no se detiene en el primer error: reporta
+    el error de cada línea inválida.
+    """
+    
+    def __init__(self, assembler: Optional[Assembler] = None):
+        """
+        Inicializa el ensamblador incremental.
+        
+        Args:
+            assembler: Ensamblador usado para directivas y símbolos
+                (default: el ensamblador compartido)
+        """
+        self._assembler = assembler or get_shared_assembler()
+        self._lines: List[str] = []
+        self._infos: List[_LineInfo] = []
+        # Última instrucción decodificada de cada línea (None si no tiene)
+        self._decoded: List[Optional[Instruction]] = []
+        self._last_report: Optional[AssemblyReport] = None
+    
+    @property
+    def last_report(self) -> Optional[AssemblyReport]:
+        """Resultado de la última actualización (None si no hubo ninguna)."""
+        return self._last_report
+    
+    def update(self, program_lines: Sequence[str]) -> AssemblyReport:
+        """
+        Ensambla la nueva versión del programa reutilizando la anterior.
+        
+        Args:
+            program_lines: Todas las líneas del editor
+        
+        Returns:
+            Reporte con el programa (si no hay errores) y los errores por línea
+        """
+        program_lines = list(program_lines)
+        start, old_end, new_end = self._changed_range(program_lines)
+        
+        analyzed = [self._analyze(line) for line in program_lines[start:new_end]]
+        self._infos[start:old_end] = [info for info, _ in analyzed]
+        self._decoded[start:old_end] = [instruction for _, instruction in analyzed]
+        self._lines = program_lines
+        
+        report = self._build()
+        report.reparsed_lines = list(range(start + 1, new_end + 1))
+        self._last_report = report
+        return report
+    
+    def reset(self) -> None:
+        """Descarta el estado guardado; la siguiente actualización analiza todo."""
+        self._lines = []
+        self._infos = []
+        self._decoded = []
+        self._last_report = None
+    
+    def _changed_range(self, new_lines: List[str]) -> Tuple[int, int, int]:
+        """
+        Calcula el bloque de líneas que cambió respecto a la versión anterior.
+        
+        Returns:
+            Tupla (inicio, fin en la versión anterior, fin en la nueva)
+        """
+        old_lines = self._lines
+        limit = min(len(old_lines), len(new_lines))
+        
+        start = 0
+        while start < limit and old_lines[start] == new_lines[start]:
+            start += 1
+        
+        old_end = len(old_lines)
+        new_end = len(new_lines)
+        while old_end > start and new_end > start and old_lines[old_end - 1] == new_lines[new_end - 1]:
+            old_end -= 1
+            new_end -= 1
+        
+        return start, old_end, new_end
+    
+    def _analyze(self, line: str) -> Tuple[_LineInfo, Optional[Instruction]]:
+        """
+        Analiza una línea sin depender del resto del programa.
+        
+        Returns:
+            Tupla (análisis, instrucción decodificada en la dirección 0 o
+            None si la línea no tiene instrucción o usa símbolos)
+        """
+        text = strip_comment(line)
+        if not text:
+            return _EMPTY_LINE, None
+        
+        label = None
+        match = LABEL_PATTERN.match(text)
+        if match:
+            label = match.group(1)
+            text = text[match.end():].strip()
+        
+        if not text:
+            return _LineInfo(label, None, None, False, None), None
+        if text.startswith('.'):
+            return _LineInfo(label, text, None, False, None), None
+        
+        _, unresolved = self._assembler._resolve_symbols(text, {})
+        if unresolved:
+            return _LineInfo(label, None, text, True, None), None
+        
+        # Sin símbolos la instrucción se parsea una sola vez; _build solo la reubica
+        try:
+            instruction = self._assembler._parser.parse(text)
+        except InvalidInstructionError as e:
+            return _LineInfo(label, None, text, False, Assembler._statement_error(e, [])), None
+        return _LineInfo(label, None, text, False, None), instruction
+    
+    def _build(self) -> AssemblyReport:
+        """Asigna direcciones, resuelve símbolos y decodifica el programa."""
+        assembler = self._assembler
+        symbols: Dict[str, int] = {}
+        data: Dict[int, int] = {}
+        errors: Dict[int, str] = {}
+        statements: List[int] = []
+        
+        for index, info in enumerate(self._infos):
+            if info is _EMPTY_LINE:
+                continue
+            line_number = index + 1
+            try:
+                if info.label is not None:
+                    assembler._define_symbol(symbols, info.label, len(statements), line_number, info.label)
+                if info.directive is not None:
+                    assembler._apply_directive(symbols, data, info.directive, line_number)
+            except AssemblyError as e:
+                errors[line_number] = e.details
+            if info.statement is not None:
+                statements.append(index)
+        
+        program = AssembledProgram(symbols=symbols, data=data)
+        parser = assembler._parser
+        decoded = self._decoded
+        
+        for address, index in enumerate(statements):
+            info = self._infos[index]
+            if info.error is not None:
+                errors.setdefault(index + 1, info.error)
+                continue
+            
+            text, unresolved = info.statement, []
+            if info.symbolic:
+                text, unresolved = assembler._resolve_symbols(text, symbols)
+            
+            # Reutilizar la instrucción de la versión anterior: si solo
+            # cambió su dirección se reubica sin volver a parsearla
+            instruction = decoded[index]
+            if instruction is None or instruction.raw_instruction != text:
+                try:
+                    instruction = parser.parse(text, address)
+                except InvalidInstructionError as e:
+                    errors.setdefault(index + 1, Assembler._statement_error(e, unresolved))
+                    decoded[index] = None
+                    continue
+                decoded[index] = instruction
+            elif instruction.address != address:
+                instruction = instruction._replace(address=address)
+                decoded[index] = instruction
+            
+            program.instructions.append(instruction)
+            program.source_map.append(index + 1)
+        
+        if errors:
+            return AssemblyReport(None, errors)
+        return AssemblyReport(program)
+
+
+_shared_assembler: Optional[Assembler] = None
+
+
+def get_shared_assembler() -> Assembler:
+    """
+    Obtiene la instancia de ensamblador compartida por todo el proceso.
+    
+    Returns:
+        Assembler reutilizable (no guarda estado entre llamadas)
+    """
+    global _shared_assembler
+    if _shared_assembler is None:
+        _shared_assembler = Assembler()
+    return _shared_assembler
+
+
+def assemble(program_lines: Iterable[str]) -> AssembledProgram:
+    """
+    Ensambla un programa con el ensamblador compartido.
+    
+    Args:
+        program_lines: Líneas del programa
+    
+    Returns:
+        Programa ensamblado
+    
+    Raises:
+        AssemblyError: Si alguna línea es inválida
+    """
+    return get_shared_assembler().assemble(program_lines)
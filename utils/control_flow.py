@@ -0,0 +1,472 @@
+"""
+Análisis de flujo de control de programas decodificados.
+
+Construye el grafo de flujo de control (bloques básicos unidos por saltos
+JP/JPZ y por la ejecución secuencial), calcula dominadores y bucles
+naturales e identifica los registros de inducción de cada bucle, en
+particular el contador de los bucles que terminan con `JPZ salida, R`.
+
+Es la base de los motores de ejecución que compilan bloques o aceleran
+bucles, y permite reportar en qué bucles pasa el tiempo un programa.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Mapping, Optional, Sequence, Set, Tuple
+
+from core.instruction import Instruction, OperandKind, OperandToken
+from utils.instruction_parser import tokenize_operand
+
+
+JUMP_OPCODES = frozenset({'JP', 'JPZ'})
+THREE_OPERAND_ALU_OPCODES = frozenset({'ADD', 'SUB', 'MUL', 'DIV', 'AND', 'OR', 'XOR'})
+
+
+def operand_tokens(instruction: Instruction) -> Tuple[OperandToken, ...]:
+    """Operandos clasificados de una instrucción (tokeniza si no los tiene)."""
+    if instruction.operand_tokens:
+        return instruction.operand_tokens
+    return tuple(
+        tokenize_operand(operand or '')
+        for operand in (instruction.operand1, instruction.operand2, instruction.operand3)
+        if operand
+    )
+
+
+def registers_read(opcode: str, tokens: Tuple[OperandToken, ...]) -> Set[str]:
+    """Registros que lee una instrucción."""
+    if opcode == 'STORE':
+        return {tokens[0].text}
+    if opcode == 'JPZ':
+        return {tokens[1].text}
+    if opcode in ('LOAD', 'MOVE'):
+        positions = tokens[1:2]
+    else:
+        positions = tokens[:2]
+    
+    registers = set()
+    for token in positions:
+        if token.kind is OperandKind.REGISTER:
+            registers.add(token.text)
+        elif token.kind is OperandKind.INDIRECT_REGISTER:
+            registers.add(token.text[1:])
+    return registers
+
+
+def register_written(opcode: str, tokens: Tuple[OperandToken, ...]) -> Optional[str]:
+    """Registro que escribe una instrucción (None si no escribe ninguno)."""
+    if opcode in ('LOAD', 'MOVE'):
+        return tokens[0].text
+    if opcode == 'NOT':
+        return tokens[1].text
+    if opcode in THREE_OPERAND_ALU_OPCODES:
+        return tokens[2].text
+    return None
+
+
+def jump_target(instruction: Instruction) -> Optional[int]:
+    """Dirección destino de un salto (None si la instrucción no salta)."""
+    if instruction.opcode in JUMP_OPCODES:
+        return operand_tokens(instruction)[0].value
+    return None
+
+
+@dataclass
+class BasicBlock:
+    """
+    Secuencia de instrucciones que se ejecuta completa, sin saltos
+    intermedios ni destinos de salto después de la primera.
+    
+    Attributes:
+        index: Posición del bloque en el grafo (orden de direcciones)
+        start: Dirección de la primera instrucción
+        end: Dirección siguiente a la última instrucción
+        successors: Índices de los bloques que pueden ejecutarse después
+        predecessors: Índices de los bloques que pueden ejecutarse antes
+        exits_program: True si desde el bloque la ejecución puede terminar
+            (cae al final del programa, salta fuera de él o acaba en HALT)
+    """
+    index: int
+    start: int
+    end: int
+    successors: List[int] = field(default_factory=list)
+    predecessors: List[int] = field(default_factory=list)
+    exits_program: bool = False
+    
+    def __len__(self) -> int:
+        return self.end - self.start
+    
+    @property
+    def addresses(self) -> range:
+        """Direcciones de las instrucciones del bloque."""
+        return range(self.start, self.end)
+    
+    @property
+    def last(self) -> int:
+        """Dirección de la última instrucción del bloque."""
+        return self.end - 1
+
+
+@dataclass(frozen=True)
+class InductionRegister:
+    """
+    Registro que un bucle modifica una sola vez por iteración sumándole o
+    restándole un paso constante o un registro que el bucle no modifica.
+    
+    Attributes:
+        register: Nombre del registro (por ejemplo 'R1')
+        address: Dirección de la instrucción que lo actualiza
+        step: Paso por iteración, si es un valor inmediato
+        step_register: Registro invariante que se suma o resta, si no es inmediato
+        negated: True si el paso de step_register se resta
+    """
+    register: str
+    address: int
+    step: Optional[int] = None
+    step_register: Optional[str] = None
+    negated: bool = False
+
+
+@dataclass
+class NaturalLoop:
+    """
+    Bucle natural: una cabecera que domina a todos los bloques del bucle,
+    y uno o más saltos hacia atrás que vuelven a ella.
+    
+    Attributes:
+        header: Índice del bloque cabecera
+        blocks: Índices de los bloques del bucle (incluida la cabecera)
+        back_edges: Aristas (bloque origen, cabecera) que cierran el bucle
+        exits: Aristas (bloque del bucle, bloque fuera del bucle) de salida;
+            el destino es None si la salida termina el programa
+        induction_registers: Registros de inducción del bucle
+        counter: Registro de inducción que decide la salida con JPZ (None
+            si el bucle no es de conteo)
+        parent: Índice del bucle que lo contiene en analysis.loops (None si
+            es exterior)
+    """
+    header: int
+    blocks: FrozenSet[int]
+    back_edges: List[Tuple[int, int]] = field(default_factory=list)
+    exits: List[Tuple[int, Optional[int]]] = field(default_factory=list)
+    induction_registers: Dict[str, InductionRegister] = field(default_factory=dict)
+    counter: Optional[str] = None
+    parent: Optional[int] = None
+
+
+@dataclass
+class ControlFlowGraph:
+    """
+    Grafo de flujo de control de un programa.
+    
+    Attributes:
+        instructions: Instrucciones del programa, una por dirección
+        blocks: Bloques básicos en orden de dirección (el 0 es la entrada)
+    """
+    instructions: Sequence[Instruction]
+    blocks: List[BasicBlock]
+    _block_by_address: List[int] = field(default_factory=list, repr=False)
+    
+    def block_at(self, address: int) -> Optional[BasicBlock]:
+        """Bloque que contiene una dirección (None si está fuera del programa)."""
+        if 0 <= address < len(self._block_by_address):
+            return self.blocks[self._block_by_address[address]]
+        return None
+    
+    def reverse_postorder(self) -> List[int]:
+        """Bloques alcanzables desde la entrada, en orden posterior inverso."""
+        if not self.blocks:
+            return []
+        
+        order: List[int] = []
+        visited = {0}
+        # Recorrido en profundidad iterativo: (bloque, próximo sucesor a visitar)
+        stack = [(0, 0)]
+        while stack:
+            index, position = stack.pop()
+            successors = self.blocks[index].successors
+            if position < len(successors):
+                stack.append((index, position + 1))
+                successor = successors[position]
+                if successor not in visited:
+                    visited.add(successor)
+                    stack.append((successor, 0))
+            else:
+                order.append(index)
+        order.reverse()
+        return order
+
+
+def build_cfg(instructions: Sequence[Instruction]) -> ControlFlowGraph:
+    """
+    Construye el grafo de flujo de control de un programa.
+    
+    Un bloque empieza en la dirección 0, en cada destino de salto y después
+    de cada salto o HALT. JP tiene como único sucesor su destino; JPZ, su
+    destino y la instrucción siguiente. HALT no tiene sucesores: termina el
+    programa, igual que un destino fuera de él o llegar al final.
+    
+    Args:
+        instructions: Instrucciones decodificadas, una por dirección
+    
+    Returns:
+        Grafo con los bloques básicos y sus aristas
+    """
+    size = len(instructions)
+    leaders = {0} if size else set()
+    for address, instruction in enumerate(instructions):
+        target = jump_target(instruction)
+        if target is None:
+            if instruction.opcode == 'HALT' and address + 1 < size:
+                leaders.add(address + 1)
+            continue
+        if 0 <= target < size:
+            leaders.add(target)
+        if address + 1 < size:
+            leaders.add(address + 1)
+    
+    starts = sorted(leaders)
+    blocks = [BasicBlock(index, start, end) for index, (start, end) in enumerate(zip(starts, starts[1:] + [size]))]
+    block_by_address = [0] * size
+    for block in blocks:
+        block_by_address[block.start:block.end] = [block.index] * len(block)
+    
+    def link(block: BasicBlock, address: int) -> None:
+        if 0 <= address < size:
+            successor = block_by_address[address]
+            if successor not in block.successors:
+                block.successors.append(successor)
+                blocks[successor].predecessors.append(block.index)
+        else:
+            block.exits_program = True
+    
+    for block in blocks:
+        last = instructions[block.last]
+        target = jump_target(last)
+        if last.opcode == 'JP':
+            link(block, target)
+        elif last.opcode == 'HALT':
+            block.exits_program = True
+        else:
+            link(block, block.end)
+            if target is not None:
+                link(block, target)
+    
+    return ControlFlowGraph(instructions, blocks, block_by_address)
+
+
+def compute_dominators(cfg: ControlFlowGraph) -> Dict[int, int]:
+    """
+    Calcula el dominador inmediato de cada bloque alcanzable.
+    
+    Usa el algoritmo iterativo de Cooper, Harvey y Kennedy sobre el orden
+    posterior inverso. La entrada es su propio dominador inmediato.
+    
+    Args:
+        cfg: Grafo de flujo de control
+    
+    Returns:
+        Diccionario bloque -> dominador inmediato (sin los bloques
+        inalcanzables)
+    """
+    order = cfg.reverse_postorder()
+    if not order:
+        return {}
+    rank = {index: position for position, index in enumerate(order)}
+    idom = {order[0]: order[0]}
+    
+    def intersect(first: int, second: int) -> int:
+        while first != second:
+            while rank[first] > rank[second]:
+                first = idom[first]
+            while rank[second] > rank[first]:
+                second = idom[second]
+        return first
+    
+    changed = True
+    while changed:
+        changed = False
+        for index in order[1:]:
+            processed = [pred for pred in cfg.blocks[index].predecessors if pred in idom]
+            new_idom = processed[0]
+            for predecessor in processed[1:]:
+                new_idom = intersect(predecessor, new_idom)
+            if idom.get(index) != new_idom:
+                idom[index] = new_idom
+                changed = True
+    return idom
+
+
+def dominates(idom: Mapping[int, int], dominator: int, block: int) -> bool:
+    """Indica si `dominator` domina a `block` según los dominadores inmediatos."""
+    if block not in idom:
+        return False
+    while True:
+        if block == dominator:
+            return True
+        parent = idom[block]
+        if parent == block:
+            return False
+        block = parent
+
+
+@dataclass
+class ProgramAnalysis:
+    """
+    Resultado del análisis de un programa.
+    
+    Attributes:
+        cfg: Grafo de flujo de control
+        idom: Dominador inmediato de cada bloque alcanzable
+        loops: Bucles naturales, de interior a exterior
+    """
+    cfg: ControlFlowGraph
+    idom: Dict[int, int]
+    loops: List[NaturalLoop]
+    
+    def loop_at(self, address: int) -> Optional[int]:
+        """
+        Índice del bucle más interior que contiene una dirección.
+        
+        Returns:
+            Índice en `loops`, o None si la dirección no está en ningún bucle
+        """
+        block = self.cfg.block_at(address)
+        if block is None:
+            return None
+        for position, loop in enumerate(self.loops):
+            if block.index in loop.blocks:
+                return position
+        return None
+    
+    def loop_addresses(self, position: int) -> List[int]:
+        """Direcciones de las instrucciones de un bucle, en orden."""
+        loop = self.loops[position]
+        return [address for index in sorted(loop.blocks) for address in self.cfg.blocks[index].addresses]
+    
+    def cycles_per_loop(self, address_counts: Mapping[int, int]) -> List[Tuple[int, int]]:
+        """
+        Reparte los ciclos ejecutados entre los bucles del programa.
+        
+        Cada ciclo se asigna al bucle más interior que contiene la
+        instrucción ejecutada (los ciclos de un bucle interior no se suman
+        también al exterior).
+        
+        Args:
+            address_counts: Veces que se ejecutó cada dirección
+        
+        Returns:
+            Lista (índice del bucle, ciclos) de mayor a menor número de ciclos
+        """
+        cycles: Dict[int, int] = {}
+        for address, count in address_counts.items():
+            position = self.loop_at(address)
+            if position is not None:
+                cycles[position] = cycles.get(position, 0) + count
+        return sorted(cycles.items(), key=lambda item: (-item[1], item[0]))
+
+
+def find_loops(cfg: ControlFlowGraph, idom: Mapping[int, int]) -> List[NaturalLoop]:
+    """
+    Encuentra los bucles naturales del grafo.
+    
+    Los saltos hacia atrás con la misma cabecera forman un único bucle.
+    
+    Args:
+        cfg: Grafo de flujo de control
+        idom: Dominadores inmediatos (compute_dominators)
+    
+    Returns:
+        Bucles ordenados de interior a exterior, con su bucle padre
+    """
+    back_edges: Dict[int, List[Tuple[int, int]]] = {}
+    for block in cfg.blocks:
+        for successor in block.successors:
+            if dominates(idom, successor, block.index):
+                back_edges.setdefault(successor, []).append((block.index, successor))
+    
+    loops = []
+    for header, edges in back_edges.items():
+        body = {header}
+        worklist = [tail for tail, _ in edges if tail != header]
+        while worklist:
+            index = worklist.pop()
+            if index in body:
+                continue
+            body.add(index)
+            worklist.extend(pred for pred in cfg.blocks[index].predecessors if pred in idom)
+        
+        loop = NaturalLoop(header, frozenset(body), edges)
+        for index in sorted(body):
+            block = cfg.blocks[index]
+            loop.exits.extend((index, successor) for successor in block.successors if successor not in body)
+            if block.exits_program:
+                loop.exits.append((index, None))
+        _find_induction_registers(cfg, loop)
+        loops.append(loop)
+    
+    # Un bucle interior tiene menos bloques que los que lo contienen
+    loops.sort(key=lambda loop: (len(loop.blocks), cfg.blocks[loop.header].start))
+    for position, loop in enumerate(loops):
+        for outer_position in range(position + 1, len(loops)):
+            outer = loops[outer_position]
+            if loop.header in outer.blocks and loop.blocks < outer.blocks:
+                loop.parent = outer_position
+                break
+    return loops
+
+
+def _find_induction_registers(cfg: ControlFlowGraph, loop: NaturalLoop) -> None:
+    """Identifica los registros de inducción y el contador de un bucle."""
+    instructions = cfg.instructions
+    addresses = [address for index in sorted(loop.blocks) for address in cfg.blocks[index].addresses]
+    
+    writes: Dict[str, List[int]] = {}
+    for address in addresses:
+        instruction = instructions[address]
+        written = register_written(instruction.opcode, operand_tokens(instruction))
+        if written is not None:
+            writes.setdefault(written, []).append(address)
+    
+    for register, written_at in writes.items():
+        if len(written_at) != 1:
+            continue
+        address = written_at[0]
+        instruction = instructions[address]
+        if instruction.opcode not in ('ADD', 'SUB'):
+            continue
+        source, step, destination = operand_tokens(instruction)
+        if source.text != register or destination.text != register:
+            continue
+        
+        negated = instruction.opcode == 'SUB'
+        if step.kind is OperandKind.IMMEDIATE:
+            loop.induction_registers[register] = InductionRegister(
+                register, address, -step.value if negated else step.value)
+        elif step.text not in writes:
+            loop.induction_registers[register] = InductionRegister(
+                register, address, step_register=step.text, negated=negated)
+    
+    # Bucle de conteo: una salida es `JPZ destino, R` sobre un registro de inducción
+    for index in dict.fromkeys(index for index, _ in loop.exits):
+        last = instructions[cfg.blocks[index].last]
+        if last.opcode == 'JPZ':
+            tested = operand_tokens(last)[1].text
+            if tested in loop.induction_registers:
+                loop.counter = tested
+                break
+
+
+def analyze_program(instructions: Sequence[Instruction]) -> ProgramAnalysis:
+    """
+    Analiza el flujo de control de un programa.
+    
+    Args:
+        instructions: Instrucciones decodificadas (por ejemplo
+            AssembledProgram.instructions)
+    
+    Returns:
+        Grafo, dominadores y bucles del programa
+    """
+    cfg = build_cfg(instructions)
+    idom = compute_dominators(cfg)
+    return ProgramAnalysis(cfg, idom, find_loops(cfg, idom))
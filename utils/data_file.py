@@ -0,0 +1,135 @@
+"""
+Importación y exportación del segmento de datos de la memoria.
+
+Los vectores de prueba se guardan en uno de dos formatos:
+
+- Binario: palabras consecutivas little-endian del tipo de los bloques de
+  la memoria (WordFormat.block_typecode: int8/int16/int32 según el ancho
+  de palabra, int64 con el formato histórico), sin cabecera.
+- CSV (extensión .csv): enteros separados por comas o saltos de línea.
+
+Ambos se cargan con una sola lectura del archivo y se guardan en memoria
+con Memory.store_block (una validación, una copia y una notificación).
+"""
+
+import os
+import sys
+from array import array
+from typing import Any, Optional
+
+from core.exceptions import DataFormatError
+from hardware.memory import Memory
+
+
+CSV_EXTENSION = '.csv'
+
+
+def is_csv_file(path: str) -> bool:
+    """Indica si un archivo de datos usa el formato CSV (por su extensión)."""
+    return os.path.splitext(path)[1].lower() == CSV_EXTENSION
+
+
+def read_data_file(path: str, typecode: str) -> array:
+    """
+    Lee un archivo de datos binario o CSV.
+    
+    Args:
+        path: Ruta del archivo
+        typecode: Código de array.array de las palabras de un archivo binario
+    
+    Returns:
+        Valores del archivo
+    
+    Raises:
+        DataFormatError: Si el contenido no es válido
+    """
+    if is_csv_file(path):
+        with open(path, encoding='utf-8') as source:
+            text = source.read()
+        try:
+            # Los valores pueden exceder la palabra: store_block los trunca
+            return array('q', [int(field) for field in text.replace('\n', ',').split(',') if field.strip()])
+        except (ValueError, OverflowError) as e:
+            raise DataFormatError(f"Invalid CSV data file {path}: {e}")
+    
+    with open(path, 'rb') as source:
+        content = source.read()
+    block = array(typecode)
+    if len(content) % block.itemsize:
+        raise DataFormatError(
+            f"Invalid binary data file {path}: {len(content)} bytes is not a multiple "
+            f"of the {block.itemsize}-byte word"
+        )
+    block.frombytes(content)
+    if sys.byteorder == 'big':
+        block.byteswap()
+    return block
+
+
+def write_data_file(values: Any, path: str, typecode: str) -> None:
+    """
+    Escribe valores en un archivo de datos binario o CSV.
+    
+    Args:
+        values: Enteros a escribir (cualquier iterable o buffer)
+        path: Ruta del archivo a crear
+        typecode: Código de array.array de las palabras de un archivo binario
+    """
+    if is_csv_file(path):
+        with open(path, 'w', encoding='utf-8') as output:
+            output.write("\n".join(map(str, values)))
+            output.write("\n")
+        return
+    
+    block = array(typecode, values)
+    if sys.byteorder == 'big':
+        block.byteswap()
+    with open(path, 'wb') as output:
+        output.write(block.tobytes())
+
+
+def import_data(memory: Memory, path: str, address: Optional[int] = None) -> int:
+    """
+    Carga un archivo de datos en la memoria.
+    
+    Args:
+        memory: Memoria de destino
+        path: Ruta del archivo (binario o CSV)
+        address: Primera dirección de datos (default: inicio del segmento)
+    
+    Returns:
+        Cantidad de palabras cargadas
+    
+    Raises:
+        DataFormatError: Si el contenido no es válido
+        InvalidMemoryAddressError: Si los datos no caben en el segmento
+    """
+    block = read_data_file(path, memory.block_typecode)
+    memory.store_block(memory.instruction_size if address is None else address, block)
+    return len(block)
+
+
+def export_data(memory: Memory, path: str, address: Optional[int] = None,
+                count: Optional[int] = None) -> int:
+    """
+    Guarda un bloque del segmento de datos en un archivo.
+    
+    Args:
+        memory: Memoria de origen
+        path: Ruta del archivo a crear (binario o CSV)
+        address: Primera dirección de datos (default: inicio del segmento)
+        count: Palabras a guardar (default: hasta el final de la memoria)
+    
+    Returns:
+        Cantidad de palabras guardadas
+    
+    Raises:
+        InvalidMemoryAddressError: Si el bloque no está en el segmento
+    """
+    if address is None:
+        address = memory.instruction_size
+    if count is None:
+        count = max(memory.size - address, 0)
+    block = memory.load_block(address, count)
+    write_data_file(block, path, block.typecode)
+    return len(block)
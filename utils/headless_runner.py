@@ -0,0 +1,264 @@
+"""
+Ejecutor del simulador sin interfaz gráfica.
+
+Este módulo permite cargar y ejecutar un programa desde la línea de
+comandos e imprimir el estado final y contadores de rendimiento. No
+importa tkinter ni el paquete gui, por lo que funciona en servidores
+sin pantalla.
+"""
+
+import sys
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, TextIO, Union
+
+from core.computer import Computer
+from core.exceptions import AssemblyErrorGroup, SimulatorError
+from core.word_format import word_format_for
+from utils.instruction_parser import parse_cache_info
+
+if TYPE_CHECKING:
+    from utils.object_format import ObjectImage
+
+# El ensamblador completo, el formato objeto, el motor de bucles y json se
+# importan solo en los caminos que los usan, para que ejecutar un programa
+# pequeño no pague su costo de arranque.
+
+# Códigos de salida
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_MAX_CYCLES = 3
+
+# Firma de los archivos objeto (utils.object_format.MAGIC), comprobada aquí
+# para no importar el formato objeto al ejecutar programas de texto
+_OBJECT_MAGIC = b'SIMO'
+
+
+def _is_object_file(path: str) -> bool:
+    """Indica si un archivo comienza con la firma del formato objeto (como utils.object_format.is_object_file)."""
+    with open(path, 'rb') as source:
+        return source.read(len(_OBJECT_MAGIC)) == _OBJECT_MAGIC
+
+
+def run_program(program_lines: Union[Iterable[str], 'ObjectImage'], max_cycles: Optional[int] = None,
+                memory_size: int = 32, max_errors: Optional[int] = None,
+                optimize: bool = False, accelerate: bool = True,
+                word_width: Optional[int] = None, data: Any = None) -> Dict[str, Any]:
+    """
+    Carga y ejecuta un programa en un Computer sin observadores.
+    
+    Args:
+        program_lines: Líneas del programa (cualquier iterable, incluido un
+            archivo abierto) o imagen de un archivo objeto
+        max_cycles: Límite de ciclos (None = sin límite)
+        memory_size: Tamaño de la memoria del simulador
+        max_errors: Errores de ensamblado a reportar antes de abandonar la carga
+            (None = utils.assembler.DEFAULT_MAX_ERRORS)
+        optimize: True para aplicar el optimizador de mirilla antes de
+            ejecutar (no aplica a imágenes de archivo objeto)
+        accelerate: True para calcular directamente las iteraciones de los
+            bucles de conteo (core.engine.FastEngine); el resultado es el
+            mismo que al interpretarlas
+        word_width: Ancho de palabra de la máquina (8, 16 o 32; None =
+            semántica histórica)
+        data: Bloque de enteros con protocolo de buffer (bytes, array,
+            NumPy...) a guardar al inicio del segmento de datos antes de
+            ejecutar (None = sin datos)
+    
+    Returns:
+        Diccionario con el estado final, los contadores y el motivo de parada
+        (y el resumen de la optimización si se pidió)
+    
+    Raises:
+        SimulatorError: Si el programa no se puede cargar o ejecutar
+        ValueError: Si el ancho de palabra no está admitido
+    """
+    computer = Computer(memory_size, word_width)
+    # Nadie observa cada ciclo: el PSW se calcula solo al reportar el estado
+    computer.set_lazy_flags(True)
+    
+    optimization = None
+    
+    # Solo puede haber una ObjectImage si su módulo ya se importó
+    object_format = sys.modules.get('utils.object_format')
+    
+    load_start = time.perf_counter()
+    if object_format is not None and isinstance(program_lines, object_format.ObjectImage):
+        computer.load_object_image(program_lines)
+    elif optimize:
+        # El optimizador necesita el programa completo decodificado
+        from utils.assembler import assemble
+        from utils.optimizer import optimize_program
+        program, optimization = optimize_program(assemble(program_lines), word_format=computer.word_format)
+        computer.load_assembled_program(program)
+    else:
+        computer.load_program_stream(program_lines, max_errors)
+    if data is not None:
+        computer.memory.store_block(computer.memory.instruction_size, data)
+    load_seconds = time.perf_counter() - load_start
+    
+    run_start = time.perf_counter()
+    if accelerate:
+        from core.engine import FastEngine
+        engine = FastEngine(computer)
+        cycles = engine.run(max_cycles)
+        accelerated_cycles = engine.accelerated_cycles
+    else:
+        cycles = computer.execute_program(max_cycles)
+        accelerated_cycles = 0
+    run_seconds = time.perf_counter() - run_start
+    
+    state = computer.get_system_state()
+    finished = state['pc'] >= state['program_size'] or state['is_halted']
+    
+    report = {
+        'state': state,
+        'word_format': str(computer.word_format),
+        'stop_reason': 'completed' if finished else 'max_cycles',
+        'performance': {
+            'cycles': cycles,
+            'accelerated_cycles': accelerated_cycles,
+            'load_seconds': load_seconds,
+            'run_seconds': run_seconds,
+            'cycles_per_second': cycles / run_seconds if run_seconds > 0 else None,
+            'parse_cache': parse_cache_info()
+        }
+    }
+    if optimization is not None:
+        report['optimization'] = optimization.to_dict()
+    return report
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """
+    Formatea el resultado de una ejecución como texto legible.
+    
+    Args:
+        report: Resultado de run_program()
+    
+    Returns:
+        Texto con el estado final y los contadores
+    """
+    state = report['state']
+    performance = report['performance']
+    psw = state['psw']
+    
+    lines = [
+        f"Estado: {report['stop_reason']}",
+        f"Palabra: {report['word_format']}",
+        f"PC: {state['pc']}  MAR: {state['mar']}  MBR: {state['mbr']}",
+        f"IR: {state['ir']}",
+        f"ALU: {state['alu_value']}  PSW: Z: {psw['Z']} C: {psw['C']} S: {psw['S']} O: {psw['O']}",
+        "Registros: " + ", ".join(f"{name}={value}" for name, value in state['registers'].items()),
+        f"Ciclos: {performance['cycles']} ({performance['accelerated_cycles']} en bucles acelerados)",
+        f"Tiempo de carga: {performance['load_seconds'] * 1000:.3f} ms",
+        f"Tiempo de ejecución: {performance['run_seconds'] * 1000:.3f} ms",
+    ]
+    if performance['cycles_per_second'] is not None:
+        lines.append(f"Ciclos/segundo: {performance['cycles_per_second']:.0f}")
+    cache = performance['parse_cache']
+    lines.append(f"Caché de parseo: {cache['hits']} aciertos, {cache['misses']} fallos")
+    
+    optimization = report.get('optimization')
+    if optimization is not None:
+        lines.append(f"Optimización: {len(optimization['changes'])} cambios, "
+                     f"{optimization['original_size']} -> {optimization['optimized_size']} instrucciones")
+        lines.extend(f"  {change}" for change in optimization['changes'])
+    
+    return "\n".join(lines)
+
+
+def run_headless(program_path: str, max_cycles: Optional[int] = None,
+                 dump_state: str = "text", memory_size: int = 32,
+                 output: TextIO = None, max_errors: Optional[int] = None,
+                 optimize: bool = False, accelerate: bool = True,
+                 word_width: Optional[int] = None, data_path: Optional[str] = None) -> int:
+    """
+    Ejecuta un archivo de programa e imprime el resultado.
+    
+    Args:
+        program_path: Ruta del programa (texto o archivo objeto)
+        max_cycles: Límite de ciclos (None = sin límite)
+        dump_state: Formato de salida ("text" o "json")
+        memory_size: Tamaño de la memoria del simulador
+        output: Flujo de salida (default: sys.stdout)
+        max_errors: Errores de ensamblado a reportar antes de abandonar la carga
+            (None = utils.assembler.DEFAULT_MAX_ERRORS)
+        optimize: True para aplicar el optimizador de mirilla
+        accelerate: True para acelerar los bucles de conteo
+        word_width: Ancho de palabra de la máquina (None = semántica histórica)
+        data_path: Archivo de datos (binario o CSV, ver utils.data_file) a
+            cargar al inicio del segmento de datos
+    
+    Returns:
+        Código de salida del proceso
+    """
+    output = output or sys.stdout
+    
+    try:
+        data = None
+        if data_path is not None:
+            from utils.data_file import read_data_file
+            data = read_data_file(data_path, word_format_for(word_width).block_typecode)
+        if _is_object_file(program_path):
+            from utils.object_format import read_object
+            report = run_program(read_object(program_path), max_cycles, memory_size,
+                                 accelerate=accelerate, word_width=word_width, data=data)
+        else:
+            # El archivo se ensambla mientras se lee, sin cargarlo completo
+            # en memoria; los errores indican la línea del archivo
+            with open(program_path, encoding='utf-8') as source:
+                report = run_program(source, max_cycles, memory_size, max_errors, optimize, accelerate,
+                                     word_width, data)
+    except OSError as e:
+        print(f"Error leyendo el programa: {e}", file=sys.stderr)
+        return EXIT_ERROR
+    except AssemblyErrorGroup as e:
+        for error in e.errors:
+            print(f"Error de simulación: {error}", file=sys.stderr)
+        return EXIT_ERROR
+    except SimulatorError as e:
+        print(f"Error de simulación: {e}", file=sys.stderr)
+        return EXIT_ERROR
+    
+    if dump_state == "json":
+        import json
+        print(json.dumps(report, indent=2, ensure_ascii=False), file=output)
+    else:
+        print(format_report(report), file=output)
+    
+    return EXIT_OK if report['stop_reason'] == 'completed' else EXIT_MAX_CYCLES
+
+
+def assemble_to_object(program_path: str, object_path: str, workers: int = 1) -> int:
+    """
+    Ensambla un programa de texto y lo guarda como archivo objeto.
+    
+    Args:
+        program_path: Ruta del programa en texto
+        object_path: Ruta del archivo objeto a crear
+        workers: Procesos para ensamblar en paralelo (1 = en este proceso)
+    
+    Returns:
+        Código de salida del proceso
+    """
+    # El ensamblado en paralelo carga multiprocessing: solo se importa aquí
+    from utils.object_format import write_object
+    from utils.parallel_assembler import assemble_parallel
+    
+    try:
+        with open(program_path, encoding='utf-8') as source:
+            image = assemble_parallel(source.read().splitlines(), workers)
+        write_object(image, object_path)
+    except OSError as e:
+        print(f"Error de archivo: {e}", file=sys.stderr)
+        return EXIT_ERROR
+    except AssemblyErrorGroup as e:
+        for error in e.errors:
+            print(f"Error de ensamblado: {error}", file=sys.stderr)
+        return EXIT_ERROR
+    except SimulatorError as e:
+        print(f"Error de ensamblado: {e}", file=sys.stderr)
+        return EXIT_ERROR
+    
+    print(f"{len(image)} instrucciones escritas en {object_path}")
+    return EXIT_OK
@@ -6,27 +6,122 @@ del simulador.
 """
 
 import re
-from typing import Tuple, Optional
-from core.instruction import Instruction, InstructionSet
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, Tuple, Optional
+from core.instruction import Instruction, InstructionSet, OperandKind, OperandToken
 from core.exceptions import InvalidInstructionError
 
 
+# Expresión maestra que clasifica un operando en una sola pasada
+OPERAND_PATTERN = re.compile(
+    r'(?P<register>R[1-9])'
+    r'|\*(?:(?P<indirect_register>R[1-9])|(?P<indirect_address>\d+))'
+    r'|(?P<immediate>-?\d+)'
+)
+
+_KIND_BY_GROUP = {
+    'register': OperandKind.REGISTER,
+    'immediate': OperandKind.IMMEDIATE,
+    'indirect_register': OperandKind.INDIRECT_REGISTER,
+    'indirect_address': OperandKind.INDIRECT_ADDRESS,
+}
+
+# Número de operandos que se leen según el opcode
+THREE_OPERAND_OPCODES = frozenset({'ADD', 'SUB', 'MUL', 'DIV', 'AND', 'OR', 'XOR'})
+TWO_OPERAND_OPCODES = frozenset({'LOAD', 'STORE', 'MOVE', 'JP', 'JPZ', 'NOT'})
+
+# Clases de operando permitidas
+_REGISTER = frozenset({OperandKind.REGISTER})
+_REGISTER_OR_IMMEDIATE = frozenset({OperandKind.REGISTER, OperandKind.IMMEDIATE})
+_ADDRESS = frozenset({OperandKind.IMMEDIATE})
+_LOAD_SOURCE = frozenset({
+    OperandKind.IMMEDIATE, OperandKind.INDIRECT_REGISTER, OperandKind.INDIRECT_ADDRESS
+})
+
+
+def _build_operand_rules() -> Dict[str, Tuple[int, str, Optional[str], Tuple[Tuple[frozenset, str], ...]]]:
+    """
+    Construye la tabla de reglas semánticas por opcode.
+    
+    Cada regla es (operandos obligatorios, mensaje si faltan, mensaje si
+    sobra el segundo operando o None, (clases permitidas, mensaje) por posición).
+    """
+    rules = {}
+    for opcode in sorted(THREE_OPERAND_OPCODES | {'NOT'}):
+        rules[opcode] = (
+            2, f"{opcode} requires two operands: {InstructionSet.get_instruction_format(opcode)}", None, (
+                (_REGISTER, f"{opcode} first operand must be a register (R1-R9)"),
+                (_REGISTER_OR_IMMEDIATE, f"{opcode} second operand must be a register or immediate value"),
+            )
+        )
+    rules['LOAD'] = (2, "LOAD requires two operands: LOAD R1, value or LOAD R1, *R2", None, (
+        (_REGISTER, "LOAD first operand must be a register (R1-R9)"),
+        (_LOAD_SOURCE, "LOAD second operand must be immediate value, indirect register (*R1-*R9), or indirect address (*16)"),
+    ))
+    rules['STORE'] = (2, "STORE requires two operands: STORE R1, address", None, (
+        (_REGISTER, "STORE first operand must be a register (R1-R9)"),
+        (_ADDRESS, "STORE second operand must be a memory address"),
+    ))
+    rules['MOVE'] = (2, "MOVE requires two operands: MOVE R1, R2", None, (
+        (_REGISTER, "MOVE first operand must be a register (R1-R9)"),
+        (_REGISTER, "MOVE second operand must be a register (R1-R9)"),
+    ))
+    rules['JP'] = (1, "JP requires one operand: JP address", "JP takes only one operand", (
+        (_ADDRESS, "JP operand must be a memory address"),
+    ))
+    rules['JPZ'] = (2, "JPZ requires two operands: JPZ address, register", None, (
+        (_ADDRESS, "JPZ first operand must be a memory address"),
+        (_REGISTER, "JPZ second operand must be a register (R1-R9)"),
+    ))
+    return rules
+
+
+OPERAND_RULES = _build_operand_rules()
+
+# Número máximo de líneas distintas en la caché de parseo compartida
+PARSE_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=1024)
+def tokenize_operand(text: str) -> Optional[OperandToken]:
+    """
+    Clasifica un operando con una sola búsqueda de la expresión maestra.
+    
+    Args:
+        text: Operando tal como aparece entre comas (puede tener espacios)
+        
+    Returns:
+        OperandToken con su clase, texto sin espacios y valor, o None si el
+        operando está vacío. Los operandos no reconocidos se devuelven con
+        clase UNKNOWN.
+    """
+    text = text.strip()
+    if not text:
+        return None
+    
+    match = OPERAND_PATTERN.fullmatch(text)
+    if match is None:
+        return OperandToken(OperandKind.UNKNOWN, text, None)
+    
+    group = match.lastgroup
+    kind = _KIND_BY_GROUP[group]
+    value = match.group(group)
+    if kind is OperandKind.REGISTER or kind is OperandKind.INDIRECT_REGISTER:
+        value = value[1:]
+    return OperandToken(kind, text, int(value))
+
+
 class InstructionParser:
     """
     Parser que convierte strings en objetos Instruction validados.
     
     Valida la sintaxis y semántica de las instrucciones del simulador.
+    Cada operando se clasifica una sola vez con la expresión maestra
+    OPERAND_PATTERN y la validación compara las clases obtenidas con la
+    tabla OPERAND_RULES. El parser no guarda estado entre llamadas, por
+    lo que una misma instancia puede compartirse (ver get_shared_parser()).
     """
     
-    def __init__(self):
-        """Inicializa el parser con patrones de expresiones regulares."""
-        # Patrones para validar diferentes tipos de operandos
-        self._register_pattern = re.compile(r'^R[1-9]$')
-        self._immediate_pattern = re.compile(r'^-?\d+$')
-        self._indirect_pattern = re.compile(r'^\*R[1-9]$')
-        self._indirect_address_pattern = re.compile(r'^\*\d+$')
-        self._address_pattern = re.compile(r'^\d+$')
-    
     def parse(self, instruction_str: str, address: int = 0) -> Instruction:
         """
         Parsea una instrucción desde string.
@@ -44,9 +139,32 @@ class InstructionParser:
         if not instruction_str or not instruction_str.strip():
             raise InvalidInstructionError("Empty instruction")
         
-        # Limpiar y dividir la instrucción
+        # Reutilizar el resultado de la caché compartida
         clean_instruction = instruction_str.strip()
-        parts = clean_instruction.split(maxsplit=1)
+        instruction = parse_cached(clean_instruction)
+        
+        if address == instruction.address and clean_instruction == instruction.raw_instruction:
+            return instruction
+        return instruction._replace(raw_instruction=clean_instruction, address=address)
+    
+    def tokenize(self, instruction_str: str) -> Tuple[str, Tuple[Optional[OperandToken], ...]]:
+        """
+        Separa una instrucción en opcode y operandos clasificados.
+        
+        Solo se leen los operandos que usa el opcode: tres para las
+        operaciones de la ALU con destino, dos para el resto y ninguno
+        para HALT.
+        
+        Args:
+            instruction_str: Instrucción sin espacios al inicio ni al final
+            
+        Returns:
+            Tupla (opcode en mayúsculas, operandos clasificados)
+            
+        Raises:
+            InvalidInstructionError: Si el opcode o el número de operandos es inválido
+        """
+        parts = instruction_str.split(maxsplit=1)
         
         if not parts:
             raise InvalidInstructionError("No opcode found")
@@ -54,237 +172,77 @@ class InstructionParser:
         opcode = parts[0].upper()
         
         # Validar opcode
-        if not InstructionSet.is_valid_opcode(opcode):
+        if opcode not in InstructionSet.VALID_OPCODES:
             raise InvalidInstructionError(
                 f"Invalid opcode '{opcode}'. Valid opcodes: {', '.join(sorted(InstructionSet.VALID_OPCODES))}"
             )
         
-        # Parsear operandos
-        operand1, operand2, operand3 = self._parse_operands(parts[1] if len(parts) > 1 else "", opcode)
-        
-        # Validar semántica de la instrucción
-        self._validate_instruction_semantics(opcode, operand1, operand2, operand3)
-        
-        return Instruction(
-            type=opcode,
-            operand1=operand1,
-            operand2=operand2,
-            operand3=operand3,
-            raw_instruction=clean_instruction,
-            address=address
-        )
-    
-    def _parse_operands(self, operands_str: str, opcode: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
-        """
-        Parsea los operandos de una instrucción.
-        
-        Args:
-            operands_str: String con los operandos
-            opcode: Código de operación
-            
-        Returns:
-            Tupla con (operand1, operand2, operand3)
-        """
-        if not operands_str.strip():
-            return None, None, None
+        if len(parts) == 1 or opcode == 'HALT':
+            return opcode, ()
         
-        # Dividir operandos por coma
-        operands = [op.strip() for op in operands_str.split(',')]
+        operands = parts[1].split(',')
         
-        # Determinar número de operandos según la operación
-        if opcode in ['ADD', 'SUB', 'MUL', 'DIV', 'AND', 'OR', 'XOR']:
+        if opcode in THREE_OPERAND_OPCODES:
             # Operaciones de 3 operandos: src1, src2, dest
             if len(operands) != 3:
                 raise InvalidInstructionError(f"{opcode} requires three operands: src1, src2, dest")
-            return operands[0], operands[1], operands[2]
-        
-        elif opcode in ['LOAD', 'STORE', 'MOVE', 'JP', 'JPZ', 'NOT']:
-            # Operaciones de 2 operandos
-            if len(operands) < 1:
-                raise InvalidInstructionError(f"{opcode} requires at least one operand")
-            return (operands[0], 
-                   operands[1] if len(operands) > 1 else None,
-                   None)
-        
-        elif opcode in ['HALT']:
-            # Operaciones sin operandos
-            return (None, None, None)
-        
         else:
-            # Default: hasta 3 operandos
-            return (operands[0] if len(operands) > 0 else None,
-                   operands[1] if len(operands) > 1 else None,
-                   operands[2] if len(operands) > 2 else None)
-        
-        operand1 = operands[0] if len(operands) > 0 and operands[0] else None
-        operand2 = operands[1] if len(operands) > 1 and operands[1] else None
-        
-        # Validar formato de operandos
-        if operand1:
-            self._validate_operand_format(operand1, opcode, 1)
-        if operand2:
-            self._validate_operand_format(operand2, opcode, 2)
+            # Operaciones de 2 operandos (los sobrantes se ignoran)
+            del operands[2:]
         
-        return operand1, operand2
+        return opcode, tuple(map(tokenize_operand, operands))
     
-    def _validate_operand_format(self, operand: str, opcode: str, position: int) -> None:
+    def _parse_uncached(self, clean_instruction: str, address: int = 0) -> Instruction:
         """
-        Valida el formato de un operando específico.
+        Parsea una instrucción ya limpia sin consultar la caché.
         
         Args:
-            operand: Operando a validar
-            opcode: Código de operación
-            position: Posición del operando (1 o 2)
+            clean_instruction: Instrucción sin espacios al inicio ni al final
+            address: Dirección de memoria (opcional)
+            
+        Returns:
+            Objeto Instruction validado
             
         Raises:
-            InvalidInstructionError: Si el formato es inválido
+            InvalidInstructionError: Si la instrucción es inválida
         """
-        if not operand:
-            return
-        
-        # Verificar si es un registro válido
-        if self._register_pattern.match(operand):
-            return
-        
-        # Verificar si es un valor inmediato válido
-        if self._immediate_pattern.match(operand):
-            value = int(operand)
-            if not (-16384 <= value <= 16383):
-                raise InvalidInstructionError(
-                    f"Immediate value {value} out of range [-16384, 16383] in operand {position}"
-                )
-            return
+        opcode, tokens = self.tokenize(clean_instruction)
         
-        # Verificar si es direccionamiento indirecto válido
-        if self._indirect_pattern.match(operand):
-            return
+        # Validar semántica de la instrucción
+        self._validate_operands(opcode, tokens)
         
-        # Verificar si es una dirección válida (solo para ciertas instrucciones)
-        if self._address_pattern.match(operand):
-            address = int(operand)
-            if not (0 <= address <= 31):  # Asumiendo memoria de 32 posiciones
-                raise InvalidInstructionError(
-                    f"Memory address {address} out of range [0, 31] in operand {position}"
-                )
-            return
+        operand1, operand2, operand3 = (*[token and token.text for token in tokens], None, None, None)[:3]
         
-        raise InvalidInstructionError(
-            f"Invalid operand format '{operand}' in position {position}. "
-            f"Expected: register (R1-R9), immediate value, indirect (*R1-*R9), or address (0-31)"
-        )
+        return Instruction(opcode, operand1, operand2, operand3, clean_instruction, address, tokens)
     
-    def _validate_instruction_semantics(self, opcode: str, operand1: Optional[str], operand2: Optional[str], operand3: Optional[str] = None) -> None:
+    def _validate_operands(self, opcode: str, tokens: Tuple[Optional[OperandToken], ...]) -> None:
         """
-        Valida la semántica de la instrucción completa.
+        Valida las clases de los operandos contra la tabla OPERAND_RULES.
         
         Args:
             opcode: Código de operación
-            operand1: Primer operando
-            operand2: Segundo operando
+            tokens: Operandos clasificados
             
         Raises:
             InvalidInstructionError: Si la semántica es inválida
         """
-        # Validaciones específicas por tipo de instrucción
-        if opcode in ['ADD', 'SUB', 'MUL', 'DIV', 'AND', 'OR', 'XOR']:
-            self._validate_binary_arithmetic_instruction(opcode, operand1, operand2)
-            
-        elif opcode == 'NOT':
-            self._validate_unary_instruction(opcode, operand1, operand2)
-            
-        elif opcode == 'LOAD':
-            self._validate_load_instruction(operand1, operand2)
-            
-        elif opcode == 'STORE':
-            self._validate_store_instruction(operand1, operand2)
-            
-        elif opcode == 'MOVE':
-            self._validate_move_instruction(operand1, operand2)
-            
-        elif opcode == 'JP':
-            self._validate_jump_instruction(operand1, operand2)
-            
-        elif opcode == 'JPZ':
-            self._validate_conditional_jump_instruction(operand1, operand2)
-    
-    def _validate_binary_arithmetic_instruction(self, opcode: str, op1: Optional[str], op2: Optional[str]) -> None:
-        """Valida instrucciones aritméticas binarias."""
-        if not op1 or not op2:
-            raise InvalidInstructionError(f"{opcode} requires two operands: {InstructionSet.get_instruction_format(opcode)}")
-        
-        if not self._register_pattern.match(op1):
-            raise InvalidInstructionError(f"{opcode} first operand must be a register (R1-R9)")
-        
-        if not (self._register_pattern.match(op2) or self._immediate_pattern.match(op2)):
-            raise InvalidInstructionError(f"{opcode} second operand must be a register or immediate value")
-    
-    def _validate_unary_instruction(self, opcode: str, op1: Optional[str], op2: Optional[str]) -> None:
-        """Valida instrucciones unarias como NOT."""
-        if not op1 or not op2:
-            raise InvalidInstructionError(f"{opcode} requires two operands: {InstructionSet.get_instruction_format(opcode)}")
-        
-        if not self._register_pattern.match(op1):
-            raise InvalidInstructionError(f"{opcode} first operand must be a register (R1-R9)")
-        
-        if not (self._register_pattern.match(op2) or self._immediate_pattern.match(op2)):
-            raise InvalidInstructionError(f"{opcode} second operand must be a register or immediate value")
-    
-    def _validate_load_instruction(self, op1: Optional[str], op2: Optional[str]) -> None:
-        """Valida instrucciones LOAD."""
-        if not op1 or not op2:
-            raise InvalidInstructionError("LOAD requires two operands: LOAD R1, value or LOAD R1, *R2")
-        
-        if not self._register_pattern.match(op1):
-            raise InvalidInstructionError("LOAD first operand must be a register (R1-R9)")
-        
-        if not (self._immediate_pattern.match(op2) or 
-                self._indirect_pattern.match(op2) or 
-                self._indirect_address_pattern.match(op2)):
-            raise InvalidInstructionError("LOAD second operand must be immediate value, indirect register (*R1-*R9), or indirect address (*16)")
-    
-    def _validate_store_instruction(self, op1: Optional[str], op2: Optional[str]) -> None:
-        """Valida instrucciones STORE."""
-        if not op1 or not op2:
-            raise InvalidInstructionError("STORE requires two operands: STORE R1, address")
-        
-        if not self._register_pattern.match(op1):
-            raise InvalidInstructionError("STORE first operand must be a register (R1-R9)")
-        
-        if not (self._address_pattern.match(op2) or self._immediate_pattern.match(op2)):
-            raise InvalidInstructionError("STORE second operand must be a memory address")
-    
-    def _validate_move_instruction(self, op1: Optional[str], op2: Optional[str]) -> None:
-        """Valida instrucciones MOVE."""
-        if not op1 or not op2:
-            raise InvalidInstructionError("MOVE requires two operands: MOVE R1, R2")
-        
-        if not self._register_pattern.match(op1):
-            raise InvalidInstructionError("MOVE first operand must be a register (R1-R9)")
-        
-        if not self._register_pattern.match(op2):
-            raise InvalidInstructionError("MOVE second operand must be a register (R1-R9)")
-    
-    def _validate_jump_instruction(self, op1: Optional[str], op2: Optional[str]) -> None:
-        """Valida instrucciones JP."""
-        if not op1:
-            raise InvalidInstructionError("JP requires one operand: JP address")
+        rule = OPERAND_RULES.get(opcode)
+        if rule is None:
+            return
         
-        if op2:
-            raise InvalidInstructionError("JP takes only one operand")
+        required, missing_message, extra_message, positions = rule
         
-        if not (self._address_pattern.match(op1) or self._immediate_pattern.match(op1)):
-            raise InvalidInstructionError("JP operand must be a memory address")
-    
-    def _validate_conditional_jump_instruction(self, op1: Optional[str], op2: Optional[str]) -> None:
-        """Valida instrucciones JPZ."""
-        if not op1 or not op2:
-            raise InvalidInstructionError("JPZ requires two operands: JPZ address, register")
+        # Como en la validación original, el número de operandos se revisa
+        # antes que sus clases
+        if len(tokens) < required or None in tokens[:required]:
+            raise InvalidInstructionError(missing_message)
         
-        if not (self._address_pattern.match(op1) or self._immediate_pattern.match(op1)):
-            raise InvalidInstructionError("JPZ first operand must be a memory address")
+        if extra_message and len(tokens) > required and tokens[required] is not None:
+            raise InvalidInstructionError(extra_message)
         
-        if not self._register_pattern.match(op2):
-            raise InvalidInstructionError("JPZ second operand must be a register (R1-R9)")
+        for token, (allowed, message) in zip(tokens, positions):
+            if token.kind not in allowed:
+                raise InvalidInstructionError(message)
     
     def validate_program(self, program_lines: list) -> list:
         """
@@ -299,17 +257,109 @@ class InstructionParser:
         Raises:
             InvalidInstructionError: Si alguna instrucción es inválida
         """
-        instructions = []
+        return list(self.iter_program(program_lines))
+    
+    def iter_program(self, program_lines: Iterable[str]) -> Iterator[Instruction]:
+        """
+        Valida un programa de forma perezosa, una línea a la vez.
         
+        Args:
+            program_lines: Cualquier iterable de líneas (lista, archivo, generador)
+            
+        Yields:
+            Objetos Instruction validados, con la dirección de su línea
+            
+        Raises:
+            InvalidInstructionError: Al llegar a una instrucción inválida
+        """
         for line_num, line in enumerate(program_lines, 1):
             line = line.strip()
             if not line:  # Ignorar líneas vacías
                 continue
             
             try:
-                instruction = self.parse(line, line_num - 1)
-                instructions.append(instruction)
+                yield self.parse(line, line_num - 1)
             except InvalidInstructionError as e:
                 raise InvalidInstructionError(f"Line {line_num}: {str(e)}")
+
+
+_shared_parser: Optional[InstructionParser] = None
+
+
+def get_shared_parser() -> InstructionParser:
+    """
+    Obtiene la instancia de parser compartida por todo el proceso.
+    
+    Returns:
+        InstructionParser reutilizable por Computer, ControlUnit, etc.
+    """
+    global _shared_parser
+    if _shared_parser is None:
+        _shared_parser = InstructionParser()
+    return _shared_parser
+
+
+def normalize_instruction_text(instruction_str: str) -> str:
+    """
+    Normaliza una línea para usarla como clave de la caché de parseo.
+    
+    Elimina los espacios al inicio y al final y reduce cualquier secuencia
+    de espacios internos a uno solo.
+    
+    Args:
+        instruction_str: Instrucción como string
+        
+    Returns:
+        Texto normalizado
+    """
+    return ' '.join(instruction_str.split())
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_normalized(normalized: str) -> Instruction:
+    """Parsea una línea normalizada (resultado compartido por la caché LRU)."""
+    return get_shared_parser()._parse_uncached(normalized)
+
+
+def parse_cached(instruction_str: str) -> Instruction:
+    """
+    Parsea una instrucción usando la caché LRU compartida por el proceso.
+    
+    Líneas idénticas tras normalizar devuelven la misma instancia inmutable
+    de Instruction (con address 0), sin volver a validarlas. Las líneas
+    inválidas no se guardan en la caché.
+    
+    Args:
+        instruction_str: Instrucción como string
+        
+    Returns:
+        Objeto Instruction validado y compartido
         
-        return instructions
\ No newline at end of file
+    Raises:
+        InvalidInstructionError: Si la instrucción es inválida
+    """
+    normalized = normalize_instruction_text(instruction_str)
+    if not normalized:
+        raise InvalidInstructionError("Empty instruction")
+    return _parse_normalized(normalized)
+
+
+def parse_cache_info() -> Dict[str, Any]:
+    """
+    Obtiene los contadores de la caché de parseo.
+    
+    Returns:
+        Diccionario con hits, misses, maxsize y currsize
+    """
+    info = _parse_normalized.cache_info()
+    return {
+        'hits': info.hits,
+        'misses': info.misses,
+        'maxsize': info.maxsize,
+        'currsize': info.currsize
+    }
+
+
+def clear_parse_cache() -> None:
+    """Vacía la caché de parseo y reinicia sus contadores."""
+    _parse_normalized.cache_clear()
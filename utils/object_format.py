@@ -0,0 +1,405 @@
+"""
+Formato binario de archivo objeto para programas ensamblados.
+
+Un archivo objeto contiene, en este orden:
+
+- Cabecera (HEADER): firma b'SIMO', versión, banderas, número de
+  instrucciones y número de datos iniciales.
+- Código: un registro de ancho fijo (RECORD) por instrucción con el id
+  del opcode, la clase de cada operando y su valor entero.
+- Datos iniciales: pares (dirección, valor).
+- Mapa de líneas fuente (opcional): línea de cada dirección.
+
+Todos los enteros son little-endian. La lectura hace una sola lectura
+del archivo y decodifica cada instrucción bajo demanda desde un
+memoryview, sin volver a parsear texto.
+"""
+
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import Dict, Optional, Tuple, Union
+
+from core.exceptions import InvalidInstructionError, ObjectFormatError
+from core.instruction import OPCODE_IDS, OPCODES_BY_ID, Instruction, OperandKind, OperandToken
+from utils.assembler import AssembledProgram, LazySequence
+from utils.instruction_parser import get_shared_parser, tokenize_operand
+
+
+MAGIC = b'SIMO'
+VERSION = 1
+
+# Banderas de la cabecera
+FLAG_SOURCE_MAP = 0x0001
+
+HEADER = struct.Struct('<4sHHII')       # firma, versión, banderas, instrucciones, datos
+RECORD = struct.Struct('<BBBBiii')      # opcode, clase de op1..op3, valor de op1..op3
+DATA_RECORD = struct.Struct('<Ii')      # dirección, valor
+SOURCE_LINE_SIZE = 4                    # uint32 por dirección
+
+# Clase de operando para posiciones vacías
+NO_OPERAND = 0
+
+# Texto de un operando según su clase
+OPERAND_FORMATS: Dict[OperandKind, str] = {
+    OperandKind.REGISTER: 'R{}',
+    OperandKind.IMMEDIATE: '{}',
+    OperandKind.INDIRECT_REGISTER: '*R{}',
+    OperandKind.INDIRECT_ADDRESS: '*{}',
+}
+
+# Clases cuyo valor es el número de registro (R1-R9, como acepta el parser)
+_REGISTER_KINDS = frozenset({OperandKind.REGISTER, OperandKind.INDIRECT_REGISTER})
+
+
+def encode_instruction(instruction: Instruction) -> Tuple[int, ...]:
+    """
+    Codifica una instrucción como los campos de un registro RECORD.
+    
+    Args:
+        instruction: Instrucción decodificada
+    
+    Returns:
+        Tupla (opcode, clase1, clase2, clase3, valor1, valor2, valor3)
+    
+    Raises:
+        ObjectFormatError: Si la instrucción no se puede codificar
+    """
+    opcode_id = OPCODE_IDS.get(instruction.opcode)
+    if opcode_id is None:
+        raise ObjectFormatError(f"Opcode '{instruction.opcode}' has no object code")
+    
+    tokens = instruction.operand_tokens or tuple(
+        tokenize_operand(operand or '')
+        for operand in (instruction.operand1, instruction.operand2, instruction.operand3)
+    )
+    
+    kinds = [NO_OPERAND] * 3
+    values = [0] * 3
+    for position, token in enumerate(tokens[:3]):
+        if token is None:
+            continue
+        if token.kind == OperandKind.UNKNOWN:
+            raise ObjectFormatError(f"Operand '{token.text}' in '{instruction}' has no object code")
+        kinds[position] = int(token.kind)
+        values[position] = token.value
+    
+    return (opcode_id, *kinds, *values)
+
+
+def decode_record(record: Tuple[int, ...]) -> Instruction:
+    """
+    Reconstruye una instrucción a partir de los campos de un registro.
+    
+    Se validan el opcode y las clases de operando con la tabla de reglas
+    del parser, pero no se parsea texto.
+    
+    Args:
+        record: Campos desempaquetados con RECORD
+    
+    Returns:
+        Instrucción decodificada (con address 0)
+    
+    Raises:
+        ObjectFormatError: Si el registro es inválido
+    """
+    opcode = OPCODES_BY_ID.get(record[0])
+    if opcode is None:
+        raise ObjectFormatError(f"Unknown opcode id {record[0]}")
+    
+    tokens = []
+    for kind, value in zip(record[1:4], record[4:7]):
+        if kind == NO_OPERAND:
+            tokens.append(None)
+            continue
+        try:
+            kind = OperandKind(kind)
+            text = OPERAND_FORMATS[kind].format(value)
+        except (ValueError, KeyError):
+            raise ObjectFormatError(f"Invalid operand kind {kind} for {opcode}")
+        if kind in _REGISTER_KINDS and not 1 <= value <= 9:
+            raise ObjectFormatError(f"Invalid register number {value} for {opcode}")
+        tokens.append(OperandToken(kind, text, value))
+    
+    while tokens and tokens[-1] is None:
+        tokens.pop()
+    tokens = tuple(tokens)
+    
+    try:
+        get_shared_parser()._validate_operands(opcode, tokens)
+    except InvalidInstructionError as e:
+        raise ObjectFormatError(f"Invalid {opcode} record: {e}")
+    
+    texts = [token.text if token else None for token in tokens]
+    raw_instruction = f"{opcode} {', '.join(text or '' for text in texts)}" if texts else opcode
+    texts.extend([None] * (3 - len(texts)))
+    
+    return Instruction(opcode, texts[0], texts[1], texts[2], raw_instruction, 0, tokens)
+
+
+def encode_program(program: AssembledProgram, include_source_map: bool = True) -> bytes:
+    """
+    Codifica un programa ensamblado en formato objeto.
+    
+    Args:
+        program: Programa ensamblado
+        include_source_map: True para incluir el mapa de líneas fuente
+    
+    Returns:
+        Contenido del archivo objeto
+    
+    Raises:
+        ObjectFormatError: Si alguna instrucción o dato no se puede codificar
+    """
+    count = len(program.instructions)
+    code = bytearray(count * RECORD.size)
+    offset = 0
+    
+    # Instrucciones idénticas comparten su codificación
+    encoded: Dict[Tuple, Tuple[int, ...]] = {}
+    try:
+        for instruction in program.instructions:
+            key = (instruction.opcode, instruction.operand1, instruction.operand2, instruction.operand3)
+            fields = encoded.get(key)
+            if fields is None:
+                fields = encoded[key] = encode_instruction(instruction)
+            RECORD.pack_into(code, offset, *fields)
+            offset += RECORD.size
+    except struct.error as e:
+        raise ObjectFormatError(f"Value out of range for object format: {e}")
+    
+    return pack_object(code, program.data, program.source_map if include_source_map else None)
+
+
+def pack_object(code: bytes, data: Dict[int, int], source_map=None) -> bytes:
+    """
+    Arma el contenido de un archivo objeto a partir de su código ya codificado.
+    
+    Args:
+        code: Registros RECORD concatenados, uno por instrucción
+        data: Valores iniciales de la memoria de datos
+        source_map: Línea fuente de cada dirección (None = sin mapa)
+    
+    Returns:
+        Contenido del archivo objeto
+    
+    Raises:
+        ObjectFormatError: Si el código está incompleto o un dato no se puede codificar
+    """
+    count, remainder = divmod(len(code), RECORD.size)
+    if remainder:
+        raise ObjectFormatError(f"Code size {len(code)} is not a multiple of the record size")
+    
+    data = sorted(data.items())
+    flags = FLAG_SOURCE_MAP if source_map is not None else 0
+    
+    size = HEADER.size + len(code) + len(data) * DATA_RECORD.size
+    if source_map is not None:
+        size += count * SOURCE_LINE_SIZE
+    buffer = bytearray(size)
+    
+    HEADER.pack_into(buffer, 0, MAGIC, VERSION, flags, count, len(data))
+    offset = HEADER.size
+    buffer[offset:offset + len(code)] = code
+    offset += len(code)
+    
+    try:
+        for address, value in data:
+            DATA_RECORD.pack_into(buffer, offset, address, value)
+            offset += DATA_RECORD.size
+    except struct.error as e:
+        raise ObjectFormatError(f"Value out of range for object format: {e}")
+    
+    if source_map is not None:
+        buffer[offset:] = _uint32_array(source_map).tobytes()
+    
+    return bytes(buffer)
+
+
+def write_object(program: Union[AssembledProgram, 'ObjectImage'], path: str,
+                 include_source_map: bool = True) -> None:
+    """
+    Escribe un programa ensamblado en un archivo objeto.
+    
+    Args:
+        program: Programa ensamblado o imagen ya codificada (se escribe tal cual)
+        path: Ruta del archivo a crear
+        include_source_map: True para incluir el mapa de líneas fuente
+    """
+    if isinstance(program, ObjectImage):
+        content = program.content
+    else:
+        content = encode_program(program, include_source_map)
+    with open(path, 'wb') as output:
+        output.write(content)
+
+
+def read_object(path: str) -> 'ObjectImage':
+    """
+    Lee un archivo objeto con una sola lectura.
+    
+    Args:
+        path: Ruta del archivo objeto
+    
+    Returns:
+        Imagen del programa, decodificada bajo demanda
+    
+    Raises:
+        ObjectFormatError: Si el archivo no tiene un formato válido
+    """
+    with open(path, 'rb') as source:
+        return ObjectImage(source.read())
+
+
+def is_object_file(path: str) -> bool:
+    """Indica si un archivo comienza con la firma del formato objeto."""
+    with open(path, 'rb') as source:
+        return source.read(len(MAGIC)) == MAGIC
+
+
+def _uint32_array(values) -> array:
+    """Crea un array de uint32 en orden little-endian."""
+    result = array('I', values)
+    if sys.byteorder == 'big':
+        result.byteswap()
+    return result
+
+
+class ObjectImage:
+    """
+    Programa cargado desde un archivo objeto.
+    
+    Ofrece la misma interfaz de consulta que AssembledProgram (lines,
+    instructions, source_map, data, line_for_address, address_for_line)
+    pero decodifica cada instrucción solo cuando se pide. Los registros
+    idénticos comparten la misma instancia de Instruction.
+    """
+    
+    def __init__(self, content: bytes):
+        """
+        Interpreta el contenido de un archivo objeto.
+        
+        Args:
+            content: Bytes del archivo completo
+        
+        Raises:
+            ObjectFormatError: Si la cabecera o el tamaño son inválidos
+        """
+        view = memoryview(content)
+        if len(view) < HEADER.size:
+            raise ObjectFormatError("Object file too short")
+        
+        magic, version, flags, count, data_count = HEADER.unpack_from(view, 0)
+        if magic != MAGIC:
+            raise ObjectFormatError("Not a simulator object file")
+        if version != VERSION:
+            raise ObjectFormatError(f"Unsupported object file version {version}")
+        
+        code_end = HEADER.size + count * RECORD.size
+        data_end = code_end + data_count * DATA_RECORD.size
+        expected_size = data_end + (count * SOURCE_LINE_SIZE if flags & FLAG_SOURCE_MAP else 0)
+        if len(view) != expected_size:
+            raise ObjectFormatError(f"Object file size {len(view)} does not match header ({expected_size})")
+        
+        self._content = content
+        self._count = count
+        self._code = view[HEADER.size:code_end]
+        self._data = dict(DATA_RECORD.iter_unpack(view[code_end:data_end]))
+        self._source_map = self._read_source_map(view[data_end:]) if flags & FLAG_SOURCE_MAP else None
+        self._decoded: Dict[Tuple[int, ...], Instruction] = {}
+    
+    @staticmethod
+    def _read_source_map(view: memoryview) -> Sequence:
+        """Obtiene el mapa de líneas sin copiarlo cuando el orden de bytes lo permite."""
+        if sys.byteorder == 'little' and array('I').itemsize == SOURCE_LINE_SIZE:
+            return view.cast('I')
+        result = array('I')
+        result.frombytes(view)
+        if sys.byteorder == 'big':
+            result.byteswap()
+        return result
+    
+    def __len__(self) -> int:
+        """Número de instrucciones del programa."""
+        return self._count
+    
+    def instruction(self, address: int) -> Instruction:
+        """
+        Decodifica la instrucción de una dirección.
+        
+        Args:
+            address: Dirección de la instrucción
+        
+        Returns:
+            Instrucción compartida (con address 0)
+        
+        Raises:
+            IndexError: Si la dirección está fuera del programa
+            ObjectFormatError: Si el registro es inválido
+        """
+        if not 0 <= address < self._count:
+            raise IndexError(f"Instruction address {address} out of program range")
+        
+        record = RECORD.unpack_from(self._code, address * RECORD.size)
+        instruction = self._decoded.get(record)
+        if instruction is None:
+            instruction = self._decoded[record] = decode_record(record)
+        return instruction
+    
+    @property
+    def content(self) -> bytes:
+        """Contenido completo del archivo objeto."""
+        return self._content
+    
+    def text(self, address: int) -> str:
+        """Obtiene el texto de la instrucción de una dirección."""
+        return self.instruction(address).raw_instruction
+    
+    @property
+    def instructions(self) -> Sequence:
+        """Instrucciones decodificadas bajo demanda."""
+        return LazySequence(self._count, self.instruction)
+    
+    @property
+    def lines(self) -> Sequence:
+        """Texto de cada instrucción, generado bajo demanda."""
+        return LazySequence(self._count, self.text)
+    
+    @property
+    def data(self) -> Dict[int, int]:
+        """Valores iniciales de la memoria de datos."""
+        return dict(self._data)
+    
+    @property
+    def source_map(self) -> Optional[Sequence]:
+        """Línea fuente de cada dirección, o None si el archivo no la incluye."""
+        return self._source_map
+    
+    def line_for_address(self, address: int) -> Optional[int]:
+        """Obtiene la línea fuente de una dirección (None si no se conoce)."""
+        if self._source_map is not None and 0 <= address < self._count:
+            return self._source_map[address]
+        return None
+    
+    def address_for_line(self, line_number: int) -> Optional[int]:
+        """Obtiene la dirección escrita en una línea fuente (None si no se conoce)."""
+        if self._source_map is None:
+            return None
+        for address, line in enumerate(self._source_map):
+            if line == line_number:
+                return address
+        return None
+    
+    def to_program(self) -> AssembledProgram:
+        """
+        Decodifica todo el archivo como un AssembledProgram.
+        
+        Returns:
+            Programa con instrucciones, datos y mapa de líneas
+        """
+        return AssembledProgram(
+            instructions=list(self.instructions),
+            source_map=list(self._source_map) if self._source_map is not None else [],
+            data=self.data
+        )
@@ -0,0 +1,334 @@
+"""
+Optimizador de mirilla (peephole) para programas ensamblados.
+
+Reescribe patrones redundantes de un programa ya decodificado, entre el
+ensamblado y la ejecución:
+
+- `self_move`: `MOVE R1, R1` se elimina.
+- `store_load`: `STORE R1, 20` seguido de `LOAD R2, *20` lee el valor del
+  registro (`MOVE R2, R1`) en lugar de la memoria.
+- `constant_fold`: una operación de la ALU cuyos operandos tienen valores
+  conocidos se reemplaza por `LOAD destino, resultado`.
+- `dead_load`: un `LOAD R1, valor` cuyo registro se sobrescribe en la
+  siguiente instrucción sin leerlo se elimina.
+
+Los saltos se reasignan a las nuevas direcciones. El estado final de
+registros y memoria es el mismo; el PSW, el MBR y el número de ciclos
+pueden cambiar, por lo que el modo docente (donde debe verse exactamente
+el programa escrito) no debe optimizar.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from core.exceptions import SimulatorError
+from core.instruction import Instruction, OperandKind
+from core.word_format import LEGACY_WORD, WordFormat
+from hardware.alu import ALU
+from utils.assembler import AssembledProgram
+from utils.control_flow import (
+    JUMP_OPCODES, THREE_OPERAND_ALU_OPCODES, operand_tokens, register_written, registers_read
+)
+from utils.instruction_parser import InstructionParser, get_shared_parser
+
+
+SELF_MOVE = 'self_move'
+STORE_LOAD = 'store_load'
+CONSTANT_FOLD = 'constant_fold'
+DEAD_LOAD = 'dead_load'
+
+ALL_RULES = (SELF_MOVE, STORE_LOAD, CONSTANT_FOLD, DEAD_LOAD)
+
+
+@dataclass
+class OptimizationChange:
+    """
+    Cambio aplicado por el optimizador.
+    
+    Attributes:
+        rule: Regla que produjo el cambio
+        address: Dirección de la instrucción en el programa original
+        line_number: Línea fuente de la instrucción (None si no se conoce)
+        before: Instrucción original
+        after: Instrucción resultante (None si se eliminó)
+    """
+    rule: str
+    address: int
+    line_number: Optional[int]
+    before: str
+    after: Optional[str]
+    
+    def __str__(self) -> str:
+        location = f"línea {self.line_number}" if self.line_number is not None else f"dirección {self.address}"
+        result = self.after if self.after is not None else "(eliminada)"
+        return f"[{self.rule}] {location}: {self.before} -> {result}"
+
+
+@dataclass
+class OptimizationReport:
+    """
+    Resultado de optimizar un programa.
+    
+    Attributes:
+        original_size: Instrucciones del programa original
+        optimized_size: Instrucciones del programa optimizado
+        changes: Cambios aplicados, por dirección original
+        address_map: Nueva dirección de cada dirección original (una
+            instrucción eliminada se asocia a la siguiente que sobrevive)
+    """
+    original_size: int = 0
+    optimized_size: int = 0
+    changes: List[OptimizationChange] = field(default_factory=list)
+    address_map: List[int] = field(default_factory=list)
+    
+    @property
+    def removed(self) -> int:
+        """Número de instrucciones eliminadas."""
+        return self.original_size - self.optimized_size
+    
+    def summary(self) -> str:
+        """Resumen de una línea del resultado."""
+        return (f"{len(self.changes)} cambios, {self.original_size} -> "
+                f"{self.optimized_size} instrucciones")
+    
+    def to_dict(self) -> Dict[str, object]:
+        """Representación serializable (por ejemplo, para JSON)."""
+        return {
+            'original_size': self.original_size,
+            'optimized_size': self.optimized_size,
+            'changes': [str(change) for change in self.changes]
+        }
+
+
+class PeepholeOptimizer:
+    """
+    Optimizador de mirilla sobre programas ensamblados.
+    
+    Solo mira instrucciones consecutivas dentro de un bloque básico: los
+    valores conocidos de los registros se descartan en cada destino de
+    salto y después de cada JP, de modo que ningún camino de ejecución
+    ve un resultado distinto.
+    """
+    
+    def __init__(self, rules: Sequence[str] = ALL_RULES, parser: Optional[InstructionParser] = None,
+                 word_format: WordFormat = LEGACY_WORD):
+        """
+        Inicializa el optimizador.
+        
+        Args:
+            rules: Reglas a aplicar (default: todas)
+            parser: Parser para construir las instrucciones reescritas
+                (default: el parser compartido)
+            word_format: Formato de palabra de la máquina que ejecutará el
+                programa (default: el histórico)
+        
+        Raises:
+            ValueError: Si alguna regla no existe
+        """
+        unknown = set(rules) - set(ALL_RULES)
+        if unknown:
+            raise ValueError(f"Unknown optimization rules: {', '.join(sorted(unknown))}")
+        self._rules = frozenset(rules)
+        self._parser = parser or get_shared_parser()
+        self._word = word_format
+        # ALU sin observadores para plegar constantes con la misma semántica
+        self._alu = ALU(word_format=word_format)
+    
+    def optimize(self, program: AssembledProgram) -> Tuple[AssembledProgram, OptimizationReport]:
+        """
+        Optimiza un programa sin modificar el original.
+        
+        Args:
+            program: Programa ensamblado
+        
+        Returns:
+            Tupla (programa optimizado, reporte de cambios)
+        """
+        instructions: List[Optional[Instruction]] = list(program.instructions)
+        targets = self._jump_targets(instructions)
+        changes: List[OptimizationChange] = []
+        
+        self._rewrite_forward(instructions, targets, changes, program)
+        if DEAD_LOAD in self._rules:
+            self._remove_dead_loads(instructions, changes, program)
+        
+        optimized, address_map = self._relocate(instructions, program)
+        changes.sort(key=lambda change: change.address)
+        report = OptimizationReport(len(program), len(optimized), changes, address_map)
+        return optimized, report
+    
+    @staticmethod
+    def _jump_targets(instructions: List[Optional[Instruction]]) -> Set[int]:
+        """Direcciones a las que salta alguna instrucción."""
+        targets = set()
+        for instruction in instructions:
+            if instruction.opcode in JUMP_OPCODES:
+                targets.add(operand_tokens(instruction)[0].value)
+        return targets
+    
+    def _rewrite_forward(self, instructions: List[Optional[Instruction]], targets: Set[int],
+                         changes: List[OptimizationChange], program: AssembledProgram) -> None:
+        """Aplica las reglas self_move, store_load y constant_fold en orden."""
+        known: Dict[str, int] = {}
+        previous: Optional[Instruction] = None
+        
+        for address, instruction in enumerate(instructions):
+            if address in targets:
+                known.clear()
+                previous = None
+            
+            opcode = instruction.opcode
+            tokens = operand_tokens(instruction)
+            replacement = instruction
+            rule = None
+            
+            if SELF_MOVE in self._rules and opcode == 'MOVE' and tokens[0].text == tokens[1].text:
+                replacement, rule = None, SELF_MOVE
+            
+            elif (STORE_LOAD in self._rules and opcode == 'LOAD' and previous is not None
+                  and previous.opcode == 'STORE' and tokens[1].kind is OperandKind.INDIRECT_ADDRESS):
+                stored = operand_tokens(previous)
+                if stored[1].value == tokens[1].value:
+                    source, target = stored[0].text, tokens[0].text
+                    replacement = None if source == target else self._build(f"MOVE {target}, {source}", address)
+                    rule = STORE_LOAD
+            
+            elif CONSTANT_FOLD in self._rules and (opcode in THREE_OPERAND_ALU_OPCODES or opcode == 'NOT'):
+                destination = tokens[2] if opcode != 'NOT' else tokens[1]
+                value = self._fold(opcode, tokens, known)
+                if value is not None and destination.kind is OperandKind.REGISTER:
+                    replacement = self._build(f"LOAD {destination.text}, {value}", address)
+                    rule = CONSTANT_FOLD
+            
+            if rule is not None:
+                self._record(changes, rule, address, instruction, replacement, program)
+                instructions[address] = replacement
+            
+            if replacement is not None:
+                self._track_constants(replacement, known)
+                previous = replacement
+            if opcode == 'JP':
+                known.clear()
+                previous = None
+    
+    def _fold(self, opcode: str, tokens: Tuple, known: Dict[str, int]) -> Optional[int]:
+        """
+        Calcula el resultado de una operación de la ALU si sus operandos son
+        conocidos (NOT también valida su primer operando, aunque solo niega
+        el segundo).
+        """
+        values = []
+        for token in tokens[:2]:
+            if token.kind is OperandKind.IMMEDIATE:
+                values.append(token.value)
+            elif token.kind is OperandKind.REGISTER and token.text in known:
+                values.append(known[token.text])
+            else:
+                return None
+        
+        # Con operandos fuera de rango la ALU falla: se deja la instrucción
+        if not all(map(self._word.in_range, values)):
+            return None
+        try:
+            return self._alu.execute(opcode, values[0], values[1])
+        except SimulatorError:
+            return None
+    
+    def _track_constants(self, instruction: Instruction, known: Dict[str, int]) -> None:
+        """Actualiza los valores conocidos de los registros tras una instrucción."""
+        opcode = instruction.opcode
+        tokens = operand_tokens(instruction)
+        written = register_written(opcode, tokens)
+        if written is None:
+            return
+        
+        if opcode == 'LOAD' and tokens[1].kind is OperandKind.IMMEDIATE:
+            # El registro guarda el valor truncado a la palabra
+            known[written] = self._word.wrap(tokens[1].value)
+        elif opcode == 'MOVE' and tokens[1].text in known:
+            known[written] = known[tokens[1].text]
+        else:
+            known.pop(written, None)
+    
+    def _remove_dead_loads(self, instructions: List[Optional[Instruction]],
+                           changes: List[OptimizationChange], program: AssembledProgram) -> None:
+        """Elimina cargas inmediatas cuyo registro sobrescribe la siguiente instrucción."""
+        survivors = [address for address, instruction in enumerate(instructions) if instruction is not None]
+        
+        for current, following in zip(survivors, survivors[1:]):
+            instruction = instructions[current]
+            if instruction.opcode != 'LOAD':
+                continue
+            tokens = operand_tokens(instruction)
+            if tokens[1].kind is not OperandKind.IMMEDIATE:
+                continue
+            
+            # La siguiente instrucción es la única sucesora de un LOAD
+            next_instruction = instructions[following]
+            next_tokens = operand_tokens(next_instruction)
+            register = tokens[0].text
+            if (register_written(next_instruction.opcode, next_tokens) == register
+                    and register not in registers_read(next_instruction.opcode, next_tokens)):
+                self._record(changes, DEAD_LOAD, current, instruction, None, program)
+                instructions[current] = None
+    
+    def _relocate(self, instructions: List[Optional[Instruction]],
+                  program: AssembledProgram) -> Tuple[AssembledProgram, List[int]]:
+        """Compacta el programa y reasigna los destinos de salto."""
+        address_map = []
+        new_address = 0
+        for instruction in instructions:
+            address_map.append(new_address)
+            if instruction is not None:
+                new_address += 1
+        address_map.append(new_address)
+        
+        optimized = AssembledProgram(symbols=dict(program.symbols), data=dict(program.data))
+        for address, instruction in enumerate(instructions):
+            if instruction is None:
+                continue
+            relocated_address = len(optimized.instructions)
+            
+            if instruction.opcode in JUMP_OPCODES:
+                tokens = operand_tokens(instruction)
+                target = tokens[0].value
+                if 0 <= target < len(address_map):
+                    operands = [str(address_map[target])] + [token.text for token in tokens[1:]]
+                    instruction = self._build(f"{instruction.opcode} {', '.join(operands)}", relocated_address)
+            if instruction.address != relocated_address:
+                instruction = self._parser.parse(instruction.raw_instruction, relocated_address)
+            
+            optimized.instructions.append(instruction)
+            if address < len(program.source_map):
+                optimized.source_map.append(program.source_map[address])
+        
+        return optimized, address_map
+    
+    def _build(self, text: str, address: int) -> Instruction:
+        """Construye una instrucción reescrita."""
+        return self._parser.parse(text, address)
+    
+    @staticmethod
+    def _record(changes: List[OptimizationChange], rule: str, address: int, before: Instruction,
+                after: Optional[Instruction], program: AssembledProgram) -> None:
+        """Registra un cambio aplicado."""
+        changes.append(OptimizationChange(
+            rule, address, program.line_for_address(address), before.raw_instruction,
+            after.raw_instruction if after is not None else None
+        ))
+
+
+def optimize_program(program: AssembledProgram, rules: Sequence[str] = ALL_RULES,
+                     word_format: WordFormat = LEGACY_WORD) -> Tuple[AssembledProgram, OptimizationReport]:
+    """
+    Optimiza un programa ensamblado.
+    
+    Args:
+        program: Programa ensamblado
+        rules: Reglas a aplicar (default: todas)
+        word_format: Formato de palabra de la máquina (default: el histórico)
+    
+    Returns:
+        Tupla (programa optimizado, reporte de cambios)
+    """
+    return PeepholeOptimizer(rules, word_format=word_format).optimize(program)
@@ -0,0 +1,200 @@
+"""
+Ensamblado en paralelo de programas muy grandes.
+
+El programa se divide en bloques de líneas consecutivas que se validan y
+codifican en un pool de procesos. Cada bloque se ensambla con direcciones
+locales (empezando en 0) y devuelve, en orden, sus etiquetas y directivas
+para que el proceso principal construya la tabla de símbolos completa. Las
+instrucciones que usan símbolos quedan pendientes y se codifican al unir
+los bloques, por lo que una etiqueta puede usarse desde cualquier bloque.
+
+El resultado es una imagen en formato objeto (ver utils.object_format).
+"""
+
+import struct
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from core.exceptions import AssemblyError, AssemblyErrorGroup, InvalidInstructionError, ObjectFormatError
+from utils.assembler import DEFAULT_MAX_ERRORS, LABEL_PATTERN, get_shared_assembler, strip_comment
+from utils.instruction_parser import parse_cached
+from utils.object_format import RECORD, ObjectImage, encode_instruction, pack_object
+
+
+# Líneas por bloque: bloques grandes reducen el costo de enviar y unir
+# resultados entre procesos
+DEFAULT_CHUNK_LINES = 50_000
+
+
+class _ChunkEvent(NamedTuple):
+    """Etiqueta o directiva de un bloque, en el orden en que aparece."""
+    line_number: int
+    address: int
+    label: Optional[str]
+    directive: Optional[str]
+
+
+class _ChunkResult(NamedTuple):
+    """Resultado de ensamblar un bloque con direcciones locales."""
+    instruction_count: int
+    code: bytes
+    source_map: array
+    events: List[_ChunkEvent]
+    pending: List[Tuple[int, int, str]]
+    errors: List[Tuple[int, str, str]]
+
+
+def _encode_statement(text: str, encoded: Dict[str, Tuple[int, ...]]) -> Tuple[int, ...]:
+    """
+    Decodifica y codifica una instrucción sin símbolos.
+    
+    Raises:
+        InvalidInstructionError: Si la instrucción es inválida
+        ObjectFormatError: Si no se puede codificar
+    """
+    fields = encoded.get(text)
+    if fields is None:
+        fields = encoded[text] = encode_instruction(parse_cached(text))
+    return fields
+
+
+def _error_details(error: Exception) -> str:
+    """Obtiene el detalle de un error de decodificación o codificación."""
+    if isinstance(error, InvalidInstructionError) and error.instruction is not None:
+        return error.instruction
+    return str(error)
+
+
+def _assemble_chunk(chunk: Tuple[int, Sequence[str]]) -> _ChunkResult:
+    """
+    Ensambla un bloque de líneas (se ejecuta en un proceso del pool).
+    
+    Args:
+        chunk: Tupla (número de la primera línea, líneas del bloque)
+    
+    Returns:
+        Código del bloque con direcciones locales y lo que falta resolver
+    """
+    first_line, lines = chunk
+    resolve_symbols = get_shared_assembler()._resolve_symbols
+    
+    code = bytearray(len(lines) * RECORD.size)
+    source_map = array('I')
+    events: List[_ChunkEvent] = []
+    pending: List[Tuple[int, int, str]] = []
+    errors: List[Tuple[int, str, str]] = []
+    encoded: Dict[str, Tuple[int, ...]] = {}
+    address = 0
+    
+    for line_number, line in enumerate(lines, first_line):
+        text = strip_comment(line)
+        if not text:
+            continue
+        
+        label = LABEL_PATTERN.match(text)
+        if label:
+            events.append(_ChunkEvent(line_number, address, label.group(1), None))
+            text = text[label.end():].strip()
+            if not text:
+                continue
+        if text.startswith('.'):
+            events.append(_ChunkEvent(line_number, address, None, text))
+            continue
+        
+        _, unresolved = resolve_symbols(text, {})
+        if unresolved:
+            pending.append((address, line_number, text))
+        else:
+            try:
+                RECORD.pack_into(code, address * RECORD.size, *_encode_statement(text, encoded))
+            except (InvalidInstructionError, ObjectFormatError, struct.error) as e:
+                errors.append((line_number, _error_details(e), text))
+        
+        source_map.append(line_number)
+        address += 1
+    
+    return _ChunkResult(address, bytes(code[:address * RECORD.size]), source_map, events, pending, errors)
+
+
+def assemble_parallel(program_lines: Sequence[str], workers: Optional[int] = None,
+                      chunk_lines: int = DEFAULT_CHUNK_LINES, max_errors: int = DEFAULT_MAX_ERRORS,
+                      include_source_map: bool = True) -> ObjectImage:
+    """
+    Ensambla un programa repartiendo bloques de líneas entre procesos.
+    
+    Args:
+        program_lines: Líneas del programa
+        workers: Procesos del pool (None = uno por CPU; 1 = sin pool, en
+            el proceso actual)
+        chunk_lines: Líneas por bloque
+        max_errors: Errores a reportar como máximo
+        include_source_map: True para incluir el mapa de líneas fuente
+    
+    Returns:
+        Imagen del programa en formato objeto
+    
+    Raises:
+        AssemblyErrorGroup: Con los primeros `max_errors` errores, por línea
+    """
+    if chunk_lines < 1:
+        raise ValueError("chunk_lines must be positive")
+    
+    chunks = [(start + 1, program_lines[start:start + chunk_lines])
+              for start in range(0, len(program_lines), chunk_lines)]
+    
+    if workers == 1 or len(chunks) <= 1:
+        results = [_assemble_chunk(chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_assemble_chunk, chunks))
+    
+    return _merge_chunks(results, max_errors, include_source_map)
+
+
+def _merge_chunks(results: List[_ChunkResult], max_errors: int, include_source_map: bool) -> ObjectImage:
+    """
+    Une los bloques: reubica sus direcciones, arma la tabla de símbolos y
+    codifica las instrucciones pendientes.
+    """
+    assembler = get_shared_assembler()
+    symbols: Dict[str, int] = {}
+    data: Dict[int, int] = {}
+    errors: List[AssemblyError] = []
+    pending: List[Tuple[int, int, str]] = []
+    source_map = array('I')
+    base = 0
+    
+    for result in results:
+        errors.extend(AssemblyError(details, line_number, text) for line_number, details, text in result.errors)
+        
+        for event in result.events:
+            try:
+                if event.label is not None:
+                    assembler._define_symbol(symbols, event.label, base + event.address,
+                                             event.line_number, event.label)
+                else:
+                    assembler._apply_directive(symbols, data, event.directive, event.line_number)
+            except AssemblyError as e:
+                errors.append(e)
+        
+        pending.extend((base + address, line_number, text) for address, line_number, text in result.pending)
+        source_map.extend(result.source_map)
+        base += result.instruction_count
+    
+    code = bytearray(b''.join(result.code for result in results))
+    encoded: Dict[str, Tuple[int, ...]] = {}
+    
+    for address, line_number, text in pending:
+        resolved, unresolved = assembler._resolve_symbols(text, symbols)
+        try:
+            RECORD.pack_into(code, address * RECORD.size, *_encode_statement(resolved, encoded))
+        except (InvalidInstructionError, ObjectFormatError, struct.error) as e:
+            details = f"Undefined symbol '{unresolved[0]}'" if unresolved else _error_details(e)
+            errors.append(AssemblyError(details, line_number, text))
+    
+    if errors:
+        errors.sort(key=lambda error: error.line_number)
+        raise AssemblyErrorGroup(errors[:max_errors])
+    
+    return ObjectImage(pack_object(code, data, source_map if include_source_map else None))